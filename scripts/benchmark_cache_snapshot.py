@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Cache Snapshot Benchmark
+
+Compares the legacy indented JSON snapshot (json.dump with indent=2) with
+the versioned compact snapshot format of the JSON cache, measuring save
+time, load time and file size for blacklists of 10k and 100k entries.
+
+Usage:
+    python scripts/benchmark_cache_snapshot.py [--sizes 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.cache.snapshot_codec import decode_snapshot, encode_snapshot  # noqa: E402
+
+CHANNELS = [
+    "moraselalthawrah",
+    "jh_team",
+    "shaamnetwork",
+    "alktroone",
+    "alhourya_news",
+    "alekhbariahsy",
+    "samsyria01",
+]
+
+
+def build_state(entries: int, iso_timestamps: bool) -> dict:
+    """
+    Build a bot state with the given number of blacklist entries.
+
+    The legacy cache kept ISO timestamps in memory; the current one keeps
+    epoch seconds.
+    """
+    rng = random.Random(entries)
+    now = datetime.datetime(2025, 1, 16)
+    blacklist = {channel: {} for channel in CHANNELS}
+    next_ids = {channel: rng.randint(1000, 50000) for channel in CHANNELS}
+    for i in range(entries):
+        channel = CHANNELS[i % len(CHANNELS)]
+        next_ids[channel] += rng.randint(1, 5)
+        added_at = now - datetime.timedelta(seconds=rng.randint(0, 30 * 86400))
+        blacklist[channel][str(next_ids[channel])] = (
+            added_at.isoformat()
+            if iso_timestamps
+            else int(added_at.replace(tzinfo=datetime.timezone.utc).timestamp())
+        )
+    return {
+        "latest_news": [],
+        "telegram_channels": CHANNELS,
+        "automation_config": {"enabled": True, "interval_minutes": 180},
+        "blacklist": blacklist,
+    }
+
+
+def legacy_save(path: str, state: dict):
+    with open(path, "w") as f:
+        f.write(json.dumps(state, indent=2))
+
+
+def legacy_load(path: str) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compact_save(path: str, state: dict):
+    with open(path, "wb") as f:
+        f.write(encode_snapshot(state))
+
+
+def compact_load(path: str) -> dict:
+    with open(path, "rb") as f:
+        return decode_snapshot(f.read())[0]
+
+
+def time_call(func, *args, repeat: int) -> float:
+    """Return the median wall time of func(*args) in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes, repeat: int):
+    print(f"{'entries':>8} {'format':>8} {'save ms':>9} {'load ms':>9} {'size KiB':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for entries in sizes:
+            for name, save, load, state in (
+                ("legacy", legacy_save, legacy_load, build_state(entries, iso_timestamps=True)),
+                ("compact", compact_save, compact_load, build_state(entries, iso_timestamps=False)),
+            ):
+                path = os.path.join(directory, f"{name}-{entries}.json")
+                save_ms = time_call(save, path, state, repeat=repeat)
+                load_ms = time_call(load, path, repeat=repeat)
+                assert load(path) == state, f"{name} snapshot did not round-trip"
+                size_kib = os.path.getsize(path) / 1024
+                print(f"{entries:>8} {name:>8} {save_ms:>9.1f} {load_ms:>9.1f} {size_kib:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache snapshot formats")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ import datetime
 import os
 import platform
 import socket
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 import time as time_module  # Import time module with alias to avoid scope issues
 
 # =============================================================================
@@ -27,6 +27,7 @@ from discord.ext import commands
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.post_jobs import get_post_job_store
 from src.core.unified_config import unified_config as config
 from src.utils import error_handler
 from src.utils.base_logger import base_logger as logger
@@ -191,11 +192,15 @@ async def start_monitoring_tasks(bot: "NewsBot") -> None:
         async def update_metrics_wrapper():
             await update_metrics(bot)
 
+        async def scheduled_post_wrapper():
+            await scheduled_post_task(bot)
+
         # Start other background tasks via task manager
         await task_manager.start_task("auto_post", auto_post_wrapper)
         await task_manager.start_task("log_tail", log_tail_wrapper)
         await task_manager.start_task("rich_presence", rich_presence_wrapper)
         await task_manager.start_task("update_metrics", update_metrics_wrapper)
+        await task_manager.start_task("scheduled_posts", scheduled_post_wrapper)
 
         logger.debug("✅ All monitoring tasks started")
 
@@ -518,124 +523,208 @@ async def rich_presence_task(bot: "NewsBot"):
         raise
 
 
+async def record_auto_post(bot: "NewsBot", channel: str) -> None:
+    """Update the posting interval timer and rich presence after an auto-post."""
+    # IMPORTANT: Sets last_post_time and saves to cache so interval timing is maintained
+    bot.mark_just_posted()
+
+    from src.core.rich_presence import mark_content_posted
+    await mark_content_posted(bot)
+
+    logger.info(f"✅ Successfully posted from {channel} at {bot.last_post_time}")
+
+
+def _seconds_since_last_post(bot: "NewsBot") -> float:
+    """Seconds since bot.last_post_time (which must be set)."""
+    # TIMEZONE FIX: Ensure both times are timezone-aware before calculation
+    last_post_aware = bot.last_post_time
+    if last_post_aware.tzinfo is None:
+        from src.utils.timezone_utils import EASTERN
+        last_post_aware = last_post_aware.replace(tzinfo=EASTERN)
+    return (now_eastern() - last_post_aware).total_seconds()
+
+
+def seconds_until_breaking_allowed(bot: "NewsBot") -> float:
+    """Seconds until the minimum gap for breaking posts has passed (0 if it has)."""
+    if not bot.last_post_time:
+        return 0.0
+    min_gap = float(config.get("automation.breaking_min_interval_minutes", 15)) * 60
+    return max(0.0, min_gap - _seconds_since_last_post(bot))
+
+
+def seconds_until_auto_post(bot: "NewsBot") -> Tuple[Optional[float], str]:
+    """
+    Work out how long the auto-poster has to wait before its next attempt.
+
+    Checks run in the same order the poster has always applied them:
+    startup grace period, manual verification delay, auto-posting
+    disabled, force flag, then the posting interval.
+
+    Returns:
+        Tuple[Optional[float], str]: Seconds until the next attempt (0 when
+            due now, None while auto-posting is disabled) and what is being
+            waited for: "grace", "verification", "disabled", "interval" or "due"
+    """
+    # CRITICAL: Check startup grace period first
+    # This prevents any posting during the initial startup window
+    should_wait, seconds_to_wait = bot.should_wait_for_startup_delay()
+    if should_wait:
+        return float(seconds_to_wait), "grace"
+
+    # Check for manual verification delay (activated after flagged content)
+    delays = getattr(bot, '_manual_verification_delay_until', None)
+    if delays and 'auto_fetch' in delays:
+        remaining = (delays['auto_fetch'] - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        if remaining > 0:
+            return remaining, "verification"
+        # Delay period has expired, remove the restriction
+        logger.info("🚀 Manual verification delay expired - auto-posting resumed")
+        del delays['auto_fetch']
+
+    # Check if auto-posting is enabled (interval must be > 0)
+    if bot.auto_post_interval <= 0:
+        return None, "disabled"
+
+    if bot.force_auto_post or not bot.last_post_time:
+        return 0.0, "due"
+
+    remaining = bot.auto_post_interval - _seconds_since_last_post(bot)
+    if remaining > 0:
+        return remaining, "interval"
+    return 0.0, "due"
+
+
+async def post_breaking_news(bot: "NewsBot") -> bool:
+    """
+    Post a queued breaking message ahead of the posting interval.
+
+    A minimum gap since the last post (automation.breaking_min_interval_minutes)
+    still applies so a burst of breaking updates cannot flood the channel.
+
+    Returns:
+        bool: True if a breaking message was posted
+    """
+    if seconds_until_breaking_allowed(bot) > 0:
+        logger.debug("⏳ Breaking news queued, but the minimum gap since the last post has not passed")
+        return False
+
+    logger.info("🚨 Breaking news pushed - posting ahead of the interval")
+    channel = await bot.post_from_ingest_queue(breaking_only=True)
+    if not channel:
+        return False
+    await record_auto_post(bot, channel)
+    return True
+
+
 async def auto_post_task(bot: "NewsBot"):
     """
     Background task for automatic news posting with interval management.
     
-    This task continuously monitors the posting schedule and automatically
-    posts content from configured Telegram channels at the specified interval.
+    This task computes when the next post is due and sleeps exactly until
+    then, instead of re-checking the clock every minute. It wakes early when
+    bot.wake_auto_poster() is called (force flag, interval change, startup
+    protection or verification delay lifted) or when breaking news is pushed.
     
     Key Features:
     - Respects startup grace period to prevent posting during initialization
     - Enforces posting intervals to prevent spam (default: 3 hours)
     - Handles manual verification delays for flagged content
-    - Implements channel rotation for fair distribution
+    - Selects and stages the next post (AI analysis, translation, media)
+      automation.lookahead_seconds before its slot, so the slot only uploads
+    - Posts messages pushed by the Telegram NewMessage handler before polling,
+      and posts queued breaking news ahead of the interval
+    - Catches up after a restart or Telegram reconnect by posting the best
+      of the missed messages within a burst budget (automation.backfill)
+    - Implements channel rotation for fair distribution, or polls channels
+      by their observed publish rate or post yield
+      (automation.channel_selection: adaptive / bandit)
+    - Optional concurrent mode (automation.fetch_mode: concurrent) that queries
+      all active channels at once and posts the best candidate
     - Comprehensive error handling and recovery
     
     Flow:
-    1. Check startup grace period (prevents posting for 5 minutes after restart)
-    2. Check manual verification delays (pauses auto-posting after flagged content)
-    3. Verify auto-posting is enabled (interval > 0)
-    4. Calculate time since last post vs required interval
-    5. If time elapsed >= interval, select next channel and attempt posting
-    6. If successful, update last_post_time via mark_just_posted()
+    1. Compute the next due time (see seconds_until_auto_post())
+    2. If it lies ahead, stage the next post once inside the look-ahead
+       window, then sleep until the window, the slot or a wake-up
+    3. When due, post the staged post, a pushed message or a fetched one
+    4. If successful, update last_post_time via mark_just_posted();
+       otherwise retry after a back-off unless woken earlier
     
     Args:
         bot (NewsBot): The bot instance containing configuration and state
         
     Note:
-        This task runs indefinitely until the bot shuts down. It uses
-        asyncio.sleep() for timing control and error recovery.
+        This task runs indefinitely until the bot shuts down.
     """
     logger.info("🔄 Starting auto-post task")
+    lookahead_slot = None  # last_post_time of the slot a look-ahead was attempted for
+    retry_at = 0.0  # monotonic time before which a failed attempt is not repeated
+    breaking_retry_at = 0.0  # monotonic time before which breaking news is not retried
+
+    def back_off(seconds: float) -> None:
+        nonlocal retry_at
+        retry_at = time_module.monotonic() + seconds
 
     try:
         while True:
             try:
-                # CRITICAL: Check startup grace period first
-                # This prevents any posting during the initial startup window
-                should_wait, seconds_to_wait = bot.should_wait_for_startup_delay()
-                if should_wait:
-                    minutes_remaining = seconds_to_wait // 60
-                    seconds_remaining = seconds_to_wait % 60
-                    logger.info(
-                        f"🛡️ STARTUP GRACE PERIOD ACTIVE: {minutes_remaining}m {seconds_remaining}s remaining - AUTO-POSTING DISABLED"
-                    )
-                    logger.info(
-                        f"⏳ Bot will not post any content until {minutes_remaining} minutes after startup"
-                    )
-                    await asyncio.sleep(30)  # Check every 30 seconds during grace period
+                delay, reason = seconds_until_auto_post(bot)
+                now = time_module.monotonic()
+                if reason == "due" and not bot.force_auto_post and now < retry_at:
+                    delay, reason = retry_at - now, "retry"
+
+                # Catch up on messages missed while down or disconnected,
+                # once posting is allowed at all
+                if reason not in ("grace", "verification", "disabled") and bot.backfill_pending:
+                    for channel in await bot.run_backfill():
+                        await record_auto_post(bot, channel)
                     continue
 
-                # Check for manual verification delay (activated after flagged content)
-                if hasattr(bot, '_manual_verification_delay_until') and 'auto_fetch' in bot._manual_verification_delay_until:
-                    now_utc = datetime.datetime.now(datetime.timezone.utc)
-                    delay_until = bot._manual_verification_delay_until['auto_fetch']
-                    
-                    if now_utc < delay_until:
-                        time_remaining = delay_until - now_utc
-                        minutes_remaining = int(time_remaining.total_seconds() // 60)
+                if delay is None or delay > 0:
+                    timeout = delay
+                    if reason == "grace":
                         logger.info(
-                            f"🛡️ MANUAL VERIFICATION DELAY ACTIVE: {minutes_remaining}m remaining - AUTO-POSTING DISABLED"
+                            f"🛡️ STARTUP GRACE PERIOD ACTIVE: {int(delay) // 60}m {int(delay) % 60}s remaining - AUTO-POSTING DISABLED"
                         )
+                    elif reason == "verification":
                         logger.info(
-                            f"⏳ Waiting for manual verification of flagged content - auto-posting resumes at {delay_until.strftime('%H:%M UTC')}"
+                            f"🛡️ MANUAL VERIFICATION DELAY ACTIVE: {int(delay // 60)}m remaining - AUTO-POSTING DISABLED"
                         )
-                        await asyncio.sleep(60)  # Check every minute during delay
-                        continue
-                    else:
-                        # Delay period has expired, remove the restriction
-                        logger.info("🚀 Manual verification delay expired - auto-posting resumed")
-                        del bot._manual_verification_delay_until['auto_fetch']
-
-                # Check if auto-posting is enabled (interval must be > 0)
-                if bot.auto_post_interval <= 0:
-                    logger.debug("⏸️ Auto-posting disabled, checking again in 5 minutes")
-                    await asyncio.sleep(300)  # Check every 5 minutes
-                    continue
-
-                logger.debug(
-                    f"🔍 Auto-post check: interval={bot.auto_post_interval}s, force_flag={bot.force_auto_post}"
-                )
-
-                # Calculate time since last post to determine if interval has elapsed
-                if bot.last_post_time:
-                    # TIMEZONE FIX: Ensure both times are timezone-aware before calculation
-                    try:
-                        # Make sure last_post_time is timezone-aware
-                        last_post_aware = bot.last_post_time
-                        if last_post_aware.tzinfo is None:
-                            from src.utils.timezone_utils import EASTERN
-                            last_post_aware = last_post_aware.replace(tzinfo=EASTERN)
-                        
-                        time_since_last = (
-                            now_eastern() - last_post_aware
-                        ).total_seconds()
-                        logger.debug(
-                            f"⏱️ Time since last post: {time_since_last:.0f}s (need {bot.auto_post_interval}s)"
-                        )
-
-                        # Check if we need to wait longer before next post
+                    elif reason == "disabled":
+                        logger.debug("⏸️ Auto-posting disabled, waiting for the interval to be set")
+                    elif reason == "interval":
+                        logger.debug(f"⏳ Not time yet, waiting {delay / 60:.1f} minutes more")
+
+                        # Look-ahead: select the next post and run its AI work and
+                        # media download before the slot, so posting only uploads
+                        lookahead = float(config.get("automation.lookahead_seconds", 120))
                         if (
-                            time_since_last < bot.auto_post_interval
-                            and not bot.force_auto_post
+                            delay <= lookahead
+                            and not bot.has_prepared_post
+                            and lookahead_slot != bot.last_post_time
                         ):
-                            remaining = bot.auto_post_interval - time_since_last
-                            remaining_minutes = remaining / 60
-                            logger.debug(f"⏳ Not time yet, waiting {remaining_minutes:.1f} minutes more")
-                            await asyncio.sleep(60)  # Check every minute
-                            continue
+                            lookahead_slot = bot.last_post_time  # One attempt per slot
+                            await bot.prepare_next_post()
+                            continue  # Re-check the clock after preparing
+                        if delay > lookahead:
+                            timeout = delay - lookahead  # Wake for the look-ahead window
+
+                    # Breaking news may end the wait once its minimum gap has
+                    # passed; until then, wake when it does
+                    listen_breaking = False
+                    if reason in ("interval", "retry"):
+                        held_back = max(seconds_until_breaking_allowed(bot), breaking_retry_at - now)
+                        if held_back > 0:
+                            timeout = min(timeout, held_back)
                         else:
-                            logger.debug("📅 Ready to post - time interval met")
-                    except Exception as tz_error:
-                        logger.error(f"❌ Auto-post timezone calculation error: {tz_error}")
-                        # If there's a timezone error, wait and try again
-                        await asyncio.sleep(60)
-                        continue
-                elif not bot.last_post_time:
-                    logger.debug("📅 No previous post time recorded - ready to post")
-                else:
-                    logger.debug("📅 Ready to post - all conditions met")
+                            listen_breaking = True
+
+                    if await bot.wait_for_auto_post_wakeup(timeout, breaking=listen_breaking):
+                        if reason == "retry":
+                            retry_at = 0.0  # Fresh content arrived, don't wait out the back-off
+                        elif not await post_breaking_news(bot):
+                            breaking_retry_at = time_module.monotonic() + 60
+                    continue
 
                 # Reset force flag if it was set (one-time override)
                 if bot.force_auto_post:
@@ -650,11 +739,37 @@ async def auto_post_task(bot: "NewsBot"):
                 # Verify the fetch_and_post_auto method is available
                 if not hasattr(bot, "fetch_and_post_auto"):
                     logger.error("❌ No fetch_and_post_auto method found on bot!")
-                    await asyncio.sleep(300)  # Wait 5 minutes before retrying
+                    back_off(300)  # Wait 5 minutes before retrying
                     continue
 
                 logger.debug("✅ Found fetch_and_post_auto method on bot")
 
+                # A post staged during the look-ahead window only needs uploading
+                channel = await bot.post_prepared()
+                if channel:
+                    await record_auto_post(bot, channel)
+                    continue
+
+                # Pushed messages next: the NewMessage handler has already
+                # queued whatever arrived since the last post, so no polling
+                # is needed unless the queue has nothing postable
+                channel = await bot.post_from_ingest_queue()
+                if channel:
+                    await record_auto_post(bot, channel)
+                    continue
+
+                # Concurrent mode: query every active channel at once and post
+                # the best candidate, instead of walking the rotation one by one
+                if config.get("automation.fetch_mode", "rotation") == "concurrent":
+                    channel = await bot.fetch_and_post_best()
+                    if channel:
+                        await record_auto_post(bot, channel)
+                    else:
+                        logger.info("ℹ️ No suitable content found in any active channel")
+                        logger.info("⏳ Waiting 10 minutes before next multi-channel attempt...")
+                        back_off(600)
+                    continue
+
                 # Channel selection and posting attempt
                 try:
                     # Enhanced multi-channel fallback system
@@ -664,17 +779,19 @@ async def auto_post_task(bot: "NewsBot"):
                     posting_successful = False
                     
                     for attempt in range(max_channel_attempts):
-                        # Get the next channel using rotation system for fairness
-                        channel = await bot.json_cache.get_next_channel_for_rotation()
+                        # Get the next channel using rotation system for fairness,
+                        # or by publish rate in adaptive mode
+                        channel = await bot.next_channel_to_poll(channels_tried)
 
                         if not channel:
+                            if config.get("automation.channel_selection", "rotation") != "rotation":
+                                break  # No channel due for polling, or none left to try
                             logger.warning(
                                 "⚠️ No active channels configured for auto-posting"
                             )
                             logger.info(
                                 "💡 Use /admin channels activate <channel_name> to add channels for auto-posting"
                             )
-                            await asyncio.sleep(300)  # Wait 5 minutes before retrying
                             break
 
                         # Skip if we already tried this channel in this cycle
@@ -710,10 +827,7 @@ async def auto_post_task(bot: "NewsBot"):
                             continue
                     
                     # After trying multiple channels
-                    if posting_successful:
-                        # Brief pause before next check to allow interval timing
-                        await asyncio.sleep(60)
-                    else:
+                    if not posting_successful:
                         # No content found in any of the attempted channels
                         if channels_tried:
                             logger.info(f"ℹ️ No suitable content found in any channels tried: {', '.join(channels_tried)}")
@@ -722,11 +836,11 @@ async def auto_post_task(bot: "NewsBot"):
                         
                         # Wait longer before trying again (but less than full interval)
                         logger.info("⏳ Waiting 10 minutes before next multi-channel attempt...")
-                        await asyncio.sleep(600)  # Wait 10 minutes before next attempt
+                        back_off(600)  # Wait 10 minutes before next attempt
 
                 except Exception as e:
                     logger.error(f"❌ Auto-post failed: {str(e)}")
-                    await asyncio.sleep(300)  # Wait 5 minutes on error
+                    back_off(300)  # Wait 5 minutes on error
 
             except Exception as e:
                 logger.error(f"❌ Auto-post loop error: {str(e)}")
@@ -735,3 +849,57 @@ async def auto_post_task(bot: "NewsBot"):
     except asyncio.CancelledError:
         logger.info("🔄 Auto-post task stopped")
         raise
+
+
+async def scheduled_post_task(bot: "NewsBot"):
+    """
+    Background task that posts scheduled post jobs when they fall due.
+
+    Jobs live in the bot's state store (see src.cache.post_jobs), so posts
+    scheduled before a restart are picked up again here. The task sleeps
+    until the earliest job is due and wakes early whenever a job is added.
+
+    Args:
+        bot (NewsBot): The bot instance containing configuration and state
+
+    Note:
+        This task runs indefinitely until the bot shuts down.
+    """
+    logger.info("🔄 Starting scheduled post task")
+    store = get_post_job_store(bot)
+
+    try:
+        while True:
+            try:
+                if not await store.load():
+                    await asyncio.sleep(60)
+                    continue
+
+                job = store.next_job()
+                if job is None:
+                    await store.wait_for_change(None)
+                    continue
+
+                delay = store.seconds_until(job)
+                if delay > 0:
+                    await store.wait_for_change(delay)
+                    continue
+
+                fetch_commands = getattr(bot, "fetch_commands", None)
+                if not fetch_commands:
+                    logger.debug("⏳ Scheduled post due, waiting for the fetch commands to load")
+                    await store.wait_for_change(60)
+                    continue
+
+                # Each job gets one attempt; the message stays blacklisted
+                # either way, so a failed job is dropped rather than retried
+                await fetch_commands.execute_post_job(job)
+                await store.remove(job.job_id)
+
+            except Exception as e:
+                logger.error(f"❌ Scheduled post loop error: {str(e)}")
+                await asyncio.sleep(60)
+
+    except asyncio.CancelledError:
+        logger.info("🔄 Scheduled post task stopped")
+        raise
@@ -49,7 +49,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.blacklist_store import BlacklistStore
+from src.cache.cache_factory import create_cache
+from src.cache.channel_cursors import ChannelCursors
+from src.cache.channel_rates import ChannelRates, get_channel_rates
+from src.cache.channel_yield import ChannelYieldStore, get_channel_yield
 from src.cache.json_cache import JSONCache
+from src.cache.post_jobs import PostJobStore
 from src.components.decorators.performance_tracking import track_auto_post_performance
 from src.core.unified_config import unified_config as config
 from src.monitoring.health_check import HealthCheckService
@@ -58,6 +64,7 @@ from src.security.rbac import RBACManager
 from src.utils.base_logger import base_logger as logger
 from src.utils.error_handler import error_handler
 from src.utils.logger import get_logger
+from src.utils.openai_client import openai_clients
 from src.utils.structured_logger import structured_logger, StructuredLogger
 from src.utils.task_manager import set_bot_instance, task_manager
 from src.utils.timezone_utils import now_eastern
@@ -123,7 +130,9 @@ class NewsBot(discord.Client):
         # Bot state tracking
         self.startup_time: Optional[datetime.datetime] = None
         self.last_post_time: Optional[datetime.datetime] = None
-        self.force_auto_post: bool = False
+        self._auto_post_wakeup = asyncio.Event()  # Wakes the auto-post scheduler early
+        self._force_auto_post: bool = False
+        self._backfill_requested: bool = False  # Catch up on missed messages
         
         # Initialize auto_post_interval from simple config manager (in seconds)
         try:
@@ -148,6 +157,11 @@ class NewsBot(discord.Client):
 
         # Core systems initialization
         self.json_cache: Optional[JSONCache] = None
+        self.blacklist_store: Optional[BlacklistStore] = None
+        self.channel_cursors: Optional[ChannelCursors] = None
+        self.channel_rates: Optional[ChannelRates] = None
+        self.channel_yield: Optional[ChannelYieldStore] = None
+        self.post_jobs: Optional[PostJobStore] = None
         self.rbac: Optional[RBACManager] = None
         self.telegram_client: Optional[Any] = None
 
@@ -206,10 +220,30 @@ class NewsBot(discord.Client):
             Exception: If any core system fails to initialize
         """
         try:
-            # Initialize JSON cache for persistent data storage
-            self.json_cache = JSONCache()
+            # Initialize the configured cache backend for persistent data storage
+            self.json_cache = create_cache()
             await self.json_cache.initialize()
-            logger.info("✅ JSON cache system initialized")
+            logger.info(f"✅ {type(self.json_cache).__name__} system initialized")
+
+            # Load the channel-scoped blacklist index from the cache
+            self.blacklist_store = BlacklistStore(self.json_cache)
+            await self.blacklist_store.load()
+
+            # Load the per-channel last seen message IDs used for min_id fetches
+            self.channel_cursors = ChannelCursors(self.json_cache)
+            await self.channel_cursors.load()
+
+            # Load per-channel publish rates for adaptive polling
+            self.channel_rates = ChannelRates(self.json_cache)
+            await self.channel_rates.load()
+
+            # Load per-channel post yield statistics for the bandit scheduler
+            self.channel_yield = ChannelYieldStore(self.json_cache)
+            await self.channel_yield.load()
+
+            # Load posts scheduled before a restart; the scheduled post task runs them
+            self.post_jobs = PostJobStore(self.json_cache)
+            await self.post_jobs.load()
 
             # Initialize role-based access control
             self.rbac = RBACManager()
@@ -669,6 +703,32 @@ class NewsBot(discord.Client):
         # Convert minutes to seconds for internal storage
         self.auto_post_interval = minutes * 60 if minutes > 0 else 0
         logger.info(f"⏰ Auto-post interval set to {minutes} minutes ({self.auto_post_interval} seconds)")
+        self.wake_auto_poster("interval changed")
+
+    @property
+    def force_auto_post(self) -> bool:
+        """One-time flag to post on the next scheduler pass regardless of the interval."""
+        return self._force_auto_post
+
+    @force_auto_post.setter
+    def force_auto_post(self, value: bool) -> None:
+        self._force_auto_post = value
+        if value:
+            self.wake_auto_poster("force post requested")
+
+    def wake_auto_poster(self, reason: str) -> None:
+        """
+        Wake the auto-post scheduler so it recomputes its next due time now.
+
+        Call this whenever something the schedule depends on changes: the
+        force flag, the interval, the startup protection or a manual
+        verification delay being lifted.
+
+        Args:
+            reason: What changed, for the logs
+        """
+        logger.debug(f"⏰ Waking auto-poster: {reason}")
+        self._auto_post_wakeup.set()
 
     def enable_auto_post_after_startup(self) -> None:
         """
@@ -678,6 +738,7 @@ class NewsBot(discord.Client):
         """
         self.disable_auto_post_on_startup = False
         logger.info("🚀 Auto-posting enabled - bot can now post automatically")
+        self.wake_auto_poster("startup protection lifted")
 
     def mark_just_posted(self) -> None:
         """
@@ -891,6 +952,261 @@ class NewsBot(discord.Client):
             # Just log the error and continue
             return False
 
+    @track_auto_post_performance
+    async def fetch_and_post_best(self) -> Optional[str]:
+        """
+        Query all active channels concurrently and post the best candidate.
+
+        Channels are passed to FetchCommands in rotation order, starting after
+        the last channel posted from, so equally ranked candidates rotate
+        fairly. In adaptive mode only the channels due for polling are
+        queried; in bandit mode channels are ordered by expected yield. On
+        success the rotation is advanced to the chosen channel.
+
+        Returns:
+            Optional[str]: The channel a post was scheduled from, or None if
+                no channel had suitable content or the operation failed.
+        """
+        try:
+            if not hasattr(self, 'telegram_client') or not self.telegram_client:
+                logger.warning("⚠️ Telegram client not available for auto-posting")
+                return None
+
+            if not hasattr(self, 'fetch_commands') or not self.fetch_commands:
+                logger.error("⚠️ FetchCommands instance not found for auto-posting")
+                return None
+
+            channels = await self._channels_in_rotation_order()
+            if not channels:
+                logger.warning("⚠️ No active channels configured for auto-posting")
+                return None
+            channels = await self._channels_to_poll(channels)
+            if not channels:
+                return None
+
+            logger.info(f"📡 Querying {len(channels)} channels concurrently for auto-post")
+            channel = await self.fetch_commands.fetch_and_post_best(channels)
+
+            if channel:
+                await self.json_cache.set_last_channel_name(channel)
+                logger.info(f"✅ Auto-post completed successfully for {channel}")
+            return channel
+
+        except Exception as e:
+            logger.error(f"❌ Multi-channel auto-post failed: {e}")
+            self.record_error(f"Auto-post failed: {str(e)}", "auto_post")
+            return None
+
+    async def _channels_in_rotation_order(self) -> list:
+        """Active channels, starting after the last channel posted from."""
+        channels = await self.json_cache.list_telegram_channels("activated")
+        last_channel = await self.json_cache.get_last_channel_name()
+        if last_channel in channels:
+            start = channels.index(last_channel) + 1
+            channels = channels[start:] + channels[:start]
+        return channels
+
+    async def _channels_to_poll(self, channels: list) -> list:
+        """
+        Filter and order channels per automation.channel_selection.
+
+        - "adaptive": only channels whose poll interval has passed, busiest
+          more likely first (see ChannelRates.due_channels())
+        - "bandit": all channels, ordered by a Thompson sample of their post
+          yield (see ChannelYieldStore.order())
+        - "rotation": channels unchanged
+        """
+        mode = config.get("automation.channel_selection", "rotation")
+        if not channels or mode not in ("adaptive", "bandit"):
+            return channels
+        if mode == "bandit":
+            store = get_channel_yield(self)
+            await store.load()
+            return store.order(channels)
+        rates = get_channel_rates(self)
+        await rates.load()
+        due = rates.due_channels(channels)
+        if not due:
+            wait = min(rates.seconds_until_due(channel) for channel in channels)
+            logger.info(f"⏳ No channel due for polling, next one in {wait / 60:.1f} minutes")
+        return due
+
+    async def next_channel_to_poll(self, exclude=()) -> Optional[str]:
+        """
+        Return the next channel for the one-channel-at-a-time auto-post path.
+
+        In rotation mode this advances the stored rotation; in adaptive mode
+        it picks among the channels due for polling, weighted by publish
+        rate, and in bandit mode by Thompson sampling over post yield.
+
+        Args:
+            exclude: Channels already tried this cycle
+
+        Returns:
+            Optional[str]: The channel to fetch from, or None
+        """
+        if config.get("automation.channel_selection", "rotation") == "rotation":
+            return await self.json_cache.get_next_channel_for_rotation()
+        channels = await self.json_cache.list_telegram_channels("activated")
+        channels = [channel for channel in channels if channel not in exclude]
+        ordered = await self._channels_to_poll(channels)
+        return ordered[0] if ordered else None
+
+    async def prepare_next_post(self) -> Optional[str]:
+        """
+        Select and stage the next auto-post ahead of its slot.
+
+        In rotation mode only the next few channels of the rotation are
+        considered, mirroring the regular multi-channel fallback; in
+        concurrent mode every active channel is.
+
+        Returns:
+            Optional[str]: The channel of the staged post, or None
+        """
+        try:
+            if not self.telegram_client or not getattr(self, 'fetch_commands', None):
+                return None
+            channels = await self._channels_to_poll(await self._channels_in_rotation_order())
+            if config.get("automation.fetch_mode", "rotation") != "concurrent":
+                channels = channels[:3]
+            return await self.fetch_commands.prepare_next_post(channels)
+        except Exception as e:
+            logger.error(f"❌ Look-ahead preparation failed: {e}")
+            return None
+
+    def request_backfill(self, reason: str) -> None:
+        """
+        Ask the auto-poster to catch up on messages missed during downtime.
+
+        Called whenever the Telegram client (re)connects; the catch-up runs
+        on the auto-poster's next pass once posting is allowed.
+
+        Args:
+            reason: Why a catch-up is needed, for the logs
+        """
+        if not config.get("automation.backfill.enabled", True):
+            return
+        logger.info(f"📚 Backfill requested: {reason}")
+        self._backfill_requested = True
+        self.wake_auto_poster("backfill requested")
+
+    @property
+    def backfill_pending(self) -> bool:
+        """Whether a catch-up has been requested and not run yet."""
+        return self._backfill_requested
+
+    async def run_backfill(self) -> list:
+        """
+        Catch up on every active channel (see FetchCommands.backfill()).
+
+        Returns:
+            list: The channels of the scheduled catch-up posts, best first
+        """
+        self._backfill_requested = False
+        try:
+            if not self.telegram_client or not getattr(self, 'fetch_commands', None):
+                return []
+            channels = await self._channels_in_rotation_order()
+            if not channels:
+                return []
+            logger.info(f"📚 Catching up on {len(channels)} channels")
+            return await self.fetch_commands.backfill(channels)
+        except Exception as e:
+            logger.error(f"❌ Backfill failed: {e}")
+            self.record_error(f"Backfill failed: {str(e)}", "auto_post")
+            return []
+
+    @property
+    def has_prepared_post(self) -> bool:
+        """Whether a staged post is waiting for the next slot."""
+        fetch_commands = getattr(self, 'fetch_commands', None)
+        return bool(fetch_commands and fetch_commands.prepared_post is not None)
+
+    @track_auto_post_performance
+    async def post_prepared(self) -> Optional[str]:
+        """
+        Upload the post staged by prepare_next_post().
+
+        Returns:
+            Optional[str]: The channel posted from, or None if nothing was
+                staged or the upload failed.
+        """
+        try:
+            if not self.has_prepared_post:
+                return None
+            channel = await self.fetch_commands.post_prepared()
+            if channel:
+                await self.json_cache.set_last_channel_name(channel)
+                logger.info(f"✅ Auto-post completed successfully for {channel}")
+            return channel
+        except Exception as e:
+            logger.error(f"❌ Staged auto-post failed: {e}")
+            self.record_error(f"Auto-post failed: {str(e)}", "auto_post")
+            return None
+
+    @track_auto_post_performance
+    async def post_from_ingest_queue(self, breaking_only: bool = False) -> Optional[str]:
+        """
+        Post the best message pushed by Telegram since the last post.
+
+        Args:
+            breaking_only: Only consider messages flagged as breaking news
+
+        Returns:
+            Optional[str]: The channel a post was scheduled from, or None if
+                the queue held no suitable content or the operation failed.
+        """
+        try:
+            queue = self.ingest_queue
+            if not queue or not hasattr(self, 'fetch_commands') or not self.fetch_commands:
+                return None
+            if breaking_only and not queue.has_breaking():
+                return None
+
+            logger.info(f"📥 Posting from ingest queue ({len(queue)} queued)")
+            channel = await self.fetch_commands.post_from_ingest_queue(breaking_only=breaking_only)
+            if channel:
+                logger.info(f"✅ Auto-post completed successfully for {channel}")
+            return channel
+
+        except Exception as e:
+            logger.error(f"❌ Ingest queue auto-post failed: {e}")
+            self.record_error(f"Auto-post failed: {str(e)}", "auto_post")
+            return None
+
+    async def wait_for_auto_post_wakeup(self, timeout: Optional[float], breaking: bool = True) -> bool:
+        """
+        Sleep until the auto-poster's next deadline or until woken early.
+
+        wake_auto_poster() always ends the wait; a breaking message pushed
+        into the ingest queue ends it too when breaking is True.
+
+        Args:
+            timeout: Seconds until the deadline, or None to wait for a wake-up
+            breaking: Whether breaking news should end the wait
+
+        Returns:
+            bool: True if a breaking message is waiting in the ingest queue
+        """
+        queue = self.ingest_queue if breaking else None
+        waiters = [asyncio.ensure_future(self._auto_post_wakeup.wait())]
+        if queue is not None:
+            waiters.append(asyncio.ensure_future(queue.wait_for_breaking(timeout)))
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        self._auto_post_wakeup.clear()
+        return queue is not None and queue.has_breaking()
+
+    @property
+    def ingest_queue(self):
+        """The Telegram push-ingestion queue, or None if push ingestion is off."""
+        if not config.get("automation.push_ingest", True):
+            return None
+        return getattr(self.telegram_client, 'ingest_queue', None)
+
     async def close(self) -> None:
         """
         Clean shutdown of the bot and all its systems.
@@ -959,13 +1275,19 @@ class NewsBot(discord.Client):
             # Save final cache state with timeout
             try:
                 if self.json_cache:
-                    await asyncio.wait_for(self.json_cache.save(), timeout=2.0)  # Reduced from 3.0
+                    await asyncio.wait_for(self.json_cache.close(), timeout=2.0)  # Reduced from 3.0
                     logger.info("💾 Final cache save completed")
             except asyncio.TimeoutError:
                 logger.warning("🛑 Cache save timeout")
             except Exception as e:
                 logger.error(f"❌ Error saving cache: {e}")
 
+            # Close the shared OpenAI connection pool
+            try:
+                await asyncio.wait_for(openai_clients.close(), timeout=2.0)
+            except asyncio.TimeoutError:
+                logger.warning("🛑 OpenAI client close timeout")
+
             # Call parent close method with shorter timeout
             try:
                 await asyncio.wait_for(super().close(), timeout=3.0)  # Reduced from 5.0
@@ -1,5 +1,5 @@
 # =============================================================================
 # NewsBot Cache Package
 # =============================================================================
-# Caching implementations including JSON and Redis-based solutions
+# Caching implementations including JSON, SQLite and Redis-based solutions
 # Last updated: 2025-01-16
@@ -0,0 +1,324 @@
+# =============================================================================
+# NewsBot Blacklist Store Module
+# =============================================================================
+# This module provides the blacklist of already handled Telegram posts,
+# keyed by (channel, message_id) since Telegram message IDs are only unique
+# within a channel. Lookups are served from in-memory sets, optionally
+# fronted by a Bloom filter, and each addition is persisted as a single
+# entry through the cache backend. Entries age out after a retention horizon,
+# with per-channel high-water marks keeping older IDs implicitly blacklisted.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import datetime
+import hashlib
+import math
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+# Entries stored without a channel (the legacy flat list) apply to every channel
+GLOBAL_CHANNEL = ""
+LEGACY_BLACKLIST_KEY = "blacklisted_posts"
+HIGH_WATER_MARKS_KEY = "blacklist_high_water_marks"
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_COMPACT_INTERVAL_HOURS = 24
+
+
+def normalize_channel(channel: Optional[str]) -> str:
+    """Normalize a channel name for use as a blacklist scope."""
+    return (channel or GLOBAL_CHANNEL).strip().lower().lstrip("@")
+
+
+def _parse_timestamp(value: Optional[Union[str, int, float]]) -> Optional[float]:
+    """Convert a naive UTC ISO timestamp (or epoch seconds) to epoch seconds."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+# =============================================================================
+# Bloom Filter
+# =============================================================================
+class BloomFilter:
+    """
+    Minimal Bloom filter for fast negative membership checks.
+
+    A negative answer is definitive; a positive answer must be confirmed
+    against the exact set. The filter doubles its capacity when full.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001):
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.size = max(
+            int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)), 8
+        )
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+# =============================================================================
+# Blacklist Store Main Class
+# =============================================================================
+class BlacklistStore:
+    """
+    Channel-scoped blacklist of Telegram posts.
+
+    Features:
+    - (channel, message_id) keys with per-channel sets for O(1) lookups
+    - Global entries (no channel) honoured for every channel
+    - Optional Bloom filter in front of the exact sets
+    - Incremental persistence: one backend entry per addition
+    - Retention horizon: entries older than blacklist.retention_days are
+      dropped during periodic compaction
+    - Per-channel high-water marks: when entries of a channel age out, the
+      highest dropped ID becomes the channel's mark and every ID at or below
+      it stays implicitly blacklisted
+    """
+
+    def __init__(self, cache, use_bloom_filter: Optional[bool] = None):
+        self.cache = cache
+        if use_bloom_filter is None:
+            use_bloom_filter = config.get("blacklist.bloom_filter", False)
+        self.use_bloom_filter = bool(use_bloom_filter)
+        self.retention_days = float(
+            config.get("blacklist.retention_days", DEFAULT_RETENTION_DAYS)
+        )
+        self.use_high_water_marks = bool(config.get("blacklist.high_water_marks", True))
+        self.compact_interval = (
+            float(config.get("blacklist.compact_interval_hours", DEFAULT_COMPACT_INTERVAL_HOURS))
+            * 3600
+        )
+        # channel -> message_id -> added_at (epoch seconds, None if unknown)
+        self._entries: Dict[str, Dict[int, Optional[float]]] = {}
+        self._high_water_marks: Dict[str, int] = {}
+        self._bloom: Optional[BloomFilter] = None
+        self._loaded = False
+        self._last_compacted = 0.0
+        self._load_lock = asyncio.Lock()
+
+    # =========================================================================
+    # Loading Methods
+    # =========================================================================
+    async def load(self) -> bool:
+        """Load all entries from the cache backend once and compact them."""
+        if self._loaded:
+            return True
+        async with self._load_lock:
+            if self._loaded:
+                return True
+            try:
+                entries: Dict[str, Dict[int, Optional[float]]] = {}
+                for channel, message_id, added_at in await self.cache.get_blacklist_entries():
+                    entries.setdefault(normalize_channel(channel), {})[int(message_id)] = (
+                        _parse_timestamp(added_at)
+                    )
+                self._entries = entries
+                marks = await self.cache.get(HIGH_WATER_MARKS_KEY, {}) or {}
+                self._high_water_marks = {
+                    normalize_channel(channel): int(message_id)
+                    for channel, message_id in marks.items()
+                }
+                self._loaded = True
+                await self.compact()
+                logger.debug(f"[BLACKLIST] Loaded {len(self)} blacklisted posts across {len(entries)} scopes")
+                return True
+            except Exception as e:
+                logger.error(f"❌ [BLACKLIST] Failed to load blacklist: {e}")
+                return False
+
+    def _rebuild_bloom(self):
+        if not self.use_bloom_filter:
+            self._bloom = None
+            return
+        self._bloom = BloomFilter(capacity=max(len(self) * 2, 10000))
+        for channel, message_ids in self._entries.items():
+            for message_id in message_ids:
+                self._bloom.add(f"{channel}:{message_id}")
+
+    def __len__(self) -> int:
+        return sum(len(message_ids) for message_ids in self._entries.values())
+
+    # =========================================================================
+    # Retention and Compaction Methods
+    # =========================================================================
+    async def compact(self) -> int:
+        """
+        Drop entries past the retention horizon and advance high-water marks.
+
+        Entries without a timestamp (from the legacy flat list) are stamped
+        with the current time so they age out like everything else.
+
+        Returns:
+            int: Number of entries removed
+        """
+        try:
+            now = time.time()
+            self._last_compacted = now
+
+            # Adopt untimestamped legacy entries into the scoped store
+            legacy = [
+                (channel, message_id)
+                for channel, message_ids in self._entries.items()
+                for message_id, added_at in message_ids.items()
+                if added_at is None
+            ]
+            if legacy:
+                stamp = datetime.datetime.utcfromtimestamp(now).isoformat()
+                for channel, message_id in legacy:
+                    self._entries[channel][message_id] = now
+                    await self.cache.add_blacklist_entry(channel, message_id, stamp)
+                # Only the JSON backend keeps a separate, untimestamped legacy list
+                await self.cache.delete(LEGACY_BLACKLIST_KEY)
+                logger.info(f"🧹 [BLACKLIST] Migrated {len(legacy)} legacy blacklist entries")
+
+            removed: List[Tuple[str, int]] = []
+            cutoff = now - self.retention_days * 86400 if self.retention_days > 0 else None
+            marks_changed = False
+            for channel, message_ids in self._entries.items():
+                expired = [
+                    message_id
+                    for message_id, added_at in message_ids.items()
+                    if cutoff is not None and added_at is not None and added_at < cutoff
+                ]
+                if self.use_high_water_marks and channel != GLOBAL_CHANNEL:
+                    if expired and max(expired) > self._high_water_marks.get(channel, -1):
+                        self._high_water_marks[channel] = max(expired)
+                        marks_changed = True
+                    # Entries at or below the mark are covered by it
+                    mark = self._high_water_marks.get(channel, -1)
+                    expired = [message_id for message_id in message_ids if message_id <= mark]
+                for message_id in expired:
+                    del message_ids[message_id]
+                    removed.append((channel, message_id))
+
+            if removed:
+                await self.cache.remove_blacklist_entries(removed)
+                self._rebuild_bloom()
+                logger.info(f"🧹 [BLACKLIST] Compacted {len(removed)} entries, {len(self)} remain")
+            elif self._bloom is None and self.use_bloom_filter:
+                self._rebuild_bloom()
+            if marks_changed:
+                await self.cache.set(HIGH_WATER_MARKS_KEY, dict(self._high_water_marks))
+            return len(removed)
+        except Exception as e:
+            logger.error(f"❌ [BLACKLIST] Failed to compact blacklist: {e}")
+            return 0
+
+    # =========================================================================
+    # Lookup and Update Methods
+    # =========================================================================
+    def _contains_scope(self, channel: str, message_id: int) -> bool:
+        if self._bloom is not None and f"{channel}:{message_id}" not in self._bloom:
+            return False
+        return message_id in self._entries.get(channel, ())
+
+    async def contains(self, channel: Optional[str], message_id: int) -> bool:
+        """
+        Check whether a post is blacklisted.
+
+        Args:
+            channel: Telegram channel the message belongs to
+            message_id: Telegram message ID
+
+        Returns:
+            bool: True if the post is blacklisted for this channel or globally,
+                or lies at or below the channel's high-water mark
+        """
+        await self.load()
+        message_id = int(message_id)
+        channel = normalize_channel(channel)
+        if self.use_high_water_marks and message_id <= self._high_water_marks.get(channel, -1):
+            return True
+        return self._contains_scope(channel, message_id) or self._contains_scope(
+            GLOBAL_CHANNEL, message_id
+        )
+
+    async def add(self, channel: Optional[str], message_id: int) -> bool:
+        """
+        Blacklist a post and persist the single new entry.
+
+        Args:
+            channel: Telegram channel the message belongs to
+            message_id: Telegram message ID
+
+        Returns:
+            bool: True if the post is blacklisted (newly or already), False on error
+        """
+        try:
+            await self.load()
+            message_id = int(message_id)
+            channel = normalize_channel(channel)
+            if await self.contains(channel, message_id):
+                return True
+
+            # Update the in-memory index before yielding so concurrent adds see it
+            now = time.time()
+            self._entries.setdefault(channel, {})[message_id] = now
+            if self._bloom is not None:
+                if self._bloom.count >= self._bloom.capacity:
+                    self._rebuild_bloom()
+                self._bloom.add(f"{channel}:{message_id}")
+
+            added_at = datetime.datetime.utcfromtimestamp(now).isoformat()
+            if not await self.cache.add_blacklist_entry(channel, message_id, added_at):
+                self._entries[channel].pop(message_id, None)
+                return False
+
+            if now - self._last_compacted >= self.compact_interval:
+                await self.compact()
+            return True
+        except Exception as e:
+            logger.error(f"❌ [BLACKLIST] Failed to add message {message_id} from {channel}: {e}")
+            return False
+
+
+# =============================================================================
+# Bot Integration Helpers
+# =============================================================================
+def get_blacklist_store(bot) -> BlacklistStore:
+    """Return the bot's blacklist store, creating it over the bot's cache if needed."""
+    store = getattr(bot, "blacklist_store", None)
+    if store is None:
+        store = BlacklistStore(bot.json_cache)
+        bot.blacklist_store = store
+    return store
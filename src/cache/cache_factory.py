@@ -0,0 +1,48 @@
+# =============================================================================
+# NewsBot Cache Factory Module
+# =============================================================================
+# This module selects and builds the cache backend used for persistent bot
+# state, based on the "cache.backend" configuration setting.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.json_cache import JSONCache
+from src.cache.redis_cache import RedisCache
+from src.cache.sqlite_cache import SQLiteCache
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+
+# =============================================================================
+# Cache Factory Functions
+# =============================================================================
+def create_cache(backend: str = None):
+    """
+    Create the configured cache backend.
+
+    Args:
+        backend: Backend name ("json", "sqlite" or "redis"); defaults to cache.backend
+
+    Returns:
+        A cache instance implementing the JSONCache API
+    """
+    backend = (backend or config.get("cache.backend", "json")).lower()
+    json_path = config.get("cache.json_path", "data/botdata.json")
+
+    if backend == "sqlite":
+        return SQLiteCache(
+            db_path=config.get("cache.sqlite_path", "data/botdata.db"),
+            json_path=json_path,
+        )
+
+    if backend == "redis":
+        return RedisCache(
+            url=config.get("cache.redis_url", "redis://localhost:6379/0"),
+            json_path=json_path,
+        )
+
+    if backend != "json":
+        logger.warning(f"⚠️ Unknown cache backend '{backend}', falling back to JSON")
+    return JSONCache(json_path)
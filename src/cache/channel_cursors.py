@@ -0,0 +1,158 @@
+# =============================================================================
+# NewsBot Channel Cursor Module
+# =============================================================================
+# This module tracks, per channel, the Telegram message ID up to which every
+# fetched message has been handled. Fetches ask Telegram only for messages
+# newer than that ID (min_id), so repeated cycles on quiet channels return
+# nothing instead of re-downloading the same latest message, and
+# deduplication of fetched messages no longer depends on the blacklist.
+# A cursor never moves past a fetched message that is still undecided (for
+# example a postable candidate that lost to another channel's), so it is
+# fetched again on the next cycle.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+from typing import Dict, Iterable, Set
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.blacklist_store import normalize_channel
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+LAST_SEEN_KEY = "channel_last_seen"
+
+
+# =============================================================================
+# Channel Cursor Store
+# =============================================================================
+class ChannelCursors:
+    """
+    Per-channel "last seen message ID" high-water marks.
+
+    Features:
+    - Loaded once from the cache backend, then served from memory
+    - Monotonic: a cursor only ever moves forward
+    - Gap-aware: a cursor only moves over a contiguous run of handled
+      messages, never past one a fetch returned that is still pending;
+      handled messages above it are remembered in memory (is_handled())
+    - Each advance is persisted through the backend's atomic update()
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._cursors: Dict[str, int] = {}
+        self._pending: Dict[str, Set[int]] = {}  # fetched, not yet handled
+        self._handled: Dict[str, Set[int]] = {}  # handled, above the cursor
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> bool:
+        """Load the cursors from the cache backend once."""
+        if self._loaded:
+            return True
+        async with self._load_lock:
+            if self._loaded:
+                return True
+            try:
+                stored = await self.cache.get(LAST_SEEN_KEY, {}) or {}
+                self._cursors = {
+                    normalize_channel(channel): int(message_id)
+                    for channel, message_id in stored.items()
+                }
+                self._loaded = True
+                return True
+            except Exception as e:
+                logger.error(f"❌ [CURSOR] Failed to load channel cursors: {e}")
+                return False
+
+    def get(self, channel: str) -> int:
+        """Return the last seen message ID of a channel (0 if none)."""
+        return self._cursors.get(normalize_channel(channel), 0)
+
+    def is_handled(self, channel: str, message_id: int) -> bool:
+        """Return whether a message is at or below the cursor or was handled above it."""
+        channel = normalize_channel(channel)
+        message_id = int(message_id)
+        return message_id <= self._cursors.get(channel, 0) or message_id in self._handled.get(channel, ())
+
+    def track(self, channel: str, message_ids: Iterable[int]) -> None:
+        """
+        Record the messages a fetch returned as pending.
+
+        The cursor will not move past a pending message until it is handled.
+        The set is replaced on every fetch, so a message that dropped out of
+        the fetch window no longer holds the cursor back.
+
+        Args:
+            channel: Telegram channel the messages belong to
+            message_ids: IDs of the fetched messages
+        """
+        channel = normalize_channel(channel)
+        self._pending[channel] = {
+            int(message_id) for message_id in message_ids if not self.is_handled(channel, message_id)
+        }
+
+    async def advance(self, channel: str, message_id: int) -> bool:
+        """
+        Record a message as handled, moving the channel's cursor forward.
+
+        The cursor moves to the highest handled message below the lowest
+        pending one; handled messages above a pending one are remembered
+        until the gap closes.
+
+        Args:
+            channel: Telegram channel the message belongs to
+            message_id: The handled message ID
+
+        Returns:
+            bool: True if the cursor moved, False if it was already at or
+                past message_id, is held back by a pending message, or
+                persisting failed
+        """
+        channel = normalize_channel(channel)
+        message_id = int(message_id)
+        cursor = self._cursors.get(channel, 0)
+        if message_id <= cursor:
+            return False
+        pending = self._pending.setdefault(channel, set())
+        pending.discard(message_id)
+        handled = self._handled.setdefault(channel, set())
+        handled.add(message_id)
+
+        lowest_pending = min(pending, default=None)
+        target = max(
+            (handled_id for handled_id in handled if lowest_pending is None or handled_id < lowest_pending),
+            default=cursor,
+        )
+        if target <= cursor:
+            logger.debug(f"📍 [CURSOR] {channel} held at {cursor} by pending message {lowest_pending}")
+            return False
+        self._cursors[channel] = target
+        self._handled[channel] = {handled_id for handled_id in handled if handled_id > target}
+
+        def merge(stored):
+            stored = dict(stored or {})
+            stored[channel] = max(int(stored.get(channel, 0)), target)
+            return stored
+
+        if await self.cache.update(LAST_SEEN_KEY, merge, default={}) is None:
+            logger.error(f"❌ [CURSOR] Failed to persist cursor {target} for {channel}")
+            return False
+        logger.debug(f"📍 [CURSOR] {channel} last seen message is now {target}")
+        return True
+
+
+def get_channel_cursors(bot) -> ChannelCursors:
+    """Return the bot's channel cursors, creating them over the bot's cache if needed."""
+    cursors = getattr(bot, "channel_cursors", None)
+    if cursors is None:
+        cursors = ChannelCursors(bot.json_cache)
+        bot.channel_cursors = cursors
+    return cursors
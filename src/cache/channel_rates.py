@@ -0,0 +1,220 @@
+# =============================================================================
+# NewsBot Channel Publish Rate Module
+# =============================================================================
+# This module estimates how often each Telegram channel publishes, from the
+# timestamps of the messages its fetches return. The estimate (an EWMA of
+# the gaps between messages) decides how often a channel is polled and how
+# likely it is to be picked, so the Telegram request budget goes to busy
+# channels instead of being spread evenly over quiet ones.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import math
+import random
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Iterable, List, Optional
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.blacklist_store import normalize_channel
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+CHANNEL_RATES_KEY = "channel_publish_rates"
+DEFAULT_ALPHA = 0.3  # weight of the newest gap in the EWMA
+DEFAULT_POLL_FACTOR = 0.5  # poll twice per expected gap between messages
+DEFAULT_MIN_POLL_MINUTES = 5
+DEFAULT_MAX_POLL_MINUTES = 180
+
+
+# =============================================================================
+# Channel Rate Data Class
+# =============================================================================
+@dataclass
+class ChannelRate:
+    """Publish-rate estimate of one channel."""
+    gap: Optional[float] = None  # EWMA of seconds between messages
+    last_message_at: float = 0.0  # Unix timestamp of the newest message seen
+    last_polled_at: float = 0.0  # Unix timestamp of the last fetch
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChannelRate":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+# =============================================================================
+# Channel Rate Store
+# =============================================================================
+class ChannelRates:
+    """
+    Per-channel publish-rate estimates driving adaptive polling.
+
+    Features:
+    - Loaded once from the cache backend, then served from memory
+    - EWMA of inter-message gaps, updated from every fetch result
+    - Silence since the newest message counts as a lower bound on the gap,
+      so a channel that stops publishing slows down without new messages
+    - Poll intervals and weighted channel ordering derived from the estimate
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._rates: Dict[str, ChannelRate] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> bool:
+        """Load the estimates from the cache backend once."""
+        if self._loaded:
+            return True
+        async with self._load_lock:
+            if self._loaded:
+                return True
+            try:
+                stored = await self.cache.get(CHANNEL_RATES_KEY, {}) or {}
+                self._rates = {
+                    normalize_channel(channel): ChannelRate.from_dict(data)
+                    for channel, data in stored.items()
+                }
+                self._loaded = True
+                return True
+            except Exception as e:
+                logger.error(f"❌ [RATES] Failed to load channel publish rates: {e}")
+                return False
+
+    # =========================================================================
+    # Estimation Methods
+    # =========================================================================
+    async def record_fetch(self, channel: str, messages: Iterable, complete: bool = True) -> bool:
+        """
+        Update a channel's estimate from the result of a fetch.
+
+        Args:
+            channel: Telegram channel that was fetched
+            messages: The messages the fetch returned (newer than the cursor)
+            complete: False if the fetch hit its limit, in which case the gap
+                from the previously newest message spans unseen messages and
+                is not counted
+
+        Returns:
+            bool: True if the estimate was persisted
+        """
+        channel = normalize_channel(channel)
+        now = time.time()
+        rate = self._rates.setdefault(channel, ChannelRate())
+        rate.last_polled_at = now
+
+        stamps = sorted(
+            message.date.timestamp()
+            for message in messages
+            if getattr(message, "date", None) is not None
+        )
+        stamps = [stamp for stamp in stamps if stamp > rate.last_message_at]
+        if stamps:
+            previous = rate.last_message_at if complete and rate.last_message_at else None
+            alpha = float(config.get("automation.adaptive_polling.alpha", DEFAULT_ALPHA))
+            for stamp in stamps:
+                if previous is not None:
+                    gap = max(1.0, stamp - previous)
+                    rate.gap = gap if rate.gap is None else alpha * gap + (1 - alpha) * rate.gap
+                previous = stamp
+            rate.last_message_at = stamps[-1]
+
+        snapshot = rate.to_dict()
+
+        def merge(stored):
+            stored = dict(stored or {})
+            stored[channel] = snapshot
+            return stored
+
+        if await self.cache.update(CHANNEL_RATES_KEY, merge, default={}) is None:
+            logger.error(f"❌ [RATES] Failed to persist publish rate for {channel}")
+            return False
+        if rate.gap is not None:
+            logger.debug(f"📈 [RATES] {channel} publishes every {rate.gap / 60:.1f} minutes on average")
+        return True
+
+    def expected_gap(self, channel: str, now: Optional[float] = None) -> Optional[float]:
+        """
+        Return the expected seconds between a channel's messages.
+
+        The time since the newest message is a lower bound on the current
+        gap, so long silences raise the estimate. None if the channel has
+        not been seen publishing twice yet.
+        """
+        rate = self._rates.get(normalize_channel(channel))
+        if rate is None or rate.gap is None:
+            return None
+        now = time.time() if now is None else now
+        return max(rate.gap, now - rate.last_message_at)
+
+    def poll_interval(self, channel: str, now: Optional[float] = None) -> float:
+        """
+        Return how many seconds to wait between fetches of a channel.
+
+        The expected gap times automation.adaptive_polling.poll_factor,
+        clamped to [min_poll_minutes, max_poll_minutes]. Channels without an
+        estimate are polled at the minimum interval until they have one.
+        """
+        min_interval = float(config.get("automation.adaptive_polling.min_poll_minutes", DEFAULT_MIN_POLL_MINUTES)) * 60
+        max_interval = float(config.get("automation.adaptive_polling.max_poll_minutes", DEFAULT_MAX_POLL_MINUTES)) * 60
+        gap = self.expected_gap(channel, now)
+        if gap is None:
+            return min_interval
+        factor = float(config.get("automation.adaptive_polling.poll_factor", DEFAULT_POLL_FACTOR))
+        return min(max_interval, max(min_interval, gap * factor))
+
+    def seconds_until_due(self, channel: str, now: Optional[float] = None) -> float:
+        """Seconds until a channel should be polled again (0 if it is due)."""
+        now = time.time() if now is None else now
+        rate = self._rates.get(normalize_channel(channel))
+        if rate is None:
+            return 0.0
+        return max(0.0, rate.last_polled_at + self.poll_interval(channel, now) - now)
+
+    # =========================================================================
+    # Selection Methods
+    # =========================================================================
+    def due_channels(self, channels: List[str]) -> List[str]:
+        """
+        Return the channels due for polling, busiest more likely first.
+
+        Due channels are ordered by weighted random sampling without
+        replacement, weighted by publish rate (1 / expected gap), so busy
+        channels usually come first without starving quiet ones. Channels
+        without an estimate are weighted as if they published every
+        min_poll_minutes, so they are learned quickly.
+        """
+        now = time.time()
+        min_interval = float(config.get("automation.adaptive_polling.min_poll_minutes", DEFAULT_MIN_POLL_MINUTES)) * 60
+        keyed = []
+        for channel in channels:
+            if self.seconds_until_due(channel, now) > 0:
+                continue
+            gap = self.expected_gap(channel, now) or min_interval
+            # Efraimidis-Spirakis key u ** (1 / weight), in log form since
+            # weights are tiny
+            keyed.append((math.log(1.0 - random.random()) * gap, channel))
+        keyed.sort(key=lambda item: item[0], reverse=True)
+        return [channel for _, channel in keyed]
+
+
+def get_channel_rates(bot) -> ChannelRates:
+    """Return the bot's channel publish rates, creating them over the bot's cache if needed."""
+    rates = getattr(bot, "channel_rates", None)
+    if rates is None:
+        rates = ChannelRates(bot.json_cache)
+        bot.channel_rates = rates
+    return rates
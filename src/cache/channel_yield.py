@@ -0,0 +1,176 @@
+# =============================================================================
+# NewsBot Channel Yield Module
+# =============================================================================
+# This module keeps per-channel outcome statistics of auto-post attempts:
+# how many messages were fetched, how many were filtered out (ads, spam,
+# AI rejections), how many were duplicates and whether the attempt ended in
+# a post. A Thompson-sampling scheduler uses them to send posting attempts
+# to channels likely to yield a post, instead of walking a fixed rotation.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import random
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Mapping
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.blacklist_store import normalize_channel
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+CHANNEL_YIELD_KEY = "channel_yield"
+DEFAULT_DECAY = 0.98  # weight kept by past attempts on every new one
+OUTCOMES = ("fetched", "filtered", "duplicate", "posted")
+
+
+# =============================================================================
+# Channel Yield Data Class
+# =============================================================================
+@dataclass
+class ChannelYield:
+    """Decayed outcome counts of one channel's auto-post attempts."""
+    attempts: float = 0.0
+    fetched: float = 0.0
+    filtered: float = 0.0
+    duplicate: float = 0.0
+    posted: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChannelYield":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: float(value) for key, value in data.items() if key in known})
+
+    @property
+    def failures(self) -> float:
+        return max(0.0, self.attempts - self.posted)
+
+    def sample(self) -> float:
+        """Draw a post probability from the Beta(1 + posted, 1 + failures) posterior."""
+        return random.betavariate(1.0 + self.posted, 1.0 + self.failures)
+
+    def mean(self) -> float:
+        """Posterior mean of the post probability."""
+        return (1.0 + self.posted) / (2.0 + self.attempts)
+
+
+# =============================================================================
+# Channel Yield Store
+# =============================================================================
+class ChannelYieldStore:
+    """
+    Per-channel yield statistics driving the bandit channel scheduler.
+
+    Features:
+    - Loaded once from the cache backend, then served from memory
+    - One update per auto-post attempt, persisted through the backend's
+      atomic update()
+    - Exponential decay of past attempts, so a channel's standing follows
+      changes in what it publishes
+    - Thompson sampling over a Beta posterior of each channel's post rate
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._stats: Dict[str, ChannelYield] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> bool:
+        """Load the statistics from the cache backend once."""
+        if self._loaded:
+            return True
+        async with self._load_lock:
+            if self._loaded:
+                return True
+            try:
+                stored = await self.cache.get(CHANNEL_YIELD_KEY, {}) or {}
+                self._stats = {
+                    normalize_channel(channel): ChannelYield.from_dict(data)
+                    for channel, data in stored.items()
+                }
+                self._loaded = True
+                return True
+            except Exception as e:
+                logger.error(f"❌ [YIELD] Failed to load channel yield statistics: {e}")
+                return False
+
+    def get(self, channel: str) -> ChannelYield:
+        """Return a channel's statistics (empty if it has none)."""
+        return self._stats.get(normalize_channel(channel), ChannelYield())
+
+    async def record_attempt(self, channel: str, outcomes: Mapping[str, int], posted: bool) -> bool:
+        """
+        Record the outcome of one auto-post attempt on a channel.
+
+        Args:
+            channel: Telegram channel that was tried
+            outcomes: Message counts by outcome ("fetched", "filtered",
+                "duplicate"); other keys are ignored
+            posted: Whether the attempt ended in a post from this channel
+
+        Returns:
+            bool: True if the statistics were persisted
+        """
+        channel = normalize_channel(channel)
+        decay = float(config.get("automation.bandit.decay", DEFAULT_DECAY))
+        stats = self._stats.setdefault(channel, ChannelYield())
+        for name in ("attempts",) + OUTCOMES:
+            setattr(stats, name, getattr(stats, name) * decay)
+        stats.attempts += 1
+        stats.posted += 1 if posted else 0
+        for name in ("fetched", "filtered", "duplicate"):
+            setattr(stats, name, getattr(stats, name) + outcomes.get(name, 0))
+
+        snapshot = stats.to_dict()
+
+        def merge(stored):
+            stored = dict(stored or {})
+            stored[channel] = snapshot
+            return stored
+
+        if await self.cache.update(CHANNEL_YIELD_KEY, merge, default={}) is None:
+            logger.error(f"❌ [YIELD] Failed to persist yield statistics for {channel}")
+            return False
+        logger.debug(
+            f"🎰 [YIELD] {channel}: {stats.mean():.0%} expected yield "
+            f"({stats.posted:.1f} posted of {stats.attempts:.1f} attempts)"
+        )
+        return True
+
+    def order(self, channels: List[str]) -> List[str]:
+        """
+        Order channels by a Thompson sample of their post probability.
+
+        Each channel draws once from its posterior; channels with few
+        attempts draw widely, so they keep being explored.
+        """
+        draws = [(self.get(channel).sample(), channel) for channel in channels]
+        draws.sort(key=lambda item: item[0], reverse=True)
+        return [channel for _, channel in draws]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return every channel's statistics and expected yield."""
+        return {
+            channel: {**stats.to_dict(), "expected_yield": stats.mean()}
+            for channel, stats in self._stats.items()
+        }
+
+
+def get_channel_yield(bot) -> ChannelYieldStore:
+    """Return the bot's channel yield store, creating it over the bot's cache if needed."""
+    store = getattr(bot, "channel_yield", None)
+    if store is None:
+        store = ChannelYieldStore(bot.json_cache)
+        bot.channel_yield = store
+    return store
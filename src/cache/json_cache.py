@@ -4,21 +4,87 @@
 # This module provides JSON-based caching functionality for the bot,
 # including storage for latest news, Telegram channels, and metadata
 # with comprehensive channel management capabilities.
+# The cache keeps its state in memory and writes it back to disk with a
+# debounced, atomic flush (temp file + rename), or in journal mode appends
+# one record per mutation and periodically compacts the log into a snapshot.
+# Keys set with a ttl expire lazily on access and through a periodic sweep.
+# Mutations are serialized through a single writer lock, and snapshot and
+# fsync I/O runs in a worker thread so the event loop never blocks on disk.
+# Snapshots use the versioned compact format from snapshot_codec; plain JSON
+# files from older releases are read transparently and upgraded on flush.
 # Last updated: 2025-01-16
 
 # =============================================================================
 # Standard Library Imports
 # =============================================================================
+import asyncio
+import contextlib
+import copy
 import datetime
+import heapq
 import json
 import os
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.snapshot_codec import (
+    SNAPSHOT_SCHEMA_VERSION,
+    SnapshotSchemaError,
+    decode_snapshot,
+    encode_snapshot,
+    to_epoch_seconds,
+)
+from src.core.unified_config import unified_config as config
 from src.utils.base_logger import base_logger as logger
 
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_COMPACT_INTERVAL_SECONDS = 300.0
+DEFAULT_JOURNAL_MAX_RECORDS = 1000
+PERSISTENCE_MODES = ("snapshot", "journal")
+DEFAULT_TTL_SWEEP_INTERVAL_SECONDS = 60.0
+# Reserved key holding {key: expiry epoch} for keys set with a ttl
+EXPIRY_KEY = "cache_expiry"
+
+
+# =============================================================================
+# Journal Record Helpers
+# =============================================================================
+def _lookup_path(data: Dict[str, Any], path: Sequence[str]):
+    """Return (found, value) for a nested key path."""
+    node: Any = data
+    for part in path:
+        if not isinstance(node, dict) or part not in node:
+            return False, None
+        node = node[part]
+    return True, node
+
+
+def _apply_record(data: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply one journal record to the state and return the new state."""
+    op = record.get("op")
+    if op == "reset":
+        return record.get("value") or {}
+    path = record.get("path") or []
+    if not path:
+        return data
+    parent = data
+    for part in path[:-1]:
+        if op == "del" and part not in parent:
+            return data
+        parent = parent.setdefault(part, {})
+    if op == "set":
+        parent[path[-1]] = record.get("value")
+    elif op == "del":
+        parent.pop(path[-1], None)
+    return data
+
 
 # =============================================================================
 # JSON Cache Main Class
@@ -29,21 +95,75 @@ class JSONCache:
     
     Features:
     - Persistent storage for bot data in JSON format
+    - In-memory authoritative state with dirty tracking
+    - Debounced write-back that coalesces mutations into one flush
+    - Atomic flushes (temp file + rename) so a crash never leaves a torn file
+    - Optional journal mode: append-only mutation log plus periodic compaction
+    - Serialized writers with compare-and-set and atomic update primitives
+    - Snapshot writes and fsyncs run off the event loop
     - Channel management (activation/deactivation)
     - Metadata tracking for channels
-    - Thread-safe file operations
     - Automatic directory creation
     
     Stores:
     - latest_news: List[str]
     - telegram_channels: List[str]
     - channel_metadata: Dict[str, Dict]
+    - blacklist: Dict[channel, Dict[message_id, added_at epoch seconds]]
     """
 
-    def __init__(self, json_path: str = "data/botdata.json"):
+    def __init__(
+        self,
+        json_path: str = "data/botdata.json",
+        flush_interval: Optional[float] = None,
+        persistence: Optional[str] = None,
+    ):
         self.json_path = os.path.abspath(json_path)
+        if flush_interval is None:
+            flush_interval = config.get(
+                "cache.flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+            )
+        self.flush_interval = float(flush_interval)
+
+        # Persistence mode: "snapshot" rewrites the file, "journal" appends records
+        persistence = (persistence or config.get("cache.persistence", "snapshot")).lower()
+        if persistence not in PERSISTENCE_MODES:
+            logger.warning(f"⚠️ Unknown cache persistence '{persistence}', using snapshot")
+            persistence = "snapshot"
+        self.persistence = persistence
+        self.journal_path = f"{self.json_path}.journal"
+        self.compact_interval = float(
+            config.get(
+                "cache.journal_compact_interval_seconds", DEFAULT_COMPACT_INTERVAL_SECONDS
+            )
+        )
+        self.journal_max_records = int(
+            config.get("cache.journal_max_records", DEFAULT_JOURNAL_MAX_RECORDS)
+        )
+
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._journal_file = None
+        self._journal_records = 0
+        # Every read-modify-write of the state runs under this lock
+        self._write_lock = asyncio.Lock()
+
+        # TTL bookkeeping: authoritative deadlines plus a min-heap for sweeping
+        self.ttl_sweep_interval = float(
+            config.get("cache.ttl_sweep_interval_seconds", DEFAULT_TTL_SWEEP_INTERVAL_SECONDS)
+        )
+        self._deadlines: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._sweep_task: Optional[asyncio.Task] = None
+        # Callbacks run after the set of active channels changes
+        self._channel_listeners: List[Callable[[], None]] = []
         self._ensure_file()
 
+    @property
+    def journaled(self) -> bool:
+        return self.persistence == "journal"
+
     # =========================================================================
     # Initialization Methods
     # =========================================================================
@@ -52,7 +172,11 @@ class JSONCache:
         try:
             # Ensure the data directory exists
             os.makedirs(os.path.dirname(self.json_path), exist_ok=True)
-            self._ensure_file()
+            async with self._write_lock:
+                if self._data is None:
+                    self._adopt(await asyncio.to_thread(self._load_state))
+                if self._flush_due():
+                    await self._flush_locked()
             logger.info(f"✅ JSON cache initialized at {self.json_path}")
         except Exception as e:
             logger.error(f"❌ Failed to initialize JSON cache: {e}")
@@ -62,20 +186,339 @@ class JSONCache:
         if not os.path.exists(self.json_path):
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.json_path), exist_ok=True)
-            with open(self.json_path, "w") as f:
-                json.dump({"latest_news": [], "telegram_channels": []}, f)
+            with open(self.json_path, "wb") as f:
+                f.write(encode_snapshot({"latest_news": [], "telegram_channels": []}))
 
     # =========================================================================
     # File I/O Methods
     # =========================================================================
-    def _read(self) -> Dict[str, Any]:
+    def _load(self) -> Dict[str, Any]:
+        """Load the cache file from disk, setting aside an unreadable file."""
         self._ensure_file()
-        with open(self.json_path, "r") as f:
-            return json.load(f)
+        try:
+            with open(self.json_path, "rb") as f:
+                data, version = decode_snapshot(f.read())
+            if version < SNAPSHOT_SCHEMA_VERSION:
+                # Rewritten in the current format by the next flush
+                logger.info(
+                    f"🔄 Upgrading cache snapshot from schema {version} to {SNAPSHOT_SCHEMA_VERSION}"
+                )
+                self._dirty = True
+            return data
+        except SnapshotSchemaError as e:
+            logger.error(f"❌ Cannot read cache file {self.json_path}: {e}")
+            raise
+        except ValueError as e:
+            corrupt_path = f"{self.json_path}.corrupt"
+            logger.error(
+                f"❌ Cache file is not valid JSON ({e}), moving it to {corrupt_path}"
+            )
+            os.replace(self.json_path, corrupt_path)
+            return {}
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the snapshot and replay the journal tail; blocking, thread-safe."""
+        data = self._load()
+        if self.journaled:
+            data = self._replay_journal(data)
+        return data
+
+    def _adopt(self, data: Dict[str, Any]):
+        """Install freshly loaded state and rebuild its expiry deadlines."""
+        self._data = data
+        self._rebuild_expiry()
+
+    def _read(self) -> Dict[str, Any]:
+        """Return the in-memory state, loading it from disk on first use."""
+        if self._data is None:
+            self._adopt(self._load_state())
+        return self._data
+
+    @contextlib.asynccontextmanager
+    async def _writer(self):
+        """
+        Hold the writer lock around a read-modify-write of the state.
+
+        Yields the live state; the body mutates it and calls _write(). A flush
+        that is due right away (journal over budget, or write-back disabled)
+        runs before the lock is released.
+        """
+        async with self._write_lock:
+            yield self._read()
+            if self._flush_due():
+                self._cancel_pending_flush()
+                await self._flush_locked()
+
+    def _write(self, data: Dict[str, Any], changes: Optional[Iterable[Sequence[str]]] = None):
+        """
+        Replace the in-memory state and schedule a write-back.
+
+        Args:
+            data: The new state
+            changes: Key paths touched by the mutation, journaled as records;
+                None journals the whole state
+        """
+        self._data = data
+        self._dirty = True
+        if self.journaled:
+            self._append_journal(data, changes)
+        self._schedule_flush()
+
+    def _flush_due(self) -> bool:
+        """Whether pending changes must be flushed now rather than debounced."""
+        if not self._dirty:
+            return False
+        if self.journaled:
+            return self._journal_records >= self.journal_max_records or self.compact_interval <= 0
+        return self.flush_interval <= 0
+
+    def _schedule_flush(self):
+        """Schedule a debounced flush, or flush now when no loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._cancel_pending_flush()
+            self._flush()
+            return
+        if self._flush_due():
+            # The writer holding the lock flushes on its way out
+            return
+        if self._flush_task and not self._flush_task.done():
+            return
+        interval = self.compact_interval if self.journaled else self.flush_interval
+        self._flush_task = loop.create_task(self._delayed_flush(interval))
+
+    async def _delayed_flush(self, interval: float):
+        try:
+            await asyncio.sleep(interval)
+            self._flush_task = None
+            await self._flush_async()
+        except asyncio.CancelledError:
+            pass
+
+    def _cancel_pending_flush(self):
+        if self._flush_task and not self._flush_task.done():
+            if self._flush_task is not asyncio.current_task():
+                self._flush_task.cancel()
+        self._flush_task = None
+
+    def _write_snapshot(self, data: Dict[str, Any]) -> bool:
+        """
+        Atomically replace the cache file with an encoded snapshot; blocking.
+
+        The snapshot is written to a temporary file in the same directory and
+        then renamed over the cache file, so readers only ever see a complete
+        document. The caller must keep the state from changing meanwhile.
+
+        Returns:
+            bool: True if the snapshot is durable, False if the write failed
+        """
+        directory = os.path.dirname(self.json_path)
+        tmp_path = None
+        try:
+            payload = encode_snapshot(data)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory, prefix=".botdata-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.json_path)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to flush cache to {self.json_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return False
 
-    def _write(self, data: Dict[str, Any]):
-        with open(self.json_path, "w") as f:
-            json.dump(data, f, indent=2)
+    def _flush(self) -> bool:
+        """
+        Write the in-memory state to disk on the calling thread if it changed.
+
+        Used when no event loop is running; inside the loop, _flush_async()
+        does the same work in a worker thread. In journal mode this is the
+        compaction step: once the snapshot is durable the journal is truncated.
+
+        Returns:
+            bool: True if the state is persisted, False if the write failed
+        """
+        if not self._dirty or self._data is None:
+            return True
+        if not self._write_snapshot(self._data):
+            return False
+        self._dirty = False
+        if self.journaled:
+            self._truncate_journal()
+        return True
+
+    async def _flush_async(self) -> bool:
+        """Flush pending changes from the event loop without blocking it."""
+        async with self._write_lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self) -> bool:
+        """
+        Flush with the writer lock held.
+
+        Encoding and the blocking write both run in a worker thread; holding
+        the lock meanwhile keeps the state unchanged, so the snapshot is
+        consistent, keeps flushes ordered and, in journal mode, keeps new
+        records out of the journal until it has been truncated.
+        """
+        if not self._dirty or self._data is None:
+            return True
+        if not await asyncio.to_thread(self._write_snapshot, self._data):
+            return False
+        self._dirty = False
+        if self.journaled:
+            await asyncio.to_thread(self._truncate_journal)
+        return True
+
+    # =========================================================================
+    # Journal Methods
+    # =========================================================================
+    def _append_journal(self, data: Dict[str, Any], changes: Optional[Iterable[Sequence[str]]]):
+        """Append one compact record per changed key path to the journal."""
+        if changes is None:
+            records = [{"op": "reset", "value": data}]
+        else:
+            records = []
+            for path in changes:
+                found, value = _lookup_path(data, path)
+                if found:
+                    records.append({"op": "set", "path": list(path), "value": value})
+                else:
+                    records.append({"op": "del", "path": list(path)})
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+        for record in records:
+            self._journal_file.write(
+                json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            )
+        self._journal_file.flush()
+        self._journal_records += len(records)
+
+    def _replay_journal(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply journal records written since the last snapshot to the state."""
+        if not os.path.exists(self.journal_path):
+            return data
+        replayed = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final append from a crash; everything before it is intact
+                    logger.warning("⚠️ Ignoring incomplete record at the end of the cache journal")
+                    break
+                data = _apply_record(data, record)
+                replayed += 1
+        self._journal_records = replayed
+        if replayed:
+            self._dirty = True
+            logger.info(f"✅ Replayed {replayed} cache journal records")
+        return data
+
+    def _sync_journal(self):
+        """Force journal records to stable storage."""
+        if self._journal_file is not None:
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+
+    def _truncate_journal(self):
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._journal_records = 0
+
+    # =========================================================================
+    # Expiry Methods
+    # =========================================================================
+    def _rebuild_expiry(self):
+        """Rebuild the deadline heap from persisted expiry times."""
+        self._deadlines = {
+            key: float(deadline)
+            for key, deadline in (self._data.get(EXPIRY_KEY) or {}).items()
+        }
+        self._expiry_heap = [(deadline, key) for key, deadline in self._deadlines.items()]
+        heapq.heapify(self._expiry_heap)
+        if self._deadlines:
+            self._sweep_expired()
+            self._ensure_sweeper()
+
+    def _set_deadline(self, data: Dict[str, Any], key: str, ttl: Optional[float]) -> List[Sequence[str]]:
+        """Record (or clear) a key's deadline and return the changed paths."""
+        if ttl:
+            deadline = time.time() + float(ttl)
+            self._deadlines[key] = deadline
+            heapq.heappush(self._expiry_heap, (deadline, key))
+            data.setdefault(EXPIRY_KEY, {})[key] = deadline
+            self._ensure_sweeper()
+            return [(EXPIRY_KEY, key)]
+        if self._deadlines.pop(key, None) is not None:
+            data.get(EXPIRY_KEY, {}).pop(key, None)
+            return [(EXPIRY_KEY, key)]
+        return []
+
+    def _is_expired(self, key: str, now: Optional[float] = None) -> bool:
+        deadline = self._deadlines.get(key)
+        return deadline is not None and deadline <= (now or time.time())
+
+    def _expire_keys(self, keys: List[str]):
+        data = self._read()
+        changes: List[Sequence[str]] = []
+        for key in keys:
+            data.pop(key, None)
+            changes.append((key,))
+            changes.extend(self._set_deadline(data, key, None))
+        if changes:
+            self._write(data, changes)
+
+    def _sweep_expired(self) -> int:
+        """Pop due deadlines off the heap and drop their keys."""
+        now = time.time()
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._expiry_heap)
+            # Skip stale heap entries left behind by a later set() of the key
+            if self._deadlines.get(key) == deadline:
+                expired.append(key)
+        if expired:
+            self._expire_keys(expired)
+            logger.debug(f"Expired {len(expired)} cache keys")
+        return len(expired)
+
+    def _ensure_sweeper(self):
+        if self._sweep_task and not self._sweep_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sweep_task = loop.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self):
+        try:
+            while self._expiry_heap:
+                delay = min(
+                    self.ttl_sweep_interval,
+                    max(self._expiry_heap[0][0] - time.time(), 0),
+                )
+                await asyncio.sleep(delay)
+                async with self._writer():
+                    self._sweep_expired()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Cache TTL sweep failed: {e}")
 
     # =========================================================================
     # Basic Cache Operations
@@ -83,19 +526,47 @@ class JSONCache:
     async def save(self):
         """Explicitly save the current cache to disk and log the save."""
         try:
-            # Just re-write the file with current data
-            data = self._read()
-            self._write(data)
-            logger.info("✅ Cache saved to botdata.json")
+            if self.journaled:
+                # Records are already in the journal; make them durable
+                async with self._write_lock:
+                    await asyncio.to_thread(self._sync_journal)
+                return
+            self._cancel_pending_flush()
+            if await self._flush_async():
+                logger.info("✅ Cache saved to botdata.json")
         except Exception as e:
             logger.error(f"Failed to save cache: {str(e)}")
 
+    async def close(self):
+        """Flush pending changes (compacting the journal) on shutdown."""
+        try:
+            if self._sweep_task and not self._sweep_task.done():
+                self._sweep_task.cancel()
+            self._cancel_pending_flush()
+            if await self._flush_async():
+                logger.info("✅ Cache saved to botdata.json")
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
+        except Exception as e:
+            logger.error(f"Failed to close cache: {str(e)}")
+
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
+        """
+        Set a cache key.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Optional lifetime in seconds; setting a key without a ttl
+                makes it persistent again
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
         try:
-            data = self._read()
-            data[key] = value
-            self._write(data)
-            await self.save()
+            async with self._writer() as data:
+                self._store(data, key, value, ttl)
             return True
         except Exception as e:
             logger.error(f"Failed to set cache key {key}: {str(e)}")
@@ -104,51 +575,145 @@ class JSONCache:
     async def get(self, key: str, default: Any = None) -> Optional[Any]:
         try:
             data = self._read()
-            return data.get(key, default)
+            if self._is_expired(key):
+                async with self._writer():
+                    if self._is_expired(key):
+                        self._expire_keys([key])
+            if key not in data:
+                return default
+            # Hand out a copy so callers cannot mutate cached state in place
+            return copy.deepcopy(data[key])
         except Exception as e:
             logger.error(f"Failed to get cache key {key}: {str(e)}")
             return default
 
     async def delete(self, key: str) -> bool:
         try:
-            data = self._read()
-            if key in data:
-                del data[key]
-                self._write(data)
-                await self.save()
+            async with self._writer() as data:
+                if key in data:
+                    del data[key]
+                    self._write(data, [(key,)] + self._set_deadline(data, key, None))
             return True
         except Exception as e:
             logger.error(f"Failed to delete cache key {key}: {str(e)}")
             return False
 
+    def _store(self, data: Dict[str, Any], key: str, value: Any, ttl: Optional[float]):
+        """Assign a key inside a writer block and journal the change."""
+        data[key] = value
+        self._write(data, [(key,)] + self._set_deadline(data, key, ttl))
+
+    def _current(self, data: Dict[str, Any], key: str, default: Any = None) -> Any:
+        """Return a key's live value inside a writer block, honouring expiry."""
+        if self._is_expired(key):
+            self._expire_keys([key])
+        return data.get(key, default)
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl: int = None) -> bool:
+        """
+        Set a cache key only if its current value equals the expected one.
+
+        Args:
+            key: Cache key
+            expected: Value the key must currently hold (None for a missing key)
+            value: JSON-serializable value to store
+            ttl: Optional lifetime in seconds
+
+        Returns:
+            bool: True if the value was swapped, False if it did not match or on error
+        """
+        try:
+            async with self._writer() as data:
+                if self._current(data, key) != expected:
+                    return False
+                self._store(data, key, copy.deepcopy(value), ttl)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to compare-and-set cache key {key}: {str(e)}")
+            return False
+
+    async def update(
+        self,
+        key: str,
+        updater: Callable[[Any], Any],
+        default: Any = None,
+        ttl: int = None,
+    ) -> Optional[Any]:
+        """
+        Atomically replace a cache key with updater(current value).
+
+        The updater runs under the writer lock, so no other mutation can
+        interleave between the read and the write. It receives a copy of the
+        current value (or the default) and must return the new value; it must
+        not await.
+
+        Args:
+            key: Cache key
+            updater: Function mapping the current value to the new value
+            default: Value passed to the updater when the key is missing
+            ttl: Optional lifetime in seconds for the new value
+
+        Returns:
+            Any: A copy of the stored value, or None on error
+        """
+        try:
+            async with self._writer() as data:
+                current = copy.deepcopy(self._current(data, key, default))
+                value = updater(current)
+                self._store(data, key, value, ttl)
+                return copy.deepcopy(value)
+        except Exception as e:
+            logger.error(f"Failed to update cache key {key}: {str(e)}")
+            return None
+
     # =========================================================================
     # Telegram Channel Management Methods
     # =========================================================================
+    def add_channel_listener(self, callback: Callable[[], None]):
+        """Register a callback to run after the active channel list changes."""
+        self._channel_listeners.append(callback)
+
+    def _notify_channel_listeners(self):
+        for callback in self._channel_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Channel listener failed: {str(e)}")
+
+    @staticmethod
+    def _channel_changes(channel: str) -> List[Sequence[str]]:
+        """Key paths touched by a channel status change."""
+        return [
+            ("telegram_channels",),
+            ("deactivated_channels",),
+            ("channel_metadata", channel),
+        ]
+
     async def add_telegram_channel(self, channel: str) -> bool:
         if not channel:
             return False
         try:
-            data = self._read()
-            channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
-            # Prevent duplicate activation
-            if channel in data.get("telegram_channels", []):
-                logger.info(f"Channel {channel} is already activated.")
-                return False
-            # Remove from deactivated if present
-            if channel in data.get("deactivated_channels", []):
-                data["deactivated_channels"].remove(channel)
-            if channel not in data.get("telegram_channels", []):
-                data.setdefault("telegram_channels", []).append(channel)
-            # Update metadata
-            meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-            meta["status"] = "activated"
-            meta["date_added"] = now
-            meta["date_deactivated"] = None
-            if "notes" in meta:
-                del meta["notes"]
-            self._write(data)
-            await self.save()
+            async with self._writer() as data:
+                channel = channel.lower()
+                now = datetime.datetime.utcnow().isoformat()
+                # Prevent duplicate activation
+                if channel in data.get("telegram_channels", []):
+                    logger.info(f"Channel {channel} is already activated.")
+                    return False
+                # Remove from deactivated if present
+                if channel in data.get("deactivated_channels", []):
+                    data["deactivated_channels"].remove(channel)
+                if channel not in data.get("telegram_channels", []):
+                    data.setdefault("telegram_channels", []).append(channel)
+                # Update metadata
+                meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
+                meta["status"] = "activated"
+                meta["date_added"] = now
+                meta["date_deactivated"] = None
+                if "notes" in meta:
+                    del meta["notes"]
+                self._write(data, self._channel_changes(channel))
+            self._notify_channel_listeners()
             return True
         except Exception as e:
             logger.error(f"Failed to add telegram channel {channel}: {str(e)}")
@@ -158,25 +723,25 @@ class JSONCache:
         if not channel:
             return False
         try:
-            data = self._read()
-            channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
-            # Prevent duplicate deactivation
-            if channel in data.get("deactivated_channels", []):
-                logger.info(f"Channel {channel} is already deactivated.")
+            async with self._writer() as data:
+                channel = channel.lower()
+                now = datetime.datetime.utcnow().isoformat()
+                # Prevent duplicate deactivation
+                if channel in data.get("deactivated_channels", []):
+                    logger.info(f"Channel {channel} is already deactivated.")
+                    return False
+                if channel in data.get("telegram_channels", []):
+                    data["telegram_channels"].remove(channel)
+                    if channel not in data.get("deactivated_channels", []):
+                        data.setdefault("deactivated_channels", []).append(channel)
+                    # Update metadata
+                    meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
+                    meta["status"] = "deactivated"
+                    meta["date_deactivated"] = now
+                    self._write(data, self._channel_changes(channel))
+                    self._notify_channel_listeners()
+                    return True
                 return False
-            if channel in data.get("telegram_channels", []):
-                data["telegram_channels"].remove(channel)
-                if channel not in data.get("deactivated_channels", []):
-                    data.setdefault("deactivated_channels", []).append(channel)
-                # Update metadata
-                meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-                meta["status"] = "deactivated"
-                meta["date_deactivated"] = now
-                self._write(data)
-                await self.save()
-                return True
-            return False
         except Exception as e:
             logger.error(f"Failed to remove telegram channel {channel}: {str(e)}")
             return False
@@ -187,7 +752,9 @@ class JSONCache:
     async def get_channel_metadata(self, channel: str) -> dict:
         try:
             data = self._read()
-            return data.get("channel_metadata", {}).get(channel.lower(), {})
+            return copy.deepcopy(
+                data.get("channel_metadata", {}).get(channel.lower(), {})
+            )
         except Exception as e:
             logger.error(f"Failed to get metadata for channel {channel}: {str(e)}")
             return {}
@@ -222,35 +789,110 @@ class JSONCache:
             )
             return False
         try:
-            data = self._read()
-            channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
-            meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-            meta["status"] = status
-            if status == "deactivated":
-                meta["date_deactivated"] = now
-                # Move to deactivated_channels
-                if channel not in data.get("deactivated_channels", []):
-                    data.setdefault("deactivated_channels", []).append(channel)
-                if channel in data.get("telegram_channels", []):
-                    data["telegram_channels"].remove(channel)
-                logger.info(f"Channel {channel} marked as deactivated.")
-            elif status == "activated":
-                meta["date_deactivated"] = None
-                meta["date_added"] = now
-                # Move to telegram_channels
-                if channel not in data.get("telegram_channels", []):
-                    data.setdefault("telegram_channels", []).append(channel)
-                if channel in data.get("deactivated_channels", []):
-                    data["deactivated_channels"].remove(channel)
-                logger.info(f"Channel {channel} marked as activated.")
-            self._write(data)
-            await self.save()
+            async with self._writer() as data:
+                channel = channel.lower()
+                now = datetime.datetime.utcnow().isoformat()
+                meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
+                meta["status"] = status
+                if status == "deactivated":
+                    meta["date_deactivated"] = now
+                    # Move to deactivated_channels
+                    if channel not in data.get("deactivated_channels", []):
+                        data.setdefault("deactivated_channels", []).append(channel)
+                    if channel in data.get("telegram_channels", []):
+                        data["telegram_channels"].remove(channel)
+                    logger.info(f"Channel {channel} marked as deactivated.")
+                elif status == "activated":
+                    meta["date_deactivated"] = None
+                    meta["date_added"] = now
+                    # Move to telegram_channels
+                    if channel not in data.get("telegram_channels", []):
+                        data.setdefault("telegram_channels", []).append(channel)
+                    if channel in data.get("deactivated_channels", []):
+                        data["deactivated_channels"].remove(channel)
+                    logger.info(f"Channel {channel} marked as activated.")
+                self._write(data, self._channel_changes(channel))
+            self._notify_channel_listeners()
             return True
         except Exception as e:
             logger.error(f"Failed to set status for channel {channel}: {str(e)}")
             return False
 
+    # =========================================================================
+    # Blacklist Methods
+    # =========================================================================
+    async def get_blacklist_entries(self) -> List[Tuple[str, int, Optional[int]]]:
+        """
+        Return all blacklist entries as (channel, message_id, added_at).
+
+        added_at is in epoch seconds, as kept in memory and in the snapshot.
+        IDs from the legacy flat blacklisted_posts list are returned with an
+        empty channel and no timestamp, meaning they apply to every channel.
+        """
+        try:
+            data = self._read()
+            entries = [
+                ("", int(message_id), None)
+                for message_id in data.get("blacklisted_posts", [])
+            ]
+            for channel, message_ids in data.get("blacklist", {}).items():
+                for message_id, added_at in message_ids.items():
+                    entries.append((channel, int(message_id), added_at))
+            return entries
+        except Exception as e:
+            logger.error(f"Failed to get blacklist entries: {str(e)}")
+            return []
+
+    async def add_blacklist_entry(self, channel: str, message_id: int, added_at: str) -> bool:
+        """
+        Persist a single blacklist entry.
+
+        Args:
+            channel: Normalized channel name ("" for global)
+            message_id: Telegram message ID
+            added_at: ISO timestamp of when the entry was added
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            async with self._writer() as data:
+                key = str(int(message_id))
+                data.setdefault("blacklist", {}).setdefault(channel, {})[key] = (
+                    to_epoch_seconds(added_at)
+                )
+                self._write(data, [("blacklist", channel, key)])
+                return True
+        except Exception as e:
+            logger.error(f"Failed to add blacklist entry {channel}:{message_id}: {str(e)}")
+            return False
+
+    async def remove_blacklist_entries(self, entries: List[Tuple[str, int]]) -> bool:
+        """
+        Remove blacklist entries in one mutation.
+
+        Args:
+            entries: (channel, message_id) pairs to remove
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            async with self._writer() as data:
+                blacklist = data.get("blacklist", {})
+                changes = []
+                for channel, message_id in entries:
+                    key = str(int(message_id))
+                    if key in blacklist.get(channel, {}):
+                        del blacklist[channel][key]
+                        changes.append(("blacklist", channel, key))
+                if changes:
+                    self._write(data, changes)
+                return True
+        except Exception as e:
+            logger.error(f"Failed to remove blacklist entries: {str(e)}")
+            return False
+
     # =========================================================================
     # Channel Rotation Management Methods
     # =========================================================================
@@ -279,13 +921,12 @@ class JSONCache:
             bool: True if successful, False otherwise
         """
         try:
-            data = self._read()
-            now = datetime.datetime.utcnow().isoformat()
-            data.setdefault("channel_rotation", {})["last_index"] = index
-            data["channel_rotation"]["last_updated"] = now
-            self._write(data)
-            await self.save()
-            return True
+            async with self._writer() as data:
+                now = datetime.datetime.utcnow().isoformat()
+                data.setdefault("channel_rotation", {})["last_index"] = index
+                data["channel_rotation"]["last_updated"] = now
+                self._write(data, [("channel_rotation",)])
+                return True
         except Exception as e:
             logger.error(f"Failed to set last channel index: {str(e)}")
             return False
@@ -315,13 +956,12 @@ class JSONCache:
             bool: True if successful, False otherwise
         """
         try:
-            data = self._read()
-            now = datetime.datetime.utcnow().isoformat()
-            data.setdefault("channel_rotation", {})["last_channel"] = channel_name
-            data["channel_rotation"]["last_updated"] = now
-            self._write(data)
-            await self.save()
-            return True
+            async with self._writer() as data:
+                now = datetime.datetime.utcnow().isoformat()
+                data.setdefault("channel_rotation", {})["last_channel"] = channel_name
+                data["channel_rotation"]["last_updated"] = now
+                self._write(data, [("channel_rotation",)])
+                return True
         except Exception as e:
             logger.error(f"Failed to set last channel name: {str(e)}")
             return False
@@ -335,33 +975,38 @@ class JSONCache:
             str: The next channel name to use, or None if no channels available
         """
         try:
-            # Get active channels
-            active_channels = await self.list_telegram_channels("activated")
-            if not active_channels:
-                logger.warning("No active channels available for rotation")
-                return None
-            
-            # Get last used channel name (more robust than index)
-            last_channel_name = await self.get_last_channel_name()
-            
-            # Find the index of the last used channel
-            try:
-                last_index = active_channels.index(last_channel_name)
-            except ValueError:
-                # Last channel no longer exists, start from beginning
-                logger.info(f"Last used channel '{last_channel_name}' no longer active, starting rotation from beginning")
-                last_index = -1
-            
-            # Calculate next index (with wraparound)
-            next_index = (last_index + 1) % len(active_channels)
-            
-            # Get the next channel
-            next_channel = active_channels[next_index]
-            
-            # Update both index and channel name for backward compatibility
-            await self.set_last_channel_index(next_index)
-            await self.set_last_channel_name(next_channel)
-            
+            # Read and advance the rotation under one lock so concurrent
+            # callers are handed distinct channels
+            async with self._writer() as data:
+                active_channels = sorted(data.get("telegram_channels", []))
+                if not active_channels:
+                    logger.warning("No active channels available for rotation")
+                    return None
+
+                # Get last used channel name (more robust than index)
+                rotation = data.setdefault("channel_rotation", {})
+                last_channel_name = rotation.get("last_channel", "")
+
+                # Find the index of the last used channel
+                try:
+                    last_index = active_channels.index(last_channel_name)
+                except ValueError:
+                    # Last channel no longer exists, start from beginning
+                    logger.info(f"Last used channel '{last_channel_name}' no longer active, starting rotation from beginning")
+                    last_index = -1
+
+                # Calculate next index (with wraparound)
+                next_index = (last_index + 1) % len(active_channels)
+
+                # Get the next channel
+                next_channel = active_channels[next_index]
+
+                # Update both index and channel name for backward compatibility
+                rotation["last_index"] = next_index
+                rotation["last_channel"] = next_channel
+                rotation["last_updated"] = datetime.datetime.utcnow().isoformat()
+                self._write(data, [("channel_rotation",)])
+
             logger.info(f"Channel rotation: last_channel='{last_channel_name}', next_channel='{next_channel}' (index {next_index})")
             return next_channel
             
@@ -0,0 +1,166 @@
+# =============================================================================
+# NewsBot Scheduled Post Job Module
+# =============================================================================
+# This module keeps scheduled posts in the bot's state store instead of in
+# sleeping asyncio tasks. A job holds everything needed to post without
+# redoing AI work (translation, title, location, urgency and category), so
+# a restart between scheduling and posting neither loses the post nor pays
+# for the AI calls again. A single timer task executes due jobs.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.blacklist_store import normalize_channel
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+SCHEDULED_POSTS_KEY = "scheduled_posts"
+
+
+# =============================================================================
+# Post Job Data Class
+# =============================================================================
+@dataclass
+class PostJob:
+    """A post scheduled for a given time, with its AI results precomputed."""
+    channel: str
+    message_id: int
+    due_at: float  # Unix timestamp
+    arabic_text: str = ""
+    ai_english: Optional[str] = None
+    ai_title: Optional[str] = None
+    ai_location: Optional[str] = None
+    urgency_level: str = "normal"
+    should_ping_news: bool = False
+    content_category: str = "social"
+    quality_score: float = 0.7
+
+    @property
+    def job_id(self) -> str:
+        return f"{normalize_channel(self.channel)}:{self.message_id}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PostJob":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+# =============================================================================
+# Post Job Store
+# =============================================================================
+class PostJobStore:
+    """
+    Durable queue of scheduled posts.
+
+    Features:
+    - Loaded once from the cache backend, then served from memory
+    - Every add/remove is persisted through the backend's atomic update()
+    - Event that fires whenever the queue changes, for the timer task
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._jobs: Dict[str, PostJob] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def load(self) -> bool:
+        """Load the scheduled posts from the cache backend once."""
+        if self._loaded:
+            return True
+        async with self._load_lock:
+            if self._loaded:
+                return True
+            try:
+                stored = await self.cache.get(SCHEDULED_POSTS_KEY, {}) or {}
+                jobs = (PostJob.from_dict(data) for data in stored.values())
+                self._jobs = {job.job_id: job for job in jobs}
+                self._loaded = True
+                if self._jobs:
+                    logger.info(f"📬 [POST-JOBS] Loaded {len(self._jobs)} scheduled posts")
+                    self._changed.set()
+                return True
+            except Exception as e:
+                logger.error(f"❌ [POST-JOBS] Failed to load scheduled posts: {e}")
+                return False
+
+    async def add(self, job: PostJob) -> bool:
+        """
+        Schedule a post, replacing any job for the same message.
+
+        Returns:
+            bool: True if the job was persisted
+        """
+        job_id = job.job_id
+        self._jobs[job_id] = job
+        self._changed.set()
+
+        def merge(stored):
+            stored = dict(stored or {})
+            stored[job_id] = job.to_dict()
+            return stored
+
+        if await self.cache.update(SCHEDULED_POSTS_KEY, merge, default={}) is None:
+            logger.error(f"❌ [POST-JOBS] Failed to persist scheduled post {job_id}")
+            return False
+        return True
+
+    async def remove(self, job_id: str) -> bool:
+        """Drop a job once it has run."""
+        self._jobs.pop(job_id, None)
+        self._changed.set()
+
+        def merge(stored):
+            stored = dict(stored or {})
+            stored.pop(job_id, None)
+            return stored
+
+        if await self.cache.update(SCHEDULED_POSTS_KEY, merge, default={}) is None:
+            logger.error(f"❌ [POST-JOBS] Failed to remove scheduled post {job_id}")
+            return False
+        return True
+
+    def next_job(self) -> Optional[PostJob]:
+        """Return the job due first, or None if nothing is scheduled."""
+        if not self._jobs:
+            return None
+        return min(self._jobs.values(), key=lambda job: job.due_at)
+
+    async def wait_for_change(self, timeout: Optional[float]) -> None:
+        """Wait until a job is added or removed, or the timeout expires."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    def seconds_until(self, job: PostJob) -> float:
+        """Seconds until a job is due (0 if it is overdue)."""
+        return max(0.0, job.due_at - time.time())
+
+
+def get_post_job_store(bot) -> PostJobStore:
+    """Return the bot's scheduled post store, creating it over the bot's cache if needed."""
+    store = getattr(bot, "post_jobs", None)
+    if store is None:
+        store = PostJobStore(bot.json_cache)
+        bot.post_jobs = store
+    return store
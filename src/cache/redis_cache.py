@@ -1,9 +1,11 @@
 # =============================================================================
-# NewsBot JSON Cache Module
+# NewsBot Redis Cache Module
 # =============================================================================
-# This module provides JSON-based caching functionality for the bot including
-# channel management, news caching, and persistent data storage with
-# comprehensive metadata tracking and status management.
+# This module provides a Redis-backed implementation of the bot cache with
+# the same async API as JSONCache, so several bot processes can share state.
+# Channel metadata is stored in hashes, channel lists and blacklists in sets,
+# and channel rotation and atomic key updates use optimistic WATCH/MULTI
+# pipelines.
 # Last updated: 2025-01-16
 
 # =============================================================================
@@ -11,129 +13,481 @@
 # =============================================================================
 import datetime
 import json
+import math
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# =============================================================================
+# Third-Party Library Imports
+# =============================================================================
+import redis.asyncio as redis
+from redis.exceptions import WatchError
 
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.snapshot_codec import load_snapshot, to_iso_timestamp
+from src.core.unified_config import unified_config as config
 from src.utils.base_logger import base_logger as logger
 
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+DEFAULT_KEY_PREFIX = "newsbot:"
+MAX_ROTATION_RETRIES = 10
+MAX_UPDATE_RETRIES = 10
+MIGRATION_LOCK_SECONDS = 300  # held while one instance imports botdata.json
+
+CHANNEL_STATUSES = ("activated", "deactivated")
+CHANNEL_LIST_KEYS = {
+    "telegram_channels": "activated",
+    "deactivated_channels": "deactivated",
+}
+CHANNEL_METADATA_KEY = "channel_metadata"
+ROTATION_KEY = "channel_rotation"
+BLACKLIST_KEY = "blacklisted_posts"
+SCOPED_BLACKLIST_KEY = "blacklist"
+# Key of the JSON document holding {key: expiry epoch} for keys set with a ttl
+EXPIRY_KEY = "cache_expiry"
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().isoformat()
+
 
 # =============================================================================
-# JSON Cache Main Class
+# Redis Cache Main Class
 # =============================================================================
-class JSONCache:
+class RedisCache:
     """
-    JSON file-based cache manager for the bot.
-    
-    Features:
-    - Persistent JSON storage for bot data
-    - Telegram channel management with metadata
-    - Channel activation/deactivation tracking
-    - Automatic file creation and maintenance
-    - Error handling and logging
-    
-    Stores:
-    - latest_news: List[str]
-    - telegram_channels: List[str]
-    - deactivated_channels: List[str]
-    - channel_metadata: Dict[str, Dict]
+    Redis-backed cache manager for the bot.
+
+    Drop-in replacement for JSONCache. Generic keys are JSON strings (with
+    native expiry when a ttl is given); channels and blacklisted posts use
+    Redis hashes and sets so every operation touches only the affected
+    members.
+
+    Layout (all keys share the configured prefix):
+    - kv:<key>: JSON-encoded value
+    - channels:<status>: set of channel names per status
+    - channel:<name>: hash with status, date_added, date_deactivated, notes
+    - rotation: hash with last_index, last_channel, last_updated
+    - blacklist:scopes: set of blacklist scopes (channel names, "" = global)
+    - blacklist:<scope>: set of blacklisted message IDs
+    - blacklist_added:<scope>: hash of message ID -> added_at
     """
 
-    def __init__(self, json_path: str = "data/botdata.json"):
-        self.json_path = os.path.abspath(json_path)
-        self._ensure_file()
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Optional[redis.Redis] = None,
+        key_prefix: Optional[str] = None,
+        json_path: Optional[str] = None,
+    ):
+        self.url = url or config.get("cache.redis_url", DEFAULT_REDIS_URL)
+        self.key_prefix = key_prefix or config.get("cache.redis_prefix", DEFAULT_KEY_PREFIX)
+        self.json_path = os.path.abspath(json_path) if json_path else None
+        self._redis = client or redis.from_url(self.url, decode_responses=True)
+        # Callbacks run after this process changes the set of active channels
+        self._channel_listeners: List[Callable[[], None]] = []
 
     # =========================================================================
-    # File Management Methods
+    # Key Helpers
     # =========================================================================
-    def _ensure_file(self):
-        if not os.path.exists(self.json_path):
-            with open(self.json_path, "w") as f:
-                json.dump({"latest_news": [], "telegram_channels": []}, f)
+    def _key(self, *parts: str) -> str:
+        return self.key_prefix + ":".join(parts)
+
+    def _kv_key(self, key: str) -> str:
+        return self._key("kv", key)
+
+    def _channels_key(self, status: str) -> str:
+        return self._key("channels", status)
 
-    def _read(self) -> Dict[str, Any]:
-        self._ensure_file()
-        with open(self.json_path, "r") as f:
-            return json.load(f)
+    def _channel_key(self, channel: str) -> str:
+        return self._key("channel", channel)
 
-    def _write(self, data: Dict[str, Any]):
-        with open(self.json_path, "w") as f:
-            json.dump(data, f, indent=2)
+    def _blacklist_key(self, scope: str) -> str:
+        return self._key("blacklist", scope)
+
+    def _blacklist_added_key(self, scope: str) -> str:
+        return self._key("blacklist_added", scope)
 
     # =========================================================================
-    # Basic Cache Operations
+    # Initialization Methods
     # =========================================================================
-    async def save(self):
-        """Explicitly save the current cache to disk and log the save."""
+    async def initialize(self):
+        """Check the connection and run the one-shot JSON migration."""
+        try:
+            await self._redis.ping()
+            if self.json_path:
+                await self.migrate_from_json(self.json_path)
+            logger.info(f"✅ Redis cache initialized at {self.url}")
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize Redis cache: {e}")
+            raise
+
+    async def close(self):
+        """Close the Redis connection pool."""
         try:
-            # Just re-write the file with current data
-            data = self._read()
-            self._write(data)
-            logger.info("✅ Cache saved to botdata.json")
+            await self._redis.aclose()
         except Exception as e:
-            logger.error(f"Failed to save cache: {str(e)}")
+            logger.error(f"Failed to close Redis cache: {str(e)}")
+
+    async def migrate_from_json(self, json_path: str) -> bool:
+        """
+        Import an existing botdata.json into Redis, once.
+
+        The migrated marker is written only after every key was imported, so
+        a failed import is retried on the next start; a short-lived lock key
+        keeps concurrent instances from importing at the same time.
+
+        Args:
+            json_path: Path to the JSON cache file to import
+
+        Returns:
+            bool: True if data was imported, False if skipped or failed
+        """
+        marker = self._key("meta", "migrated_from_json")
+        lock = self._key("meta", "migrating_from_json")
+        try:
+            if not os.path.exists(json_path) or await self._redis.exists(marker):
+                return False
+            if not await self._redis.set(lock, _now(), nx=True, ex=MIGRATION_LOCK_SECONDS):
+                return False
+        except Exception as e:
+            logger.error(f"❌ Failed to migrate {json_path} into Redis cache: {e}")
+            return False
+
+        try:
+            data = load_snapshot(json_path)
+            deadlines = data.get(EXPIRY_KEY) or {}
+            now = time.time()
+
+            for key, value in data.items():
+                if key == EXPIRY_KEY:
+                    continue
+                deadline = deadlines.get(key)
+                if deadline and float(deadline) <= now:
+                    continue  # expired in the JSON cache; do not revive it
+                if key == SCOPED_BLACKLIST_KEY:
+                    for scope, message_ids in (value or {}).items():
+                        for message_id, added_at in message_ids.items():
+                            if not await self.add_blacklist_entry(
+                                scope, int(message_id), to_iso_timestamp(added_at) or _now()
+                            ):
+                                raise RuntimeError(f"blacklist entry {scope}:{message_id} not imported")
+                elif key not in CHANNEL_LIST_KEYS:
+                    ttl = math.ceil(float(deadline) - now) if deadline else None
+                    if not await self.set(key, value, ttl=ttl):
+                        raise RuntimeError(f"key {key} not imported")
+            # Lists last, so list membership wins over stale metadata status
+            for key in CHANNEL_LIST_KEYS:
+                if key in data and not await self.set(key, data[key]):
+                    raise RuntimeError(f"key {key} not imported")
+            await self._redis.set(marker, _now())
+            logger.info(f"✅ Migrated {len(data)} keys from {json_path} into Redis cache")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to migrate {json_path} into Redis cache, will retry on next start: {e}")
+            return False
+        finally:
+            try:
+                await self._redis.delete(lock)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to release Redis migration lock: {e}")
+
+    # =========================================================================
+    # Structured Key Helpers
+    # =========================================================================
+    async def _channel_names(self, status: str) -> List[str]:
+        return sorted(await self._redis.smembers(self._channels_key(status)))
+
+    async def _channel_metadata(self) -> Dict[str, Dict]:
+        names = sorted(
+            set(await self._redis.smembers(self._channels_key("activated")))
+            | set(await self._redis.smembers(self._channels_key("deactivated")))
+        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.hgetall(self._channel_key(name))
+            rows = await pipe.execute()
+        return {name: self._decode_metadata(row) for name, row in zip(names, rows)}
+
+    @staticmethod
+    def _decode_metadata(row: Dict[str, str]) -> Dict[str, Any]:
+        if not row:
+            return {}
+        meta = {
+            "status": row.get("status"),
+            "date_added": row.get("date_added"),
+            "date_deactivated": row.get("date_deactivated"),
+        }
+        if "notes" in row:
+            meta["notes"] = row["notes"]
+        return meta
+
+    def _queue_channel_status(self, pipe, channel: str, status: str, fields: Dict[str, Optional[str]]):
+        """Queue the commands that move a channel to a status on a pipeline."""
+        other = "deactivated" if status == "activated" else "activated"
+        pipe.srem(self._channels_key(other), channel)
+        pipe.sadd(self._channels_key(status), channel)
+        values = {k: v for k, v in fields.items() if v is not None}
+        values["status"] = status
+        pipe.hset(self._channel_key(channel), mapping=values)
+        cleared = [k for k, v in fields.items() if v is None]
+        if cleared:
+            pipe.hdel(self._channel_key(channel), *cleared)
+
+    async def _replace_channel_list(self, status: str, names: List[str]):
+        names = [name for name in (names or []) if name]
+        current = set(await self._redis.smembers(self._channels_key(status)))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            # Channels dropped from the list are forgotten, as with the JSON document
+            for name in current - set(names):
+                pipe.srem(self._channels_key(status), name)
+                pipe.delete(self._channel_key(name))
+            for name in names:
+                self._queue_channel_status(pipe, name, status, {})
+                pipe.hsetnx(self._channel_key(name), "date_added", _now())
+            await pipe.execute()
+
+    async def _replace_channel_metadata(self, metadata: Dict[str, Dict]):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for name, meta in (metadata or {}).items():
+                status = meta.get("status", "activated")
+                if status not in CHANNEL_STATUSES:
+                    continue
+                self._queue_channel_status(
+                    pipe,
+                    name,
+                    status,
+                    {
+                        "date_added": meta.get("date_added"),
+                        "date_deactivated": meta.get("date_deactivated"),
+                        "notes": meta.get("notes"),
+                    },
+                )
+            await pipe.execute()
+
+    async def _get_rotation(self) -> Dict[str, Any]:
+        row = await self._redis.hgetall(self._key("rotation"))
+        rotation: Dict[str, Any] = dict(row)
+        if "last_index" in rotation:
+            rotation["last_index"] = int(rotation["last_index"])
+        return rotation
+
+    async def _update_rotation(self, **fields) -> bool:
+        fields["last_updated"] = _now()
+        await self._redis.hset(
+            self._key("rotation"), mapping={k: str(v) for k, v in fields.items()}
+        )
+        return True
+
+    async def _global_blacklist_ids(self) -> List[int]:
+        return sorted(int(i) for i in await self._redis.smembers(self._blacklist_key("")))
+
+    async def _replace_global_blacklist(self, message_ids: List[int]):
+        wanted = {int(i) for i in message_ids or []}
+        current = set(await self._global_blacklist_ids())
+        now = _now()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            removed = current - wanted
+            if removed:
+                pipe.srem(self._blacklist_key(""), *removed)
+                pipe.hdel(self._blacklist_added_key(""), *removed)
+            added = wanted - current
+            if added:
+                pipe.sadd(self._key("blacklist", "scopes"), "")
+                pipe.sadd(self._blacklist_key(""), *added)
+                pipe.hset(self._blacklist_added_key(""), mapping={i: now for i in added})
+            await pipe.execute()
+
+    # =========================================================================
+    # Basic Cache Operations
+    # =========================================================================
+    async def save(self):
+        """Redis persists on the server side; nothing to flush locally."""
+        return None
 
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         try:
-            data = self._read()
-            data[key] = value
-            self._write(data)
-            await self.save()
+            if key in CHANNEL_LIST_KEYS:
+                await self._replace_channel_list(CHANNEL_LIST_KEYS[key], value)
+            elif key == CHANNEL_METADATA_KEY:
+                await self._replace_channel_metadata(value)
+            elif key == ROTATION_KEY:
+                await self._redis.delete(self._key("rotation"))
+                if value:
+                    await self._redis.hset(
+                        self._key("rotation"),
+                        mapping={k: str(v) for k, v in value.items() if v is not None},
+                    )
+            elif key == BLACKLIST_KEY:
+                await self._replace_global_blacklist(value)
+            else:
+                await self._redis.set(self._kv_key(key), json.dumps(value), ex=ttl or None)
             return True
         except Exception as e:
             logger.error(f"Failed to set cache key {key}: {str(e)}")
             return False
 
-    async def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str, default: Any = None) -> Optional[Any]:
         try:
-            data = self._read()
-            return data.get(key)
+            if key in CHANNEL_LIST_KEYS:
+                return await self._channel_names(CHANNEL_LIST_KEYS[key])
+            if key == CHANNEL_METADATA_KEY:
+                return await self._channel_metadata()
+            if key == ROTATION_KEY:
+                return await self._get_rotation() or default
+            if key == BLACKLIST_KEY:
+                return await self._global_blacklist_ids()
+            raw = await self._redis.get(self._kv_key(key))
+            return json.loads(raw) if raw is not None else default
         except Exception as e:
             logger.error(f"Failed to get cache key {key}: {str(e)}")
-            return None
+            return default
 
     async def delete(self, key: str) -> bool:
         try:
-            data = self._read()
-            if key in data:
-                del data[key]
-                self._write(data)
-                await self.save()
+            if key in CHANNEL_LIST_KEYS:
+                await self._replace_channel_list(CHANNEL_LIST_KEYS[key], [])
+            elif key == CHANNEL_METADATA_KEY:
+                for name in await self._channel_metadata():
+                    await self._redis.delete(self._channel_key(name))
+            elif key == ROTATION_KEY:
+                await self._redis.delete(self._key("rotation"))
+            elif key == BLACKLIST_KEY:
+                await self._redis.delete(self._blacklist_key(""), self._blacklist_added_key(""))
+            else:
+                await self._redis.delete(self._kv_key(key))
             return True
         except Exception as e:
             logger.error(f"Failed to delete cache key {key}: {str(e)}")
             return False
 
+    async def _watched_update(self, key: str, compute: Callable[[Any], Tuple[bool, Any]], ttl: Optional[int]):
+        """
+        Run a WATCH/MULTI read-modify-write of a generic key.
+
+        Args:
+            key: Generic (non-structured) cache key
+            compute: Maps the current value (None if missing) to (write, new value)
+            ttl: Optional lifetime in seconds for the new value
+
+        Returns:
+            Tuple[bool, Any]: Whether the value was written, and the new value
+        """
+        if key in CHANNEL_LIST_KEYS or key in (CHANNEL_METADATA_KEY, ROTATION_KEY, BLACKLIST_KEY):
+            raise ValueError(f"{key} is a structured key and cannot be updated atomically")
+        redis_key = self._kv_key(key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for _ in range(MAX_UPDATE_RETRIES):
+                try:
+                    await pipe.watch(redis_key)
+                    raw = await pipe.get(redis_key)
+                    write, value = compute(json.loads(raw) if raw is not None else None)
+                    if not write:
+                        await pipe.unwatch()
+                        return False, value
+                    pipe.multi()
+                    pipe.set(redis_key, json.dumps(value), ex=ttl or None)
+                    await pipe.execute()
+                    return True, value
+                except WatchError:
+                    # Another writer changed the key first; retry with fresh state
+                    continue
+        raise RuntimeError(f"update of {key} contended too long")
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl: int = None) -> bool:
+        """
+        Set a cache key only if its current value equals the expected one.
+
+        Args:
+            key: Cache key
+            expected: Value the key must currently hold (None for a missing key)
+            value: JSON-serializable value to store
+            ttl: Optional lifetime in seconds
+
+        Returns:
+            bool: True if the value was swapped, False if it did not match or on error
+        """
+        try:
+            swapped, _ = await self._watched_update(
+                key, lambda current: (current == expected, value), ttl
+            )
+            return swapped
+        except Exception as e:
+            logger.error(f"Failed to compare-and-set cache key {key}: {str(e)}")
+            return False
+
+    async def update(
+        self,
+        key: str,
+        updater: Callable[[Any], Any],
+        default: Any = None,
+        ttl: int = None,
+    ) -> Optional[Any]:
+        """
+        Atomically replace a cache key with updater(current value).
+
+        The key is WATCHed, so a concurrent writer (in this or another
+        process) makes the transaction retry with the fresh value; the
+        updater may therefore run more than once and must not await.
+
+        Args:
+            key: Cache key
+            updater: Function mapping the current value to the new value
+            default: Value passed to the updater when the key is missing
+            ttl: Optional lifetime in seconds for the new value
+
+        Returns:
+            Any: The stored value, or None on error
+        """
+        try:
+            _, value = await self._watched_update(
+                key,
+                lambda current: (True, updater(default if current is None else current)),
+                ttl,
+            )
+            return value
+        except Exception as e:
+            logger.error(f"Failed to update cache key {key}: {str(e)}")
+            return None
+
     # =========================================================================
     # Telegram Channel Management Methods
     # =========================================================================
+    def add_channel_listener(self, callback: Callable[[], None]):
+        """Register a callback to run after the active channel list changes."""
+        self._channel_listeners.append(callback)
+
+    def _notify_channel_listeners(self):
+        for callback in self._channel_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Channel listener failed: {str(e)}")
+
     async def add_telegram_channel(self, channel: str) -> bool:
         if not channel:
             return False
         try:
-            data = self._read()
             channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
             # Prevent duplicate activation
-            if channel in data.get("telegram_channels", []):
+            if await self._redis.sismember(self._channels_key("activated"), channel):
                 logger.info(f"Channel {channel} is already activated.")
                 return False
-            # Remove from deactivated if present
-            if channel in data.get("deactivated_channels", []):
-                data["deactivated_channels"].remove(channel)
-            if channel not in data.get("telegram_channels", []):
-                data.setdefault("telegram_channels", []).append(channel)
-            # Update metadata
-            meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-            meta["status"] = "activated"
-            meta["date_added"] = now
-            meta["date_deactivated"] = None
-            if "notes" in meta:
-                del meta["notes"]
-            self._write(data)
-            await self.save()
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._queue_channel_status(
+                    pipe,
+                    channel,
+                    "activated",
+                    {"date_added": _now(), "date_deactivated": None, "notes": None},
+                )
+                await pipe.execute()
+            self._notify_channel_listeners()
             return True
         except Exception as e:
             logger.error(f"Failed to add telegram channel {channel}: {str(e)}")
@@ -143,53 +497,43 @@ class JSONCache:
         if not channel:
             return False
         try:
-            data = self._read()
             channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
             # Prevent duplicate deactivation
-            if channel in data.get("deactivated_channels", []):
+            if await self._redis.sismember(self._channels_key("deactivated"), channel):
                 logger.info(f"Channel {channel} is already deactivated.")
                 return False
-            if channel in data.get("telegram_channels", []):
-                data["telegram_channels"].remove(channel)
-                if channel not in data.get("deactivated_channels", []):
-                    data.setdefault("deactivated_channels", []).append(channel)
-                # Update metadata
-                meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-                meta["status"] = "deactivated"
-                meta["date_deactivated"] = now
-                self._write(data)
-                await self.save()
-                return True
-            return False
+            if not await self._redis.sismember(self._channels_key("activated"), channel):
+                return False
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._queue_channel_status(
+                    pipe, channel, "deactivated", {"date_deactivated": _now()}
+                )
+                await pipe.execute()
+            self._notify_channel_listeners()
+            return True
         except Exception as e:
             logger.error(f"Failed to remove telegram channel {channel}: {str(e)}")
             return False
 
     # =========================================================================
-    # Channel Metadata and Status Methods
+    # Channel Metadata and Query Methods
     # =========================================================================
     async def get_channel_metadata(self, channel: str) -> dict:
         try:
-            data = self._read()
-            return data.get("channel_metadata", {}).get(channel.lower(), {})
+            row = await self._redis.hgetall(self._channel_key(channel.lower()))
+            return self._decode_metadata(row)
         except Exception as e:
             logger.error(f"Failed to get metadata for channel {channel}: {str(e)}")
             return {}
 
     async def list_telegram_channels(self, status: str = "activated") -> List[str]:
         try:
-            data = self._read()
-            if status == "activated":
-                return sorted(data.get("telegram_channels", []))
-            elif status == "deactivated":
-                return sorted(data.get("deactivated_channels", []))
+            if status in CHANNEL_STATUSES:
+                return await self._channel_names(status)
             elif status == "all":
                 return sorted(
-                    set(
-                        data.get("telegram_channels", [])
-                        + data.get("deactivated_channels", [])
-                    )
+                    set(await self._channel_names("activated"))
+                    | set(await self._channel_names("deactivated"))
                 )
             else:
                 return []
@@ -201,39 +545,88 @@ class JSONCache:
         """
         Set the status of a Telegram channel (activated/deactivated) and update metadata.
         """
-        if not channel or status not in ("activated", "deactivated"):
+        if not channel or status not in CHANNEL_STATUSES:
             logger.error(
                 f"Invalid channel or status for set_channel_status: {channel}, {status}"
             )
             return False
         try:
-            data = self._read()
             channel = channel.lower()
-            now = datetime.datetime.utcnow().isoformat()
-            meta = data.setdefault("channel_metadata", {}).setdefault(channel, {})
-            meta["status"] = status
+            now = _now()
             if status == "deactivated":
-                meta["date_deactivated"] = now
-                # Move to deactivated_channels
-                if channel not in data.get("deactivated_channels", []):
-                    data.setdefault("deactivated_channels", []).append(channel)
-                if channel in data.get("telegram_channels", []):
-                    data["telegram_channels"].remove(channel)
-                logger.info(f"Channel {channel} marked as deactivated.")
-            elif status == "activated":
-                meta["date_deactivated"] = None
-                meta["date_added"] = now
-                # Move to telegram_channels
-                if channel not in data.get("telegram_channels", []):
-                    data.setdefault("telegram_channels", []).append(channel)
-                if channel in data.get("deactivated_channels", []):
-                    data["deactivated_channels"].remove(channel)
-                logger.info(f"Channel {channel} marked as activated.")
-            self._write(data)
-            await self.save()
+                fields = {"date_deactivated": now}
+            else:
+                fields = {"date_added": now, "date_deactivated": None}
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._queue_channel_status(pipe, channel, status, fields)
+                await pipe.execute()
+            logger.info(f"Channel {channel} marked as {status}.")
+            self._notify_channel_listeners()
             return True
         except Exception as e:
-            logger.error(f"Failed to set channel status: {str(e)}")
+            logger.error(f"Failed to set status for channel {channel}: {str(e)}")
+            return False
+
+    # =========================================================================
+    # Blacklist Methods
+    # =========================================================================
+    async def get_blacklist_entries(self) -> List[Tuple[str, int, Optional[str]]]:
+        """Return all blacklist entries as (channel, message_id, added_at)."""
+        try:
+            entries = []
+            for scope in await self._redis.smembers(self._key("blacklist", "scopes")):
+                message_ids = await self._redis.smembers(self._blacklist_key(scope))
+                added = await self._redis.hgetall(self._blacklist_added_key(scope))
+                for message_id in message_ids:
+                    entries.append((scope, int(message_id), added.get(message_id)))
+            return entries
+        except Exception as e:
+            logger.error(f"Failed to get blacklist entries: {str(e)}")
+            return []
+
+    async def add_blacklist_entry(self, channel: str, message_id: int, added_at: str) -> bool:
+        """
+        Persist a single blacklist entry as one set member.
+
+        Args:
+            channel: Normalized channel name ("" for global)
+            message_id: Telegram message ID
+            added_at: ISO timestamp of when the entry was added
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            message_id = int(message_id)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.sadd(self._key("blacklist", "scopes"), channel)
+                pipe.sadd(self._blacklist_key(channel), message_id)
+                pipe.hsetnx(self._blacklist_added_key(channel), message_id, added_at)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add blacklist entry {channel}:{message_id}: {str(e)}")
+            return False
+
+    async def remove_blacklist_entries(self, entries: List[Tuple[str, int]]) -> bool:
+        """
+        Remove blacklist entries in one pipeline.
+
+        Args:
+            entries: (channel, message_id) pairs to remove
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for channel, message_id in entries:
+                    pipe.srem(self._blacklist_key(channel), int(message_id))
+                    pipe.hdel(self._blacklist_added_key(channel), int(message_id))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to remove blacklist entries: {str(e)}")
             return False
 
     # =========================================================================
@@ -242,13 +635,12 @@ class JSONCache:
     async def get_last_channel_index(self) -> int:
         """
         Get the index of the last used channel for rotation.
-        
+
         Returns:
             int: The index of the last used channel (0-based), or 0 if not set
         """
         try:
-            data = self._read()
-            return data.get("channel_rotation", {}).get("last_index", 0)
+            return (await self._get_rotation()).get("last_index", 0)
         except Exception as e:
             logger.error(f"Failed to get last channel index: {str(e)}")
             return 0
@@ -256,21 +648,15 @@ class JSONCache:
     async def set_last_channel_index(self, index: int) -> bool:
         """
         Set the index of the last used channel for rotation.
-        
+
         Args:
             index: The index to save (0-based)
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            data = self._read()
-            now = datetime.datetime.utcnow().isoformat()
-            data.setdefault("channel_rotation", {})["last_index"] = index
-            data["channel_rotation"]["last_updated"] = now
-            self._write(data)
-            await self.save()
-            return True
+            return await self._update_rotation(last_index=index)
         except Exception as e:
             logger.error(f"Failed to set last channel index: {str(e)}")
             return False
@@ -278,13 +664,12 @@ class JSONCache:
     async def get_last_channel_name(self) -> str:
         """
         Get the name of the last used channel for rotation.
-        
+
         Returns:
             str: The name of the last used channel, or empty string if not set
         """
         try:
-            data = self._read()
-            return data.get("channel_rotation", {}).get("last_channel", "")
+            return (await self._get_rotation()).get("last_channel", "")
         except Exception as e:
             logger.error(f"Failed to get last channel name: {str(e)}")
             return ""
@@ -292,21 +677,15 @@ class JSONCache:
     async def set_last_channel_name(self, channel_name: str) -> bool:
         """
         Set the name of the last used channel for rotation.
-        
+
         Args:
             channel_name: The channel name to save
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            data = self._read()
-            now = datetime.datetime.utcnow().isoformat()
-            data.setdefault("channel_rotation", {})["last_channel"] = channel_name
-            data["channel_rotation"]["last_updated"] = now
-            self._write(data)
-            await self.save()
-            return True
+            return await self._update_rotation(last_channel=channel_name)
         except Exception as e:
             logger.error(f"Failed to set last channel name: {str(e)}")
             return False
@@ -314,42 +693,56 @@ class JSONCache:
     async def get_next_channel_for_rotation(self) -> Optional[str]:
         """
         Get the next channel in the rotation sequence.
-        Enhanced to remember specific channel name across restarts.
-        
+
+        The rotation hash and the active channel set are WATCHed, and the
+        update is applied in a MULTI/EXEC pipeline, so concurrent bot
+        processes never hand out the same slot twice.
+
         Returns:
             str: The next channel name to use, or None if no channels available
         """
+        rotation_key = self._key("rotation")
+        active_key = self._channels_key("activated")
         try:
-            # Get active channels
-            active_channels = await self.list_telegram_channels("activated")
-            if not active_channels:
-                logger.warning("No active channels available for rotation")
-                return None
-            
-            # Get last used channel name (more robust than index)
-            last_channel_name = await self.get_last_channel_name()
-            
-            # Find the index of the last used channel
-            try:
-                last_index = active_channels.index(last_channel_name)
-            except ValueError:
-                # Last channel no longer exists, start from beginning
-                logger.info(f"Last used channel '{last_channel_name}' no longer active, starting rotation from beginning")
-                last_index = -1
-            
-            # Calculate next index (with wraparound)
-            next_index = (last_index + 1) % len(active_channels)
-            
-            # Get the next channel
-            next_channel = active_channels[next_index]
-            
-            # Update both index and channel name for backward compatibility
-            await self.set_last_channel_index(next_index)
-            await self.set_last_channel_name(next_channel)
-            
-            logger.info(f"Channel rotation: last_channel='{last_channel_name}', next_channel='{next_channel}' (index {next_index})")
-            return next_channel
-            
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for _ in range(MAX_ROTATION_RETRIES):
+                    try:
+                        await pipe.watch(rotation_key, active_key)
+                        active_channels = sorted(await pipe.smembers(active_key))
+                        if not active_channels:
+                            await pipe.unwatch()
+                            logger.warning("No active channels available for rotation")
+                            return None
+
+                        last_channel_name = await pipe.hget(rotation_key, "last_channel") or ""
+                        try:
+                            last_index = active_channels.index(last_channel_name)
+                        except ValueError:
+                            logger.info(f"Last used channel '{last_channel_name}' no longer active, starting rotation from beginning")
+                            last_index = -1
+
+                        next_index = (last_index + 1) % len(active_channels)
+                        next_channel = active_channels[next_index]
+
+                        pipe.multi()
+                        pipe.hset(
+                            rotation_key,
+                            mapping={
+                                "last_index": str(next_index),
+                                "last_channel": next_channel,
+                                "last_updated": _now(),
+                            },
+                        )
+                        await pipe.execute()
+
+                        logger.info(f"Channel rotation: last_channel='{last_channel_name}', next_channel='{next_channel}' (index {next_index})")
+                        return next_channel
+                    except WatchError:
+                        # Another process advanced the rotation first; retry with fresh state
+                        continue
+            logger.warning("Channel rotation contended too long, giving up this cycle")
+            return None
+
         except Exception as e:
             logger.error(f"Failed to get next channel for rotation: {str(e)}")
             return None
@@ -357,7 +750,7 @@ class JSONCache:
     async def reset_channel_rotation(self) -> bool:
         """
         Reset the channel rotation to start from the beginning.
-        
+
         Returns:
             bool: True if successful, False otherwise
         """
@@ -0,0 +1,175 @@
+# =============================================================================
+# NewsBot Cache Snapshot Codec Module
+# =============================================================================
+# This module encodes and decodes the on-disk snapshot of the JSON cache.
+# Snapshots are compact orjson documents carrying a schema version header;
+# the channel-scoped blacklist, by far the largest part of the state, is
+# stored as sorted, delta-encoded integer arrays of message IDs and epoch
+# seconds instead of a mapping of string IDs to ISO timestamps. Unversioned
+# (schema 1) documents written by json.dump are still readable and are
+# upgraded on the next flush.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import datetime
+import itertools
+from typing import Any, Dict, Optional, Tuple
+
+# =============================================================================
+# Third-Party Library Imports
+# =============================================================================
+import orjson
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+SNAPSHOT_SCHEMA_VERSION = 2
+# Reserved top-level key holding the schema version of a snapshot
+SCHEMA_KEY = "cache_schema_version"
+SCOPED_BLACKLIST_KEY = "blacklist"
+
+
+class SnapshotSchemaError(ValueError):
+    """Raised when a snapshot was written by a newer, unknown schema."""
+
+
+# =============================================================================
+# Timestamp Helpers
+# =============================================================================
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(added_at: Any) -> Optional[int]:
+    """
+    Normalize a blacklist timestamp to whole epoch seconds.
+
+    Accepts epoch numbers as stored in memory and ISO timestamps (naive
+    values are UTC) as written by older releases and the other backends.
+    """
+    if added_at is None or isinstance(added_at, bool):
+        return None
+    if isinstance(added_at, (int, float)):
+        return int(added_at)
+    try:
+        parsed = datetime.datetime.fromisoformat(added_at)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return int((parsed - _EPOCH).total_seconds())
+
+
+def to_iso_timestamp(added_at: Any) -> Optional[str]:
+    """Return a blacklist timestamp as a naive UTC ISO string."""
+    if isinstance(added_at, str) or added_at is None:
+        return added_at
+    return (_EPOCH + datetime.timedelta(seconds=int(added_at))).isoformat()
+
+
+# =============================================================================
+# Blacklist Encoding
+# =============================================================================
+def _encode_blacklist(blacklist: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, list]]:
+    """
+    Encode {channel: {id: added_at}} as parallel integer arrays per channel.
+
+    IDs are sorted and stored as deltas from the previous ID, which keeps
+    the numbers small; added_at values are epoch seconds (null if unknown).
+    """
+    encoded = {}
+    for channel, entries in blacklist.items():
+        ordered = sorted(zip(map(int, entries), entries.values()))
+        ids = [message_id for message_id, _ in ordered]
+        encoded[channel] = {
+            "ids": [b - a for a, b in zip(itertools.chain((0,), ids), ids)],
+            "added_at": [
+                added_at if type(added_at) is int else to_epoch_seconds(added_at)
+                for _, added_at in ordered
+            ],
+        }
+    return encoded
+
+
+def _decode_blacklist(encoded: Dict[str, Dict[str, list]]) -> Dict[str, Dict[str, Optional[int]]]:
+    """Inverse of _encode_blacklist."""
+    blacklist = {}
+    for channel, arrays in encoded.items():
+        entries = {}
+        message_id = 0
+        for delta, added_at in zip(arrays.get("ids", []), arrays.get("added_at", [])):
+            message_id += delta
+            entries[str(message_id)] = added_at
+        blacklist[channel] = entries
+    return blacklist
+
+
+def _upgrade_blacklist(blacklist: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Optional[int]]]:
+    """Convert a schema 1 blacklist with ISO timestamps to epoch seconds."""
+    return {
+        channel: {
+            message_id: to_epoch_seconds(added_at) for message_id, added_at in entries.items()
+        }
+        for channel, entries in blacklist.items()
+    }
+
+
+# =============================================================================
+# Snapshot Encoding
+# =============================================================================
+def encode_snapshot(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize the cache state into a versioned snapshot.
+
+    Args:
+        data: The in-memory cache state
+
+    Returns:
+        bytes: The encoded snapshot
+    """
+    document: Dict[str, Any] = {SCHEMA_KEY: SNAPSHOT_SCHEMA_VERSION}
+    for key, value in data.items():
+        if key == SCOPED_BLACKLIST_KEY and isinstance(value, dict):
+            value = _encode_blacklist(value)
+        document[key] = value
+    return orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS)
+
+
+def decode_snapshot(raw: bytes) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse a snapshot in any known schema into the in-memory cache state.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Tuple[Dict[str, Any], int]: The state and the schema version it was
+            stored with (1 for unversioned json.dump documents)
+
+    Raises:
+        ValueError: If the contents are not valid JSON
+        SnapshotSchemaError: If the snapshot comes from a newer schema
+    """
+    document = orjson.loads(raw)
+    if not isinstance(document, dict):
+        return {}, 1
+    version = document.pop(SCHEMA_KEY, 1)
+    if version > SNAPSHOT_SCHEMA_VERSION:
+        raise SnapshotSchemaError(
+            f"snapshot schema {version} is newer than supported schema {SNAPSHOT_SCHEMA_VERSION}"
+        )
+    blacklist = document.get(SCOPED_BLACKLIST_KEY)
+    if isinstance(blacklist, dict):
+        if version >= 2:
+            document[SCOPED_BLACKLIST_KEY] = _decode_blacklist(blacklist)
+        else:
+            document[SCOPED_BLACKLIST_KEY] = _upgrade_blacklist(blacklist)
+    return document, version
+
+
+def load_snapshot(path: str) -> Dict[str, Any]:
+    """Read and decode the snapshot at path."""
+    with open(path, "rb") as f:
+        data, _ = decode_snapshot(f.read())
+    return data
@@ -0,0 +1,901 @@
+# =============================================================================
+# NewsBot SQLite Cache Module
+# =============================================================================
+# This module provides a SQLite-backed implementation of the bot cache with
+# the same async API as JSONCache. State is stored as per-key rows in a
+# WAL-mode database so that mutations cost a row update instead of a full
+# document rewrite, and a one-shot migrator imports an existing botdata.json.
+# Keys set with a ttl expire lazily on access and through a periodic sweep.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import datetime
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# =============================================================================
+# Third-Party Library Imports
+# =============================================================================
+import aiosqlite
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.snapshot_codec import load_snapshot, to_iso_timestamp
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Schema Definition
+# =============================================================================
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_kv_expires_at ON kv(expires_at);
+CREATE TABLE IF NOT EXISTS channels (
+    name TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    date_added TEXT,
+    date_deactivated TEXT,
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_channels_status ON channels(status);
+CREATE TABLE IF NOT EXISTS blacklist (
+    channel TEXT NOT NULL DEFAULT '',
+    message_id INTEGER NOT NULL,
+    added_at TEXT NOT NULL,
+    PRIMARY KEY (channel, message_id)
+);
+CREATE INDEX IF NOT EXISTS idx_blacklist_added_at ON blacklist(added_at);
+"""
+
+# Keys of the JSON document that are stored in dedicated tables
+CHANNEL_LIST_KEYS = {
+    "telegram_channels": "activated",
+    "deactivated_channels": "deactivated",
+}
+CHANNEL_METADATA_KEY = "channel_metadata"
+BLACKLIST_KEY = "blacklisted_posts"
+SCOPED_BLACKLIST_KEY = "blacklist"
+# Key of the JSON document holding {key: expiry epoch} for keys set with a ttl
+EXPIRY_KEY = "cache_expiry"
+
+DEFAULT_TTL_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().isoformat()
+
+
+# =============================================================================
+# SQLite Cache Main Class
+# =============================================================================
+class SQLiteCache:
+    """
+    SQLite-backed cache manager for the bot.
+
+    Drop-in replacement for JSONCache. Generic keys live in a key/value
+    table, while channels and blacklisted posts get their own indexed
+    tables so that the hot paths touch single rows.
+
+    Features:
+    - WAL journal mode for concurrent readers and cheap commits
+    - Per-key rows with JSON-encoded values
+    - Indexed channel status and blacklist tables
+    - Channel rotation state updated in a single transaction
+    - Generic keys may be set with a ttl; expired rows read as missing and
+      are deleted by a background sweep
+    - One-shot migration from botdata.json
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/botdata.db",
+        json_path: Optional[str] = "data/botdata.json",
+    ):
+        self.db_path = os.path.abspath(db_path)
+        self.json_path = os.path.abspath(json_path) if json_path else None
+        self._db: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        # Callbacks run after the set of active channels changes
+        self._channel_listeners: List[Callable[[], None]] = []
+        self.ttl_sweep_interval = float(
+            config.get("cache.ttl_sweep_interval_seconds", DEFAULT_TTL_SWEEP_INTERVAL_SECONDS)
+        )
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    # =========================================================================
+    # Initialization Methods
+    # =========================================================================
+    async def initialize(self):
+        """Open the database, create the schema and run the JSON migration."""
+        try:
+            await self._get_db()
+            if self.json_path:
+                await self.migrate_from_json(self.json_path)
+            logger.info(f"✅ SQLite cache initialized at {self.db_path}")
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize SQLite cache: {e}")
+            raise
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Return the shared connection, opening it on first use."""
+        if self._db is not None:
+            return self._db
+        async with self._connect_lock:
+            if self._db is None:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                db = await aiosqlite.connect(self.db_path)
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute("PRAGMA synchronous=NORMAL")
+                await self._upgrade_schema(db)
+                await db.executescript(SCHEMA)
+                await db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+                await db.commit()
+                self._db = db
+                await self._start_sweeper_if_needed(db)
+        return self._db
+
+    async def _upgrade_schema(self, db: aiosqlite.Connection):
+        """Upgrade tables created by older schema versions in place."""
+        async with db.execute("PRAGMA table_info(kv)") as cursor:
+            kv_columns = [row[1] for row in await cursor.fetchall()]
+        if kv_columns and "expires_at" not in kv_columns:
+            # v2 had no expiry; existing keys stay persistent
+            await db.execute("ALTER TABLE kv ADD COLUMN expires_at REAL")
+            logger.info("✅ Added expiry column to SQLite cache key/value table")
+
+        async with db.execute("PRAGMA table_info(blacklist)") as cursor:
+            columns = [row[1] for row in await cursor.fetchall()]
+        if columns and "channel" not in columns:
+            # v1 keyed the blacklist by message_id only; keep rows as global entries
+            await db.executescript(
+                """
+                ALTER TABLE blacklist RENAME TO blacklist_v1;
+                CREATE TABLE blacklist (
+                    channel TEXT NOT NULL DEFAULT '',
+                    message_id INTEGER NOT NULL,
+                    added_at TEXT NOT NULL,
+                    PRIMARY KEY (channel, message_id)
+                );
+                INSERT INTO blacklist (channel, message_id, added_at)
+                    SELECT '', message_id, added_at FROM blacklist_v1;
+                DROP TABLE blacklist_v1;
+                """
+            )
+            logger.info("✅ Upgraded SQLite cache blacklist table to channel-scoped keys")
+
+    async def close(self):
+        """Close the database connection."""
+        try:
+            if self._sweep_task and not self._sweep_task.done():
+                self._sweep_task.cancel()
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
+        except Exception as e:
+            logger.error(f"Failed to close SQLite cache: {str(e)}")
+
+    # =========================================================================
+    # Migration Methods
+    # =========================================================================
+    async def migrate_from_json(self, json_path: str) -> bool:
+        """
+        Import an existing botdata.json into the database, once.
+
+        Args:
+            json_path: Path to the JSON cache file to import
+
+        Returns:
+            bool: True if data was imported, False if skipped or failed
+        """
+        try:
+            db = await self._get_db()
+            async with db.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_from_json'"
+            ) as cursor:
+                if await cursor.fetchone():
+                    return False
+            if not os.path.exists(json_path):
+                return False
+
+            data = load_snapshot(json_path)
+            deadlines = data.get(EXPIRY_KEY) or {}
+
+            async with self._write_lock:
+                for key, value in data.items():
+                    if key in CHANNEL_LIST_KEYS or key in (CHANNEL_METADATA_KEY, EXPIRY_KEY):
+                        continue
+                    if key == BLACKLIST_KEY:
+                        await self._replace_blacklist(db, value or [])
+                    elif key == SCOPED_BLACKLIST_KEY:
+                        await db.executemany(
+                            "INSERT OR IGNORE INTO blacklist (channel, message_id, added_at) "
+                            "VALUES (?, ?, ?)",
+                            [
+                                (channel, int(message_id), to_iso_timestamp(added_at) or _now())
+                                for channel, message_ids in (value or {}).items()
+                                for message_id, added_at in message_ids.items()
+                            ],
+                        )
+                    else:
+                        deadline = deadlines.get(key)
+                        await self._set_kv(db, key, value, float(deadline) if deadline else None)
+                await self._import_channels(db, data)
+                await db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                    (_now(),),
+                )
+                await db.commit()
+            logger.info(f"✅ Migrated {len(data)} keys from {json_path} into SQLite cache")
+            await self._start_sweeper_if_needed(db)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to migrate {json_path} into SQLite cache: {e}")
+            return False
+
+    async def _import_channels(self, db: aiosqlite.Connection, data: Dict[str, Any]):
+        metadata = data.get(CHANNEL_METADATA_KEY, {}) or {}
+        statuses: Dict[str, str] = {
+            name: meta.get("status", "activated") for name, meta in metadata.items()
+        }
+        for key, status in CHANNEL_LIST_KEYS.items():
+            for name in data.get(key, []) or []:
+                statuses[name] = status
+        for name, status in statuses.items():
+            meta = metadata.get(name, {})
+            await db.execute(
+                "INSERT OR REPLACE INTO channels "
+                "(name, status, date_added, date_deactivated, notes) VALUES (?, ?, ?, ?, ?)",
+                (
+                    name,
+                    status,
+                    meta.get("date_added"),
+                    meta.get("date_deactivated"),
+                    meta.get("notes"),
+                ),
+            )
+
+    # =========================================================================
+    # Row Helpers
+    # =========================================================================
+    async def _set_kv(
+        self, db: aiosqlite.Connection, key: str, value: Any, expires_at: Optional[float] = None
+    ):
+        # Setting a key without an expiry makes it persistent again
+        await db.execute(
+            "INSERT INTO kv (key, value, updated_at, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+            "updated_at = excluded.updated_at, expires_at = excluded.expires_at",
+            (key, json.dumps(value), _now(), expires_at),
+        )
+
+    async def _get_kv(self, db: aiosqlite.Connection, key: str, default: Any = None) -> Any:
+        async with db.execute(
+            "SELECT value FROM kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ) as cursor:
+            row = await cursor.fetchone()
+        return json.loads(row[0]) if row else default
+
+    async def _channel_names(self, db: aiosqlite.Connection, status: str) -> List[str]:
+        async with db.execute(
+            "SELECT name FROM channels WHERE status = ? ORDER BY rowid", (status,)
+        ) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def _channel_metadata(self, db: aiosqlite.Connection) -> Dict[str, Dict]:
+        metadata = {}
+        async with db.execute(
+            "SELECT name, status, date_added, date_deactivated, notes FROM channels ORDER BY rowid"
+        ) as cursor:
+            for name, status, date_added, date_deactivated, notes in await cursor.fetchall():
+                meta = {
+                    "status": status,
+                    "date_added": date_added,
+                    "date_deactivated": date_deactivated,
+                }
+                if notes is not None:
+                    meta["notes"] = notes
+                metadata[name] = meta
+        return metadata
+
+    async def _replace_channel_list(self, db: aiosqlite.Connection, status: str, names: List[str]):
+        names = [name for name in (names or []) if name]
+        placeholders = ",".join("?" * len(names))
+        # Channels dropped from the list are forgotten, as with the JSON document
+        if names:
+            await db.execute(
+                f"DELETE FROM channels WHERE status = ? AND name NOT IN ({placeholders})",
+                (status, *names),
+            )
+        else:
+            await db.execute("DELETE FROM channels WHERE status = ?", (status,))
+        for name in names:
+            await db.execute(
+                "INSERT INTO channels (name, status, date_added) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET status = excluded.status",
+                (name, status, _now()),
+            )
+
+    async def _replace_channel_metadata(self, db: aiosqlite.Connection, metadata: Dict[str, Dict]):
+        for name, meta in (metadata or {}).items():
+            await db.execute(
+                "INSERT INTO channels (name, status, date_added, date_deactivated, notes) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                "status = excluded.status, date_added = excluded.date_added, "
+                "date_deactivated = excluded.date_deactivated, notes = excluded.notes",
+                (
+                    name,
+                    meta.get("status", "activated"),
+                    meta.get("date_added"),
+                    meta.get("date_deactivated"),
+                    meta.get("notes"),
+                ),
+            )
+
+    async def _blacklist_ids(self, db: aiosqlite.Connection) -> List[int]:
+        async with db.execute(
+            "SELECT message_id FROM blacklist WHERE channel = '' ORDER BY rowid"
+        ) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def _replace_blacklist(self, db: aiosqlite.Connection, message_ids: List[int]):
+        wanted = {int(message_id) for message_id in message_ids}
+        current = set(await self._blacklist_ids(db))
+        removed = current - wanted
+        if removed:
+            await db.executemany(
+                "DELETE FROM blacklist WHERE channel = '' AND message_id = ?",
+                [(i,) for i in removed],
+            )
+        now = _now()
+        await db.executemany(
+            "INSERT OR IGNORE INTO blacklist (channel, message_id, added_at) VALUES ('', ?, ?)",
+            [(i, now) for i in message_ids if int(i) not in current],
+        )
+
+    # =========================================================================
+    # Expiry Methods
+    # =========================================================================
+    async def _next_expiry(self, db: aiosqlite.Connection) -> Optional[float]:
+        async with db.execute("SELECT MIN(expires_at) FROM kv WHERE expires_at IS NOT NULL") as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def _sweep_expired(self, db: aiosqlite.Connection) -> int:
+        """Delete the rows whose ttl has passed; the caller holds the write lock."""
+        cursor = await db.execute(
+            "DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+        await db.commit()
+        if cursor.rowcount:
+            logger.debug(f"Expired {cursor.rowcount} cache keys")
+        return cursor.rowcount
+
+    async def _start_sweeper_if_needed(self, db: aiosqlite.Connection):
+        if await self._next_expiry(db) is not None:
+            self._ensure_sweeper()
+
+    def _ensure_sweeper(self):
+        if self._sweep_task and not self._sweep_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sweep_task = loop.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self):
+        try:
+            db = await self._get_db()
+            while (deadline := await self._next_expiry(db)) is not None:
+                await asyncio.sleep(min(self.ttl_sweep_interval, max(deadline - time.time(), 0)))
+                async with self._write_lock:
+                    await self._sweep_expired(db)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Cache TTL sweep failed: {e}")
+
+    # =========================================================================
+    # Basic Cache Operations
+    # =========================================================================
+    async def save(self):
+        """Commit any pending changes to disk."""
+        try:
+            db = await self._get_db()
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to save cache: {str(e)}")
+
+    async def _store(self, db: aiosqlite.Connection, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Write a key to its table; the caller holds the write lock and commits.
+
+        Raises:
+            ValueError: If a ttl is given for a key kept in a dedicated table
+        """
+        if ttl and (key in CHANNEL_LIST_KEYS or key in (CHANNEL_METADATA_KEY, BLACKLIST_KEY)):
+            raise ValueError(f"Key {key} does not support a ttl")
+        if key in CHANNEL_LIST_KEYS:
+            await self._replace_channel_list(db, CHANNEL_LIST_KEYS[key], value)
+        elif key == CHANNEL_METADATA_KEY:
+            await self._replace_channel_metadata(db, value)
+        elif key == BLACKLIST_KEY:
+            await self._replace_blacklist(db, value or [])
+        else:
+            await self._set_kv(db, key, value, time.time() + float(ttl) if ttl else None)
+            if ttl:
+                self._ensure_sweeper()
+
+    async def _fetch(self, db: aiosqlite.Connection, key: str, default: Any = None) -> Any:
+        """Read a key from its table."""
+        if key in CHANNEL_LIST_KEYS:
+            return await self._channel_names(db, CHANNEL_LIST_KEYS[key])
+        if key == CHANNEL_METADATA_KEY:
+            return await self._channel_metadata(db)
+        if key == BLACKLIST_KEY:
+            return await self._blacklist_ids(db)
+        return await self._get_kv(db, key, default)
+
+    async def set(self, key: str, value: Any, ttl: int = None) -> bool:
+        """
+        Set a cache key.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Optional lifetime in seconds; setting a key without a ttl
+                makes it persistent again
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                await self._store(db, key, value, ttl)
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {str(e)}")
+            return False
+
+    async def get(self, key: str, default: Any = None) -> Optional[Any]:
+        try:
+            db = await self._get_db()
+            return await self._fetch(db, key, default)
+        except Exception as e:
+            logger.error(f"Failed to get cache key {key}: {str(e)}")
+            return default
+
+    async def delete(self, key: str) -> bool:
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                if key in CHANNEL_LIST_KEYS:
+                    await db.execute(
+                        "DELETE FROM channels WHERE status = ?", (CHANNEL_LIST_KEYS[key],)
+                    )
+                elif key == CHANNEL_METADATA_KEY:
+                    await db.execute("DELETE FROM channels")
+                elif key == BLACKLIST_KEY:
+                    await db.execute("DELETE FROM blacklist WHERE channel = ''")
+                else:
+                    await db.execute("DELETE FROM kv WHERE key = ?", (key,))
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete cache key {key}: {str(e)}")
+            return False
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl: int = None) -> bool:
+        """
+        Set a cache key only if its current value equals the expected one.
+
+        Args:
+            key: Cache key
+            expected: Value the key must currently hold (None for a missing key)
+            value: JSON-serializable value to store
+            ttl: Optional lifetime in seconds
+
+        Returns:
+            bool: True if the value was swapped, False if it did not match or on error
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                if await self._fetch(db, key) != expected:
+                    return False
+                await self._store(db, key, value, ttl)
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to compare-and-set cache key {key}: {str(e)}")
+            return False
+
+    async def update(
+        self,
+        key: str,
+        updater: Callable[[Any], Any],
+        default: Any = None,
+        ttl: int = None,
+    ) -> Optional[Any]:
+        """
+        Atomically replace a cache key with updater(current value).
+
+        The read, the updater call and the write share one write-lock hold
+        and one transaction. The updater must not await.
+
+        Args:
+            key: Cache key
+            updater: Function mapping the current value to the new value
+            default: Value passed to the updater when the key is missing
+            ttl: Optional lifetime in seconds for the new value
+
+        Returns:
+            Any: The stored value, or None on error
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                value = updater(await self._fetch(db, key, default))
+                await self._store(db, key, value, ttl)
+                await db.commit()
+            return value
+        except Exception as e:
+            logger.error(f"Failed to update cache key {key}: {str(e)}")
+            return None
+
+    # =========================================================================
+    # Telegram Channel Management Methods
+    # =========================================================================
+    def add_channel_listener(self, callback: Callable[[], None]):
+        """Register a callback to run after the active channel list changes."""
+        self._channel_listeners.append(callback)
+
+    def _notify_channel_listeners(self):
+        for callback in self._channel_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Channel listener failed: {str(e)}")
+
+    async def add_telegram_channel(self, channel: str) -> bool:
+        if not channel:
+            return False
+        try:
+            db = await self._get_db()
+            channel = channel.lower()
+            async with self._write_lock:
+                async with db.execute(
+                    "SELECT status FROM channels WHERE name = ?", (channel,)
+                ) as cursor:
+                    row = await cursor.fetchone()
+                # Prevent duplicate activation
+                if row and row[0] == "activated":
+                    logger.info(f"Channel {channel} is already activated.")
+                    return False
+                await db.execute(
+                    "INSERT INTO channels (name, status, date_added, date_deactivated, notes) "
+                    "VALUES (?, 'activated', ?, NULL, NULL) ON CONFLICT(name) DO UPDATE SET "
+                    "status = 'activated', date_added = excluded.date_added, "
+                    "date_deactivated = NULL, notes = NULL",
+                    (channel, _now()),
+                )
+                await db.commit()
+            self._notify_channel_listeners()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add telegram channel {channel}: {str(e)}")
+            return False
+
+    async def remove_telegram_channel(self, channel: str) -> bool:
+        if not channel:
+            return False
+        try:
+            db = await self._get_db()
+            channel = channel.lower()
+            async with self._write_lock:
+                async with db.execute(
+                    "SELECT status FROM channels WHERE name = ?", (channel,)
+                ) as cursor:
+                    row = await cursor.fetchone()
+                # Prevent duplicate deactivation
+                if row and row[0] == "deactivated":
+                    logger.info(f"Channel {channel} is already deactivated.")
+                    return False
+                if not row:
+                    return False
+                await db.execute(
+                    "UPDATE channels SET status = 'deactivated', date_deactivated = ? "
+                    "WHERE name = ?",
+                    (_now(), channel),
+                )
+                await db.commit()
+            self._notify_channel_listeners()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to remove telegram channel {channel}: {str(e)}")
+            return False
+
+    # =========================================================================
+    # Channel Metadata and Query Methods
+    # =========================================================================
+    async def get_channel_metadata(self, channel: str) -> dict:
+        try:
+            db = await self._get_db()
+            metadata = await self._channel_metadata(db)
+            return metadata.get(channel.lower(), {})
+        except Exception as e:
+            logger.error(f"Failed to get metadata for channel {channel}: {str(e)}")
+            return {}
+
+    async def list_telegram_channels(self, status: str = "activated") -> List[str]:
+        try:
+            db = await self._get_db()
+            if status in ("activated", "deactivated"):
+                return sorted(await self._channel_names(db, status))
+            elif status == "all":
+                async with db.execute(
+                    "SELECT name FROM channels WHERE status IN ('activated', 'deactivated') "
+                    "ORDER BY name"
+                ) as cursor:
+                    return [row[0] for row in await cursor.fetchall()]
+            else:
+                return []
+        except Exception as e:
+            logger.error(f"Failed to list telegram channels: {str(e)}")
+            return []
+
+    async def set_channel_status(self, channel: str, status: str) -> bool:
+        """
+        Set the status of a Telegram channel (activated/deactivated) and update metadata.
+        """
+        if not channel or status not in ("activated", "deactivated"):
+            logger.error(
+                f"Invalid channel or status for set_channel_status: {channel}, {status}"
+            )
+            return False
+        try:
+            db = await self._get_db()
+            channel = channel.lower()
+            now = _now()
+            async with self._write_lock:
+                if status == "deactivated":
+                    await db.execute(
+                        "INSERT INTO channels (name, status, date_deactivated) "
+                        "VALUES (?, 'deactivated', ?) ON CONFLICT(name) DO UPDATE SET "
+                        "status = 'deactivated', date_deactivated = excluded.date_deactivated",
+                        (channel, now),
+                    )
+                else:
+                    await db.execute(
+                        "INSERT INTO channels (name, status, date_added) "
+                        "VALUES (?, 'activated', ?) ON CONFLICT(name) DO UPDATE SET "
+                        "status = 'activated', date_added = excluded.date_added, "
+                        "date_deactivated = NULL",
+                        (channel, now),
+                    )
+                await db.commit()
+            logger.info(f"Channel {channel} marked as {status}.")
+            self._notify_channel_listeners()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set status for channel {channel}: {str(e)}")
+            return False
+
+    # =========================================================================
+    # Blacklist Methods
+    # =========================================================================
+    async def get_blacklist_entries(self) -> List[Tuple[str, int, Optional[str]]]:
+        """Return all blacklist entries as (channel, message_id, added_at)."""
+        try:
+            db = await self._get_db()
+            async with db.execute(
+                "SELECT channel, message_id, added_at FROM blacklist ORDER BY rowid"
+            ) as cursor:
+                return [tuple(row) for row in await cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to get blacklist entries: {str(e)}")
+            return []
+
+    async def add_blacklist_entry(self, channel: str, message_id: int, added_at: str) -> bool:
+        """
+        Persist a single blacklist entry as one row.
+
+        Args:
+            channel: Normalized channel name ("" for global)
+            message_id: Telegram message ID
+            added_at: ISO timestamp of when the entry was added
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                await db.execute(
+                    "INSERT OR IGNORE INTO blacklist (channel, message_id, added_at) "
+                    "VALUES (?, ?, ?)",
+                    (channel, int(message_id), added_at),
+                )
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add blacklist entry {channel}:{message_id}: {str(e)}")
+            return False
+
+    async def remove_blacklist_entries(self, entries: List[Tuple[str, int]]) -> bool:
+        """
+        Remove blacklist entries in one transaction.
+
+        Args:
+            entries: (channel, message_id) pairs to remove
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                await db.executemany(
+                    "DELETE FROM blacklist WHERE channel = ? AND message_id = ?",
+                    [(channel, int(message_id)) for channel, message_id in entries],
+                )
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to remove blacklist entries: {str(e)}")
+            return False
+
+    # =========================================================================
+    # Channel Rotation Management Methods
+    # =========================================================================
+    async def _update_rotation(self, **fields) -> bool:
+        db = await self._get_db()
+        async with self._write_lock:
+            rotation = await self._get_kv(db, "channel_rotation", {}) or {}
+            rotation.update(fields)
+            rotation["last_updated"] = _now()
+            await self._set_kv(db, "channel_rotation", rotation)
+            await db.commit()
+        return True
+
+    async def get_last_channel_index(self) -> int:
+        """
+        Get the index of the last used channel for rotation.
+
+        Returns:
+            int: The index of the last used channel (0-based), or 0 if not set
+        """
+        try:
+            rotation = await self.get("channel_rotation", {}) or {}
+            return rotation.get("last_index", 0)
+        except Exception as e:
+            logger.error(f"Failed to get last channel index: {str(e)}")
+            return 0
+
+    async def set_last_channel_index(self, index: int) -> bool:
+        """
+        Set the index of the last used channel for rotation.
+
+        Args:
+            index: The index to save (0-based)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            return await self._update_rotation(last_index=index)
+        except Exception as e:
+            logger.error(f"Failed to set last channel index: {str(e)}")
+            return False
+
+    async def get_last_channel_name(self) -> str:
+        """
+        Get the name of the last used channel for rotation.
+
+        Returns:
+            str: The name of the last used channel, or empty string if not set
+        """
+        try:
+            rotation = await self.get("channel_rotation", {}) or {}
+            return rotation.get("last_channel", "")
+        except Exception as e:
+            logger.error(f"Failed to get last channel name: {str(e)}")
+            return ""
+
+    async def set_last_channel_name(self, channel_name: str) -> bool:
+        """
+        Set the name of the last used channel for rotation.
+
+        Args:
+            channel_name: The channel name to save
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            return await self._update_rotation(last_channel=channel_name)
+        except Exception as e:
+            logger.error(f"Failed to set last channel name: {str(e)}")
+            return False
+
+    async def get_next_channel_for_rotation(self) -> Optional[str]:
+        """
+        Get the next channel in the rotation sequence.
+
+        The read of the last channel and the update of the rotation state
+        happen in one transaction, so concurrent callers never get the
+        same channel twice.
+
+        Returns:
+            str: The next channel name to use, or None if no channels available
+        """
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                active_channels = sorted(await self._channel_names(db, "activated"))
+                if not active_channels:
+                    logger.warning("No active channels available for rotation")
+                    return None
+
+                rotation = await self._get_kv(db, "channel_rotation", {}) or {}
+                last_channel_name = rotation.get("last_channel", "")
+                try:
+                    last_index = active_channels.index(last_channel_name)
+                except ValueError:
+                    logger.info(f"Last used channel '{last_channel_name}' no longer active, starting rotation from beginning")
+                    last_index = -1
+
+                next_index = (last_index + 1) % len(active_channels)
+                next_channel = active_channels[next_index]
+
+                rotation.update(
+                    last_index=next_index,
+                    last_channel=next_channel,
+                    last_updated=_now(),
+                )
+                await self._set_kv(db, "channel_rotation", rotation)
+                await db.commit()
+
+            logger.info(f"Channel rotation: last_channel='{last_channel_name}', next_channel='{next_channel}' (index {next_index})")
+            return next_channel
+
+        except Exception as e:
+            logger.error(f"Failed to get next channel for rotation: {str(e)}")
+            return None
+
+    async def reset_channel_rotation(self) -> bool:
+        """
+        Reset the channel rotation to start from the beginning.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            return await self.set_last_channel_index(-1)  # Will wrap to 0 on next call
+        except Exception as e:
+            logger.error(f"Failed to reset channel rotation: {str(e)}")
+            return False
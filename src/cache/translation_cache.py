@@ -0,0 +1,326 @@
+# =============================================================================
+# NewsBot Translation Cache Module
+# =============================================================================
+# This module caches AI translation results by content. Entries are keyed by
+# a hash of the normalized source text and a namespace naming the prompt,
+# its version and the model, so the same story fetched twice, or reposted
+# by another channel, is served without a new OpenAI request. Recent
+# entries are kept in an in-memory LRU over an on-disk SQLite store with
+# TTL and size eviction, so hits survive restarts.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_PATH = "data/translations.db"
+DEFAULT_MEMORY_ENTRIES = 512
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_TTL_DAYS = 30
+PRUNE_EVERY = 100  # stores between size/TTL sweeps of the disk store
+_MISS = object()  # memory-tier miss marker (cached values are never None)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_translations_created_at ON translations(created_at);
+CREATE INDEX IF NOT EXISTS idx_translations_accessed_at ON translations(accessed_at);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: NFKC, no tatweel, collapsed whitespace."""
+    text = unicodedata.normalize("NFKC", text or "")
+    text = text.replace("ـ", "")  # Arabic tatweel is decorative
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def cache_key(text: str, namespace: str) -> str:
+    """Return the content address of a text under a prompt/model namespace."""
+    payload = f"{namespace}\0{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+# =============================================================================
+# Translation Cache Main Class
+# =============================================================================
+class TranslationCache:
+    """
+    Content-addressed cache of AI translation results.
+
+    Features:
+    - Keys hash the normalized text with a prompt/model namespace, so
+      whitespace-only differences hit and prompt or model changes miss
+    - In-memory LRU (cache.translation.memory_entries) over an on-disk
+      SQLite store (cache.translation.path)
+    - Entries expire after cache.translation.ttl_days in both tiers and the
+      least recently used disk entries are evicted beyond
+      cache.translation.max_entries
+    - Sync get()/put() for blocking callers and async aget()/aput() that
+      keep disk I/O off the event loop; the memory tier has its own lock,
+      never held across disk I/O, so aget() memory hits cannot stall on a
+      store or prune running in a worker thread
+    - Hit/miss counters exposed through stats()
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()  # key -> (created_at, value)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._lock = threading.Lock()  # memory tier and counters
+        self._disk_lock = threading.Lock()  # SQLite connection
+        self._stores_since_prune = 0
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    # =========================================================================
+    # Configuration Methods
+    # =========================================================================
+    @staticmethod
+    def enabled() -> bool:
+        return bool(config.get("cache.translation.enabled", True))
+
+    @property
+    def path(self) -> str:
+        return self._path or config.get("cache.translation.path", DEFAULT_PATH)
+
+    @staticmethod
+    def _ttl_seconds() -> float:
+        return float(config.get("cache.translation.ttl_days", DEFAULT_TTL_DAYS)) * 86400
+
+    @staticmethod
+    def _memory_entries() -> int:
+        return int(config.get("cache.translation.memory_entries", DEFAULT_MEMORY_ENTRIES))
+
+    @staticmethod
+    def _max_entries() -> int:
+        return int(config.get("cache.translation.max_entries", DEFAULT_MAX_ENTRIES))
+
+    def reset(self, path: Optional[str] = None) -> None:
+        """Close the disk store, drop the memory entries and counters, and use `path` from now on."""
+        with self._disk_lock, self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._disk_failed = False
+            self._path = path
+            self._memory.clear()
+            self._stores_since_prune = 0
+            self._reset_counters()
+
+    # =========================================================================
+    # Disk Store Methods (called with self._disk_lock held)
+    # =========================================================================
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disk_failed:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                self._conn = conn
+                self._prune()
+            except Exception as e:
+                # Keep serving from memory rather than failing translations
+                self._disk_failed = True
+                logger.error(f"❌ [TRANSLATION-CACHE] Disk store unavailable, using memory only: {e}")
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        """Return (created_at, value) of a live entry, or None."""
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT value, created_at FROM translations WHERE key = ? AND created_at >= ?",
+            (key, now - self._ttl_seconds()),
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE translations SET accessed_at = ? WHERE key = ?", (now, key))
+        conn.commit()
+        return row[1], json.loads(row[0])
+
+    def _disk_put(self, key: str, value: Any, now: float) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        conn.execute(
+            "INSERT OR REPLACE INTO translations (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), now, now),
+        )
+        conn.commit()
+        self._stores_since_prune += 1
+        if self._stores_since_prune >= PRUNE_EVERY:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        self._stores_since_prune = 0
+        conn = self._conn
+        expired = conn.execute(
+            "DELETE FROM translations WHERE created_at < ?", (time.time() - self._ttl_seconds(),)
+        ).rowcount
+        overflow = conn.execute(
+            "DELETE FROM translations WHERE key IN ("
+            "SELECT key FROM translations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries(),),
+        ).rowcount
+        conn.commit()
+        if expired or overflow:
+            self.evictions += expired + overflow
+            logger.debug(f"🧹 [TRANSLATION-CACHE] Evicted {expired} expired and {overflow} least recently used entries")
+
+    # =========================================================================
+    # Memory Store Methods (called with self._lock held)
+    # =========================================================================
+    def _remember(self, key: str, value: Any, created_at: float) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries():
+            self._memory.popitem(last=False)
+
+    def _recall(self, key: str, now: float) -> Any:
+        """Return a live memory entry (counting the hit) or _MISS; expired entries are dropped."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return _MISS
+        created_at, value = entry
+        if created_at < now - self._ttl_seconds():
+            del self._memory[key]
+            return _MISS
+        self._memory.move_to_end(key)
+        self.memory_hits += 1
+        return value
+
+    # =========================================================================
+    # Public Interface
+    # =========================================================================
+    def get(self, text: str, namespace: str) -> Optional[Any]:
+        """
+        Look up the cached result for a text.
+
+        Args:
+            text: Source text the result was computed from
+            namespace: Prompt/model namespace, e.g. "news:v1:gpt-3.5-turbo"
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        if not self.enabled():
+            return None
+        key = cache_key(text, namespace)
+        now = time.time()
+        with self._lock:
+            value = self._recall(key, now)
+        if value is not _MISS:
+            return value
+        try:
+            with self._disk_lock:
+                entry = self._disk_get(key, now)
+        except Exception as e:
+            logger.warning(f"⚠️ [TRANSLATION-CACHE] Disk lookup failed: {e}")
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            created_at, value = entry
+            self.disk_hits += 1
+            self._remember(key, value, created_at)
+            return value
+
+    def put(self, text: str, namespace: str, value: Any) -> None:
+        """
+        Store the result computed for a text.
+
+        Args:
+            text: Source text the result was computed from
+            namespace: Prompt/model namespace the result was computed under
+            value: JSON-serializable result
+        """
+        if not self.enabled() or value is None:
+            return
+        key = cache_key(text, namespace)
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self.stores += 1
+        try:
+            with self._disk_lock:
+                self._disk_put(key, value, now)
+        except Exception as e:
+            logger.warning(f"⚠️ [TRANSLATION-CACHE] Disk store failed: {e}")
+
+    async def aget(self, text: str, namespace: str) -> Optional[Any]:
+        """Async get(); memory hits are served inline, disk lookups in a worker thread."""
+        if not self.enabled():
+            return None
+        key = cache_key(text, namespace)
+        with self._lock:
+            value = self._recall(key, time.time())
+        if value is not _MISS:
+            return value
+        return await asyncio.to_thread(self.get, text, namespace)
+
+    async def aput(self, text: str, namespace: str, value: Any) -> None:
+        """Async put(); the disk write runs in a worker thread."""
+        await asyncio.to_thread(self.put, text, namespace, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and sizes of the cache."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self) -> None:
+        """Close the disk store."""
+        with self._disk_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance
+translation_cache = TranslationCache()
@@ -23,6 +23,7 @@ from discord import ui
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.blacklist_store import get_blacklist_store
 from src.components.embeds.base_embed import BaseEmbed
 from src.services.ai_service import AIService
 from src.services.media_service import MediaService
@@ -120,12 +121,16 @@ class FetchView(ui.View):
             self.media = None
 
         self.media_bytes = media_bytes
+        # (ok, media_files, temp_path) downloaded ahead of time by stage()
+        self._staged_media = None
 
         # Text content
         self.arabic_text_clean = arabic_text_clean
         self.ai_english = ai_english
         self.ai_title = ai_title
         self.ai_location = ai_location
+        # Result of the structured AI analysis, when openai.analysis_mode is "structured"
+        self.structured_analysis = None
 
         # 🧠 Intelligence data
         self.urgency_level = urgency_level
@@ -202,60 +207,17 @@ class FetchView(ui.View):
                     return False
 
             # Process AI translation if not already done
-            if not self.ai_english or not self.ai_title:
-                if self.arabic_text_clean:
-                    self.logger.info("[FETCH] Processing text with AI services")
-                    ai_english, ai_title, ai_location = await self.ai_service.process_text_with_ai(
-                        self.arabic_text_clean
-                    )
-                    if ai_english:
-                        self.ai_english = ai_english
-                    if ai_title:
-                        self.ai_title = ai_title
-                    if ai_location:
-                        self.ai_location = ai_location
-                        self.logger.info(f"[FETCH] AI detected location: {ai_location}")
-
-            # Download media if present - OPTIONAL based on configuration
-            if self.media:
-                self.logger.info("[FETCH] Downloading media using media service")
-                media_files, temp_path = (
-                    await self.media_service.download_media_with_timeout(
-                        self.post, self.media
-                    )
-                )
-                if media_files:
-                    media_files = self.media_service.validate_media_files(media_files)
-
-                    # If media download failed but we have media, check if media is required
-                    if not media_files:
-                        # Get require_media setting from config
-                        from src.core.unified_config import unified_config
-                        require_media = unified_config.get('automation.require_media', False)
-                        
-                        if require_media:
-                            self.logger.error(
-                                "[FETCH] Media download failed and media is required - aborting post"
-                            )
-                            return False
-                        else:
-                            self.logger.warning(
-                                "[FETCH] Media download failed but media is not required - proceeding without media"
-                            )
-                else:
-                    # No media present - check if media is required
-                    from src.core.unified_config import unified_config
-                    require_media = unified_config.get('automation.require_media', False)
-                    
-                    if require_media:
-                        self.logger.error(
-                            "[FETCH] No media present and media is required - aborting post"
-                        )
-                        return False
-                    else:
-                        self.logger.info(
-                            "[FETCH] No media present but media is not required - proceeding with text-only post"
-                        )
+            await self._ensure_translation()
+
+            # Use media staged ahead of time, otherwise download it now
+            if self._staged_media is not None:
+                media_ok, media_files, temp_path = self._staged_media
+                self._staged_media = None
+                self.logger.info("[FETCH] Using pre-staged media")
+            else:
+                media_ok, media_files, temp_path = await self._collect_media()
+            if not media_ok:
+                return False
 
             # Post to news channel using posting service with intelligence parameters
             success = await self.posting_service.post_to_news_channel(
@@ -342,6 +304,113 @@ class FetchView(ui.View):
 
             return False
 
+    async def _ensure_translation(self) -> None:
+        """Run the AI translation unless it has already been done."""
+        if self.ai_english and self.ai_title:
+            return
+        if not self.arabic_text_clean:
+            return
+        if self.ai_service.structured_enabled():
+            structured = await self.ai_service.analyze_news_structured(self.arabic_text_clean)
+            if structured:
+                self.structured_analysis = structured
+                self.ai_english = structured["translation"]
+                self.ai_title = structured["title"]
+                self.ai_location = structured["location"]
+                self.logger.info(f"[FETCH] Structured AI analysis done, location: {self.ai_location}")
+                return
+        self.logger.info("[FETCH] Processing text with AI services")
+        ai_english, ai_title, ai_location = await self.ai_service.process_text_with_ai(
+            self.arabic_text_clean
+        )
+        if ai_english:
+            self.ai_english = ai_english
+        if ai_title:
+            self.ai_title = ai_title
+        if ai_location:
+            self.ai_location = ai_location
+            self.logger.info(f"[FETCH] AI detected location: {ai_location}")
+
+    async def _collect_media(self):
+        """
+        Download the post's media if present - OPTIONAL based on configuration.
+
+        Returns:
+            tuple: (ok, media_files, temp_path); ok is False if media is
+                required by config but could not be obtained
+        """
+        media_files = []
+        temp_path = None
+        if not self.media:
+            return True, media_files, temp_path
+
+        self.logger.info("[FETCH] Downloading media using media service")
+        media_files, temp_path = (
+            await self.media_service.download_media_with_timeout(
+                self.post, self.media
+            )
+        )
+        # Get require_media setting from config
+        from src.core.unified_config import unified_config
+        require_media = unified_config.get('automation.require_media', False)
+
+        if media_files:
+            media_files = self.media_service.validate_media_files(media_files)
+
+            # If media download failed but we have media, check if media is required
+            if not media_files:
+                if require_media:
+                    self.logger.error(
+                        "[FETCH] Media download failed and media is required - aborting post"
+                    )
+                    return False, media_files, temp_path
+                self.logger.warning(
+                    "[FETCH] Media download failed but media is not required - proceeding without media"
+                )
+        else:
+            # No media present - check if media is required
+            if require_media:
+                self.logger.error(
+                    "[FETCH] No media present and media is required - aborting post"
+                )
+                return False, media_files, temp_path
+            self.logger.info(
+                "[FETCH] No media present but media is not required - proceeding with text-only post"
+            )
+        return True, media_files, temp_path
+
+    async def stage(self) -> bool:
+        """
+        Do the slow work of a post ahead of time.
+
+        Runs the AI translation and downloads the media now, so that a later
+        do_post_to_news() only uploads. Call discard_staged() if the staged
+        post is dropped instead of posted.
+
+        Returns:
+            bool: False if the post cannot go out (required media missing)
+        """
+        translation, media = await asyncio.gather(
+            self._ensure_translation(), self._collect_media(), return_exceptions=True
+        )
+        if isinstance(translation, Exception):
+            # do_post_to_news() retries the translation at posting time
+            self.logger.warning(f"[FETCH] Staging translation failed: {translation}")
+        if isinstance(media, Exception):
+            self.logger.error(f"[FETCH] Staging media failed: {media}")
+            return False
+        self._staged_media = media
+        return media[0]
+
+    def discard_staged(self) -> None:
+        """Remove media downloaded by stage() without posting it."""
+        if self._staged_media is None:
+            return
+        _, media_files, temp_path = self._staged_media
+        self._staged_media = None
+        if media_files and temp_path:
+            self.media_service.cleanup_media_files(media_files, temp_path)
+
     @ui.button(label="Post to News", style=discord.ButtonStyle.success)
     async def post_to_news(
         self, interaction: discord.Interaction, button: ui.Button
@@ -477,10 +546,9 @@ class FetchView(ui.View):
 
             # Add message ID to blacklist
             if hasattr(self.bot, 'json_cache') and self.bot.json_cache:
-                blacklisted_posts = await self.bot.json_cache.get("blacklisted_posts") or []
-                if self.message_id not in blacklisted_posts:
-                    blacklisted_posts.append(self.message_id)
-                    await self.bot.json_cache.set("blacklisted_posts", blacklisted_posts)
+                blacklist = get_blacklist_store(self.bot)
+                if not await blacklist.contains(self.channelname, self.message_id):
+                    await blacklist.add(self.channelname, self.message_id)
                     await self.bot.json_cache.save()
 
                     # Create blacklist confirmation
@@ -10,7 +10,10 @@
 # =============================================================================
 import asyncio
 import re
-from typing import Optional
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 
 # =============================================================================
@@ -22,8 +25,15 @@ from discord.ext import commands
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.blacklist_store import get_blacklist_store
+from src.cache.channel_cursors import get_channel_cursors
+from src.cache.channel_rates import get_channel_rates
+from src.cache.channel_yield import get_channel_yield
+from src.cache.post_jobs import PostJob, get_post_job_store
 from src.components.embeds.base_embed import ErrorEmbed, SuccessEmbed
+from src.core.unified_config import unified_config as config
 from src.utils.base_logger import base_logger as logger
+from src.utils.pipeline import DEFAULT_STAGE_QUEUE_SIZE, Pipeline
 from src.utils.structured_logger import structured_logger
 
 # Import intelligence services
@@ -32,6 +42,39 @@ from src.services.ai_content_analyzer import AIContentAnalyzer
 
 from .fetch_view import FetchView
 
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_FETCH_CONCURRENCY = 4
+DEFAULT_FETCH_WINDOW = 5
+DEFAULT_LOOKAHEAD_MAX_AGE_MINUTES = 30
+DEFAULT_POST_DELAY_SECONDS = 30
+
+# Catch-up after downtime (automation.backfill.*)
+DEFAULT_BACKFILL_PAGE_SIZE = 20
+DEFAULT_BACKFILL_MAX_MESSAGES = 60
+DEFAULT_BACKFILL_MAX_AGE_HOURS = 12
+DEFAULT_BACKFILL_MAX_POSTS = 3
+DEFAULT_BACKFILL_SPACING_SECONDS = 120
+
+# Default worker count per pipeline stage (fetch uses fetch_concurrency)
+DEFAULT_PIPELINE_WORKERS = {
+    "clean": 2,
+    "analyze": 4,
+    "media": 2,
+    "post": 1,
+}
+
+# Yield outcome of each reason a message is released for good
+OUTCOME_BY_REASON = {
+    "missing text": "filtered",
+    "no media": "filtered",
+    "content filter": "filtered",
+    "safety filter": "filtered",
+    "AI skip": "filtered",
+    "duplicate": "duplicate",
+}
+
 # =============================================================================
 # Text Processing Utility Functions
 # =============================================================================
@@ -87,50 +130,66 @@ def remove_source_phrases(text):
 # =============================================================================
 # Blacklist Management Functions
 # =============================================================================
-async def _atomic_blacklist_add(bot, message_id: int, max_retries: int = 3) -> bool:
+async def _atomic_blacklist_add(
+    bot, message_id: int, channel_name: Optional[str] = None
+) -> bool:
     """
-    Atomically add a message ID to the blacklist with retry logic to prevent race conditions.
-    
+    Add a message ID to the blacklist.
+
+    The blacklist store updates its in-memory index before yielding and the
+    cache serializes the write behind its writer lock, so concurrent callers
+    cannot lose each other's entries and no retry is needed.
+
     Args:
         bot: The bot instance
         message_id: The message ID to add to blacklist
-        max_retries: Maximum number of retry attempts
-        
+        channel_name: Telegram channel the message belongs to
+
     Returns:
         bool: True if successfully added, False otherwise
     """
-    logger.info(f"🔒 [BLACKLIST] Attempting to add message {message_id} to blacklist")
-    
-    for attempt in range(max_retries):
-        try:
-            # Get current blacklist
-            blacklist = await bot.json_cache.get("blacklisted_posts") or []
-            current_count = len(blacklist)
-            
-            # Check if already exists (avoid duplicates)
-            if message_id in blacklist:
-                logger.info(f"✅ [BLACKLIST] Message {message_id} already in blacklist (size: {current_count})")
-                return True
-            
-            # Add the new message ID
-            blacklist.append(message_id)
-            
-            # Try to save - this is where race conditions can occur
-            await bot.json_cache.set("blacklisted_posts", blacklist)
-            
-            logger.info(f"✅ [BLACKLIST] Successfully added message {message_id} to blacklist (attempt {attempt + 1}, new size: {len(blacklist)})")
-            return True
-            
-        except Exception as e:
-            logger.warning(f"⚠️ [BLACKLIST] Failed to update blacklist (attempt {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                # Wait a bit before retrying to reduce race condition probability
-                await asyncio.sleep(0.1 * (attempt + 1))  # Exponential backoff
-            else:
-                logger.error(f"❌ [BLACKLIST] Failed to add message {message_id} to blacklist after {max_retries} attempts")
-                return False
-    
-    return False
+    blacklist = get_blacklist_store(bot)
+    if not await blacklist.add(channel_name, message_id):
+        logger.error(f"❌ [BLACKLIST] Failed to add message {message_id} from {channel_name} to blacklist")
+        return False
+    logger.info(f"✅ [BLACKLIST] Message {message_id} from {channel_name} is blacklisted (size: {len(blacklist)})")
+    return True
+
+
+# =============================================================================
+# Fetch Candidate Data Class
+# =============================================================================
+@dataclass
+class FetchCandidate:
+    """A fetched Telegram message that passed the cheap filters."""
+    channel: str
+    message: Any
+    cleaned_text: str
+    analysis: Optional[Any] = None  # ProcessedContent once analyzed
+    post_delay: float = DEFAULT_POST_DELAY_SECONDS  # Delay of the scheduled post
+
+    def rank(self) -> tuple:
+        """Sort key: AI posting priority, then quality, then recency."""
+        date = getattr(self.message, "date", None)
+        recency = date.timestamp() if date else 0.0
+        if self.analysis is None:
+            return (0, 0.0, recency)
+        return (self.analysis.posting_priority, self.analysis.quality.overall_score, recency)
+
+
+@dataclass
+class FetchRequest:
+    """A channel for the pipeline's fetch stage."""
+    channel: str
+    backfill: bool = False  # Walk the history since the cursor, not just the latest
+
+
+@dataclass
+class PreparedPost:
+    """A candidate whose AI work and media download are done, ready to upload."""
+    candidate: FetchCandidate
+    view: FetchView
+    prepared_at: float = field(default_factory=time.monotonic)
 
 
 # =============================================================================
@@ -156,6 +215,21 @@ class StreamlinedFetchCommands(commands.Cog):
         # DUPLICATE PREVENTION: In-memory tracking for messages being processed
         self._processing_messages = set()  # Track messages currently being processed
         self._processing_lock = asyncio.Lock()  # Lock for processing set operations
+
+        # LOOK-AHEAD: Post selected and staged before its slot opens
+        self.prepared_post: Optional[PreparedPost] = None
+        self._lookahead_lock = asyncio.Lock()  # Guards prepared_post only
+
+        # PIPELINE: fetch -> clean -> analyze -> media -> post, built on first use
+        self._pipeline: Optional[Pipeline] = None
+
+        # YIELD: per-channel message outcomes of the running attempts,
+        # recorded to the channel yield store once an attempt ends
+        self._channel_outcomes: Dict[str, Counter] = defaultdict(Counter)
+
+        # SCHEDULED POSTS: staged views of this process's post jobs, keyed by
+        # job ID; jobs loaded after a restart are rebuilt from the job store
+        self._scheduled_views = {}
         
         # Initialize AI services for intelligent analysis
         try:
@@ -169,11 +243,25 @@ class StreamlinedFetchCommands(commands.Cog):
         
         logger.info("🔧 StreamlinedFetchCommands cog initialized (automation only)")
 
-    async def _cleanup_processing_message(self, message_id: int, reason: str = "completed"):
-        """Remove a message from the processing set with logging."""
+    async def _cleanup_processing_message(
+        self, channel_name: str, message_id: int, reason: str = "completed", handled: bool = False
+    ):
+        """
+        Remove a message from the processing set with logging.
+
+        Pass handled=True once the message has been posted or rejected for
+        good, so later fetches no longer return it; the channel's cursor
+        moves past it once no lower fetched message is still pending.
+        Without it the message stays pending and is fetched again.
+        """
         async with self._processing_lock:
-            self._processing_messages.discard(message_id)
+            self._processing_messages.discard((channel_name, message_id))
             logger.debug(f"🔓 [DUPLICATE-PREVENTION] Removed message {message_id} from processing set ({reason})")
+        if handled:
+            await get_channel_cursors(self.bot).advance(channel_name, message_id)
+            outcome = OUTCOME_BY_REASON.get(reason)
+            if outcome:
+                self._channel_outcomes[channel_name][outcome] += 1
 
     async def should_skip_post(self, content: str) -> bool:
         """
@@ -213,6 +301,405 @@ class StreamlinedFetchCommands(commands.Cog):
             # On error, skip the post to be safe
             return True
 
+    # =========================================================================
+    # Candidate Helpers
+    # =========================================================================
+    async def _fetch_messages(self, channel_name: str) -> list:
+        """
+        Fetch the latest unseen messages of a channel.
+
+        Up to automation.fetch_window messages newer than the channel's
+        cursor are returned, so an ad or duplicate on top of the channel
+        does not hide the real news just below it. Only the best of them is
+        posted per cycle. The result also updates the channel's publish-rate
+        estimate.
+
+        Args:
+            channel_name: Name of the Telegram channel to fetch from
+
+        Returns:
+            list: Telethon messages newer than the channel's cursor
+        """
+        # SPAM PREVENTION: Only messages newer than the last message handled
+        # from this channel
+        cursors = get_channel_cursors(self.bot)
+        await cursors.load()
+        last_seen = cursors.get(channel_name)
+        window = max(1, int(config.get("automation.fetch_window", DEFAULT_FETCH_WINDOW)))
+        messages = await self.bot.telegram_client.get_messages(channel_name, limit=window, min_id=last_seen)
+
+        # Feed the publish-rate estimate behind adaptive polling; a full
+        # window may have skipped messages, so its first gap is not counted
+        rates = get_channel_rates(self.bot)
+        await rates.load()
+        await rates.record_fetch(channel_name, messages or [], complete=len(messages or []) < window)
+
+        # Handled messages above a cursor held back by a pending one come
+        # back from min_id fetches; drop them before the filters
+        messages = [message for message in messages or [] if not cursors.is_handled(channel_name, message.id)]
+        cursors.track(channel_name, [message.id for message in messages])
+
+        if not messages:
+            logger.debug(f"[INTELLIGENT-FETCH] No messages newer than {last_seen} in {channel_name}")
+            return []
+        logger.debug(f"[INTELLIGENT-FETCH] Fetched {len(messages)} messages from {channel_name}")
+        return messages
+
+    async def _fetch_backlog(self, channel_name: str) -> list:
+        """
+        Fetch everything a channel published since its cursor, page by page.
+
+        Pages walk backwards with offset_date, bounded below by min_id (the
+        cursor) and automation.backfill.max_age_hours. Channels without a
+        cursor have never been processed, so they have no backlog.
+
+        Args:
+            channel_name: Name of the Telegram channel to fetch from
+
+        Returns:
+            list: Up to automation.backfill.max_messages_per_channel of the
+                newest unseen messages
+        """
+        cursors = get_channel_cursors(self.bot)
+        await cursors.load()
+        last_seen = cursors.get(channel_name)
+        if not last_seen:
+            return []
+
+        page_size = max(1, int(config.get("automation.backfill.page_size", DEFAULT_BACKFILL_PAGE_SIZE)))
+        max_messages = int(config.get("automation.backfill.max_messages_per_channel", DEFAULT_BACKFILL_MAX_MESSAGES))
+        max_age = float(config.get("automation.backfill.max_age_hours", DEFAULT_BACKFILL_MAX_AGE_HOURS))
+        oldest_allowed = datetime.now(timezone.utc) - timedelta(hours=max_age)
+
+        backlog = {}
+        offset_date = None
+        while len(backlog) < max_messages:
+            page = await self.bot.telegram_client.get_messages(
+                channel_name, limit=page_size, offset_date=offset_date, min_id=last_seen
+            )
+            fresh = [message for message in page if message.id not in backlog]
+            if not fresh:
+                break
+            too_old = False
+            for message in fresh:
+                if message.date and message.date < oldest_allowed:
+                    too_old = True
+                else:
+                    backlog[message.id] = message
+            if too_old or len(page) < page_size:
+                break
+            # offset_date is exclusive; step back one second less so messages
+            # sharing the oldest timestamp (albums) are not skipped
+            offset_date = min(message.date for message in page) + timedelta(seconds=1)
+
+        messages = sorted(backlog.values(), key=lambda message: message.id, reverse=True)[:max_messages]
+        logger.info(f"📚 [BACKFILL] {channel_name}: {len(messages)} messages since {last_seen}")
+        return messages
+
+    async def _filter_messages(self, channel_name: str, messages, blacklist) -> List[FetchCandidate]:
+        """
+        Apply the cheap filters to messages of a channel.
+
+        Messages that pass are marked as being processed; the caller must
+        schedule them or release them with _cleanup_processing_message().
+
+        Args:
+            channel_name: Telegram channel the messages belong to
+            messages: Telethon messages, fetched or pushed
+            blacklist: The bot's blacklist store
+
+        Returns:
+            List[FetchCandidate]: Candidates worth an AI analysis
+        """
+        # Get automation config to check requirements
+        automation_config = getattr(self.bot, 'automation_config', {})
+        require_media = automation_config.get('require_media', True)
+        require_text = automation_config.get('require_text', True)
+
+        candidates = []
+        for message in messages:
+            key = (channel_name, message.id)
+            # CRITICAL DUPLICATE PREVENTION: Check both persistent blacklist and in-memory processing
+            async with self._processing_lock:
+                # Check if message is currently being processed
+                if key in self._processing_messages:
+                    logger.warning(f"🚫 [DUPLICATE-PREVENTION] Message {message.id} already being processed, skipping to prevent duplicate")
+                    self._channel_outcomes[channel_name]["duplicate"] += 1
+                    continue
+
+                # Check persistent blacklist
+                if await blacklist.contains(channel_name, message.id):
+                    logger.debug(f"[INTELLIGENT-FETCH] Skipping blacklisted message {message.id}")
+                    self._channel_outcomes[channel_name]["duplicate"] += 1
+                    await get_channel_cursors(self.bot).advance(channel_name, message.id)
+                    continue
+
+                # Mark message as being processed to prevent duplicate processing
+                self._processing_messages.add(key)
+                logger.debug(f"🔒 [DUPLICATE-PREVENTION] Marked message {message.id} as being processed")
+
+            # Check if message has text (if required)
+            if require_text and not message.message:
+                logger.debug(f"[INTELLIGENT-FETCH] Skipping message {message.id} - missing text (text required)")
+                await self._cleanup_processing_message(channel_name, message.id, "missing text", handled=True)
+                continue
+
+            # Check for media requirement (only if required by config)
+            if require_media and not message.media:
+                logger.debug(f"[INTELLIGENT-FETCH] Skipping message {message.id} - text-only post (media required by config)")
+                await self._cleanup_processing_message(channel_name, message.id, "no media", handled=True)
+                continue
+
+            # Clean the message text
+            cleaned_text = message.message
+            if cleaned_text:
+                cleaned_text = remove_emojis(cleaned_text)
+                cleaned_text = remove_links(cleaned_text)
+                cleaned_text = remove_source_phrases(cleaned_text)
+                cleaned_text = cleaned_text.strip()
+
+            # Check if content should be skipped (basic blacklist)
+            if await self.should_skip_post(cleaned_text):
+                logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - basic content filter")
+                await self._cleanup_processing_message(channel_name, message.id, "content filter", handled=True)
+                continue
+
+            candidates.append(FetchCandidate(channel_name, message, cleaned_text))
+        return candidates
+
+    async def _analyze_candidate(self, candidate: FetchCandidate) -> bool:
+        """
+        Run the AI analysis on a candidate and decide whether it is postable.
+
+        Rejected candidates are released from the processing set; unsafe
+        ones are also blacklisted. If the analysis itself fails the candidate
+        stays postable, as before.
+
+        Returns:
+            bool: True if the candidate may be posted
+        """
+        message = candidate.message
+        # 🧠 AI ANALYSIS
+        try:
+            if hasattr(self, 'ai_analyzer') and self.ai_analyzer is not None:
+                ai_processed = await self.ai_analyzer.process_content_intelligently(
+                    raw_content=candidate.cleaned_text,
+                    channel=candidate.channel,
+                    media=[message.media] if message.media else [],
+                    telegram_message=message,
+                    message_id=message.id
+                )
+                candidate.analysis = ai_processed
+
+                logger.info(f"🤖 [AI-ANALYSIS] Message {message.id}: {ai_processed.sentiment.sentiment.value} "
+                          f"| {ai_processed.categories.primary_category.value} "
+                          f"| Quality: {ai_processed.quality.overall_score:.2f} "
+                          f"| Safety: {ai_processed.safety.safety_level.value} "
+                          f"| Should post: {ai_processed.should_post}")
+
+                # Safety filtering
+                if ai_processed.safety.should_filter:
+                    logger.warning(f"🛡️ [SAFETY-FILTER] Skipping message {message.id} - content filtered for safety")
+                    await _atomic_blacklist_add(self.bot, message.id, channel_name=candidate.channel)
+                    await self._cleanup_processing_message(candidate.channel, message.id, "safety filter", handled=True)
+                    return False
+
+                # AI posting recommendation
+                if not ai_processed.should_post:
+                    logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - AI analysis recommends skip")
+                    logger.info(f"[DEBUG] AI rejection reason - Quality: {ai_processed.quality.overall_score:.2f}, Similarity: {ai_processed.similarity_score:.2f}, Safety: {ai_processed.safety.safety_level.value}")
+                    await self._cleanup_processing_message(candidate.channel, message.id, "AI skip", handled=True)
+                    return False
+
+                # Duplicate check
+                if ai_processed.similarity_score > 0.8:
+                    logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - too similar to recent content")
+                    await self._cleanup_processing_message(candidate.channel, message.id, "duplicate", handled=True)
+                    return False
+
+        except Exception as e:
+            logger.error(f"❌ [AI-ANALYSIS] Analysis failed for message {message.id}: {e}")
+        return True
+
+    async def _prepare_candidate(self, candidate: FetchCandidate) -> Optional[PreparedPost]:
+        """
+        Run the slow per-post work for a candidate.
+
+        Urgency analysis, AI translation and the media download run
+        concurrently. With openai.analysis_mode "structured" the translation
+        is a single structured AI call whose urgency, category and safety
+        results replace the separate urgency call; candidates it finds unsafe
+        are rejected like in the analyze stage. Candidates whose required
+        media cannot be obtained are rejected and released.
+
+        Returns:
+            Optional[PreparedPost]: The staged post, or None if rejected
+        """
+        message = candidate.message
+        analysis = candidate.analysis
+        fetch_view = FetchView(
+            self.bot,
+            message,
+            candidate.channel,
+            message_id=message.id,
+            arabic_text_clean=candidate.cleaned_text,
+            auto_mode=True,
+            content_category=analysis.categories.primary_category.value if analysis else "social",
+            quality_score=analysis.quality.overall_score if analysis else 0.7,
+        )
+
+        async def analyze_urgency(ai_result=None):
+            if self.news_intelligence is None:
+                return None
+            try:
+                return await self.news_intelligence.analyze_urgency(
+                    candidate.cleaned_text, candidate.channel, [message.media] if message.media else [],
+                    ai_result=ai_result
+                )
+            except Exception as e:
+                logger.error(f"❌ [URGENCY] Urgency analysis failed for message {message.id}: {e}")
+                return None
+
+        if fetch_view.ai_service.structured_enabled():
+            # The structured call inside stage() also yields the urgency
+            staged = await fetch_view.stage()
+            structured = fetch_view.structured_analysis
+            urgency = await analyze_urgency(NewsIntelligenceService.urgency_from_structured(structured))
+        else:
+            structured = None
+            urgency, staged = await asyncio.gather(analyze_urgency(), fetch_view.stage())
+        if not staged:
+            logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - required media unavailable")
+            fetch_view.discard_staged()
+            await self._cleanup_processing_message(candidate.channel, message.id, "media unavailable", handled=True)
+            return None
+        if structured and analysis is not None and self.ai_analyzer is not None:
+            analysis = await self.ai_analyzer.apply_structured_analysis(
+                analysis, structured, candidate.channel, telegram_message=message, message_id=message.id
+            )
+            candidate.analysis = analysis
+            fetch_view.content_category = analysis.categories.primary_category.value
+            if analysis.safety.should_filter:
+                logger.warning(f"🛡️ [SAFETY-FILTER] Skipping message {message.id} - AI analysis filtered it for safety")
+                fetch_view.discard_staged()
+                await _atomic_blacklist_add(self.bot, message.id, channel_name=candidate.channel)
+                await self._cleanup_processing_message(candidate.channel, message.id, "safety filter", handled=True)
+                return None
+        if urgency is not None:
+            fetch_view.urgency_level = urgency.urgency_level.value
+            fetch_view.should_ping_news = urgency.should_ping
+        return PreparedPost(candidate, fetch_view)
+
+    async def _schedule_candidate(self, candidate: FetchCandidate) -> bool:
+        """Stage a candidate, schedule its delayed post and blacklist it."""
+        return bool(await self.pipeline.run([candidate], start="media", stop="post"))
+
+    async def _telegram_ready(self) -> bool:
+        # Check if Telegram client is available
+        if not hasattr(self.bot, 'telegram_client') or not self.bot.telegram_client:
+            logger.warning("[INTELLIGENT-FETCH] Telegram client not available")
+            return False
+
+        if not await self.bot.telegram_client.is_connected():
+            logger.warning("[INTELLIGENT-FETCH] Telegram client not connected")
+            return False
+        return True
+
+    # =========================================================================
+    # Pipeline Stages
+    # =========================================================================
+    @property
+    def pipeline(self) -> Pipeline:
+        """The fetch -> clean -> analyze -> media -> post pipeline."""
+        if self._pipeline is None:
+            self._pipeline = self._build_pipeline()
+        return self._pipeline
+
+    def _build_pipeline(self) -> Pipeline:
+        """
+        Build the auto-post pipeline from the configured stage sizes.
+
+        The fetch stage runs automation.fetch_concurrency workers; the other
+        stages read automation.pipeline.<stage>_workers. Every stage queue
+        holds at most automation.pipeline.queue_size items.
+        """
+        queue_size = config.get("automation.pipeline.queue_size", DEFAULT_STAGE_QUEUE_SIZE)
+        pipeline = Pipeline("auto-post")
+        pipeline.add_stage(
+            "fetch",
+            self._fetch_stage,
+            config.get("automation.fetch_concurrency", DEFAULT_FETCH_CONCURRENCY),
+            queue_size,
+        )
+        for name, handler in (
+            ("clean", self._clean_stage),
+            ("analyze", self._analyze_stage),
+            ("media", self._media_stage),
+            ("post", self._post_stage),
+        ):
+            workers = config.get(f"automation.pipeline.{name}_workers", DEFAULT_PIPELINE_WORKERS[name])
+            pipeline.add_stage(name, handler, workers, queue_size)
+        return pipeline
+
+    def pipeline_stats(self) -> dict:
+        """Return queue depth, throughput and latency of every pipeline stage."""
+        return self.pipeline.stats()
+
+    async def _fetch_stage(self, request) -> list:
+        """Fetch stage: channel name or FetchRequest -> one (channel, messages) batch."""
+        if not isinstance(request, FetchRequest):
+            request = FetchRequest(request)
+        channel_name = request.channel
+        try:
+            if request.backfill:
+                messages = await self._fetch_backlog(channel_name)
+            else:
+                messages = await self._fetch_messages(channel_name)
+        except Exception as e:
+            logger.error(f"❌ [INTELLIGENT-FETCH] Failed to fetch from {channel_name}: {e}")
+            return []
+        self._channel_outcomes[channel_name]["fetched"] += len(messages)
+        return [(channel_name, messages)] if messages else []
+
+    async def _clean_stage(self, batch) -> List[FetchCandidate]:
+        """Clean stage: (channel, messages) -> the candidates passing the cheap filters."""
+        channel_name, messages = batch
+        return await self._filter_messages(channel_name, messages, get_blacklist_store(self.bot))
+
+    async def _analyze_stage(self, candidate: FetchCandidate) -> List[FetchCandidate]:
+        """Analyze stage: keeps the candidate if the AI analysis finds it postable."""
+        return [candidate] if await self._analyze_candidate(candidate) else []
+
+    async def _media_stage(self, candidate: FetchCandidate) -> List[PreparedPost]:
+        """Media stage: urgency, translation and media download for a candidate."""
+        try:
+            prepared = await self._prepare_candidate(candidate)
+        except Exception as e:
+            logger.error(f"❌ [INTELLIGENT-FETCH] Failed to stage message {candidate.message.id}: {e}")
+            await self._cleanup_processing_message(candidate.channel, candidate.message.id, "staging failed")
+            return []
+        return [prepared] if prepared is not None else []
+
+    async def _post_stage(self, prepared: PreparedPost) -> List[str]:
+        """Post stage: schedules the delayed post and blacklists the message."""
+        candidate = prepared.candidate
+        message_id = candidate.message.id
+        try:
+            delay = candidate.post_delay
+            await self._schedule_delayed_post(prepared.view, message_id, delay, candidate.channel)
+            logger.info(f"⏱️ [INTELLIGENT-FETCH] Scheduled delayed post for message {message_id} in {delay:.0f} seconds")
+
+            # Add to blacklist immediately to prevent duplicate scheduling
+            await _atomic_blacklist_add(self.bot, message_id, channel_name=candidate.channel)
+            await self._cleanup_processing_message(candidate.channel, message_id, "scheduled", handled=True)
+            return [candidate.channel]
+
+        except Exception as e:
+            logger.error(f"❌ [INTELLIGENT-FETCH] Failed to schedule post for message {message_id}: {e}")
+            prepared.view.discard_staged()
+            await self._cleanup_processing_message(candidate.channel, message_id, "schedule failed")
+            return []
+
     # =========================================================================
     # Core Automation Methods
     # =========================================================================
@@ -237,167 +724,395 @@ class StreamlinedFetchCommands(commands.Cog):
         Returns:
             bool: True if posting was successful, False otherwise
         """
-        # SPAM PREVENTION: Global posting lock
-        if not hasattr(self.bot, '_posting_lock'):
-            self.bot._posting_lock = asyncio.Lock()
-        
-        async with self.bot._posting_lock:
-            logger.info(f"🔒 [SPAM-PREVENTION] Acquired posting lock for {channel_name}")
-            try:
-                logger.info(f"🧠 [INTELLIGENT-FETCH] Starting enhanced auto-post for channel: {channel_name}")
-                
-                # Check if Telegram client is available
-                if not hasattr(self.bot, 'telegram_client') or not self.bot.telegram_client:
-                    logger.warning("[INTELLIGENT-FETCH] Telegram client not available")
-                    return False
+        try:
+            logger.info(f"🧠 [INTELLIGENT-FETCH] Starting enhanced auto-post for channel: {channel_name}")
+            if await self._select_from_channels([channel_name], self._schedule_candidate) is not None:
+                return True
 
-                if not await self.bot.telegram_client.is_connected():
-                    logger.warning("[INTELLIGENT-FETCH] Telegram client not connected")
-                    return False
+            logger.info(f"📊 [INTELLIGENT-FETCH] No suitable content found in {channel_name}")
+            return False
+
+        except Exception as e:
+            logger.error(f"❌ [INTELLIGENT-FETCH] Error in auto-fetch for {channel_name}: {e}")
+            return False
+
+    async def fetch_and_post_best(self, channel_names: List[str]) -> Optional[str]:
+        """
+        Fetch from several channels concurrently and post the best candidate.
+
+        All channels go through the fetch stage at once, bounded by its
+        worker count (automation.fetch_concurrency); every request still goes
+        through the Telegram rate limiter. Candidates are cleaned and analyzed
+        by their own stages and ranked by AI posting priority, then quality,
+        then recency. Ties keep the order of channel_names, so callers pass
+        channels in rotation order.
+
+        Args:
+            channel_names: Channels to query, in order of preference
+
+        Returns:
+            Optional[str]: The channel a post was scheduled from, or None
+        """
+        try:
+            return await self._select_from_channels(channel_names, self._schedule_candidate)
+        except Exception as e:
+            logger.error(f"❌ [INTELLIGENT-FETCH] Error in multi-channel auto-fetch: {e}")
+            return None
+
+    async def post_from_ingest_queue(self, breaking_only: bool = False) -> Optional[str]:
+        """
+        Post the best message pushed by the Telegram NewMessage handler.
+
+        Queued messages are tried in queue order (breaking first, then by
+        urgency, then arrival) through the same filters and AI analysis as
+        fetched ones; the first postable one is scheduled. No Telegram
+        request is made to find content.
+
+        Args:
+            breaking_only: Only consider messages flagged as breaking
+
+        Returns:
+            Optional[str]: The channel a post was scheduled from, or None
+        """
+        try:
+            return await self._select_from_queue(breaking_only, self._schedule_candidate)
+        except Exception as e:
+            logger.error(f"❌ [INGEST] Error posting from ingest queue: {e}")
+            return None
+
+    async def _select_from_channels(self, channel_names: List[str], commit) -> Optional[str]:
+        """
+        Run channels through the fetch, clean and analyze stages and commit
+        the best candidate.
+
+        Args:
+            channel_names: Channels to query, in order of preference
+            commit: Coroutine function taking a FetchCandidate; returns True
+                once the candidate is taken (scheduled or staged)
+
+        Returns:
+            Optional[str]: The channel of the committed candidate, or None
+        """
+        if not channel_names or not await self._telegram_ready():
+            return None
+
+        # The clean stage checks the blacklist, so it must be in memory
+        await get_blacklist_store(self.bot).load()
+
+        # Start a fresh outcome tally for the channels of this attempt
+        for name in channel_names:
+            self._channel_outcomes.pop(name, None)
+
+        start = time.monotonic()
+        postable = await self.pipeline.run(channel_names, stop="analyze")
+        logger.info(
+            f"📊 [INTELLIGENT-FETCH] Queried {len(channel_names)} channels in {time.monotonic() - start:.1f}s: "
+            f"{len(postable)} postable candidates"
+        )
+
+        # Stages finish in any order; restore rotation order first so the
+        # stable sort below keeps it for equally ranked candidates
+        order = {name: index for index, name in enumerate(channel_names)}
+        postable.sort(key=lambda c: order.get(c.channel, len(order)))
+
+        chosen = None
+        for candidate in sorted(postable, key=lambda c: c.rank(), reverse=True):
+            if chosen is None and await commit(candidate):
+                chosen = candidate
+            elif chosen is not None:
+                # Not handled: the cursor stays below it, so the next cycle
+                # fetches it again
+                await self._cleanup_processing_message(candidate.channel, candidate.message.id, "not selected")
 
-                # Get blacklisted message IDs
-                blacklisted_ids = await self.bot.json_cache.get("blacklisted_posts") or []
-                logger.debug(f"[INTELLIGENT-FETCH] Loaded {len(blacklisted_ids)} blacklisted message IDs")
-
-                # Fetch messages from the channel (SPAM PREVENTION: Only 1 message at a time)
-                messages = await self.bot.telegram_client.get_messages(channel_name, limit=1)
-                messages_processed = len(messages)
-                logger.debug(f"[INTELLIGENT-FETCH] Fetched {messages_processed} messages from {channel_name}")
-
-                for message in messages:
-                    # CRITICAL DUPLICATE PREVENTION: Check both persistent blacklist and in-memory processing
-                    async with self._processing_lock:
-                        # Check if message is currently being processed
-                        if message.id in self._processing_messages:
-                            logger.warning(f"🚫 [DUPLICATE-PREVENTION] Message {message.id} already being processed, skipping to prevent duplicate")
-                            continue
-                        
-                        # Check persistent blacklist
-                        if message.id in blacklisted_ids:
-                            logger.debug(f"[INTELLIGENT-FETCH] Skipping blacklisted message {message.id}")
-                            continue
-                        
-                        # Mark message as being processed to prevent duplicate processing
-                        self._processing_messages.add(message.id)
-                        logger.debug(f"🔒 [DUPLICATE-PREVENTION] Marked message {message.id} as being processed")
-
-                    # Get automation config to check requirements
-                    automation_config = getattr(self.bot, 'automation_config', {})
-                    require_media = automation_config.get('require_media', True)
-                    require_text = automation_config.get('require_text', True)
-
-                    # Check if message has text (if required)
-                    if require_text and not message.message:
-                        logger.debug(f"[INTELLIGENT-FETCH] Skipping message {message.id} - missing text (text required)")
-                        await self._cleanup_processing_message(message.id, "missing text")
-                        continue
-
-                    # Check for media requirement (only if required by config)
-                    if require_media and not message.media:
-                        logger.debug(f"[INTELLIGENT-FETCH] Skipping message {message.id} - text-only post (media required by config)")
-                        await self._cleanup_processing_message(message.id, "no media")
-                        continue
-
-                    # Clean the message text
-                    cleaned_text = message.message
-                    if cleaned_text:
-                        cleaned_text = remove_emojis(cleaned_text)
-                        cleaned_text = remove_links(cleaned_text)
-                        cleaned_text = remove_source_phrases(cleaned_text)
-                        cleaned_text = cleaned_text.strip()
-
-                    # Check if content should be skipped (basic blacklist)
-                    if await self.should_skip_post(cleaned_text):
-                        logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - basic content filter")
-                        continue
-
-                    # 🧠 AI ANALYSIS
-                    try:
-                        if hasattr(self, 'ai_analyzer') and self.ai_analyzer is not None:
-                            ai_processed = await self.ai_analyzer.process_content_intelligently(
-                                raw_content=cleaned_text,
-                                channel=channel_name,
-                                media=[message.media] if message.media else [],
-                                telegram_message=message,
-                                message_id=message.id
-                            )
-
-                            logger.info(f"🤖 [AI-ANALYSIS] Message {message.id}: {ai_processed.sentiment.sentiment.value} "
-                                      f"| {ai_processed.categories.primary_category.value} "
-                                      f"| Quality: {ai_processed.quality.overall_score:.2f} "
-                                      f"| Safety: {ai_processed.safety.safety_level.value} "
-                                      f"| Should post: {ai_processed.should_post}")
-
-                            # Safety filtering
-                            if ai_processed.safety.should_filter:
-                                logger.warning(f"🛡️ [SAFETY-FILTER] Skipping message {message.id} - content filtered for safety")
-                                await _atomic_blacklist_add(self.bot, message.id)
-                                continue
-
-                            # AI posting recommendation
-                            if not ai_processed.should_post:
-                                logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - AI analysis recommends skip")
-                                logger.info(f"[DEBUG] AI rejection reason - Quality: {ai_processed.quality.overall_score:.2f}, Similarity: {ai_processed.similarity_score:.2f}, Safety: {ai_processed.safety.safety_level.value}")
-                                continue
-
-                            # Duplicate check
-                            if ai_processed.similarity_score > 0.8:
-                                logger.info(f"[INTELLIGENT-FETCH] Skipping message {message.id} - too similar to recent content")
-                                continue
-
-                    except Exception as e:
-                        logger.error(f"❌ [AI-ANALYSIS] Analysis failed for message {message.id}: {e}")
-
-                    # Schedule posting with delay
-                    try:
-                        fetch_view = FetchView(self.bot, auto_mode=True)
-                        await self._schedule_delayed_post(fetch_view, message.id, 30, channel_name)
-                        logger.info(f"⏱️ [INTELLIGENT-FETCH] Scheduled delayed post for message {message.id} in 30 seconds")
-                        
-                        # Add to blacklist immediately to prevent duplicate scheduling
-                        await _atomic_blacklist_add(self.bot, message.id)
-                        await self._cleanup_processing_message(message.id, "scheduled")
-                        
-                        return True
-                        
-                    except Exception as e:
-                        logger.error(f"❌ [INTELLIGENT-FETCH] Failed to schedule post for message {message.id}: {e}")
-                        await self._cleanup_processing_message(message.id, "schedule failed")
-                        continue
-
-                logger.info(f"📊 [INTELLIGENT-FETCH] Processed {messages_processed} messages from {channel_name}, no suitable content found")
-                return False
+        await self._record_yield(channel_names, chosen.channel if chosen else None)
+        if chosen is None:
+            return None
+        logger.info(f"🏆 [INTELLIGENT-FETCH] Selected message {chosen.message.id} from {chosen.channel}")
+        return chosen.channel
+
+    async def _record_yield(self, channel_names: List[str], posted_channel: Optional[str]):
+        """Record one attempt per queried channel in the channel yield store."""
+        try:
+            store = get_channel_yield(self.bot)
+            await store.load()
+            for name in channel_names:
+                outcomes = self._channel_outcomes.pop(name, Counter())
+                await store.record_attempt(name, outcomes, posted=name == posted_channel)
+        except Exception as e:
+            logger.error(f"❌ [YIELD] Failed to record channel yield: {e}")
+
+    async def _select_from_queue(self, breaking_only: bool, commit) -> Optional[str]:
+        """
+        Commit the first postable message of the ingest queue.
+
+        Args:
+            breaking_only: Only consider messages flagged as breaking
+            commit: Coroutine function taking a FetchCandidate; returns True
+                once the candidate is taken (scheduled or staged)
+
+        Returns:
+            Optional[str]: The channel of the committed candidate, or None
+        """
+        if not await self._telegram_ready():
+            return None
+        queue = getattr(self.bot.telegram_client, 'ingest_queue', None)
+        if queue is None:
+            return None
+
+        # The clean stage checks the blacklist, so it must be in memory
+        await get_blacklist_store(self.bot).load()
+
+        tried = 0
+        while (item := queue.pop(breaking_only=breaking_only)) is not None:
+            tried += 1
+            postable = await self.pipeline.run([(item.channel, [item.message])], start="clean", stop="analyze")
+            for candidate in postable:
+                if await commit(candidate):
+                    logger.info(
+                        f"📥 [INGEST] Took pushed message {item.message.id} from {item.channel} "
+                        f"({time.monotonic() - item.received_at:.0f}s after arrival)"
+                    )
+                    return item.channel
+
+        if tried:
+            logger.info(f"📊 [INGEST] Tried {tried} queued messages, no suitable content found")
+        return None
+
+    # =========================================================================
+    # Catch-Up Methods
+    # =========================================================================
+    async def backfill(self, channel_names: List[str]) -> List[str]:
+        """
+        Catch up on what the channels published while the bot was down.
+
+        Each channel's history since its cursor is fetched in pages and
+        scored in bulk by the clean and analyze stages. The best
+        automation.backfill.max_posts candidates are scheduled
+        automation.backfill.spacing_seconds apart so the catch-up does not
+        flood Discord; the rest are marked handled, so regular fetches do
+        not return to them.
+
+        Args:
+            channel_names: Channels to catch up on, in order of preference
+
+        Returns:
+            List[str]: The channels of the scheduled posts, best first
+        """
+        try:
+            if not channel_names or not await self._telegram_ready():
+                return []
+            await get_blacklist_store(self.bot).load()
+
+            max_posts = int(config.get("automation.backfill.max_posts", DEFAULT_BACKFILL_MAX_POSTS))
+            spacing = float(config.get("automation.backfill.spacing_seconds", DEFAULT_BACKFILL_SPACING_SECONDS))
+
+            start = time.monotonic()
+            requests = [FetchRequest(name, backfill=True) for name in channel_names]
+            postable = await self.pipeline.run(requests, stop="analyze")
+            order = {name: index for index, name in enumerate(channel_names)}
+            postable.sort(key=lambda c: order.get(c.channel, len(order)))
+
+            posted = []
+            for candidate in sorted(postable, key=lambda c: c.rank(), reverse=True):
+                if len(posted) < max_posts:
+                    candidate.post_delay = DEFAULT_POST_DELAY_SECONDS + len(posted) * spacing
+                    if await self._schedule_candidate(candidate):
+                        posted.append(candidate.channel)
+                    continue
+                await self._cleanup_processing_message(
+                    candidate.channel, candidate.message.id, "not selected in backfill", handled=True
+                )
+
+            logger.info(
+                f"📚 [BACKFILL] Scored {len(postable)} postable backlog messages from {len(channel_names)} "
+                f"channels in {time.monotonic() - start:.1f}s, scheduled {len(posted)}"
+            )
+            return posted
+
+        except Exception as e:
+            logger.error(f"❌ [BACKFILL] Catch-up failed: {e}")
+            return []
+
+    # =========================================================================
+    # Look-Ahead Preparation Methods
+    # =========================================================================
+    async def prepare_next_post(self, channel_names: List[str]) -> Optional[str]:
+        """
+        Select and stage the next post ahead of its slot.
+
+        The candidate is chosen like a regular auto-post (pushed messages
+        first, then the given channels), and its urgency analysis, AI
+        translation and media download all run now. post_prepared() then
+        only has to upload when the slot opens, so AI latency never delays
+        the post.
+
+        Args:
+            channel_names: Channels to query if the ingest queue has nothing
+                postable, in order of preference
+
+        Returns:
+            Optional[str]: The channel of the staged post, or None
+        """
+        async with self._lookahead_lock:
+            try:
+                if self.prepared_post is not None:
+                    return self.prepared_post.candidate.channel
+
+                start = time.monotonic()
+                channel = await self._select_from_queue(False, self._hold_candidate)
+                if channel is None:
+                    channel = await self._select_from_channels(channel_names, self._hold_candidate)
+                if channel:
+                    logger.info(f"🗂️ [LOOKAHEAD] Staged next post from {channel} in {time.monotonic() - start:.1f}s")
+                return channel
 
             except Exception as e:
-                logger.error(f"❌ [INTELLIGENT-FETCH] Error in auto-fetch for {channel_name}: {e}")
-                return False
+                logger.error(f"❌ [LOOKAHEAD] Error preparing next post: {e}")
+                return None
+
+    async def post_prepared(self) -> Optional[str]:
+        """
+        Upload the post staged by prepare_next_post().
+
+        Staged posts older than automation.lookahead_max_age_minutes are
+        dropped, since fresher news has likely arrived since.
+
+        Returns:
+            Optional[str]: The channel posted from, or None if nothing was
+                staged or the upload failed
+        """
+        prepared, self.prepared_post = self.prepared_post, None
+        if prepared is None:
+            return None
+        candidate = prepared.candidate
+        message_id = candidate.message.id
+        try:
+            max_age = float(config.get("automation.lookahead_max_age_minutes", DEFAULT_LOOKAHEAD_MAX_AGE_MINUTES)) * 60
+            if time.monotonic() - prepared.prepared_at > max_age:
+                logger.info(f"🗑️ [LOOKAHEAD] Dropping stale staged message {message_id} from {candidate.channel}")
+                prepared.view.discard_staged()
+                await self._cleanup_processing_message(candidate.channel, message_id, "stale")
+                return None
+
+            if await get_blacklist_store(self.bot).contains(candidate.channel, message_id):
+                logger.info(f"🚫 [LOOKAHEAD] Staged message {message_id} was posted by another path")
+                prepared.view.discard_staged()
+                await self._cleanup_processing_message(candidate.channel, message_id, "already posted", handled=True)
+                return None
+
+            await _atomic_blacklist_add(self.bot, message_id, channel_name=candidate.channel)
+            if not await prepared.view.do_post_to_news():
+                await self._cleanup_processing_message(candidate.channel, message_id, "post failed", handled=True)
+                return None
+
+            logger.info(
+                f"✅ [LOOKAHEAD] Posted staged message {message_id} from {candidate.channel} "
+                f"({time.monotonic() - prepared.prepared_at:.0f}s after staging)"
+            )
+            await self._cleanup_processing_message(candidate.channel, message_id, "posted", handled=True)
+            return candidate.channel
+
+        except Exception as e:
+            logger.error(f"❌ [LOOKAHEAD] Failed to post staged message {message_id}: {e}")
+            prepared.view.discard_staged()
+            await self._cleanup_processing_message(candidate.channel, message_id, "post failed")
+            return None
+
+    async def _hold_candidate(self, candidate: FetchCandidate) -> bool:
+        """Stage a candidate and keep it for post_prepared()."""
+        staged = await self.pipeline.run([candidate], start="media", stop="media")
+        if not staged:
+            return False
+        self.prepared_post = staged[0]
+        return True
 
     async def _schedule_delayed_post(self, fetch_view, message_id, delay, channel_name):
-        """Schedule a delayed post with proper error handling."""
-        async def delayed_post():
+        """
+        Schedule a staged post as a durable job in the state store.
+
+        The job carries the staged AI results, so it survives a restart
+        without repeating the AI work; the scheduled post task executes it
+        through execute_post_job() once due.
+        """
+        job = PostJob(
+            channel=channel_name,
+            message_id=message_id,
+            due_at=time.time() + delay,
+            arabic_text=fetch_view.arabic_text_clean or "",
+            ai_english=fetch_view.ai_english,
+            ai_title=fetch_view.ai_title,
+            ai_location=fetch_view.ai_location,
+            urgency_level=fetch_view.urgency_level,
+            should_ping_news=fetch_view.should_ping_news,
+            content_category=fetch_view.content_category,
+            quality_score=fetch_view.quality_score,
+        )
+        store = get_post_job_store(self.bot)
+        await store.load()
+        self._scheduled_views[job.job_id] = fetch_view
+        if not await store.add(job):
+            logger.warning(f"⚠️ [DELAYED-POST] Message {message_id} is scheduled but would not survive a restart")
+
+    async def execute_post_job(self, job: PostJob) -> bool:
+        """
+        Post a due job.
+
+        Jobs scheduled by this process reuse their staged view (media
+        already downloaded). Jobs loaded after a restart get a view rebuilt
+        from the stored AI results, with the message refetched for its media.
+
+        Returns:
+            bool: True if the post went out
+        """
+        message_id = job.message_id
+        channel_name = job.channel
+        logger.info(f"🚀 [DELAYED-POST] Attempting to post delayed message {message_id} from {channel_name}")
+        try:
+            # Verify message is still blacklisted (should be)
+            if not await get_blacklist_store(self.bot).contains(channel_name, message_id):
+                logger.warning(f"⚠️ [DELAYED-POST] Message {message_id} not in blacklist, may be duplicate")
+            else:
+                logger.debug(f"✅ [DELAYED-POST] Message {message_id} is properly blacklisted")
+
+            fetch_view = self._scheduled_views.pop(job.job_id, None)
+            if fetch_view is None:
+                fetch_view = await self._rebuild_view(job)
+
+            # Post the message (AI results and media were staged beforehand)
+            if await fetch_view.do_post_to_news():
+                logger.info(f"✅ [DELAYED-POST] Successfully posted message {message_id} from {channel_name}")
+                return True
+            logger.error(f"❌ [DELAYED-POST] Failed to post message {message_id}")
+            return False
+
+        except Exception as e:
+            logger.error(f"❌ [DELAYED-POST] Failed to post message {message_id}: {e}")
+            return False
+
+    async def _rebuild_view(self, job: PostJob) -> FetchView:
+        """Recreate the view of a job scheduled before a restart."""
+        message = None
+        if await self._telegram_ready():
             try:
-                await asyncio.sleep(delay)
-                logger.info(f"🚀 [DELAYED-POST] Attempting to post delayed message {message_id} from {channel_name}")
-                
-                # Verify message is still blacklisted (should be)
-                blacklisted_ids = await self.bot.json_cache.get("blacklisted_posts") or []
-                if message_id not in blacklisted_ids:
-                    logger.warning(f"⚠️ [DELAYED-POST] Message {message_id} not in blacklist, may be duplicate")
-                else:
-                    logger.debug(f"✅ [DELAYED-POST] Message {message_id} is properly blacklisted")
-                
-                # Post the message
-                try:
-                    await fetch_view.post_to_news(None, message_id, "auto_mode")
-                    logger.info(f"✅ [DELAYED-POST] Successfully posted message {message_id} from {channel_name}")
-                except Exception as e:
-                    logger.error(f"❌ [DELAYED-POST] Failed to post message {message_id}: {e}")
-                    
+                message = await self.bot.telegram_client.get_message(job.channel, job.message_id)
             except Exception as e:
-                logger.error(f"❌ [DELAYED-POST] Error in delayed post task for message {message_id}: {e}")
-        
-        # Create and start the delayed post task
-        asyncio.create_task(delayed_post())
+                logger.warning(f"⚠️ [DELAYED-POST] Could not refetch message {job.message_id} for its media: {e}")
+        logger.info(f"♻️ [DELAYED-POST] Restoring message {job.message_id} from {job.channel} with its stored AI results")
+        return FetchView(
+            self.bot,
+            message,
+            job.channel,
+            message_id=job.message_id,
+            arabic_text_clean=job.arabic_text,
+            ai_english=job.ai_english,
+            ai_title=job.ai_title,
+            ai_location=job.ai_location,
+            auto_mode=True,
+            urgency_level=job.urgency_level,
+            should_ping_news=job.should_ping_news,
+            content_category=job.content_category,
+            quality_score=job.quality_score,
+        )
 
     async def auto_post_from_channel(self, channel_name: str) -> bool:
         """
@@ -113,7 +113,29 @@ class UnifiedConfig:
             'openai': {
                 'api_key': None,
                 'model': 'gpt-3.5-turbo',
-                'max_tokens': 4000
+                'max_tokens': 4000,
+                'max_retries': 2,
+                # Concurrent identical requests share one in-flight call
+                'coalesce_requests': True,
+                # "structured": one schema-constrained call per message;
+                # "separate": translation, location and urgency calls
+                'analysis_mode': 'separate',
+                'structured_model': 'gpt-4o-mini',
+                # Keep-alive pool shared by every AI call site
+                'pool': {
+                    'max_connections': 20,
+                    'max_keepalive_connections': 10,
+                    'keepalive_expiry': 120
+                },
+                # Request timeouts in seconds, by call site
+                'timeouts': {
+                    'default': 30,
+                    'translation': 45,
+                    'location': 20,
+                    'urgency': 15,
+                    'analysis': 30,
+                    'health_check': 10
+                }
             },
             
             # Automation settings
@@ -125,13 +147,47 @@ class UnifiedConfig:
                 'require_text': True,
                 'min_content_length': 50,
                 'use_ai_filtering': True,
-                'max_posts_per_session': 1
+                'max_posts_per_session': 1,
+                'fetch_mode': 'rotation',  # or 'concurrent' (all channels per cycle)
+                'fetch_concurrency': 4,
+                'fetch_window': 5,  # newest unseen messages considered per channel
+                'channel_selection': 'rotation',  # or 'adaptive' (publish rate) / 'bandit' (post yield)
+                'adaptive_polling': {
+                    'alpha': 0.3,  # EWMA weight of the newest inter-message gap
+                    'poll_factor': 0.5,  # poll interval as a fraction of the expected gap
+                    'min_poll_minutes': 5,
+                    'max_poll_minutes': 180
+                },
+                'push_ingest': True,  # queue NewMessage events for the auto-poster
+                'ingest_queue_size': 500,
+                'ingest_max_age_minutes': 180,
+                'breaking_urgency_threshold': 0.045,
+                'breaking_min_interval_minutes': 15,
+                'lookahead_seconds': 120,  # stage the next post this long before its slot
+                'lookahead_max_age_minutes': 30,
+                'bandit': {
+                    'decay': 0.98  # weight kept by past attempts on every new one
+                },
+                'backfill': {  # catch-up after downtime
+                    'enabled': True,
+                    'max_age_hours': 12,
+                    'max_messages_per_channel': 60,
+                    'max_posts': 3,
+                    'page_size': 20,
+                    'spacing_seconds': 120
+                },
+                'pipeline': {  # per-stage workers; fetch uses fetch_concurrency
+                    'clean_workers': 2,
+                    'analyze_workers': 4,
+                    'media_workers': 2,
+                    'post_workers': 1,
+                    'queue_size': 32
+                }
             },
             
             # Channel management
             'channels': {
                 'active': [],
-                'blacklisted_posts': [],
                 'channel_metadata': {}
             },
             
@@ -246,8 +302,8 @@ class UnifiedConfig:
             if 'telegram_channels' in legacy_data:
                 self.config_data['channels']['active'] = legacy_data['telegram_channels']
             
-            if 'blacklisted_posts' in legacy_data:
-                self.config_data['channels']['blacklisted_posts'] = legacy_data['blacklisted_posts']
+            # Blacklisted posts stay in the cache's blacklist store, which ages
+            # them out; copying them here would only grow the config forever
             
             if 'channel_metadata' in legacy_data:
                 self.config_data['channels']['channel_metadata'] = legacy_data['channel_metadata']
@@ -27,7 +27,9 @@ from aiohttp import web
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.translation_cache import translation_cache
 from src.utils.base_logger import base_logger as logger
+from src.utils.openai_client import openai_clients
 
 
 # =============================================================================
@@ -428,10 +430,17 @@ class HealthCheckService:
             else:
                 last_post_ago = None
 
-            return {
+            metrics = {
                 "interval_minutes": getattr(self.bot, "auto_post_interval", 0),
                 "last_post_seconds_ago": last_post_ago,
             }
+
+            fetch_commands = getattr(self.bot, "fetch_commands", None)
+            if fetch_commands is not None and hasattr(fetch_commands, "pipeline_stats"):
+                metrics["pipeline"] = fetch_commands.pipeline_stats()
+            metrics["translation_cache"] = translation_cache.stats()
+            metrics["ai_requests"] = openai_clients.requests.stats()
+            return metrics
         except Exception as e:
             logger.error(f"❌ Error getting auto-post metrics: {e}")
             return {"error": str(e)}
@@ -507,4 +516,24 @@ class HealthCheckService:
                 ]
             )
 
+        # Auto-post pipeline metrics (one sample per stage)
+        pipeline = metrics.get("auto_posting", {}).get("pipeline")
+        if pipeline:
+            for name, help_text, key in (
+                ("newsbot_pipeline_queue_depth", "Items waiting in a pipeline stage", "queue_depth"),
+                ("newsbot_pipeline_active", "Items being processed by a pipeline stage", "active"),
+                ("newsbot_pipeline_avg_latency_milliseconds", "Average pipeline stage latency", "avg_latency_ms"),
+            ):
+                lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} gauge"])
+                lines.extend(
+                    f'{name}{{stage="{stage}"}} {stats.get(key, 0)} {timestamp}'
+                    for stage, stats in pipeline.items()
+                )
+            lines.extend(["# HELP newsbot_pipeline_processed_total Items processed by a pipeline stage",
+                          "# TYPE newsbot_pipeline_processed_total counter"])
+            lines.extend(
+                f'newsbot_pipeline_processed_total{{stage="{stage}"}} {stats.get("processed", 0)} {timestamp}'
+                for stage, stats in pipeline.items()
+            )
+
         return "\n".join(lines) + "\n"
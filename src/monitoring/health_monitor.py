@@ -3,7 +3,6 @@ Enhanced Health Monitoring System for NewsBot
 Provides comprehensive system health tracking and alerting.
 """
 
-import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -194,10 +193,9 @@ class HealthMonitor:
         start_time = time.time()
         
         try:
-            import openai
-            api_key = config.get("openai.api_key")
+            from src.utils.openai_client import openai_clients
             
-            if not api_key:
+            if openai_clients.get_client() is None:
                 return HealthCheck(
                     name="OpenAI API",
                     status=HealthStatus.CRITICAL,
@@ -207,17 +205,12 @@ class HealthMonitor:
                     duration_ms=(time.time() - start_time) * 1000
                 )
             
-            # Test API with a simple request
-            client = openai.OpenAI(api_key=api_key)
-            
             # Use a very small test request to minimize costs
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": "test"}],
-                    max_tokens=1
-                )
+            response = await openai_clients.chat(
+                "health_check",
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "test"}],
+                max_tokens=1
             )
             
             return HealthCheck(
@@ -346,8 +339,8 @@ class HealthMonitor:
         start_time = time.time()
         
         try:
-            # Test JSON cache access
-            cache = JSONCache()
+            # Test access to the bot's cache, or the default JSON cache
+            cache = getattr(self.bot, "json_cache", None) or JSONCache()
             
             # Simple read test
             test_data = await cache.get("automation_config")
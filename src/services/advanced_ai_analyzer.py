@@ -12,9 +12,9 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
 import re
 
-import openai
 from src.utils.base_logger import base_logger as logger
 from src.core.unified_config import unified_config as config
+from src.utils.openai_client import openai_clients
 
 
 class EmotionalDimension(Enum):
@@ -96,7 +96,6 @@ class AdvancedAIAnalyzer:
     
     def __init__(self):
         """Initialize the advanced analyzer."""
-        self.openai_client = openai
         self.analysis_cache: Dict[str, ContentInsights] = {}
         self.cache_ttl = 3600  # 1 hour cache
         
@@ -273,7 +272,8 @@ Respond in JSON format with analysis and suggestions.
         try:
             prompt = self.prompts['emotional_analysis'].format(content=content[:2000])
             
-            response = await self.openai_client.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are an expert in emotional analysis and psychology, specializing in Arabic and Middle Eastern content."},
@@ -310,7 +310,8 @@ Respond in JSON format with analysis and suggestions.
         try:
             prompt = self.prompts['credibility_analysis'].format(content=content[:2000])
             
-            response = await self.openai_client.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are an expert fact-checker and media literacy specialist with deep knowledge of Middle Eastern news sources."},
@@ -347,7 +348,8 @@ Respond in JSON format with analysis and suggestions.
         try:
             prompt = self.prompts['viral_prediction'].format(content=content[:2000])
             
-            response = await self.openai_client.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are a social media expert specializing in viral content prediction and engagement optimization."},
@@ -376,7 +378,8 @@ Respond in JSON format with analysis and suggestions.
         try:
             prompt = self.prompts['cultural_analysis'].format(content=content[:2000])
             
-            response = await self.openai_client.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are a cultural expert specializing in Middle Eastern, Arab, and Syrian culture with deep understanding of cross-cultural communication."},
@@ -12,9 +12,9 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
 import re
 
-import openai
 from src.utils.base_logger import base_logger as logger
 from src.core.unified_config import unified_config as config
+from src.utils.openai_client import openai_clients
 
 
 class EmotionalDimension(Enum):
@@ -191,7 +191,8 @@ Content: {content[:1500]}
 Respond in JSON format with numerical scores.
 """
             
-            response = await openai.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are an expert in emotional analysis specializing in Arabic and Middle Eastern content."},
@@ -244,7 +245,8 @@ Content: {content[:1500]}
 Respond in JSON format.
 """
             
-            response = await openai.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are an expert fact-checker and media literacy specialist."},
@@ -287,7 +289,8 @@ Content: {content[:1500]}
 Respond in JSON format.
 """
             
-            response = await openai.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are a social media expert specializing in viral content prediction."},
@@ -330,7 +333,8 @@ Content: {content[:1500]}
 Respond in JSON format.
 """
             
-            response = await openai.ChatCompletion.acreate(
+            response = await openai_clients.chat(
+                "analysis",
                 model=config.get("openai.model", "gpt-4-turbo-preview"),
                 messages=[
                     {"role": "system", "content": "You are a cultural expert specializing in Middle Eastern and Syrian culture."},
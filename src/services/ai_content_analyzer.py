@@ -444,19 +444,7 @@ class AIContentAnalyzer:
                 safety_issues.append("Video content with graphic descriptions - high risk")
                 confidence = min(confidence + 0.2, 1.0)
             
-            # Determine if content should be filtered (TEMPORARY: Only filter the most extreme content)
-            should_filter = primary_safety in [ContentSafety.DISTURBING]  # Only filter extremely disturbing content
-            
-            # Generate content warning if needed
-            content_warning = None
-            if primary_safety == ContentSafety.SENSITIVE:
-                content_warning = "⚠️ Content may contain descriptions of violence or casualties"
-            elif primary_safety == ContentSafety.GRAPHIC:
-                content_warning = "🚨 Graphic content - contains descriptions of violence and injuries"
-                should_filter = True  # Always filter graphic content
-            elif primary_safety == ContentSafety.DISTURBING:
-                content_warning = "🚨 Disturbing content - contains extremely violent material"
-                should_filter = True  # Always filter disturbing content
+            should_filter, content_warning = self._safety_decision(primary_safety)
             
             # Log safety analysis
             if should_filter:
@@ -499,6 +487,19 @@ class AIContentAnalyzer:
                 content_warning="⚠️ Content could not be analyzed for safety"
             )
 
+    @staticmethod
+    def _safety_decision(safety_level: ContentSafety) -> Tuple[bool, Optional[str]]:
+        """Return whether content of a safety level is filtered, and its content warning."""
+        if safety_level == ContentSafety.SENSITIVE:
+            return False, "⚠️ Content may contain descriptions of violence or casualties"
+        if safety_level == ContentSafety.GRAPHIC:
+            return True, "🚨 Graphic content - contains descriptions of violence and injuries"  # Always filter graphic content
+        if safety_level == ContentSafety.DISTURBING:
+            return True, "🚨 Disturbing content - contains extremely violent material"  # Always filter disturbing content
+        if safety_level == ContentSafety.BANNED:
+            return True, "🚫 Content must not be posted"
+        return False, None
+
     # =========================================================================
     # Sentiment Analysis Methods
     # =========================================================================
@@ -823,6 +824,81 @@ class AIContentAnalyzer:
                 processing_notes=["Processing failed, using defaults"]
             )
 
+    async def apply_structured_analysis(self, processed: ProcessedContent, structured: Dict[str, Any],
+                                        channel: str = None, telegram_message=None,
+                                        message_id: int = None) -> ProcessedContent:
+        """
+        Refine a keyword analysis with the result of the structured AI analysis.
+        
+        Translation, sentiment, categories and safety come from the AI;
+        quality and similarity stay with the local checks. The posting
+        decision and priority are recomputed from the combined result.
+        
+        Args:
+            processed: Keyword analysis from process_content_intelligently()
+            structured: Result of analyze_news_structured()
+            channel: Source channel, for the safety log
+            telegram_message: Original telegram message for button actions
+            message_id: Message ID for reference
+            
+        Returns:
+            ProcessedContent with the AI results applied
+        """
+        try:
+            sentiment = SentimentResult(
+                sentiment=Sentiment(structured['sentiment']),
+                confidence=0.9,
+                emotional_indicators=processed.sentiment.emotional_indicators,
+                tone=processed.sentiment.tone
+            )
+            categories = CategoryResult(
+                primary_category=NewsCategory(structured['category']),
+                secondary_categories=[NewsCategory(value) for value in structured.get('secondary_categories', [])],
+                confidence=0.9,
+                category_indicators=processed.categories.category_indicators
+            )
+            safety_level = ContentSafety(structured['safety_level'])
+            should_filter, content_warning = self._safety_decision(safety_level)
+            safety = SafetyResult(
+                safety_level=safety_level,
+                confidence=0.9,
+                graphic_indicators=processed.safety.graphic_indicators,
+                safety_issues=list(structured.get('safety_issues', [])),
+                should_filter=should_filter,
+                content_warning=content_warning
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Structured analysis unusable, keeping keyword analysis: {e}")
+            return processed
+        
+        if safety_level != processed.safety.safety_level and safety_level != ContentSafety.SAFE:
+            logger.info(f"🛡️ AI flagged content as {safety_level.value} (keywords: {processed.safety.safety_level.value})")
+            await self._send_discord_log({
+                'safety_level': safety_level.value,
+                'confidence': safety.confidence,
+                'content': processed.original_content[:500],
+                'indicators': safety.safety_issues,
+                'content_warning': content_warning,
+                'channel': channel or 'Auto-Analysis',
+                'telegram_message': telegram_message,
+                'message_id': message_id
+            })
+        
+        notes = list(processed.processing_notes)
+        notes.append(f"Structured AI analysis: {sentiment.sentiment.value} | {categories.primary_category.value} | {safety_level.value}")
+        return ProcessedContent(
+            original_content=processed.original_content,
+            translated_content=structured.get('translation') or processed.translated_content,
+            sentiment=sentiment,
+            categories=categories,
+            quality=processed.quality,
+            safety=safety,
+            similarity_score=processed.similarity_score,
+            should_post=self._decide_posting(sentiment, processed.quality, processed.similarity_score, categories, safety),
+            posting_priority=self._calculate_priority(sentiment, categories, processed.quality),
+            processing_notes=notes
+        )
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -1063,6 +1139,8 @@ class ContentFilterView(discord.ui.View):
             if hasattr(self.bot, '_manual_verification_delay_until') and 'auto_fetch' in self.bot._manual_verification_delay_until:
                 del self.bot._manual_verification_delay_until['auto_fetch']
                 logger.info("🚀 Manual verification delay cleared - admin approved content")
+                if hasattr(self.bot, 'wake_auto_poster'):
+                    self.bot.wake_auto_poster("manual verification delay lifted")
             
             logger.warning(f"🛡️ [ADMIN-OVERRIDE] Content posted despite safety filtering by {interaction.user.id}: {self.safety_level}")
             
@@ -1157,10 +1235,10 @@ class ContentFilterView(discord.ui.View):
 
             # Add message ID to blacklist
             if hasattr(self.bot, 'json_cache') and self.bot.json_cache and self.message_id:
-                blacklisted_posts = await self.bot.json_cache.get("blacklisted_posts") or []
-                if self.message_id not in blacklisted_posts:
-                    blacklisted_posts.append(self.message_id)
-                    await self.bot.json_cache.set("blacklisted_posts", blacklisted_posts)
+                from src.cache.blacklist_store import get_blacklist_store
+                blacklist = get_blacklist_store(self.bot)
+                if not await blacklist.contains(self.channel, self.message_id):
+                    await blacklist.add(self.channel, self.message_id)
                     await self.bot.json_cache.save()
 
                     # Create blacklist confirmation
@@ -1185,6 +1263,8 @@ class ContentFilterView(discord.ui.View):
                     if hasattr(self.bot, '_manual_verification_delay_until') and 'auto_fetch' in self.bot._manual_verification_delay_until:
                         del self.bot._manual_verification_delay_until['auto_fetch']
                         logger.info("🚀 Manual verification delay cleared - admin blacklisted content")
+                        if hasattr(self.bot, 'wake_auto_poster'):
+                            self.bot.wake_auto_poster("manual verification delay lifted")
 
                     logger.info(f"🚫 [BLACKLIST] Content safety post {self.message_id} from {self.channel} blacklisted by {interaction.user.id}")
                 else:
@@ -8,25 +8,30 @@
 # =============================================================================
 # Standard Library Imports
 # =============================================================================
-import asyncio
 import os
 import re
 from typing import Optional, Tuple, Dict, Any
 
-# =============================================================================
-# Third-Party Library Imports
-# =============================================================================
-import openai
-
 # =============================================================================
 # Local Application Imports
 # =============================================================================
+from src.cache.translation_cache import translation_cache
+from src.services.structured_analysis import analyze_news_structured
 from src.utils.ai_utils import call_chatgpt_for_news
 from src.utils import error_handler
 from src.utils.base_logger import base_logger as logger
+from src.utils.openai_client import openai_clients
 from src.utils.text_utils import remove_emojis
 from src.core.unified_config import unified_config as config
 
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+# Translation cache namespaces; bump a version whenever its prompt changes
+TRANSLATION_CACHE_NAMESPACE = "translation:v1:gpt-3.5-turbo"
+TITLE_CACHE_NAMESPACE = "title:v1:gpt-3.5-turbo"
+LOCATION_CACHE_NAMESPACE = "location:v1:gpt-4o-mini"
+
 # =============================================================================
 # AI Service Class
 # =============================================================================
@@ -39,14 +44,29 @@ class AIService:
         self.bot = bot
         self.logger = logger
 
-        # Initialize OpenAI client using config manager
-        api_key = config.get("openai.api_key")
-        if not api_key:
+        # Shared process-wide OpenAI client
+        self.openai_client = openai_clients.get_client()
+        if self.openai_client is None:
             logger.error("❌ OpenAI API key not found in configuration")
-            self.openai_client = None
-        else:
-            self.openai_client = openai.AsyncOpenAI(api_key=api_key)
-            logger.debug("✅ OpenAI client initialized from config")
+
+    @staticmethod
+    def structured_enabled() -> bool:
+        """Whether messages are analyzed with one structured call (openai.analysis_mode)."""
+        return config.get("openai.analysis_mode", "separate") == "structured"
+
+    async def analyze_news_structured(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Translate and analyze a message with one structured AI call.
+
+        Returns:
+            Optional[Dict[str, Any]]: Translation, title, location, ad and
+                relevance flags, urgency, category, sentiment and safety, or
+                None if the text is too short or the call failed
+        """
+        cleaned_text = self._clean_arabic_text(text)
+        if len(cleaned_text) < 50 or self.openai_client is None:
+            return None
+        return await analyze_news_structured(cleaned_text)
 
     async def process_text_with_ai(self, text: str, require_media: bool = True) -> tuple:
         """
@@ -64,9 +84,15 @@ class AIService:
                 self.logger.debug(f"🧠 [AI-DEBUG] Text too short ({len(cleaned_text)} chars), skipping AI processing")
                 return None, None, None
 
+            if self.structured_enabled():
+                structured = await analyze_news_structured(cleaned_text)
+                if structured:
+                    return structured["translation"], structured["title"], structured["location"]
+                self.logger.debug("🧠 [AI-DEBUG] Structured analysis failed, using separate calls")
+
             # Call AI processing
             self.logger.debug("🧠 [AI-DEBUG] Calling ChatGPT for news processing...")
-            ai_result = await call_chatgpt_for_news(cleaned_text)
+            ai_result = await call_chatgpt_for_news(cleaned_text, logger=self.logger)
             self.logger.debug(f"🧠 [AI-DEBUG] ChatGPT response type: {type(ai_result)}")
             
             if ai_result and isinstance(ai_result, dict):
@@ -121,14 +147,11 @@ class AIService:
 
             # Use the enhanced AI utils function for comprehensive processing
             try:
-                # Convert AsyncOpenAI to regular OpenAI for compatibility
-                api_key = config.get("openai.api_key")
-                if not api_key:
+                if self.openai_client is None:
                     logger.error("❌ OpenAI API key not found in configuration")
                     return None, None, None
                 
-                sync_client = openai.OpenAI(api_key=api_key)
-                ai_result = call_chatgpt_for_news(cleaned_text, sync_client, self.logger)
+                ai_result = await call_chatgpt_for_news(cleaned_text, logger=self.logger)
 
                 if ai_result and isinstance(ai_result, dict):
                     english_translation = ai_result.get("translation")
@@ -168,7 +191,7 @@ class AIService:
             self.logger.error(f"[AI] Error in AI processing: {str(e)}")
             raise
 
-    def get_ai_result_comprehensive(self, arabic_text: str) -> Dict[str, Any]:
+    async def get_ai_result_comprehensive(self, arabic_text: str) -> Dict[str, Any]:
         """
         Get comprehensive AI analysis including location, ad detection, and Syria relevance.
 
@@ -191,8 +214,7 @@ class AIService:
                 }
 
             # Use the enhanced AI utils function
-            api_key = config.get("openai.api_key")
-            if not api_key:
+            if self.openai_client is None:
                 logger.error("❌ OpenAI API key not found in configuration")
                 return {
                     "title": "أخبار سورية",
@@ -202,8 +224,7 @@ class AIService:
                     "is_syria_related": False
                 }
             
-            sync_client = openai.OpenAI(api_key=api_key)
-            result = call_chatgpt_for_news(cleaned_text, sync_client, self.logger)
+            result = await call_chatgpt_for_news(cleaned_text, logger=self.logger)
 
             # Ensure all required fields are present
             if result and isinstance(result, dict):
@@ -215,18 +236,10 @@ class AIService:
                 if base_location in ["Unknown", "Syria", ""] and translation:
                     self.logger.info("[AI] Basic AI returned generic location, trying intelligent detection...")
                     try:
-                        # Use asyncio to run the async method in sync context
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            intelligent_location = loop.run_until_complete(
-                                self.detect_intelligent_location(cleaned_text, translation)
-                            )
-                            if intelligent_location and not intelligent_location.endswith("Unknown"):
-                                final_location = intelligent_location.replace("📍 ", "")  # Remove emoji for consistency
-                                self.logger.info(f"[AI] Intelligent location detection improved result: {final_location}")
-                        finally:
-                            loop.close()
+                        intelligent_location = await self.detect_intelligent_location(cleaned_text, translation)
+                        if intelligent_location and not intelligent_location.endswith("Unknown"):
+                            final_location = intelligent_location.replace("📍 ", "")  # Remove emoji for consistency
+                            self.logger.info(f"[AI] Intelligent location detection improved result: {final_location}")
                     except Exception as e:
                         self.logger.warning(f"[AI] Intelligent location detection failed: {str(e)}")
                 
@@ -281,9 +294,15 @@ class AIService:
     async def _translate_to_english(self, arabic_text: str) -> Optional[str]:
         """Translate Arabic text to English using OpenAI."""
         try:
+            cached = await translation_cache.aget(arabic_text, TRANSLATION_CACHE_NAMESPACE)
+            if cached is not None:
+                self.logger.debug("[AI] Translation served from cache")
+                return cached
+
             self.logger.debug("[AI] Starting translation to English")
 
-            response = await self.openai_client.chat.completions.create(
+            response = await openai_clients.chat(
+                "translation",
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -309,6 +328,7 @@ class AIService:
                 self.logger.debug(
                     f"[AI] Translation completed: {len(translation)} characters"
                 )
+                await translation_cache.aput(arabic_text, TRANSLATION_CACHE_NAMESPACE, translation)
                 return translation
             else:
                 self.logger.warning("[AI] Empty translation received")
@@ -321,9 +341,15 @@ class AIService:
     async def _generate_title(self, text: str) -> Optional[str]:
         """Generate a concise Arabic title from the text using OpenAI."""
         try:
+            cached = await translation_cache.aget(text[:500], TITLE_CACHE_NAMESPACE)
+            if cached is not None:
+                self.logger.debug("[AI] Arabic title served from cache")
+                return cached
+
             self.logger.debug("[AI] Starting Arabic title generation")
 
-            response = await self.openai_client.chat.completions.create(
+            response = await openai_clients.chat(
+                "default",
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -354,6 +380,7 @@ class AIService:
                 # Clean the title
                 title = self._clean_title(title)
                 self.logger.debug(f"[AI] Arabic title generated: {title}")
+                await translation_cache.aput(text[:500], TITLE_CACHE_NAMESPACE, title)
                 return title
             else:
                 self.logger.warning("[AI] Empty Arabic title received")
@@ -431,6 +458,11 @@ class AIService:
             str: Detected location with confidence level
         """
         try:
+            cache_text = f"{arabic_text}\n{english_translation}"
+            cached = await translation_cache.aget(cache_text, LOCATION_CACHE_NAMESPACE)
+            if cached is not None:
+                return cached
+
             # Enhanced location detection prompt
             location_prompt = f"""
 You are a news location detection expert. Your task is to determine the most likely location of a news event based on the content provided.
@@ -474,7 +506,8 @@ Provide your analysis:
                 logger.warning("[AI-LOCATION] OpenAI client not available, using fallback")
                 return self._detect_location_fallback(arabic_text, english_translation)
                 
-            response_obj = await self.openai_client.chat.completions.create(
+            response_obj = await openai_clients.chat(
+                "location",
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a Syrian news location detection expert with deep knowledge of Syrian geography, landmarks, and current events."},
@@ -504,11 +537,13 @@ Provide your analysis:
                 # Format the result with accuracy percentage
                 if location and location.lower() != "unknown":
                     if confidence == "HIGH":
-                        return f"📍 {location} (95% accuracy)"
+                        result = f"📍 {location} (95% accuracy)"
                     elif confidence == "MEDIUM":
-                        return f"📍 {location} (75% accuracy)"
+                        result = f"📍 {location} (75% accuracy)"
                     else:
-                        return f"📍 {location} (50% accuracy)"
+                        result = f"📍 {location} (50% accuracy)"
+                    await translation_cache.aput(cache_text, LOCATION_CACHE_NAMESPACE, result)
+                    return result
                 
             # Fallback to simple detection if AI research fails
             return self._detect_location_fallback(arabic_text, english_translation)
@@ -113,7 +113,9 @@ class NewsIntelligenceService:
     # =========================================================================
     # Main Analysis Method
     # =========================================================================
-    async def analyze_urgency(self, content: str, channel: str, media: List = None) -> NewsAnalysis:
+    async def analyze_urgency(
+        self, content: str, channel: str, media: List = None, ai_result: Optional[Dict] = None
+    ) -> NewsAnalysis:
         """
         Analyze content to determine urgency level and posting priority.
         
@@ -121,13 +123,15 @@ class NewsIntelligenceService:
             content: News content text to analyze
             channel: Source channel name for credibility assessment
             media: Optional media attachments for urgency scoring
+            ai_result: Urgency already assessed by the structured analysis
+                (see urgency_from_structured); skips the separate AI call
             
         Returns:
             NewsAnalysis with comprehensive urgency assessment
         """
         try:
             # 🤖 AI-POWERED URGENCY ANALYSIS (Primary method)
-            ai_urgency_result = await self._analyze_urgency_with_ai(content, channel)
+            ai_urgency_result = ai_result or await self._analyze_urgency_with_ai(content, channel)
             
             if ai_urgency_result:
                 # Use AI analysis as primary method
@@ -241,7 +245,8 @@ REASONING: [Brief explanation]
             ai_response = await get_openai_response(
                 prompt=prompt,
                 max_tokens=200,
-                temperature=0.3  # Lower temperature for more consistent analysis
+                temperature=0.3,  # Lower temperature for more consistent analysis
+                site="urgency"
             )
             
             if ai_response:
@@ -291,11 +296,43 @@ REASONING: [Brief explanation]
             logger.error(f"🤖 AI urgency analysis failed: {e}")
             return None
 
+    @staticmethod
+    def urgency_from_structured(structured: Optional[Dict]) -> Optional[Dict]:
+        """
+        Convert a structured analysis into the AI urgency result used by analyze_urgency().
+        
+        Args:
+            structured: Result of analyze_news_structured(), or None
+            
+        Returns:
+            Dict with urgency_level, urgency_score, and reasoning, or None
+        """
+        if not structured:
+            return None
+        try:
+            return {
+                'urgency_level': UrgencyLevel(structured['urgency_level']),
+                'urgency_score': max(0.0, min(1.0, float(structured['urgency_score']))),
+                'reasoning': structured.get('urgency_reasoning') or "AI analysis completed"
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"🤖 Structured urgency unusable: {e}")
+            return None
+
     # =========================================================================
     # Keyword Urgency Analysis
     # =========================================================================
     async def _calculate_keyword_urgency(self, content: str) -> float:
         """Calculate urgency score based on breaking news keywords (0.0-1.0)."""
+        return self.keyword_urgency(content)
+
+    def keyword_urgency(self, content: str) -> float:
+        """
+        Keyword-only urgency score (0.0-1.0).
+
+        Synchronous and free of I/O, so it is cheap enough to run on every
+        incoming Telegram message before any AI analysis.
+        """
         content_lower = content.lower()
         
         # Check for breaking news keywords
@@ -0,0 +1,199 @@
+# =============================================================================
+# NewsBot Structured News Analysis Module
+# =============================================================================
+# One JSON-schema-constrained completion per message that returns everything
+# the posting path needs: translation, title, location, ad and relevance
+# flags, urgency, category, sentiment and safety. It replaces the separate
+# translation, location and urgency round trips; the result is parsed into
+# NewsAnalysis by NewsIntelligenceService and into ProcessedContent by
+# AIContentAnalyzer.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import json
+from typing import Any, Dict, Optional
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.cache.translation_cache import translation_cache
+from src.core.unified_config import unified_config as config
+from src.services.ai_content_analyzer import ContentSafety, NewsCategory, Sentiment
+from src.services.news_intelligence import UrgencyLevel
+from src.utils.ai_utils import (
+    NEWS_PROMPT_INSTRUCTIONS,
+    clean_translation,
+    normalize_news_location,
+    normalize_news_title,
+)
+from src.utils.base_logger import base_logger as logger
+from src.utils.openai_client import openai_clients
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_STRUCTURED_MODEL = "gpt-4o-mini"  # structured outputs need gpt-4o or later
+PROMPT_VERSION = 1  # bump whenever the prompt or schema changes
+MAX_TOKENS = 1600
+
+
+def _enum_values(enum_class) -> list:
+    return [member.value for member in enum_class]
+
+
+NEWS_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "title": {"type": "string", "description": "Arabic headline of 3-6 words"},
+        "translation": {"type": "string", "description": "Complete English translation"},
+        "location": {"type": "string", "description": "Primary location, e.g. \"Hama, Syria\", or \"Unknown\""},
+        "is_ad": {"type": "boolean"},
+        "is_syria_related": {"type": "boolean"},
+        "urgency_level": {"type": "string", "enum": _enum_values(UrgencyLevel)},
+        "urgency_score": {"type": "number", "description": "0.0 (routine) to 1.0 (most urgent)"},
+        "urgency_reasoning": {"type": "string"},
+        "category": {"type": "string", "enum": _enum_values(NewsCategory)},
+        "secondary_categories": {
+            "type": "array",
+            "items": {"type": "string", "enum": _enum_values(NewsCategory)},
+        },
+        "sentiment": {"type": "string", "enum": _enum_values(Sentiment)},
+        "safety_level": {"type": "string", "enum": _enum_values(ContentSafety)},
+        "safety_issues": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "title", "translation", "location", "is_ad", "is_syria_related",
+        "urgency_level", "urgency_score", "urgency_reasoning",
+        "category", "secondary_categories", "sentiment",
+        "safety_level", "safety_issues",
+    ],
+}
+
+ANALYSIS_INSTRUCTIONS = """
+    URGENCY INSTRUCTIONS:
+    - breaking (score 0.8-1.0): immediate threats, major attacks, breaking developments, mass casualties
+    - important (score 0.5-0.79): significant events, military operations, political developments, targeted attacks
+    - normal (score 0.2-0.49): regular news, updates, general information
+    - low (score 0.0-0.19): minor updates, social content, routine announcements
+    - Weigh violence level, scale of impact, time sensitivity and political/military significance
+    - urgency_reasoning: one short sentence explaining the level
+
+    CLASSIFICATION INSTRUCTIONS:
+    - category: the main topic; secondary_categories: other topics that clearly apply
+    - sentiment: the overall tone of the news
+    - is_ad: true for advertisements and promotional posts
+    - is_syria_related: true if the news concerns Syria or Syrians
+
+    SAFETY INSTRUCTIONS:
+    - safe: no violent detail
+    - sensitive: mentions violence, deaths or casualties without graphic detail
+    - graphic: explicit descriptions of injuries, bodies or gore
+    - disturbing: extremely violent or shocking material
+    - banned: content that must never be posted (e.g. incitement, execution footage)
+    - safety_issues: short reasons for any level other than safe, otherwise empty
+
+    Put the Arabic title in "title" and the full English translation in "translation".
+    """
+
+
+def _namespace(model: str) -> str:
+    return f"structured:v{PROMPT_VERSION}:{model}"
+
+
+# =============================================================================
+# Structured Analysis Functions
+# =============================================================================
+async def analyze_news_structured(arabic_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Analyze a news message with a single schema-constrained completion.
+
+    Args:
+        arabic_text: Cleaned Arabic text of the message
+
+    Returns:
+        Optional[Dict[str, Any]]: The fields of NEWS_ANALYSIS_SCHEMA, with the
+            title, translation and location normalized like the separate
+            translation call; None if the call failed or was refused
+    """
+    model = config.get("openai.structured_model", DEFAULT_STRUCTURED_MODEL)
+    namespace = _namespace(model)
+    cached = await translation_cache.aget(arabic_text, namespace)
+    if cached is not None:
+        logger.debug("[AI-STRUCTURED] Analysis served from cache")
+        return cached
+
+    prompt = f"{NEWS_PROMPT_INSTRUCTIONS}{ANALYSIS_INSTRUCTIONS}\n\nArabic text:\n{arabic_text}"
+    try:
+        response = await openai_clients.chat(
+            "translation",
+            model=model,
+            messages=[
+                {"role": "system", "content": "You are a helpful translator and news analyst."},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "news_analysis", "strict": True, "schema": NEWS_ANALYSIS_SCHEMA},
+            },
+            temperature=0.3,
+            max_tokens=MAX_TOKENS,
+        )
+        message = response.choices[0].message
+        if getattr(message, "refusal", None):
+            logger.warning(f"[AI-STRUCTURED] Analysis refused: {message.refusal}")
+            return None
+        result = parse_structured_analysis(message.content)
+    except Exception as e:
+        logger.error(f"[AI-STRUCTURED] Structured analysis failed: {e}")
+        return None
+
+    if result is not None:
+        logger.info(
+            f"[AI-STRUCTURED] {result['urgency_level']} | {result['category']} | "
+            f"{result['safety_level']} | {result['location']}"
+        )
+        await translation_cache.aput(arabic_text, namespace, result)
+    return result
+
+
+def parse_structured_analysis(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse and normalize the JSON returned by the structured completion.
+
+    Returns:
+        Optional[Dict[str, Any]]: The normalized analysis, or None if the
+            content is not a valid analysis
+    """
+    try:
+        data = json.loads(content)
+        missing = [key for key in NEWS_ANALYSIS_SCHEMA["required"] if key not in data]
+        if missing:
+            raise ValueError(f"missing fields {missing}")
+        # Reject values outside the enums before anything is built from them
+        UrgencyLevel(data["urgency_level"])
+        NewsCategory(data["category"])
+        Sentiment(data["sentiment"])
+        ContentSafety(data["safety_level"])
+    except Exception as e:
+        logger.error(f"[AI-STRUCTURED] Invalid analysis response: {e}")
+        return None
+
+    translation = clean_translation(data["translation"])
+    if not translation.strip():
+        logger.warning("[AI-STRUCTURED] Analysis returned an empty translation")
+        return None
+
+    return {
+        **data,
+        "title": normalize_news_title(data["title"], logger),
+        "translation": translation,
+        "location": normalize_news_location(data["location"]),
+        "urgency_score": max(0.0, min(1.0, float(data["urgency_score"]))),
+        "secondary_categories": [
+            category for category in data["secondary_categories"]
+            if category in NEWS_ANALYSIS_SCHEMA["properties"]["category"]["enum"]
+        ],
+    }
@@ -11,59 +11,21 @@
 # =============================================================================
 import re
 
-# =============================================================================
-# Third-Party Library Imports
-# =============================================================================
-import openai
-
 # =============================================================================
 # Local Application Imports
 # =============================================================================
-from src.core.unified_config import unified_config as config
-
-
-# =============================================================================
-# Text Cleaning Functions
-# =============================================================================
-def clean_text_output(text: str) -> str:
-    """
-    Cleans up text for Discord output:
-    - Strips leading/trailing whitespace from each line
-    - Collapses multiple newlines into one
-    - Collapses multiple spaces into one
-    - Removes empty lines
-    """
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    cleaned = "\n".join(lines)
-    cleaned = re.sub(r"\n+", "\n", cleaned)
-    cleaned = re.sub(r" +", " ", cleaned)
-    return cleaned
-
+from src.cache.translation_cache import translation_cache
+from src.utils.openai_client import openai_clients
 
 # =============================================================================
-# OpenAI API Integration Functions
+# Configuration Constants
 # =============================================================================
-def call_chatgpt_for_news(arabic_text, openai, logger=None):
-    """
-    Call ChatGPT API to translate Arabic news, create a title, detect location, ads, and content relevance.
-    
-    Args:
-        arabic_text: The Arabic text to process
-        openai: OpenAI client instance
-        logger: Optional logger for debugging
-        
-    Returns:
-        Dict containing translation, title, location, and analysis results
-    """
-    if logger:
-        logger.info("[AI_UTILS] Calling ChatGPT for translation/title/location...")
-        logger.debug(f"[AI_UTILS] Input: {arabic_text[:100]}...")
-
-    # Use the provided openai client directly instead of creating a new instance
-    client = openai  # Don't try to create a new client with openai.OpenAI()
+NEWS_MODEL = "gpt-3.5-turbo"
+# Translation cache namespace; bump the version whenever the prompt changes
+NEWS_CACHE_NAMESPACE = f"news:v1:{NEWS_MODEL}"
 
-    # Define the enhanced prompt template with location detection
-    PROMPT_TEMPLATE = """
+# Translation, title and location instructions shared by the news prompts
+NEWS_PROMPT_INSTRUCTIONS = """
     You're a translator and news analyst specializing in converting Arabic news to English and extracting key information.
 
     TRANSLATION INSTRUCTIONS:
@@ -141,7 +103,9 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
     - CORRECT (complete, clean): "Attack on Mar Elias Church and sectarian messages left. An armed group attacked the Mar Elias Church in the town of Kafarbo (Kafarbahm) in Hama Governorate, in a shocking incident that sparked fear among residents. Local residents reported that the attackers defaced the church walls with threatening writings, including the phrase: 'Your turn is coming.' The attack left the community in a state of shock and highlighted the deteriorating security situation and escalating fears of sectarian intimidation."
     - CORRECT (location): Location should be "Hama, Syria" (because text mentions "بمحافظة حماة")
 
-    Format your response EXACTLY as follows:
+"""
+
+NEWS_RESPONSE_FORMAT = """    Format your response EXACTLY as follows:
 
     TITLE: [concise Arabic title in 3-6 words describing the main event]
     TRANSLATION: [full, literal English translation with NO hashtags, links, or promotional content - COMPLETE, NOT SUMMARIZED]
@@ -150,12 +114,96 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
     IS_SYRIA_RELATED: [true/false]
     """
 
+
+# =============================================================================
+# Text Cleaning Functions
+# =============================================================================
+def clean_text_output(text: str) -> str:
+    """
+    Cleans up text for Discord output:
+    - Strips leading/trailing whitespace from each line
+    - Collapses multiple newlines into one
+    - Collapses multiple spaces into one
+    - Removes empty lines
+    """
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    cleaned = "\n".join(lines)
+    cleaned = re.sub(r"\n+", "\n", cleaned)
+    cleaned = re.sub(r" +", " ", cleaned)
+    return cleaned
+
+
+def normalize_news_title(title: str, logger=None) -> str:
+    """Clamp an AI-generated Arabic title to 3-6 words."""
+    title = title.strip()
+    # ENFORCE 4-6 WORDS LIMIT: Split title and limit to maximum 6 words
+    title_words = title.split()
+    if len(title_words) > 6:
+        title = " ".join(title_words[:6])
+        if logger:
+            logger.warning(f"[AI_UTILS] Title too long ({len(title_words)} words), truncated to: {title}")
+    elif len(title_words) < 3:
+        # If too short, pad with generic words if needed
+        if len(title_words) == 0:
+            title = "أخبار سورية"
+        elif len(title_words) == 1:
+            title = f"عاجل {title}"
+        elif len(title_words) == 2:
+            title = f"{title} اليوم"
+    return title
+
+
+def normalize_news_location(location: str) -> str:
+    """Clean up an AI-detected location, mapping vague answers to "Unknown"."""
+    location = location.strip()
+    # Clean up the location and validate it
+    location = location.replace('"', '').replace("'", "")
+    if location.lower() in ['unknown', 'unclear', 'not specified', 'n/a', 'none', '']:
+        return "Unknown"
+    return location.title()  # Capitalize properly
+
+
+# =============================================================================
+# OpenAI API Integration Functions
+# =============================================================================
+async def call_chatgpt_for_news(arabic_text, client=None, logger=None):
+    """
+    Call ChatGPT API to translate Arabic news, create a title, detect location, ads, and content relevance.
+    
+    The request is awaited on the async client, so the event loop keeps
+    serving the Discord gateway and background tasks while it runs.
+    Results are served from the translation cache when the same text was
+    processed before.
+    
+    Args:
+        arabic_text: The Arabic text to process
+        client: AsyncOpenAI client; defaults to the shared client
+        logger: Optional logger for debugging
+        
+    Returns:
+        Dict containing translation, title, location, and analysis results
+    """
+    if logger:
+        logger.info("[AI_UTILS] Calling ChatGPT for translation/title/location...")
+        logger.debug(f"[AI_UTILS] Input: {arabic_text[:100]}...")
+
+    cached = await translation_cache.aget(arabic_text, NEWS_CACHE_NAMESPACE)
+    if cached is not None:
+        if logger:
+            logger.info("[AI_UTILS] Translation served from cache")
+        return cached
+
+    # Define the enhanced prompt template with location detection
+    PROMPT_TEMPLATE = NEWS_PROMPT_INSTRUCTIONS + NEWS_RESPONSE_FORMAT
+
     # Create the complete prompt with the input text
     prompt = f"{PROMPT_TEMPLATE}\n\nArabic text:\n{arabic_text}"
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await openai_clients.chat(
+            "translation",
+            client=client,
+            model=NEWS_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful translator and news analyst."},
                 {"role": "user", "content": prompt},
@@ -175,22 +223,7 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
         # Extract title
         title_match = re.search(r"TITLE:\s*(.*?)(?:\n|$)", raw_result)
         if title_match:
-            title = title_match.group(1).strip()
-            # ENFORCE 4-6 WORDS LIMIT: Split title and limit to maximum 6 words
-            title_words = title.split()
-            if len(title_words) > 6:
-                title = " ".join(title_words[:6])
-                if logger:
-                    logger.warning(f"[AI_UTILS] Title too long ({len(title_words)} words), truncated to: {title}")
-            elif len(title_words) < 3:
-                # If too short, pad with generic words if needed
-                if len(title_words) == 0:
-                    title = "أخبار سورية"
-                elif len(title_words) == 1:
-                    title = f"عاجل {title}"
-                elif len(title_words) == 2:
-                    title = f"{title} اليوم"
-            result["title"] = title
+            result["title"] = normalize_news_title(title_match.group(1), logger)
         else:
             result["title"] = "أخبار سورية"
 
@@ -208,13 +241,7 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
         # Extract location
         location_match = re.search(r"LOCATION:\s*(.*?)(?:\n|$)", raw_result)
         if location_match:
-            location = location_match.group(1).strip()
-            # Clean up the location and validate it
-            location = location.replace('"', '').replace("'", "")
-            if location.lower() in ['unknown', 'unclear', 'not specified', 'n/a', 'none']:
-                result["location"] = "Unknown"
-            else:
-                result["location"] = location.title()  # Capitalize properly
+            result["location"] = normalize_news_location(location_match.group(1))
         else:
             result["location"] = "Unknown"
 
@@ -236,6 +263,7 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
         if logger:
             logger.debug(f"[AI_UTILS] Parsed result with location: {result}")
 
+        await translation_cache.aput(arabic_text, NEWS_CACHE_NAMESPACE, result)
         return result
         
     except Exception as e:
@@ -248,7 +276,9 @@ def call_chatgpt_for_news(arabic_text, openai, logger=None):
         }
 
 
-async def get_openai_response(prompt: str, max_tokens: int = 200, temperature: float = 0.3) -> str:
+async def get_openai_response(
+    prompt: str, max_tokens: int = 200, temperature: float = 0.3, site: str = "default"
+) -> str:
     """
     Get response from OpenAI API for general prompts.
     
@@ -256,21 +286,19 @@ async def get_openai_response(prompt: str, max_tokens: int = 200, temperature: f
         prompt: The prompt to send to OpenAI
         max_tokens: Maximum tokens in response
         temperature: Temperature for response creativity
+        site: Call site, selecting the request timeout
         
     Returns:
         Response string from OpenAI, or None if failed
     """
     try:
-        # Get API key from config
-        api_key = config.get("openai.api_key")
-        if not api_key:
+        # Shared client; None if no API key is configured
+        if openai_clients.get_client(site) is None:
             return None
-            
-        # Create async client
-        client = openai.AsyncOpenAI(api_key=api_key)
         
         # Make API call
-        response = await client.chat.completions.create(
+        response = await openai_clients.chat(
+            site,
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a helpful AI assistant for news analysis."},
@@ -0,0 +1,171 @@
+# =============================================================================
+# NewsBot Ingest Queue Module
+# =============================================================================
+# In-process priority queue for Telegram messages pushed by the NewMessage
+# event handler. Breaking messages sort ahead of everything else, then
+# higher urgency, then arrival order. The auto-poster drains the queue
+# instead of polling every channel, and can wait on breaking arrivals to
+# post them within seconds.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_QUEUE_SIZE = 500
+DEFAULT_MAX_AGE_MINUTES = 180
+
+
+# =============================================================================
+# Ingested Message Data Class
+# =============================================================================
+@dataclass(order=True)
+class IngestedMessage:
+    """A Telegram message waiting for the auto-poster."""
+    sort_key: Tuple[int, float, int]
+    channel: str = field(compare=False)
+    message: Any = field(compare=False)
+    priority: float = field(compare=False)
+    breaking: bool = field(compare=False)
+    received_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+# =============================================================================
+# Ingest Queue Class
+# =============================================================================
+class IngestQueue:
+    """
+    Bounded priority queue of pushed Telegram messages.
+
+    Features:
+    - Breaking > urgency > FIFO ordering
+    - Bounded size; when full the lowest-ranked message is dropped
+    - Messages older than max_age are discarded on pop
+    - Event that fires while a breaking message is queued
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE, max_age_minutes: float = DEFAULT_MAX_AGE_MINUTES):
+        """
+        Initialize the ingest queue.
+
+        Args:
+            maxsize: Maximum number of queued messages (<= 0 for unbounded)
+            max_age_minutes: Age after which a queued message is discarded
+        """
+        self.maxsize = maxsize
+        self.max_age = max_age_minutes * 60
+        self._heap: List[IngestedMessage] = []
+        self._sequence = itertools.count()
+        self._breaking_count = 0
+        self._breaking_event = asyncio.Event()
+        self.pushed = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, channel: str, message: Any, priority: float = 0.0, breaking: bool = False) -> bool:
+        """
+        Queue a message.
+
+        Args:
+            channel: Telegram channel the message belongs to
+            message: The Telethon message
+            priority: Urgency score; higher is posted first
+            breaking: Whether the message should bypass the posting interval
+
+        Returns:
+            bool: False if the queue was full and the message ranked lowest
+        """
+        item = IngestedMessage(
+            sort_key=(0 if breaking else 1, -priority, next(self._sequence)),
+            channel=channel,
+            message=message,
+            priority=priority,
+            breaking=breaking,
+        )
+        if self.maxsize > 0 and len(self._heap) >= self.maxsize:
+            # The heap is min-ordered on rank, so its lowest-ranked entry is
+            # one of the leaves; a linear scan is fine at this size
+            lowest = max(range(len(self._heap)), key=self._heap.__getitem__)
+            if item > self._heap[lowest]:
+                self.dropped += 1
+                logger.warning(f"⚠️ [INGEST] Queue full, dropping message {getattr(message, 'id', '?')} from {channel}")
+                return False
+            self._discard(lowest)
+
+        heapq.heappush(self._heap, item)
+        self.pushed += 1
+        if breaking:
+            self._breaking_count += 1
+            self._breaking_event.set()
+        return True
+
+    def pop(self, breaking_only: bool = False) -> Optional[IngestedMessage]:
+        """
+        Remove and return the highest-ranked fresh message.
+
+        Args:
+            breaking_only: Only return a message if it is breaking
+
+        Returns:
+            Optional[IngestedMessage]: The message, or None if there is none
+        """
+        while self._heap:
+            if breaking_only and not self._heap[0].breaking:
+                return None
+            item = heapq.heappop(self._heap)
+            self._release(item)
+            if time.monotonic() - item.received_at <= self.max_age:
+                return item
+            logger.debug(f"🗑️ [INGEST] Discarding stale message {getattr(item.message, 'id', '?')} from {item.channel}")
+        return None
+
+    def has_breaking(self) -> bool:
+        """Return True while a breaking message is queued."""
+        return self._breaking_count > 0
+
+    async def wait_for_breaking(self, timeout: float) -> bool:
+        """
+        Wait until a breaking message is queued or the timeout expires.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            bool: True if a breaking message is queued
+        """
+        try:
+            await asyncio.wait_for(self._breaking_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.has_breaking()
+
+    def _discard(self, index: int):
+        item = self._heap[index]
+        self._heap[index] = self._heap[-1]
+        self._heap.pop()
+        if index < len(self._heap):
+            heapq.heapify(self._heap)
+        self._release(item)
+        self.dropped += 1
+
+    def _release(self, item: IngestedMessage):
+        if item.breaking:
+            self._breaking_count -= 1
+            if not self._breaking_count:
+                self._breaking_event.clear()
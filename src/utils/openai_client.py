@@ -0,0 +1,216 @@
+# =============================================================================
+# NewsBot OpenAI Client Module
+# =============================================================================
+# This module provides the process-wide OpenAI clients. Every AI call site
+# shares one async client (and one sync client for the remaining blocking
+# callers) over a keep-alive connection pool, so calls reuse warm TLS
+# connections instead of opening a new pool per message. Timeouts are set
+# per call site and retries in one place, from the openai config section.
+# Concurrent identical chat requests are coalesced into one API call.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+from typing import Any, Optional
+
+# =============================================================================
+# Third-Party Library Imports
+# =============================================================================
+import httpx
+import openai
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.core.unified_config import unified_config as config
+from src.utils.base_logger import base_logger as logger
+from src.utils.single_flight import SingleFlight, request_key
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 120.0  # seconds an idle connection is kept open
+
+# Request timeouts in seconds, by call site
+DEFAULT_TIMEOUTS = {
+    "default": 30.0,
+    "translation": 45.0,  # full translation of a long message
+    "location": 20.0,
+    "urgency": 15.0,
+    "analysis": 30.0,
+    "health_check": 10.0,
+}
+
+
+# =============================================================================
+# OpenAI Client Provider Class
+# =============================================================================
+class OpenAIClientProvider:
+    """
+    Provides the shared OpenAI clients.
+
+    Features:
+    - One AsyncOpenAI client per process, created on first use
+    - Tuned keep-alive pool (openai.pool.*) shared by every call site
+    - Per-call-site timeouts (openai.timeouts.<site>)
+    - Retries configured once (openai.max_retries)
+    - Clients are rebuilt if the configured API key changes
+    - Concurrent chat() calls with identical arguments share one in-flight
+      request (openai.coalesce_requests), counted in requests.stats()
+    """
+
+    def __init__(self):
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._sync_client: Optional[openai.OpenAI] = None
+        self._api_key: Optional[str] = None
+        self.requests = SingleFlight("openai")
+
+    # =========================================================================
+    # Configuration Methods
+    # =========================================================================
+    @staticmethod
+    def timeout(site: str) -> float:
+        """Return the request timeout of a call site in seconds."""
+        default = DEFAULT_TIMEOUTS.get(site, DEFAULT_TIMEOUTS["default"])
+        return float(config.get(f"openai.timeouts.{site}", default))
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=int(config.get("openai.pool.max_connections", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive_connections=int(
+                config.get("openai.pool.max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+            ),
+            keepalive_expiry=float(config.get("openai.pool.keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY)),
+        )
+
+    def _http_options(self) -> dict:
+        # Plain httpx clients (rather than openai.DefaultHttpxClient, added in
+        # openai 1.17) keep every openai>=1.0 release usable
+        return {
+            "limits": self._limits(),
+            "timeout": self.timeout("default"),
+            "follow_redirects": True,
+        }
+
+    def _client_options(self) -> dict:
+        return {
+            "api_key": self._api_key,
+            "max_retries": int(config.get("openai.max_retries", DEFAULT_MAX_RETRIES)),
+            "timeout": self.timeout("default"),
+        }
+
+    def _check_api_key(self) -> bool:
+        """Track the configured API key, dropping clients built for another."""
+        api_key = config.get("openai.api_key")
+        if not api_key:
+            return False
+        if api_key != self._api_key:
+            if self._api_key is not None:
+                logger.info("🔑 [OPENAI] API key changed, rebuilding clients")
+            self._api_key = api_key
+            self._client = None
+            self._sync_client = None
+        return True
+
+    # =========================================================================
+    # Client Access Methods
+    # =========================================================================
+    def get_client(self, site: Optional[str] = None) -> Optional[openai.AsyncOpenAI]:
+        """
+        Return the shared async client.
+
+        Args:
+            site: Call site whose timeout applies; the returned client still
+                shares the process-wide connection pool
+
+        Returns:
+            Optional[openai.AsyncOpenAI]: The client, or None if no API key
+                is configured
+        """
+        if not self._check_api_key():
+            return None
+        if self._client is None:
+            self._client = openai.AsyncOpenAI(
+                http_client=httpx.AsyncClient(**self._http_options()),
+                **self._client_options(),
+            )
+            logger.debug("✅ [OPENAI] Shared async client created")
+        if site is None:
+            return self._client
+        return self._client.with_options(timeout=self.timeout(site))
+
+    def get_sync_client(self, site: Optional[str] = None) -> Optional[openai.OpenAI]:
+        """
+        Return the shared sync client, for callers that cannot await.
+
+        Args:
+            site: Call site whose timeout applies
+
+        Returns:
+            Optional[openai.OpenAI]: The client, or None if no API key is
+                configured
+        """
+        if not self._check_api_key():
+            return None
+        if self._sync_client is None:
+            self._sync_client = openai.OpenAI(
+                http_client=httpx.Client(**self._http_options()),
+                **self._client_options(),
+            )
+            logger.debug("✅ [OPENAI] Shared sync client created")
+        if site is None:
+            return self._sync_client
+        return self._sync_client.with_options(timeout=self.timeout(site))
+
+    async def chat(self, site: str, client: Optional[openai.AsyncOpenAI] = None, **kwargs) -> Any:
+        """
+        Create a chat completion with the shared async client.
+
+        Identical requests already in flight (same call site, client, model,
+        messages and options) are not sent again: the caller awaits the
+        pending response.
+
+        Args:
+            site: Call site, selecting the request timeout
+            client: Client to send the request with instead of the shared one
+            **kwargs: Arguments of chat.completions.create()
+
+        Returns:
+            The ChatCompletion response
+
+        Raises:
+            RuntimeError: If no API key is configured
+        """
+        # Only callers with the same timeout and client may share a request;
+        # an in-flight call keeps its client alive, so id() is unique
+        identity = {"site": site, "client": id(client) if client is not None else None}
+        if client is None:
+            client = self.get_client(site)
+        if client is None:
+            raise RuntimeError("OpenAI API key not configured")
+        if not config.get("openai.coalesce_requests", True):
+            return await client.chat.completions.create(**kwargs)
+        return await self.requests.run(
+            request_key({**identity, "request": kwargs}), lambda: client.chat.completions.create(**kwargs)
+        )
+
+    async def close(self) -> None:
+        """Close the shared clients and their connection pools."""
+        client, self._client = self._client, None
+        sync_client, self._sync_client = self._sync_client, None
+        try:
+            if client is not None:
+                await client.close()
+            if sync_client is not None:
+                sync_client.close()
+        except Exception as e:
+            logger.warning(f"⚠️ [OPENAI] Error closing clients: {e}")
+
+
+# Global instance
+openai_clients = OpenAIClientProvider()
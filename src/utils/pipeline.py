@@ -0,0 +1,247 @@
+# =============================================================================
+# NewsBot Processing Pipeline Module
+# =============================================================================
+# Staged asynchronous pipeline for the auto-poster. Each stage owns a
+# bounded asyncio queue and its own pool of workers, so a slow stage (an
+# OpenAI call, a media download) only holds up the items queued behind it
+# instead of the whole fetch-to-post flow. Producers block when a stage's
+# queue is full, which is the backpressure that keeps memory bounded.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.utils.base_logger import base_logger as logger
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+DEFAULT_STAGE_WORKERS = 2
+DEFAULT_STAGE_QUEUE_SIZE = 32
+
+# A stage handler takes one item and returns the items to pass downstream:
+# an empty list drops the item, several items fan it out
+StageHandler = Callable[[Any], Awaitable[Optional[List[Any]]]]
+
+
+# =============================================================================
+# Pipeline Job Class
+# =============================================================================
+class PipelineJob:
+    """A batch of items submitted to the pipeline, tracked until it drains."""
+
+    def __init__(self, stop_index: int):
+        self.stop_index = stop_index
+        self.results: List[Any] = []
+        self.pending = 0
+        self.done = asyncio.get_running_loop().create_future()
+
+    def _item_finished(self):
+        self.pending -= 1
+        if self.pending == 0 and not self.done.done():
+            self.done.set_result(self.results)
+
+
+# =============================================================================
+# Pipeline Stage Class
+# =============================================================================
+class PipelineStage:
+    """
+    One step of the pipeline with its own bounded queue and worker pool.
+
+    Workers are spawned on demand while the queue holds items, up to the
+    configured count, and exit once it is empty, so an idle pipeline holds
+    no tasks.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        workers: int = DEFAULT_STAGE_WORKERS,
+        queue_size: int = DEFAULT_STAGE_QUEUE_SIZE,
+    ):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Stage name used in logs and metrics
+            handler: Coroutine function processing one item
+            workers: Maximum number of items processed at once
+            queue_size: Maximum number of items waiting for a worker
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, int(queue_size)))
+        self.next_stage: Optional["PipelineStage"] = None
+        self.index = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._running = 0
+        self._forwarding = 0  # workers blocked handing outputs downstream
+
+        # Metrics
+        self.active = 0
+        self.processed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    async def put(self, job: PipelineJob, item: Any):
+        """Queue an item for this stage, waiting while the queue is full."""
+        job.pending += 1
+        await self.queue.put((job, item, time.monotonic()))
+        self._spawn_workers()
+
+    def _spawn_workers(self):
+        # Workers not yet busy will pick up queued items, so only spawn
+        # while queued items outnumber them
+        while (
+            self._running < self.workers
+            and self._running - self.active - self._forwarding < self.queue.qsize()
+        ):
+            self._running += 1
+            task = asyncio.create_task(self._worker(), name=f"pipeline-{self.name}")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _worker(self):
+        try:
+            while True:
+                try:
+                    job, item, queued_at = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await self._process(job, item, queued_at)
+                finally:
+                    job._item_finished()
+        finally:
+            self._running -= 1
+            # A cancelled worker may leave queued items of running jobs behind
+            if self.queue.qsize():
+                self._spawn_workers()
+
+    async def _process(self, job: PipelineJob, item: Any, queued_at: float):
+        started = time.monotonic()
+        self.total_wait += started - queued_at
+        self.active += 1
+        outputs = []
+        try:
+            outputs = await self.handler(item) or []
+            self.processed += 1
+        except asyncio.CancelledError:
+            self.failed += 1
+            # Only the worker being cancelled stops it; a cancellation raised
+            # by the handler itself fails just this item
+            if asyncio.current_task().cancelling():
+                raise
+            logger.warning(f"⚠️ [PIPELINE] Stage {self.name} handler was cancelled on an item")
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"❌ [PIPELINE] Stage {self.name} failed on an item: {e}")
+        finally:
+            self.active -= 1
+            latency = time.monotonic() - started
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.queue.task_done()
+
+        self._forwarding += 1
+        try:
+            for output in outputs:
+                if self.index >= job.stop_index or self.next_stage is None:
+                    job.results.append(output)
+                else:
+                    await self.next_stage.put(job, output)
+        finally:
+            self._forwarding -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the stage's queue depth, throughput and latency."""
+        handled = self.processed + self.failed
+        return {
+            "workers": self.workers,
+            "active": self.active,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait / handled * 1000, 1) if handled else 0.0,
+            "avg_latency_ms": round(self.total_latency / handled * 1000, 1) if handled else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+        }
+
+
+# =============================================================================
+# Pipeline Class
+# =============================================================================
+class Pipeline:
+    """
+    Chain of stages connected by bounded queues.
+
+    Features:
+    - Per-stage worker counts and queue sizes
+    - Backpressure: a full stage blocks the stage feeding it
+    - Jobs may enter and leave at any stage, so callers can run part of
+      the chain (e.g. select candidates first, then post the best one)
+    - Many jobs share the stages concurrently
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: List[PipelineStage] = []
+        self._by_name: Dict[str, PipelineStage] = {}
+
+    def add_stage(
+        self,
+        name: str,
+        handler: StageHandler,
+        workers: int = DEFAULT_STAGE_WORKERS,
+        queue_size: int = DEFAULT_STAGE_QUEUE_SIZE,
+    ) -> PipelineStage:
+        """Append a stage to the end of the chain."""
+        stage = PipelineStage(name, handler, workers, queue_size)
+        stage.index = len(self.stages)
+        if self.stages:
+            self.stages[-1].next_stage = stage
+        self.stages.append(stage)
+        self._by_name[name] = stage
+        return stage
+
+    async def run(self, items: Iterable[Any], start: Optional[str] = None, stop: Optional[str] = None) -> List[Any]:
+        """
+        Push items through the stages and wait for them to drain.
+
+        Args:
+            items: Items for the first stage of the run
+            start: Stage the items enter at (defaults to the first stage)
+            stop: Last stage to run; its outputs are returned (defaults to
+                the last stage)
+
+        Returns:
+            List[Any]: Outputs of the stop stage, in completion order
+        """
+        first = self._by_name[start] if start else self.stages[0]
+        last = self._by_name[stop] if stop else self.stages[-1]
+        if last.index < first.index:
+            raise ValueError(f"Stage {stop} comes before stage {start}")
+
+        job = PipelineJob(last.index)
+        job.pending += 1  # held while submitting so the job cannot finish early
+        for item in items:
+            await first.put(job, item)
+        job._item_finished()
+        return await job.done
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics of every stage, in chain order."""
+        return {stage.name: stage.stats() for stage in self.stages}
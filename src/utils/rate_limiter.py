@@ -64,6 +64,8 @@ class RateLimiter:
         # Token bucket implementation
         self.tokens = burst_limit
         self.last_refill = time.time()
+        # Concurrent callers queue here so each waits for its own token
+        self._lock = asyncio.Lock()
 
         # Stats
         self.total_calls = 0
@@ -86,37 +88,40 @@ class RateLimiter:
         """
         self.total_calls += 1
 
-        # Refill tokens based on time elapsed
-        now = time.time()
-        time_elapsed = now - self.last_refill
-        self.last_refill = now
-
-        # Calculate tokens to add
-        new_tokens = time_elapsed * self.calls_per_second
-        self.tokens = min(self.burst_limit, self.tokens + new_tokens)
-
-        # If we have a token, consume it
-        if self.tokens >= 1:
-            self.tokens -= 1
-            return 0.0
-
-        # Calculate time to wait
-        wait_time = (1.0 - self.tokens) / self.calls_per_second
-
-        # Update stats
-        self.waited_calls += 1
-        self.total_wait_time += wait_time
-
-        if not self.auto_wait:
-            # Just return the wait time, let caller handle it
+        async with self._lock:
+            # Refill tokens based on time elapsed
+            now = time.time()
+            time_elapsed = now - self.last_refill
+            self.last_refill = now
+
+            # Calculate tokens to add
+            new_tokens = time_elapsed * self.calls_per_second
+            self.tokens = min(self.burst_limit, self.tokens + new_tokens)
+
+            # If we have a token, consume it
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+
+            # Calculate time to wait
+            wait_time = (1.0 - self.tokens) / self.calls_per_second
+
+            # Update stats
+            self.waited_calls += 1
+            self.total_wait_time += wait_time
+
+            if not self.auto_wait:
+                # Just return the wait time, let caller handle it
+                return wait_time
+
+            # Wait for next token while holding the lock, so later callers
+            # queue behind this one instead of claiming the same token
+            logger.debug(f"Rate limiter '{self.name}' waiting for {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+            self.tokens = 0.0  # We've consumed the token we waited for
+            self.last_refill = time.time()
             return wait_time
 
-        # Wait for next token
-        logger.debug(f"Rate limiter '{self.name}' waiting for {wait_time:.2f}s")
-        await asyncio.sleep(wait_time)
-        self.tokens = 0.0  # We've consumed the token we waited for
-        return wait_time
-
     # =========================================================================
     # Statistics Methods
     # =========================================================================
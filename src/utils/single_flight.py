@@ -0,0 +1,93 @@
+# =============================================================================
+# NewsBot Single-Flight Module
+# =============================================================================
+# Request coalescing for concurrent identical work. When the auto-poster, a
+# delayed post and a FetchView button process the same message at the same
+# time, each would send its own OpenAI request for the same prompt; with a
+# single-flight group the first caller sends it and the others await the
+# same in-flight result.
+# Last updated: 2025-01-16
+
+# =============================================================================
+# Standard Library Imports
+# =============================================================================
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+# =============================================================================
+# Local Application Imports
+# =============================================================================
+from src.utils.base_logger import base_logger as logger
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Return a stable hash of a request's arguments (model, messages, options)."""
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# Single-Flight Group Class
+# =============================================================================
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    Features:
+    - The first caller for a key starts the work as a task; callers arriving
+      while it runs await the same task instead of starting their own
+    - A caller being cancelled does not cancel the shared work for the others
+    - Keys are forgotten as soon as the work finishes, so nothing is cached:
+      only calls that overlap in time are coalesced
+    - Counters of executed and coalesced calls exposed through stats()
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.requests = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `factory()` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the work, e.g. request_key() of the request
+            factory: Starts the work; only called by the first caller
+
+        Returns:
+            The result of the shared call; its exception is raised to every
+            caller that awaited it
+        """
+        self.requests += 1
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"🔗 [SINGLE-FLIGHT] {self.name}: joined in-flight call {key[:12]}")
+        return await asyncio.shield(future)
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the executed/coalesced counters of the group."""
+        return {
+            "requests": self.requests,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / self.requests if self.requests else 0.0,
+            "in_flight": len(self._in_flight),
+        }
@@ -494,7 +494,7 @@ async def detect_location_with_ai(text: str, bot=None) -> str:
             from src.services.ai_service import AIService
             
             ai_service = AIService(bot)
-            ai_result = ai_service.get_ai_result_comprehensive(text)
+            ai_result = await ai_service.get_ai_result_comprehensive(text)
             
             if ai_result and ai_result.get('location') and ai_result['location'] != 'Unknown':
                 ai_location = ai_result['location'].strip()
@@ -2,8 +2,8 @@
 # NewsBot Telegram Client Module
 # =============================================================================
 # This module handles the Telegram bot integration including connection management,
-# message handling, error handling, and event forwarding to Discord with
-# comprehensive rate limiting and retry logic.
+# message handling, error handling, and push ingestion of new channel messages
+# into the auto-poster's queue with comprehensive rate limiting and retry logic.
 # Last updated: 2025-01-16
 
 # =============================================================================
@@ -11,7 +11,7 @@
 # =============================================================================
 import asyncio
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # =============================================================================
 # Third-Party Library Imports
@@ -25,13 +25,18 @@ from telethon.errors import FloodWaitError, RPCError, SessionPasswordNeededError
 # =============================================================================
 from src.utils.base_logger import base_logger as logger
 from src.core.unified_config import unified_config as config
-from src.utils.content_cleaner import clean_news_content
+from src.services.news_intelligence import NewsIntelligenceService
 from src.utils.error_handler import ErrorContext, error_handler
+from src.utils.ingest_queue import DEFAULT_MAX_AGE_MINUTES, DEFAULT_QUEUE_SIZE, IngestQueue
 from src.utils.rate_limiter import rate_limited, rate_limiter_manager
 from src.utils.structured_logger import structured_logger
-from src.utils.syrian_locations import format_syrian_location_tags
-from src.utils.syrian_time import format_syrian_time, now_syrian
-from src.utils.translator import generate_arabic_title, translate_arabic_to_english
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+# Keyword urgency at which a pushed message bypasses the posting interval
+# (roughly a breaking keyword plus two critical-event keywords)
+DEFAULT_BREAKING_THRESHOLD = 0.045
 
 
 # =============================================================================
@@ -43,7 +48,7 @@ class TelegramManager:
 
     Features:
     - Secure connection management
-    - Message forwarding to Discord
+    - Push ingestion of tracked channel messages into a priority queue
     - Error handling and retry logic
     - Rate limit management
     - Event logging
@@ -60,9 +65,22 @@ class TelegramManager:
         self.discord_bot = discord_bot
         self.connected = False
         self.retrying = False
-        self.message_cache: Dict[int, datetime] = {}
+        self.message_cache: Dict[Tuple[str, int], datetime] = {}
         self.max_cache_size = 1000
 
+        # Push ingestion: NewMessage events land in a priority queue that
+        # the auto-poster drains
+        self.ingest_queue = IngestQueue(
+            maxsize=int(config.get("automation.ingest_queue_size", DEFAULT_QUEUE_SIZE)),
+            max_age_minutes=float(config.get("automation.ingest_max_age_minutes", DEFAULT_MAX_AGE_MINUTES)),
+        )
+        self.breaking_threshold = float(
+            config.get("automation.breaking_urgency_threshold", DEFAULT_BREAKING_THRESHOLD)
+        )
+        self.news_intelligence = NewsIntelligenceService()
+        self._tracked_channels: Optional[frozenset] = None
+        self._listening_for_channel_changes = False
+
     # =========================================================================
     # Connection Management Methods
     # =========================================================================
@@ -111,6 +129,11 @@ class TelegramManager:
             
             logger.info("✅ Telegram client connected successfully")
             await self._send_connection_status()
+
+            # Catch up on whatever was published while we were away
+            request_backfill = getattr(self.discord_bot, "request_backfill", None)
+            if callable(request_backfill):
+                request_backfill("Telegram connected")
             
         except Exception as e:
             logger.error(f"❌ Failed to connect to Telegram: {e}")
@@ -181,44 +204,37 @@ class TelegramManager:
 
         @self.client.on(events.NewMessage)
         async def handle_new_message(event):
-            """Handle new messages from Telegram."""
+            """Push new messages from tracked channels into the ingest queue."""
             try:
                 # Check if message is from a channel
-                if not event.is_channel:
+                if not event.is_channel or not config.get("automation.push_ingest", True):
                     return
                 # Only process if channel is in the tracked list
                 tracked_channels = await self.get_tracked_channels()
-                chat = await event.get_chat()
-                channel_username = getattr(chat, "username", None)
-                if (
-                    not channel_username
-                    or channel_username.lower() not in tracked_channels
-                ):
+                chat = event.chat or await event.get_chat()
+                channel_username = (getattr(chat, "username", None) or "").lower()
+                if channel_username not in tracked_channels:
                     return
 
-                # Avoid duplicate messages
-                if event.message.id in self.message_cache:
+                # Avoid duplicate messages (IDs are only unique per channel)
+                key = (channel_username, event.message.id)
+                if key in self.message_cache:
                     return
 
                 # Add to cache and maintain cache size
-                self.message_cache[event.message.id] = datetime.now()
+                self.message_cache[key] = datetime.now()
                 if len(self.message_cache) > self.max_cache_size:
-                    oldest_id = min(self.message_cache, key=self.message_cache.get)
-                    del self.message_cache[oldest_id]
+                    oldest_key = min(self.message_cache, key=self.message_cache.get)
+                    del self.message_cache[oldest_key]
 
-                # Create Discord embed
-                embed = await self._create_message_embed(event)
-
-                # Send to Discord news channel
-                news_channel_id = config.get("discord.channels.news") or config.get("channels.news")
-                news_channel = self.discord_bot.get_channel(news_channel_id) if news_channel_id else None
-                if news_channel:
-                    await news_channel.send(embed=embed)
+                # Rank by keyword urgency; no AI or RPC on the receive path
+                priority = self.news_intelligence.keyword_urgency(event.message.message or "")
+                breaking = priority >= self.breaking_threshold
+                if self.ingest_queue.push(channel_username, event.message, priority, breaking):
                     logger.info(
-                        f"Forwarded Telegram message {event.message.id} to Discord"
+                        f"📥 [INGEST] Queued message {event.message.id} from {channel_username} "
+                        f"(urgency {priority:.2f}{', breaking' if breaking else ''}, queued: {len(self.ingest_queue)})"
                     )
-                else:
-                    logger.error("Could not find Discord news channel")
 
             except Exception as e:
                 structured_logger.error(
@@ -236,90 +252,6 @@ class TelegramManager:
                     bot=self.discord_bot,
                 )
 
-    async def _create_message_embed(self, event) -> discord.Embed:
-        """
-        Create a Discord embed from a Telegram message with enhanced processing.
-
-        Args:
-            event: The Telegram message event
-
-        Returns:
-            discord.Embed: Formatted Discord embed with cleaned content, ChatGPT translation, and location tags
-        """
-        # Get channel/chat information
-        chat = await event.get_chat()
-
-        # Get original message text
-        original_text = event.message.message or ""
-
-        # Clean the content (remove sources, emojis, links, hashtags)
-        cleaned_text = clean_news_content(original_text)
-
-        # Generate Arabic title using ChatGPT (3-6 words)
-        arabic_title = generate_arabic_title(cleaned_text)
-
-        # Translate the cleaned content to English using ChatGPT
-        english_translation = translate_arabic_to_english(cleaned_text)
-
-        # Detect Syrian locations in the cleaned text
-        location_tags = format_syrian_location_tags(cleaned_text)
-
-        # Convert message timestamp to Syrian time
-        syrian_time = format_syrian_time(event.message.date, format_style="short")
-        message_date = format_syrian_time(event.message.date, format_style="date_only")
-
-        # Create title with calendar emoji, date, and ChatGPT-generated Arabic title
-        title = (
-            f"📅 {message_date} | {arabic_title}"
-            if arabic_title
-            else f"📅 {message_date} | أخبار سورية"
-        )
-
-        # Create description with Arabic text and English translation
-        description_parts = []
-        if cleaned_text:
-            description_parts.append(f"**العربية:**\n{cleaned_text}")
-        if english_translation and english_translation != cleaned_text:
-            description_parts.append(f"**English:**\n{english_translation}")
-
-        description = (
-            "\n\n".join(description_parts)
-            if description_parts
-            else "*(Content removed during cleaning)*"
-        )
-
-        # Create embed with enhanced content
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            color=discord.Color.blue(),
-            timestamp=event.message.date,
-        )
-
-        # Add Syrian location tags if detected
-        if location_tags:
-            embed.add_field(name="📍 Locations", value=location_tags, inline=False)
-
-        # Add Syrian time
-        embed.add_field(name="🕐 Syrian Time", value=syrian_time, inline=True)
-
-        # Add media info if present (but don't include source links)
-        if event.message.media:
-            media_type = type(event.message.media).__name__
-            if "Photo" in media_type:
-                embed.add_field(name="📷 Media", value="Image attached", inline=True)
-            elif "Video" in media_type or "Document" in media_type:
-                embed.add_field(name="🎥 Media", value="Video attached", inline=True)
-            else:
-                embed.add_field(name="📎 Media", value="Media attached", inline=True)
-
-        # Add footer with Syrian time and no source info
-        embed.set_footer(
-            text=f"Syrian News • {format_syrian_time(now_syrian(), format_style='time_only')}"
-        )
-
-        return embed
-
     async def _send_connection_status(self) -> None:
         """Send Telegram connection status to Discord."""
         if not self.discord_bot:
@@ -454,11 +386,32 @@ class TelegramManager:
         except Exception as e:
             logger.error(f"Error cleaning session files: {e}")
 
-    async def get_tracked_channels(self) -> list:
-        """Get list of tracked Telegram channels."""
-        # This would typically come from config or database
-        # For now, return empty list - implement based on your needs
-        return []
+    async def get_tracked_channels(self) -> frozenset:
+        """
+        Get the set of tracked (activated) Telegram channels.
+
+        The set is read from the bot's cache once and kept until the cache
+        reports a channel change, so the NewMessage handler does not query
+        the cache for every incoming update.
+        """
+        if self._tracked_channels is not None:
+            return self._tracked_channels
+
+        cache = getattr(self.discord_bot, "json_cache", None)
+        if cache is None:
+            return frozenset()
+        if not self._listening_for_channel_changes and hasattr(cache, "add_channel_listener"):
+            cache.add_channel_listener(self.invalidate_tracked_channels)
+            self._listening_for_channel_changes = True
+
+        channels = await cache.list_telegram_channels("activated")
+        self._tracked_channels = frozenset(channel.lower() for channel in channels)
+        logger.info(f"📡 [INGEST] Tracking {len(self._tracked_channels)} Telegram channels")
+        return self._tracked_channels
+
+    def invalidate_tracked_channels(self) -> None:
+        """Drop the tracked channel set so it is re-read on the next update."""
+        self._tracked_channels = None
 
     async def get_entity(self, entity):
         """
@@ -479,7 +432,7 @@ class TelegramManager:
             logger.error(f"Failed to get entity {entity}: {e}")
             raise
 
-    async def get_messages(self, entity, limit=10, offset_date=None):
+    async def get_messages(self, entity, limit=10, offset_date=None, min_id=0):
         """
         Get messages from a Telegram channel.
         
@@ -487,6 +440,8 @@ class TelegramManager:
             entity: Channel entity or username
             limit: Number of messages to fetch
             offset_date: Date to start fetching from
+            min_id: Only return messages with an ID greater than this
+                (0 for no lower bound)
             
         Returns:
             List of messages
@@ -496,7 +451,7 @@ class TelegramManager:
             
         try:
             return await self.client.get_messages(
-                entity, limit=limit, offset_date=offset_date
+                entity, limit=limit, offset_date=offset_date, min_id=min_id
             )
         except Exception as e:
             error_msg = str(e)
@@ -530,6 +485,21 @@ class TelegramManager:
                 logger.error(f"Failed to get messages from {entity}: {e}")
                 raise
 
+    async def get_message(self, entity, message_id: int):
+        """
+        Get a single message of a Telegram channel by ID.
+
+        Args:
+            entity: Channel entity or username
+            message_id: ID of the message
+
+        Returns:
+            The message, or None if it no longer exists
+        """
+        if not self.client or not self.connected:
+            raise Exception("Telegram client not connected")
+        return await self.client.get_messages(entity, ids=message_id)
+
     async def download_media(self, message, file=None, progress_callback=None):
         """
         Download media from a Telegram message.
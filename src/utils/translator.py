@@ -15,15 +15,18 @@ import re
 from typing import Dict, Optional
 
 # =============================================================================
-# Third-Party Library Imports
+# Local Application Imports
 # =============================================================================
-from openai import OpenAI
+from src.cache.translation_cache import translation_cache
+from src.utils.base_logger import base_logger as logger
+from src.utils.openai_client import openai_clients
 
 # =============================================================================
-# Local Application Imports
+# Configuration Constants
 # =============================================================================
-from src.core.unified_config import unified_config as config
-from src.utils.base_logger import base_logger as logger
+# Translation cache namespaces; bump a version whenever its prompt changes
+TRANSLATION_CACHE_NAMESPACE = "translator:v1:gpt-3.5-turbo"
+TITLE_CACHE_NAMESPACE = "translator-title:v1:gpt-3.5-turbo"
 
 
 # =============================================================================
@@ -43,9 +46,6 @@ class ChatGPTTranslator:
 
     def __init__(self):
         """Initialize the ChatGPT translator."""
-        api_key = config.get("openai.api_key")
-        self.client = OpenAI(api_key=api_key) if api_key else None
-
         # Fallback vocabulary for when API is unavailable
         self.fallback_vocabulary = {
             "عاجل": "Breaking",
@@ -60,6 +60,11 @@ class ChatGPTTranslator:
             "هجوم": "attack",
         }
 
+    @property
+    def client(self):
+        """The shared sync OpenAI client, or None if no API key is configured."""
+        return openai_clients.get_sync_client()
+
     # =========================================================================
     # Title Generation Methods
     # =========================================================================
@@ -76,6 +81,10 @@ class ChatGPTTranslator:
         if not self.client:
             return self._extract_title_fallback(arabic_text)
 
+        cached = translation_cache.get(arabic_text, TITLE_CACHE_NAMESPACE)
+        if cached is not None:
+            return cached
+
         try:
             prompt = f"""
             Create a concise Arabic news headline (3-6 words maximum) from this Syrian news text.
@@ -92,7 +101,7 @@ class ChatGPTTranslator:
             Text: {arabic_text}
             """
 
-            response = self.client.chat.completions.create(
+            response = openai_clients.get_sync_client("default").chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=50,
@@ -106,6 +115,7 @@ class ChatGPTTranslator:
 
             # Validate result contains Arabic and is reasonable length
             if re.search(r"[\u0600-\u06FF]", result) and len(result.split()) <= 6:
+                translation_cache.put(arabic_text, TITLE_CACHE_NAMESPACE, result)
                 return result
             else:
                 return self._extract_title_fallback(arabic_text)
@@ -198,6 +208,10 @@ class ChatGPTTranslator:
         if not self.client:
             return self._translate_fallback(arabic_text)
 
+        cached = translation_cache.get(arabic_text, TRANSLATION_CACHE_NAMESPACE)
+        if cached is not None:
+            return cached
+
         try:
             prompt = f"""
             Translate this Syrian Arabic news text to clear, professional English.
@@ -209,7 +223,7 @@ class ChatGPTTranslator:
             {arabic_text}
             """
 
-            response = self.client.chat.completions.create(
+            response = openai_clients.get_sync_client("translation").chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=500,
@@ -224,6 +238,7 @@ class ChatGPTTranslator:
                 and len(result) > 10
                 and not re.search(r"[\u0600-\u06FF]", result)
             ):
+                translation_cache.put(arabic_text, TRANSLATION_CACHE_NAMESPACE, result)
                 return result
             else:
                 return self._translate_fallback(arabic_text)
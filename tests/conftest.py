@@ -33,6 +33,19 @@ def event_loop():
     loop.close()
 
 
+# =============================================================================
+# Translation Cache Isolation
+# =============================================================================
+@pytest.fixture(autouse=True)
+def isolated_translation_cache(tmp_path):
+    """Give every test an empty translation cache outside the data directory."""
+    from src.cache.translation_cache import translation_cache
+
+    translation_cache.reset(path=str(tmp_path / "translations.db"))
+    yield translation_cache
+    translation_cache.reset()
+
+
 # =============================================================================
 # Mock Configuration
 # =============================================================================
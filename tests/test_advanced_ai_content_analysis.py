@@ -17,6 +17,7 @@ from src.services.advanced_content_analyzer import (
     ContentInsights
 )
 from src.services.enhanced_ai_service import EnhancedAIService, ContentOptimization
+from src.utils.openai_client import openai_clients
 
 
 class TestAdvancedContentAnalyzer:
@@ -39,7 +40,7 @@ class TestAdvancedContentAnalyzer:
     @pytest.mark.asyncio
     async def test_comprehensive_analysis_success(self, analyzer, sample_news_content):
         """Test successful comprehensive content analysis."""
-        with patch('openai.ChatCompletion.acreate', new_callable=AsyncMock) as mock_openai:
+        with patch.object(openai_clients, 'chat', new_callable=AsyncMock) as mock_openai:
             # Mock all OpenAI responses
             mock_openai.side_effect = [
                 # Emotional analysis response
@@ -86,7 +87,7 @@ class TestAdvancedContentAnalyzer:
     @pytest.mark.asyncio
     async def test_emotional_analysis_fallback(self, analyzer, sample_news_content):
         """Test emotional analysis with fallback when AI fails."""
-        with patch('openai.ChatCompletion.acreate', new_callable=AsyncMock) as mock_openai:
+        with patch.object(openai_clients, 'chat', new_callable=AsyncMock) as mock_openai:
             # Mock AI failure for emotional analysis
             mock_openai.side_effect = [
                 Exception("OpenAI API error"),
@@ -106,7 +107,7 @@ class TestAdvancedContentAnalyzer:
     @pytest.mark.asyncio
     async def test_caching_functionality(self, analyzer, sample_news_content):
         """Test content analysis caching."""
-        with patch('openai.ChatCompletion.acreate', new_callable=AsyncMock) as mock_openai:
+        with patch.object(openai_clients, 'chat', new_callable=AsyncMock) as mock_openai:
             mock_openai.side_effect = [
                 Mock(choices=[Mock(message=Mock(content='{"anger": 0.2, "fear": 0.3, "hope": 0.8, "sadness": 0.1, "joy": 0.6, "urgency": 0.7, "anxiety": 0.2, "determination": 0.9, "emotional_intensity": 0.7, "emotional_stability": 0.8, "manipulation_likelihood": 0.1}'))]),
                 Mock(choices=[Mock(message=Mock(content='{"overall_score": 0.8, "reliability_indicators": [], "warning_flags": [], "fact_check_suggestions": []}'))]),
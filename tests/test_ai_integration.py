@@ -211,4 +211,150 @@ class TestAIPerformanceOptimization:
             
             # All should complete successfully
             assert len(results) == 3
-            assert all(r is not None for r in results) 
\ No newline at end of file
+            assert all(r is not None for r in results) 
+
+class TestAsyncTranslationPath:
+    """The translation path must not block the event loop."""
+
+    RESPONSE_DELAY = 0.5  # seconds the fake OpenAI API takes to answer
+
+    @staticmethod
+    def slow_openai_client(delay):
+        """AsyncOpenAI client whose API answers after `delay` seconds."""
+        import httpx
+        import openai
+
+        async def handler(request):
+            await asyncio.sleep(delay)
+            content = (
+                "TITLE: انفجار في دمشق اليوم\n"
+                "TRANSLATION: An explosion was heard in Damascus today.\n"
+                "LOCATION: Damascus, Syria\n"
+                "IS_AD: false\n"
+                "IS_SYRIA_RELATED: true"
+            )
+            return httpx.Response(200, json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-3.5-turbo",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }],
+            })
+
+        return openai.AsyncOpenAI(
+            api_key="sk-test",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_during_translation(self):
+        """A slow translation leaves the loop free: a 10 ms ticker never lags."""
+        from src.utils.openai_client import openai_clients
+
+        client = self.slow_openai_client(self.RESPONSE_DELAY)
+        with patch.object(openai_clients, "get_client", return_value=client):
+            ai_service = AIService(Mock())
+            lags = []
+            done = asyncio.Event()
+
+            async def ticker():
+                loop = asyncio.get_running_loop()
+                while not done.is_set():
+                    start = loop.time()
+                    await asyncio.sleep(0.01)
+                    lags.append(loop.time() - start - 0.01)
+
+            ticks = asyncio.create_task(ticker())
+            try:
+                english, title, location = await ai_service.process_text_with_ai(
+                    "سمع دوي انفجار في العاصمة دمشق صباح اليوم وسط حالة من الترقب بين السكان"
+                )
+            finally:
+                done.set()
+                await ticks
+        await client.close()
+
+        assert english == "An explosion was heard in Damascus today."
+        assert title == "انفجار في دمشق اليوم"
+        assert location == "Damascus, Syria"
+        # The ticker kept running for the whole request...
+        assert len(lags) >= self.RESPONSE_DELAY / 0.01 / 2
+        # ...and was never held up anywhere near the request's duration
+        assert max(lags) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_repeated_story_is_translated_once(self):
+        """The same story, reposted with different spacing, is served from the translation cache."""
+        from src.cache.translation_cache import translation_cache
+        from src.utils.ai_utils import call_chatgpt_for_news
+
+        reply = Mock(choices=[Mock(message=Mock(content=(
+            "TITLE: قصف على حلب اليوم\nTRANSLATION: Shelling on Aleppo today.\n"
+            "LOCATION: Aleppo, Syria\nIS_AD: false\nIS_SYRIA_RELATED: true"
+        )))])
+        client = Mock()
+        client.chat.completions.create = AsyncMock(return_value=reply)
+
+        first = await call_chatgpt_for_news("قصف على حلب اليوم", client)
+        second = await call_chatgpt_for_news("قصف  على حلب\nاليوم", client)
+
+        assert first == second
+        assert first["location"] == "Aleppo, Syria"
+        assert client.chat.completions.create.await_count == 1
+        assert translation_cache.stats()["memory_hits"] == 1
+
+
+class TestStructuredAnalysis:
+    """One schema-constrained call returns the whole analysis of a message."""
+
+    @staticmethod
+    def analysis_json(**overrides):
+        import json
+
+        data = {
+            "title": "قصف على حلب اليوم", "translation": "Shelling on Aleppo today.",
+            "location": "aleppo, syria", "is_ad": False, "is_syria_related": True,
+            "urgency_level": "important", "urgency_score": 1.4, "urgency_reasoning": "Military strike",
+            "category": "military", "secondary_categories": ["politics", "security"], "sentiment": "negative",
+            "safety_level": "sensitive", "safety_issues": [],
+        }
+        data.update(overrides)
+        return json.dumps(data, ensure_ascii=False)
+
+    def test_parse_normalizes_fields(self):
+        """Location, score and title are normalized like the separate translation call."""
+        from src.services.structured_analysis import parse_structured_analysis
+
+        result = parse_structured_analysis(self.analysis_json())
+
+        assert result["location"] == "Aleppo, Syria"
+        assert result["urgency_score"] == 1.0
+        assert result["title"] == "قصف على حلب اليوم"
+        assert result["secondary_categories"] == ["politics"]  # unknown categories dropped
+
+    def test_parse_rejects_unknown_enum(self):
+        """A value outside the schema's enums rejects the whole analysis."""
+        from src.services.structured_analysis import parse_structured_analysis
+
+        assert parse_structured_analysis(self.analysis_json(urgency_level="critical")) is None
+        assert parse_structured_analysis("not json") is None
+
+    @pytest.mark.asyncio
+    async def test_single_request_with_json_schema(self):
+        """The analysis is one json_schema request and is cached by content."""
+        from src.services.structured_analysis import analyze_news_structured
+        from src.utils.openai_client import openai_clients
+
+        reply = Mock(choices=[Mock(message=Mock(content=self.analysis_json(), refusal=None))])
+        with patch.object(openai_clients, "chat", AsyncMock(return_value=reply)) as chat:
+            first = await analyze_news_structured("قصف على حلب اليوم")
+            second = await analyze_news_structured("قصف  على حلب اليوم")
+
+        assert first == second
+        assert first["urgency_level"] == "important"
+        chat.assert_awaited_once()
+        assert chat.call_args.kwargs["response_format"]["type"] == "json_schema"
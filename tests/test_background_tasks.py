@@ -324,4 +324,127 @@ class TestManualVerificationDelay:
         should_wait = now_utc < delay_until
         
         # Assert
-        assert should_wait is False 
\ No newline at end of file
+        assert should_wait is False 
+
+class TestAutoPostScheduler:
+    """Test the deadline-driven auto-post scheduler."""
+
+    def test_next_attempt_is_due_exactly_at_interval(self, mock_bot):
+        """The wait is the remaining interval, not a polling tick."""
+        from src.bot.background_tasks import seconds_until_auto_post
+        from src.utils.timezone_utils import now_eastern
+
+        mock_bot.should_wait_for_startup_delay.return_value = (False, 0)
+        mock_bot._manual_verification_delay_until = {}
+        mock_bot.auto_post_interval = 3600
+        mock_bot.force_auto_post = False
+        mock_bot.last_post_time = now_eastern() - timedelta(minutes=15)
+
+        delay, reason = seconds_until_auto_post(mock_bot)
+        assert reason == "interval"
+        assert delay == pytest.approx(2700, abs=5)
+
+        mock_bot.force_auto_post = True
+        assert seconds_until_auto_post(mock_bot) == (0.0, "due")
+
+        mock_bot.auto_post_interval = 0
+        assert seconds_until_auto_post(mock_bot) == (None, "disabled")
+
+    def test_grace_period_and_verification_delay_come_first(self, mock_bot):
+        """Grace period and verification delays are waited out before the interval."""
+        from src.bot.background_tasks import seconds_until_auto_post
+
+        mock_bot.force_auto_post = True
+        mock_bot.should_wait_for_startup_delay.return_value = (True, 90)
+        assert seconds_until_auto_post(mock_bot) == (90.0, "grace")
+
+        mock_bot.should_wait_for_startup_delay.return_value = (False, 0)
+        mock_bot._manual_verification_delay_until = {
+            'auto_fetch': datetime.now(timezone.utc) + timedelta(minutes=10)
+        }
+        delay, reason = seconds_until_auto_post(mock_bot)
+        assert reason == "verification"
+        assert delay == pytest.approx(600, abs=5)
+
+        # An expired delay is lifted
+        mock_bot._manual_verification_delay_until['auto_fetch'] = datetime.now(timezone.utc) - timedelta(seconds=1)
+        assert seconds_until_auto_post(mock_bot) == (0.0, "due")
+        assert mock_bot._manual_verification_delay_until == {}
+
+    @pytest.mark.asyncio
+    async def test_task_sleeps_until_deadline_and_posts_when_woken(self, mock_bot):
+        """The task sleeps once until the look-ahead window and posts as soon as it is forced."""
+        from src.utils.timezone_utils import now_eastern
+
+        mock_bot.should_wait_for_startup_delay.return_value = (False, 0)
+        mock_bot._manual_verification_delay_until = {}
+        mock_bot.auto_post_interval = 3600
+        mock_bot.force_auto_post = False
+        mock_bot.last_post_time = now_eastern()
+        mock_bot.has_prepared_post = False
+        mock_bot.backfill_pending = False
+        mock_bot.post_prepared = AsyncMock(return_value="alpha")
+        timeouts = []
+
+        async def wait(timeout, breaking=True):
+            timeouts.append(timeout)
+            if len(timeouts) > 1:
+                raise asyncio.CancelledError
+            mock_bot.force_auto_post = True  # An admin forces a post mid-wait
+            return False
+
+        settings = {"automation.lookahead_seconds": 120, "automation.breaking_min_interval_minutes": 0}
+        mock_bot.wait_for_auto_post_wakeup = wait
+        with patch("src.core.rich_presence.mark_content_posted", AsyncMock()), patch(
+            "src.bot.background_tasks.config.get",
+            side_effect=lambda key, default=None: settings.get(key, default),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await auto_post_task(mock_bot)
+
+        assert timeouts[0] == pytest.approx(3600 - 120, abs=5)
+        mock_bot.post_prepared.assert_awaited_once()
+        mock_bot.mark_just_posted.assert_called_once()
+        assert mock_bot.force_auto_post is False
+
+    @pytest.mark.asyncio
+    async def test_wake_ends_bot_wait_immediately(self):
+        """Setting the force flag wakes a waiting scheduler."""
+        from src.bot.newsbot import NewsBot
+
+        bot = NewsBot()
+        waiter = asyncio.create_task(bot.wait_for_auto_post_wakeup(30))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        bot.force_auto_post = True
+        assert await asyncio.wait_for(waiter, 1) is False
+        await bot.close()
+
+
+class TestScheduledPostTask:
+    """Test the timer task that runs scheduled post jobs."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_due_job_then_posts_and_removes_it(self, mock_bot):
+        """The task sleeps until the job is due, posts it once and drops it."""
+        import time
+        from src.bot.background_tasks import scheduled_post_task
+        from src.cache.post_jobs import PostJob
+
+        job = PostJob("alpha", 7, time.time() + 0.05)
+        store = MagicMock()
+        store.load = AsyncMock(return_value=True)
+        store.next_job.side_effect = [job, job, asyncio.CancelledError]
+        store.seconds_until.side_effect = [0.05, 0.0]
+        store.wait_for_change = AsyncMock()
+        store.remove = AsyncMock(return_value=True)
+        mock_bot.fetch_commands.execute_post_job = AsyncMock(return_value=True)
+
+        with patch("src.bot.background_tasks.get_post_job_store", return_value=store):
+            with pytest.raises(asyncio.CancelledError):
+                await scheduled_post_task(mock_bot)
+
+        store.wait_for_change.assert_awaited_once_with(0.05)
+        mock_bot.fetch_commands.execute_post_job.assert_awaited_once_with(job)
+        store.remove.assert_awaited_once_with("alpha:7")
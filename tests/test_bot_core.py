@@ -328,6 +328,47 @@ class TestAutomationConfig:
         assert 'uptime_hours' in status
 
 
+class TestChannelSelection:
+    """Test how the one-channel-at-a-time auto-post path picks its channel."""
+
+    @staticmethod
+    def settings(mode):
+        values = {"automation.channel_selection": mode}
+        return MagicMock(get=lambda key, default=None: values.get(key, default))
+
+    @pytest.mark.asyncio
+    async def test_bandit_mode_samples_channel_yield(self, real_bot):
+        """In bandit mode the channel comes from the yield posterior, not the rotation."""
+        from src.cache.channel_yield import ChannelYieldStore
+
+        real_bot.json_cache.list_telegram_channels = AsyncMock(return_value=["ads", "good", "tried"])
+        real_bot.json_cache.get_next_channel_for_rotation = AsyncMock(return_value="ads")
+        store = ChannelYieldStore(real_bot.json_cache)
+        await store.load()
+        for _ in range(20):
+            await store.record_attempt("good", {"fetched": 3}, posted=True)
+            await store.record_attempt("tried", {"fetched": 3}, posted=True)
+            await store.record_attempt("ads", {"fetched": 3, "filtered": 3}, posted=False)
+        real_bot.channel_yield = store
+
+        with patch("src.bot.newsbot.config", self.settings("bandit")), \
+                patch.object(store, "order", wraps=store.order) as order:
+            picks = [await real_bot.next_channel_to_poll(exclude=("tried",)) for _ in range(20)]
+
+        assert picks.count("good") > 15
+        assert "tried" not in picks
+        order.assert_called_with(["ads", "good"])
+        real_bot.json_cache.get_next_channel_for_rotation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rotation_mode_advances_rotation(self, real_bot):
+        """In rotation mode the stored rotation picks the channel."""
+        real_bot.json_cache.get_next_channel_for_rotation = AsyncMock(return_value="alpha")
+
+        with patch("src.bot.newsbot.config", self.settings("rotation")):
+            assert await real_bot.next_channel_to_poll() == "alpha"
+
+
 class TestErrorHandling:
     """Test error handling in core bot functions."""
 
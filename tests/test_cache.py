@@ -0,0 +1,989 @@
+# =============================================================================
+# NewsBot Cache Layer Tests
+# =============================================================================
+# Tests for the persistent cache layer including write-back behaviour,
+# atomic flushing, journaling, the SQLite and Redis backends, the blacklist
+# store, scheduled post jobs, channel publish rates, channel yield and
+# channel state management.
+
+import asyncio
+import datetime
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from src.cache.blacklist_store import BlacklistStore, BloomFilter
+from src.cache.channel_cursors import LAST_SEEN_KEY, ChannelCursors
+from src.cache.channel_rates import ChannelRates
+from src.cache.channel_yield import ChannelYieldStore
+from src.cache.json_cache import JSONCache
+from src.cache.post_jobs import SCHEDULED_POSTS_KEY, PostJob, PostJobStore
+from src.cache.redis_cache import RedisCache
+from src.cache.snapshot_codec import (
+    SCHEMA_KEY,
+    SNAPSHOT_SCHEMA_VERSION,
+    SnapshotSchemaError,
+    decode_snapshot,
+    encode_snapshot,
+)
+from src.cache.sqlite_cache import SQLiteCache
+from src.cache.translation_cache import TranslationCache
+
+
+def read_file(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class TestJSONCacheWriteBack:
+    """Test the in-memory write-back behaviour of JSONCache."""
+
+    @pytest.mark.asyncio
+    async def test_mutations_are_coalesced_into_one_flush(self, temp_dir):
+        """Mutations stay in memory until the debounced flush runs."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=0.05)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.add_telegram_channel("alpha")
+
+        # Nothing written yet, but reads see the new state
+        assert "a" not in read_file(cache_file)
+        assert await cache.get("a") == 1
+
+        await asyncio.sleep(0.15)
+
+        on_disk = read_file(cache_file)
+        assert on_disk["a"] == 1
+        assert on_disk["b"] == 2
+        assert on_disk["telegram_channels"] == ["alpha"]
+
+    @pytest.mark.asyncio
+    async def test_save_flushes_immediately(self, temp_dir):
+        """save() writes pending state without waiting for the timer."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+
+        await cache.set("key", "value")
+        await cache.save()
+
+        assert read_file(cache_file)["key"] == "value"
+        assert JSONCache(cache_file)._read()["key"] == "value"
+
+    @pytest.mark.asyncio
+    async def test_flush_leaves_no_temp_files(self, temp_dir):
+        """The atomic rename does not leave temporary files behind."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+
+        await cache.set("key", "value")
+        await cache.save()
+
+        assert os.listdir(temp_dir) == ["cache.json"]
+
+    @pytest.mark.asyncio
+    async def test_get_returns_a_copy(self, temp_dir):
+        """Mutating a returned value does not change cached state."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("blacklisted_posts", [1, 2])
+
+        values = await cache.get("blacklisted_posts")
+        values.append(3)
+
+        assert await cache.get("blacklisted_posts") == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_rotation_does_not_touch_disk_per_call(self, temp_dir):
+        """Channel rotation updates state in memory and flushes once."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        await cache.set("telegram_channels", ["one", "two"])
+
+        assert await cache.get_next_channel_for_rotation() == "one"
+        assert await cache.get_next_channel_for_rotation() == "two"
+        assert "channel_rotation" not in read_file(cache_file)
+
+        await cache.save()
+        assert read_file(cache_file)["channel_rotation"]["last_channel"] == "two"
+
+    def test_corrupt_file_is_set_aside(self, temp_dir):
+        """An unreadable cache file is moved aside instead of crashing."""
+        cache_file = temp_dir / "cache.json"
+        cache_file.write_text("{not json")
+
+        cache = JSONCache(str(cache_file))
+
+        assert cache._read() == {}
+        assert (temp_dir / "cache.json.corrupt").exists()
+
+
+
+
+class TestJSONCacheConcurrency:
+    """Test serialized writers and atomic update primitives of JSONCache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_are_not_lost(self, temp_dir):
+        """Concurrent read-modify-writes through update() all land."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+
+        await asyncio.gather(
+            *(cache.update("counter", lambda n: n + 1, default=0) for _ in range(50))
+        )
+
+        assert await cache.get("counter") == 50
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, temp_dir):
+        """compare_and_set only swaps when the current value matches."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+
+        assert await cache.compare_and_set("owner", None, "a")
+        assert not await cache.compare_and_set("owner", None, "b")
+        assert await cache.compare_and_set("owner", "a", "b")
+        assert await cache.get("owner") == "b"
+
+    @pytest.mark.asyncio
+    async def test_flush_runs_off_the_event_loop(self, temp_dir, monkeypatch):
+        """Snapshot writes happen in a worker thread, not on the loop thread."""
+        import threading
+
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        write_snapshot = cache._write_snapshot
+        threads = []
+
+        def recording_write(payload):
+            threads.append(threading.current_thread())
+            return write_snapshot(payload)
+
+        monkeypatch.setattr(cache, "_write_snapshot", recording_write)
+        await cache.set("key", "value")
+        await cache.save()
+
+        assert threads and threading.main_thread() not in threads
+        assert read_file(cache.json_path)["key"] == "value"
+
+
+class TestSnapshotFormat:
+    """Test the versioned compact snapshot format."""
+
+    def test_blacklist_round_trips_as_integer_arrays(self):
+        """Blacklist entries are stored as delta-encoded integer arrays."""
+        data = {
+            "latest_news": [],
+            "blacklist": {"alpha": {"300": 1735787045, "100": None}},
+        }
+
+        raw = encode_snapshot(data)
+        document = json.loads(raw)
+
+        assert document[SCHEMA_KEY] == SNAPSHOT_SCHEMA_VERSION
+        assert document["blacklist"]["alpha"] == {"ids": [100, 200], "added_at": [None, 1735787045]}
+        assert decode_snapshot(raw) == (data, SNAPSHOT_SCHEMA_VERSION)
+
+    def test_newer_schema_is_rejected(self):
+        """A snapshot from an unknown future schema is not misread."""
+        with pytest.raises(SnapshotSchemaError):
+            decode_snapshot(json.dumps({SCHEMA_KEY: SNAPSHOT_SCHEMA_VERSION + 1}).encode())
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_is_upgraded_on_flush(self, temp_dir):
+        """A plain json.dump file loads unchanged and is rewritten in the new format."""
+        cache_file = temp_dir / "cache.json"
+        cache_file.write_text(json.dumps({
+            "telegram_channels": ["alpha"],
+            "blacklist": {"alpha": {"7": "2025-01-02T03:04:05"}},
+        }, indent=2))
+        cache = JSONCache(str(cache_file), flush_interval=60)
+        await cache.initialize()
+
+        assert await cache.get_blacklist_entries() == [("alpha", 7, 1735787045)]
+
+        await cache.close()
+        on_disk = read_file(cache_file)
+        assert on_disk[SCHEMA_KEY] == SNAPSHOT_SCHEMA_VERSION
+        assert on_disk["blacklist"]["alpha"]["ids"] == [7]
+        assert await JSONCache(str(cache_file)).get_blacklist_entries() == [
+            ("alpha", 7, 1735787045)
+        ]
+
+
+class TestJSONCacheExpiry:
+    """Test ttl handling in JSONCache.set."""
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_dropped_on_get(self, temp_dir):
+        """A key past its ttl reads as missing and is removed."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("translation", "hello", ttl=60)
+        assert await cache.get("translation") == "hello"
+
+        cache._deadlines["translation"] = time.time() - 1
+        assert await cache.get("translation", "gone") == "gone"
+        assert "translation" not in cache._read()
+        assert "translation" not in cache._read()["cache_expiry"]
+
+    @pytest.mark.asyncio
+    async def test_sweeper_removes_expired_keys(self, temp_dir):
+        """The background sweep drops keys without them being read."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("flag", True, ttl=0.05)
+        await cache.set("kept", True)
+
+        await asyncio.sleep(0.2)
+
+        assert "flag" not in cache._read()
+        assert cache._read()["kept"] is True
+
+    @pytest.mark.asyncio
+    async def test_expiry_survives_restart(self, temp_dir):
+        """Deadlines are persisted and honoured by a new instance."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        await cache.set("short", 1, ttl=60)
+        await cache.set("long", 2, ttl=3600)
+        await cache.save()
+
+        data = read_file(cache_file)
+        data["cache_expiry"]["short"] = time.time() - 1
+        with open(cache_file, "w") as f:
+            json.dump(data, f)
+
+        restored = JSONCache(cache_file, flush_interval=60)
+        assert await restored.get("short") is None
+        assert await restored.get("long") == 2
+
+    @pytest.mark.asyncio
+    async def test_set_without_ttl_clears_deadline(self, temp_dir):
+        """Re-setting a key without a ttl makes it persistent."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("key", 1, ttl=0.05)
+        await cache.set("key", 2)
+
+        await asyncio.sleep(0.1)
+
+        assert await cache.get("key") == 2
+
+
+class TestJSONCacheJournal:
+    """Test the append-only journal persistence mode."""
+
+    @pytest.mark.asyncio
+    async def test_mutations_append_records(self, temp_dir):
+        """Each mutation appends records instead of rewriting the snapshot."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, persistence="journal")
+
+        await cache.set("a", 1)
+        await cache.add_telegram_channel("alpha")
+        await cache.save()
+
+        with open(cache.journal_path) as f:
+            records = [json.loads(line) for line in f]
+        assert records[0] == {"op": "set", "path": ["a"], "value": 1}
+        assert {"op": "set", "path": ["telegram_channels"], "value": ["alpha"]} in records
+        assert "a" not in read_file(cache_file)
+
+    @pytest.mark.asyncio
+    async def test_startup_replays_snapshot_and_tail(self, temp_dir):
+        """A new instance sees snapshot state plus journaled mutations."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, persistence="journal")
+        await cache.set("kept", "snapshot")
+        await cache.close()
+        await cache.set("tail", "journal")
+        await cache.delete("kept")
+        await cache.set_channel_status("alpha", "deactivated")
+        await cache.save()
+
+        # Simulate a crash that left half a record behind
+        with open(cache.journal_path, "a") as f:
+            f.write('{"op": "set", "pa')
+
+        restored = JSONCache(cache_file, persistence="journal")
+        assert await restored.get("tail") == "journal"
+        assert await restored.get("kept") is None
+        assert await restored.list_telegram_channels("deactivated") == ["alpha"]
+        assert (await restored.get_channel_metadata("alpha"))["status"] == "deactivated"
+
+    @pytest.mark.asyncio
+    async def test_compaction_folds_journal_into_snapshot(self, temp_dir):
+        """Compaction writes the snapshot and truncates the journal."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, persistence="journal")
+        cache.journal_max_records = 3
+
+        for i in range(3):
+            await cache.set(f"key{i}", i)
+
+        assert read_file(cache_file)["key2"] == 2
+        assert os.path.getsize(cache.journal_path) == 0
+
+
+@pytest_asyncio.fixture
+async def sqlite_cache(temp_dir):
+    """Create an initialized SQLiteCache without a JSON file to migrate."""
+    cache = SQLiteCache(str(temp_dir / "cache.db"), json_path=None)
+    await cache.initialize()
+    yield cache
+    await cache.close()
+
+
+class TestSQLiteCache:
+    """Test the SQLite cache backend against the JSONCache API."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self, sqlite_cache):
+        """Generic keys round-trip through the key/value table."""
+        await sqlite_cache.set("automation_config", {"enabled": True})
+        assert await sqlite_cache.get("automation_config") == {"enabled": True}
+
+        await sqlite_cache.delete("automation_config")
+        assert await sqlite_cache.get("automation_config", "missing") == "missing"
+
+    @pytest.mark.asyncio
+    async def test_ttl_keys_expire(self, sqlite_cache):
+        """Keys set with a ttl read as missing once it passes and are swept from disk."""
+        await sqlite_cache.set("flag", True, ttl=0.05)
+        await sqlite_cache.update("counter", lambda count: (count or 0) + 1, ttl=60)
+        await sqlite_cache.set("kept", True)
+        assert await sqlite_cache.get("flag") is True
+
+        await asyncio.sleep(0.2)
+
+        assert await sqlite_cache.get("flag", "gone") == "gone"
+        assert await sqlite_cache.get("counter") == 1
+        assert await sqlite_cache.get("kept") is True
+        db = await sqlite_cache._get_db()
+        async with db.execute("SELECT key FROM kv ORDER BY key") as cursor:
+            assert [row[0] for row in await cursor.fetchall()] == ["counter", "kept"]
+
+        # Setting without a ttl makes a key persistent again
+        await sqlite_cache.set("counter", 5)
+        async with db.execute("SELECT expires_at FROM kv WHERE key = 'counter'") as cursor:
+            assert (await cursor.fetchone())[0] is None
+        assert not await sqlite_cache.set("telegram_channels", ["alpha"], ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_channel_management(self, sqlite_cache):
+        """Channels move between activated and deactivated with metadata."""
+        assert await sqlite_cache.add_telegram_channel("Alpha")
+        assert await sqlite_cache.add_telegram_channel("beta")
+        assert not await sqlite_cache.add_telegram_channel("alpha")
+
+        assert await sqlite_cache.remove_telegram_channel("beta")
+        assert await sqlite_cache.list_telegram_channels() == ["alpha"]
+        assert await sqlite_cache.list_telegram_channels("deactivated") == ["beta"]
+        assert await sqlite_cache.list_telegram_channels("all") == ["alpha", "beta"]
+
+        meta = await sqlite_cache.get_channel_metadata("beta")
+        assert meta["status"] == "deactivated"
+        assert meta["date_deactivated"] is not None
+
+        assert await sqlite_cache.set_channel_status("beta", "activated")
+        assert await sqlite_cache.get("telegram_channels") == ["alpha", "beta"]
+
+    @pytest.mark.asyncio
+    async def test_rotation(self, sqlite_cache):
+        """Rotation walks the active channels and wraps around."""
+        await sqlite_cache.set("telegram_channels", ["one", "two"])
+
+        picks = [await sqlite_cache.get_next_channel_for_rotation() for _ in range(3)]
+
+        assert picks == ["one", "two", "one"]
+        assert await sqlite_cache.get_last_channel_name() == "one"
+        assert await sqlite_cache.get_last_channel_index() == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rotation_hands_out_distinct_channels(self, sqlite_cache):
+        """Concurrent rotation calls never return the same channel twice."""
+        await sqlite_cache.set("telegram_channels", ["a", "b", "c"])
+
+        picks = await asyncio.gather(
+            *(sqlite_cache.get_next_channel_for_rotation() for _ in range(3))
+        )
+
+        assert sorted(picks) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_atomic_update_and_compare_and_set(self, sqlite_cache):
+        """update() and compare_and_set() serialize through the write lock."""
+        await asyncio.gather(
+            *(sqlite_cache.update("counter", lambda n: n + 1, default=0) for _ in range(20))
+        )
+        assert await sqlite_cache.get("counter") == 20
+
+        assert not await sqlite_cache.compare_and_set("counter", 19, 0)
+        assert await sqlite_cache.compare_and_set("counter", 20, 0)
+        assert await sqlite_cache.get("counter") == 0
+
+    @pytest.mark.asyncio
+    async def test_blacklist_key_uses_rows(self, sqlite_cache):
+        """The blacklisted_posts key is backed by the blacklist table."""
+        await sqlite_cache.set("blacklisted_posts", [3, 1, 2])
+        await sqlite_cache.set("blacklisted_posts", [3, 1, 2, 4])
+        await sqlite_cache.set("blacklisted_posts", [1, 2, 4])
+
+        assert await sqlite_cache.get("blacklisted_posts") == [1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_migrates_json_once(self, temp_dir):
+        """An existing botdata.json is imported on first start only."""
+        json_path = temp_dir / "botdata.json"
+        json_path.write_text(json.dumps({
+            "telegram_channels": ["alpha"],
+            "deactivated_channels": ["beta"],
+            "channel_metadata": {
+                "alpha": {"status": "activated", "date_added": "2025-01-01T00:00:00",
+                          "date_deactivated": None},
+            },
+            "blacklisted_posts": [10, 11],
+            "channel_rotation": {"last_index": 0, "last_channel": "alpha"},
+            "fresh": "kept", "stale": "dropped",
+            "cache_expiry": {"fresh": time.time() + 3600, "stale": time.time() - 1},
+        }))
+
+        cache = SQLiteCache(str(temp_dir / "cache.db"), json_path=str(json_path))
+        await cache.initialize()
+        assert await cache.list_telegram_channels() == ["alpha"]
+        assert await cache.list_telegram_channels("deactivated") == ["beta"]
+        assert (await cache.get_channel_metadata("alpha"))["date_added"] == "2025-01-01T00:00:00"
+        assert await cache.get("blacklisted_posts") == [10, 11]
+        assert await cache.get_last_channel_name() == "alpha"
+        # JSON deadlines carry over instead of being imported as a key
+        assert await cache.get("fresh") == "kept"
+        assert await cache.get("stale") is None
+        assert await cache.get("cache_expiry") is None
+
+        assert not await cache.migrate_from_json(str(json_path))
+        await cache.close()
+
+
+
+@pytest_asyncio.fixture
+async def redis_cache():
+    """Create a RedisCache over an in-process fake Redis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = RedisCache(client=fakeredis.FakeAsyncRedis(decode_responses=True))
+    await cache.initialize()
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    """Test the Redis cache backend against the JSONCache API."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_delete_with_ttl(self, redis_cache):
+        """Generic keys round-trip as JSON and honour the ttl."""
+        await redis_cache.set("automation_config", {"enabled": True}, ttl=60)
+        assert await redis_cache.get("automation_config") == {"enabled": True}
+        assert 0 < await redis_cache._redis.ttl("newsbot:kv:automation_config") <= 60
+
+        await redis_cache.delete("automation_config")
+        assert await redis_cache.get("automation_config", "missing") == "missing"
+
+    @pytest.mark.asyncio
+    async def test_channel_metadata_uses_hashes(self, redis_cache):
+        """Channel status changes update sets and the metadata hash."""
+        assert await redis_cache.add_telegram_channel("Alpha")
+        assert not await redis_cache.add_telegram_channel("alpha")
+        assert await redis_cache.remove_telegram_channel("alpha")
+
+        assert await redis_cache.list_telegram_channels("deactivated") == ["alpha"]
+        stored = await redis_cache._redis.hgetall("newsbot:channel:alpha")
+        assert stored["status"] == "deactivated"
+
+        assert await redis_cache.set_channel_status("alpha", "activated")
+        meta = await redis_cache.get_channel_metadata("alpha")
+        assert meta["status"] == "activated"
+        assert meta["date_deactivated"] is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rotation_hands_out_distinct_channels(self, redis_cache):
+        """The WATCH/MULTI rotation never returns the same slot twice."""
+        await redis_cache.set("telegram_channels", ["a", "b", "c"])
+
+        picks = await asyncio.gather(
+            *(redis_cache.get_next_channel_for_rotation() for _ in range(3))
+        )
+
+        assert sorted(picks) == ["a", "b", "c"]
+        assert await redis_cache.get_last_channel_index() in (0, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_watched_update_and_compare_and_set(self, redis_cache):
+        """update() retries on contention instead of losing increments."""
+        await asyncio.gather(
+            *(redis_cache.update("counter", lambda n: n + 1, default=0) for _ in range(5))
+        )
+        assert await redis_cache.get("counter") == 5
+
+        assert not await redis_cache.compare_and_set("counter", 4, 0)
+        assert await redis_cache.compare_and_set("counter", 5, 0)
+        assert await redis_cache.get("counter") == 0
+
+    @pytest.mark.asyncio
+    async def test_blacklist_store_over_redis_sets(self, redis_cache):
+        """The blacklist store persists entries as set members."""
+        store = BlacklistStore(redis_cache)
+        await store.add("alpha", 42)
+
+        assert await redis_cache._redis.sismember("newsbot:blacklist:alpha", 42)
+        assert await BlacklistStore(redis_cache).contains("alpha", 42)
+
+    @pytest.mark.asyncio
+    async def test_failed_migration_is_retried(self, redis_cache, temp_dir):
+        """A migration that fails halfway leaves no marker and runs again on the next start."""
+        json_path = temp_dir / "botdata.json"
+        json_path.write_text(json.dumps({"automation_config": {"enabled": True}, "telegram_channels": ["alpha"]}))
+        real_set = redis_cache.set
+
+        async def failing_set(key, value, ttl=None):
+            return False if key == "telegram_channels" else await real_set(key, value, ttl)
+
+        with patch.object(redis_cache, "set", side_effect=failing_set):
+            assert not await redis_cache.migrate_from_json(str(json_path))
+        assert not await redis_cache._redis.exists("newsbot:meta:migrated_from_json")
+        assert not await redis_cache._redis.exists("newsbot:meta:migrating_from_json")
+
+        assert await redis_cache.migrate_from_json(str(json_path))
+        assert await redis_cache.list_telegram_channels() == ["alpha"]
+        assert not await redis_cache.migrate_from_json(str(json_path))
+
+    @pytest.mark.asyncio
+    async def test_migration_carries_json_deadlines(self, redis_cache, temp_dir):
+        """Expired JSON keys are dropped and live ones keep their remaining ttl."""
+        json_path = temp_dir / "botdata.json"
+        json_path.write_text(json.dumps({
+            "session": "stale", "translation": "fresh", "kept": True,
+            "cache_expiry": {"session": time.time() - 1, "translation": time.time() + 120},
+        }))
+
+        assert await redis_cache.migrate_from_json(str(json_path))
+
+        assert not await redis_cache._redis.exists("newsbot:kv:session")
+        assert not await redis_cache._redis.exists("newsbot:kv:cache_expiry")
+        assert await redis_cache.get("translation") == "fresh"
+        assert 0 < await redis_cache._redis.ttl("newsbot:kv:translation") <= 120
+        assert await redis_cache._redis.ttl("newsbot:kv:kept") == -1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_migration_is_skipped(self, redis_cache, temp_dir):
+        """Only one instance imports while the migration lock is held."""
+        json_path = temp_dir / "botdata.json"
+        json_path.write_text(json.dumps({"automation_config": {"enabled": True}}))
+        await redis_cache._redis.set("newsbot:meta:migrating_from_json", "other instance")
+
+        assert not await redis_cache.migrate_from_json(str(json_path))
+        assert await redis_cache.get("automation_config") is None
+
+
+class TestBlacklistStore:
+    """Test the channel-scoped blacklist store."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_by_channel(self, temp_dir):
+        """The same message ID in another channel is not blacklisted."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        store = BlacklistStore(cache)
+
+        assert await store.add("Alpha", 100)
+
+        assert await store.contains("alpha", 100)
+        assert not await store.contains("beta", 100)
+
+    @pytest.mark.asyncio
+    async def test_legacy_flat_list_applies_to_all_channels(self, temp_dir):
+        """IDs from the old blacklisted_posts list stay blacklisted everywhere."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("blacklisted_posts", [7])
+        store = BlacklistStore(cache)
+
+        assert await store.contains("alpha", 7)
+        assert await store.contains("beta", 7)
+
+    @pytest.mark.asyncio
+    async def test_additions_are_journaled_individually(self, temp_dir):
+        """Each addition persists one entry instead of the whole list."""
+        cache = JSONCache(str(temp_dir / "cache.json"), persistence="journal")
+        store = BlacklistStore(cache)
+        await store.add("alpha", 1)
+        await store.add("alpha", 2)
+        await cache.save()
+
+        with open(cache.journal_path) as f:
+            records = [json.loads(line) for line in f]
+        assert [r["path"] for r in records] == [
+            ["blacklist", "alpha", "1"],
+            ["blacklist", "alpha", "2"],
+        ]
+
+        restored = BlacklistStore(JSONCache(cache.json_path, persistence="journal"))
+        assert await restored.contains("alpha", 2)
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_and_bloom_filter(self, sqlite_cache):
+        """The store works over SQLite rows and with the Bloom filter enabled."""
+        store = BlacklistStore(sqlite_cache, use_bloom_filter=True)
+        await store.add("alpha", 5)
+
+        restored = BlacklistStore(sqlite_cache, use_bloom_filter=True)
+        assert await restored.contains("alpha", 5)
+        assert not await restored.contains("alpha", 6)
+        assert len(restored) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_become_a_high_water_mark(self, temp_dir):
+        """Aged-out entries are dropped but stay covered by the channel's mark."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.add_blacklist_entry("alpha", 10, "2020-01-01T00:00:00")
+        await cache.add_blacklist_entry("alpha", 12, "2020-01-02T00:00:00")
+        await cache.add_blacklist_entry("beta", 3, "2020-01-01T00:00:00")
+        store = BlacklistStore(cache)
+        await store.add("alpha", 50)
+
+        assert len(store) == 1
+        assert await cache.get("blacklist_high_water_marks") == {"alpha": 12, "beta": 3}
+        assert await store.contains("alpha", 11)
+        assert await store.contains("alpha", 50)
+        assert not await store.contains("alpha", 13)
+        assert not await store.contains("gamma", 3)
+
+    @pytest.mark.asyncio
+    async def test_retention_without_high_water_marks(self, temp_dir):
+        """With marks disabled, expired entries are simply forgotten."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.add_blacklist_entry("alpha", 10, "2020-01-01T00:00:00")
+        store = BlacklistStore(cache)
+        store.use_high_water_marks = False
+
+        assert not await store.contains("alpha", 10)
+        assert (await cache.get("blacklist"))["alpha"] == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_entries_are_stamped_and_migrated(self, temp_dir):
+        """The untimestamped legacy list is folded into scoped, ageing entries."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        await cache.set("blacklisted_posts", [7, 8])
+        store = BlacklistStore(cache)
+        await store.load()
+
+        assert await cache.get("blacklisted_posts") is None
+        assert set((await cache.get("blacklist"))[""]) == {"7", "8"}
+        assert await store.contains("alpha", 8)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Every added key is reported as present."""
+        bloom = BloomFilter(capacity=1000)
+        keys = [f"alpha:{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"beta:{i}" in bloom for i in range(1000))
+        assert false_positives < 20
+
+
+class TestChannelCursors:
+    """Test the per-channel last seen message IDs."""
+
+    @pytest.mark.asyncio
+    async def test_cursors_only_move_forward_and_persist(self, temp_dir):
+        """Advancing is monotonic and survives a reload."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        cursors = ChannelCursors(cache)
+        await cursors.load()
+
+        assert cursors.get("alpha") == 0
+        assert await cursors.advance("@Alpha", 120)
+        assert not await cursors.advance("alpha", 90)
+        assert cursors.get("alpha") == 120
+        assert cursors.get("beta") == 0
+        await cache.close()
+
+        reloaded = ChannelCursors(JSONCache(cache_file, flush_interval=60))
+        await reloaded.load()
+        assert reloaded.get("alpha") == 120
+
+    @pytest.mark.asyncio
+    async def test_pending_message_holds_cursor_back(self, temp_dir):
+        """A handled message above a pending one does not move the cursor past the pending one."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        cursors = ChannelCursors(cache)
+        await cursors.load()
+        await cursors.advance("alpha", 10)
+        cursors.track("alpha", [13, 12, 11])
+
+        assert await cursors.advance("alpha", 11)
+        assert not await cursors.advance("alpha", 13)
+        assert cursors.get("alpha") == 11
+        assert cursors.is_handled("alpha", 13)
+        assert not cursors.is_handled("alpha", 12)
+
+        # Handling the gap moves the cursor over everything handled above it
+        assert await cursors.advance("alpha", 12)
+        assert cursors.get("alpha") == 13
+        assert (await cache.get(LAST_SEEN_KEY))["alpha"] == 13
+
+        # A pending message that drops out of the next fetch no longer holds it back
+        cursors.track("alpha", [15, 14])
+        await cursors.advance("alpha", 15)
+        assert cursors.get("alpha") == 13
+        cursors.track("alpha", [16])
+        assert await cursors.advance("alpha", 16)
+        assert cursors.get("alpha") == 16
+
+    @pytest.mark.asyncio
+    async def test_concurrent_advances_keep_the_highest(self, temp_dir):
+        """Interleaved advances from two stores never move a cursor back."""
+        cache = JSONCache(str(temp_dir / "cache.json"), flush_interval=60)
+        first, second = ChannelCursors(cache), ChannelCursors(cache)
+        await first.load()
+        await second.load()
+
+        await asyncio.gather(first.advance("alpha", 50), second.advance("alpha", 40))
+
+        assert (await cache.get(LAST_SEEN_KEY))["alpha"] == 50
+
+
+def message_at(timestamp):
+    return SimpleNamespace(date=datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc))
+
+
+class TestChannelRates:
+    """Test the per-channel publish-rate estimates behind adaptive polling."""
+
+    @pytest.mark.asyncio
+    async def test_gap_estimate_drives_poll_interval(self, temp_dir):
+        """Busy channels get short poll intervals; the estimate survives a reload."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        rates = ChannelRates(cache)
+        await rates.load()
+
+        now = time.time()
+        await rates.record_fetch("@Busy", [message_at(now - 600), message_at(now - 300), message_at(now)])
+        await rates.record_fetch("quiet", [message_at(now - 7200), message_at(now - 60)])
+
+        assert rates.expected_gap("busy", now) == pytest.approx(300)
+        assert rates.poll_interval("busy", now) == pytest.approx(300)  # min_poll_minutes
+        assert rates.poll_interval("quiet", now) > rates.poll_interval("busy", now)
+        assert rates.expected_gap("never-seen") is None
+        # Just polled, so neither is due; an unknown channel always is
+        assert rates.due_channels(["busy", "quiet", "new"]) == ["new"]
+        await cache.close()
+
+        reloaded = ChannelRates(JSONCache(cache_file, flush_interval=60))
+        await reloaded.load()
+        assert reloaded.expected_gap("busy", now) == pytest.approx(300)
+
+    @pytest.mark.asyncio
+    async def test_incomplete_fetch_skips_the_gap_to_the_previous_message(self, temp_dir):
+        """A full fetch window may hide messages, so its first gap is not counted."""
+        rates = ChannelRates(JSONCache(str(temp_dir / "cache.json"), flush_interval=60))
+        await rates.load()
+
+        now = time.time()
+        await rates.record_fetch("alpha", [message_at(now - 3660), message_at(now - 3600)])
+        await rates.record_fetch("alpha", [message_at(now - 60), message_at(now)], complete=False)
+        assert rates.expected_gap("alpha", now) == pytest.approx(60)
+
+    @pytest.mark.asyncio
+    async def test_busy_channels_are_usually_first(self, temp_dir):
+        """Due channels are ordered by publish-rate-weighted sampling."""
+        rates = ChannelRates(JSONCache(str(temp_dir / "cache.json"), flush_interval=60))
+        await rates.load()
+
+        now = time.time()
+        await rates.record_fetch("busy", [message_at(now - 120), message_at(now - 60)])
+        await rates.record_fetch("slow", [message_at(now - 6000), message_at(now - 3000)])
+        for channel in ("busy", "slow"):
+            rates._rates[channel].last_polled_at = 0.0
+
+        firsts = [rates.due_channels(["slow", "busy"])[0] for _ in range(200)]
+        assert firsts.count("busy") > 150
+
+
+class TestChannelYield:
+    """Test the per-channel yield statistics behind the bandit scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_counted_and_persisted(self, temp_dir):
+        """Outcome counts accumulate with decay and survive a reload."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        store = ChannelYieldStore(cache)
+        await store.load()
+
+        await store.record_attempt("@Alpha", {"fetched": 5, "filtered": 3, "duplicate": 1}, posted=True)
+        await store.record_attempt("alpha", {"fetched": 2, "filtered": 2}, posted=False)
+        await cache.close()
+
+        reloaded = ChannelYieldStore(JSONCache(cache_file, flush_interval=60))
+        await reloaded.load()
+        stats = reloaded.get("alpha")
+        assert stats.attempts == pytest.approx(1.98)
+        assert stats.posted == pytest.approx(0.98)
+        assert stats.fetched == pytest.approx(6.9)
+        assert stats.duplicate == pytest.approx(0.98)
+        assert reloaded.get("unknown").mean() == 0.5
+
+    @pytest.mark.asyncio
+    async def test_thompson_order_favours_high_yield(self, temp_dir):
+        """Channels that usually post are tried first; unknown ones still get explored."""
+        store = ChannelYieldStore(JSONCache(str(temp_dir / "cache.json"), flush_interval=60))
+        await store.load()
+        for _ in range(20):
+            await store.record_attempt("good", {"fetched": 3}, posted=True)
+            await store.record_attempt("ads", {"fetched": 3, "filtered": 3}, posted=False)
+
+        firsts = [store.order(["ads", "new", "good"])[0] for _ in range(200)]
+        assert firsts.count("good") > 150
+        assert firsts.count("ads") == 0
+        assert "new" in firsts
+
+
+class TestPostJobStore:
+    """Test the durable queue of scheduled posts."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_a_restart(self, temp_dir):
+        """Scheduled posts and their AI results are reloaded in due order."""
+        cache_file = str(temp_dir / "cache.json")
+        cache = JSONCache(cache_file, flush_interval=60)
+        store = PostJobStore(cache)
+        await store.load()
+
+        now = time.time()
+        assert await store.add(PostJob("@Alpha", 7, now + 600, ai_english="Later"))
+        assert await store.add(PostJob("beta", 3, now + 60, ai_english="Sooner", urgency_level="high"))
+        await cache.close()
+
+        reloaded = PostJobStore(JSONCache(cache_file, flush_interval=60))
+        await reloaded.load()
+        assert len(reloaded) == 2
+        job = reloaded.next_job()
+        assert (job.channel, job.message_id, job.ai_english, job.urgency_level) == ("beta", 3, "Sooner", "high")
+        assert 0 < reloaded.seconds_until(job) <= 60
+
+        assert await reloaded.remove(job.job_id)
+        assert reloaded.next_job().job_id == "alpha:7"
+        assert list(await reloaded.cache.get(SCHEDULED_POSTS_KEY)) == ["alpha:7"]
+
+    @pytest.mark.asyncio
+    async def test_adding_a_job_wakes_the_waiter(self, temp_dir):
+        """A waiting timer is woken as soon as a job is scheduled."""
+        store = PostJobStore(JSONCache(str(temp_dir / "cache.json"), flush_interval=60))
+        await store.load()
+
+        waiter = asyncio.create_task(store.wait_for_change(30))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await store.add(PostJob("alpha", 1, time.time()))
+        await asyncio.wait_for(waiter, 1)
+
+
+class TestTranslationCache:
+    """Test the content-addressed translation cache."""
+
+    def test_keys_normalize_text_and_separate_namespaces(self, temp_dir):
+        """Whitespace and tatweel differences hit; another prompt/model misses."""
+        cache = TranslationCache(str(temp_dir / "translations.db"))
+        cache.put("قصف  على\nحلب", "news:v1:gpt-3.5-turbo", {"translation": "Shelling on Aleppo"})
+
+        assert cache.get(" قصـف على حلب ", "news:v1:gpt-3.5-turbo") == {"translation": "Shelling on Aleppo"}
+        assert cache.get("قصف على حلب", "news:v2:gpt-3.5-turbo") is None
+        assert cache.get("قصف على إدلب", "news:v1:gpt-3.5-turbo") is None
+        stats = cache.stats()
+        assert (stats["memory_hits"], stats["misses"], stats["stores"]) == (1, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_a_restart_through_the_disk_store(self, temp_dir):
+        """A new process finds earlier translations on disk and promotes them to memory."""
+        path = str(temp_dir / "translations.db")
+        cache = TranslationCache(path)
+        await cache.aput("نص الخبر", "translation:v1", "The news text")
+        cache.close()
+
+        restarted = TranslationCache(path)
+        assert await restarted.aget("نص الخبر", "translation:v1") == "The news text"
+        assert await restarted.aget("نص الخبر", "translation:v1") == "The news text"
+        stats = restarted.stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+        restarted.close()
+
+    def test_memory_lru_and_disk_size_and_ttl_eviction(self, temp_dir):
+        """Memory keeps the most recent entries; disk drops expired and least recently used ones."""
+        path = str(temp_dir / "translations.db")
+        with patch.object(TranslationCache, "_memory_entries", staticmethod(lambda: 2)), \
+                patch.object(TranslationCache, "_max_entries", staticmethod(lambda: 3)):
+            cache = TranslationCache(path)
+            for text in ("a", "b", "c"):
+                cache.put(text, "ns", text.upper())
+            assert [value for _, value in cache._memory.values()] == ["B", "C"]
+
+            # "a" is read back from disk, making "b" the least recently used
+            assert cache.get("a", "ns") == "A"
+            cache._conn.execute("UPDATE translations SET accessed_at = accessed_at - 100 WHERE value = '\"B\"'")
+            cache.put("d", "ns", "D")
+            cache._prune()
+            cache._memory.clear()
+            assert cache.get("b", "ns") is None
+            assert [cache.get(text, "ns") for text in ("a", "c", "d")] == ["A", "C", "D"]
+
+            # Entries older than the TTL are neither served nor kept
+            cache._conn.execute("UPDATE translations SET created_at = created_at - 31 * 86400 WHERE value = '\"C\"'")
+            cache._memory.clear()
+            assert cache.get("c", "ns") is None
+            cache._prune()
+            assert cache._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 2
+            assert cache.stats()["evictions"] == 2
+            cache.close()
+
+    def test_memory_entries_expire_with_the_ttl(self, temp_dir):
+        """A long-running process stops serving memory entries once they pass the TTL."""
+        cache = TranslationCache(str(temp_dir / "translations.db"))
+        cache.put("a", "ns", "A")
+        assert cache.get("a", "ns") == "A"
+
+        with patch.object(TranslationCache, "_ttl_seconds", staticmethod(lambda: 0.0)):
+            assert cache.get("a", "ns") is None
+        assert not cache._memory
+        assert cache.stats()["memory_hits"] == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_hits_do_not_wait_for_disk_io(self, temp_dir):
+        """aget() memory hits return while a worker thread holds the disk store."""
+        import threading
+
+        cache = TranslationCache(str(temp_dir / "translations.db"))
+        await cache.aput("a", "ns", "A")
+        disk_busy, release = threading.Event(), threading.Event()
+
+        def slow_commit():
+            with cache._disk_lock:
+                disk_busy.set()
+                release.wait(2)
+
+        worker = asyncio.create_task(asyncio.to_thread(slow_commit))
+        await asyncio.to_thread(disk_busy.wait, 5)
+        try:
+            start = time.monotonic()
+            assert await cache.aget("a", "ns") == "A"
+            assert time.monotonic() - start < 0.5
+        finally:
+            release.set()
+            await worker
+        cache.close()
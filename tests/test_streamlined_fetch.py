@@ -0,0 +1,634 @@
+# =============================================================================
+# NewsBot Streamlined Fetch Tests
+# =============================================================================
+# Tests for the automated fetch cog: candidate ranking, concurrent
+# multi-channel fetching, incremental min_id fetches, the multi-message
+# window, posting from the push-ingestion queue, look-ahead staging, the
+# staged pipeline, catch-up after downtime, scheduled post jobs, channel
+# yield recording, the structured AI analysis mode and refetching candidates
+# that were not selected.
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.cache.post_jobs import PostJob
+from src.cogs.streamlined_fetch import FetchCandidate, StreamlinedFetchCommands
+from src.utils.ingest_queue import IngestQueue
+
+
+def make_candidate(channel, message_id, priority, score, minutes_ago=0):
+    message = SimpleNamespace(
+        id=message_id, date=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    )
+    analysis = SimpleNamespace(
+        posting_priority=priority, quality=SimpleNamespace(overall_score=score)
+    )
+    return FetchCandidate(channel=channel, message=message, cleaned_text="text", analysis=analysis)
+
+
+@pytest.fixture
+def fetch_cog():
+    """Create a StreamlinedFetchCommands cog with the AI services stubbed out."""
+    with patch("src.cogs.streamlined_fetch.NewsIntelligenceService"), patch(
+        "src.cogs.streamlined_fetch.AIContentAnalyzer"
+    ):
+        cog = StreamlinedFetchCommands(MagicMock())
+    cog.bot.channel_rates = MagicMock(load=AsyncMock(), record_fetch=AsyncMock(return_value=True))
+    cog.bot.channel_yield = MagicMock(load=AsyncMock(), record_attempt=AsyncMock(return_value=True))
+    cog._telegram_ready = AsyncMock(return_value=True)
+    cog._analyze_candidate = AsyncMock(return_value=True)
+    cog._schedule_candidate = AsyncMock(return_value=True)
+    return cog
+
+
+class TestFetchCandidateRanking:
+    """Test the ordering of fetched candidates."""
+
+    def test_priority_then_quality_then_recency(self):
+        """Priority dominates quality, which dominates recency."""
+        low_priority = make_candidate("a", 1, priority=3, score=0.9)
+        high_quality = make_candidate("b", 2, priority=5, score=0.8, minutes_ago=30)
+        newer = make_candidate("c", 3, priority=5, score=0.6)
+        older = make_candidate("d", 4, priority=5, score=0.6, minutes_ago=10)
+
+        ranked = sorted([low_priority, older, newer, high_quality], key=lambda c: c.rank(), reverse=True)
+
+        assert [c.channel for c in ranked] == ["b", "c", "d", "a"]
+
+    def test_unanalyzed_candidate_ranks_last(self):
+        """A candidate without analysis sorts below any analyzed one."""
+        unanalyzed = FetchCandidate("a", SimpleNamespace(id=1, date=None), "text")
+        assert unanalyzed.rank() < make_candidate("b", 2, priority=1, score=0.1).rank()
+
+
+class TestFetchAndPostBest:
+    """Test concurrent fetching across channels."""
+
+    @pytest.mark.asyncio
+    async def test_channels_are_fetched_concurrently(self, fetch_cog):
+        """All channels are in flight at once and the best candidate is posted."""
+        in_flight = 0
+        peak = 0
+        candidates = {
+            "alpha": make_candidate("alpha", 10, priority=4, score=0.7),
+            "beta": make_candidate("beta", 20, priority=5, score=0.6),
+            "gamma": make_candidate("gamma", 30, priority=4, score=0.9),
+        }
+
+        async def fake_fetch(channel_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [candidates[channel_name].message]
+
+        async def fake_filter(channel_name, messages, blacklist):
+            return [candidates[channel_name]]
+
+        fetch_cog._fetch_messages = fake_fetch
+        fetch_cog._filter_messages = fake_filter
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            result = await fetch_cog.fetch_and_post_best(["alpha", "beta", "gamma"])
+
+        assert result == "beta"
+        assert peak == 3
+        fetch_cog._schedule_candidate.assert_awaited_once_with(candidates["beta"])
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_fallback(self, fetch_cog):
+        """The fan-out honours the cap and falls back when scheduling fails."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(channel_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [SimpleNamespace(id=int(channel_name[-1]))]
+
+        async def fake_filter(channel_name, messages, blacklist):
+            index = messages[0].id
+            return [make_candidate(channel_name, index, priority=index, score=0.5)]
+
+        fetch_cog._fetch_messages = fake_fetch
+        fetch_cog._filter_messages = fake_filter
+        fetch_cog._schedule_candidate = AsyncMock(side_effect=[False, True])
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store, patch(
+            "src.cogs.streamlined_fetch.config.get",
+            side_effect=lambda key, default=None: 2 if key == "automation.fetch_concurrency" else default,
+        ):
+            store.return_value.load = AsyncMock()
+            result = await fetch_cog.fetch_and_post_best([f"channel{i}" for i in range(1, 6)])
+
+        assert peak == 2
+        # channel5 ranks highest but fails to schedule, so channel4 is posted
+        assert result == "channel4"
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_recorded_per_channel(self, fetch_cog):
+        """Every queried channel gets one attempt with its fetched, filtered and duplicate counts."""
+        messages = {
+            "alpha": [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)],
+            "beta": [SimpleNamespace(id=4)],
+        }
+
+        async def fake_fetch(channel_name):
+            return messages[channel_name]
+
+        async def fake_filter(channel_name, batch, blacklist):
+            if channel_name == "beta":
+                return [make_candidate("beta", 4, priority=5, score=0.5)]
+            fetch_cog._channel_outcomes[channel_name]["duplicate"] += 1
+            await fetch_cog._cleanup_processing_message(channel_name, 2, "content filter", handled=True)
+            await fetch_cog._cleanup_processing_message(channel_name, 3, "AI skip", handled=True)
+            return []
+
+        fetch_cog._fetch_messages = fake_fetch
+        fetch_cog._filter_messages = fake_filter
+        fetch_cog.bot.channel_cursors = MagicMock(advance=AsyncMock())
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            assert await fetch_cog.fetch_and_post_best(["alpha", "beta"]) == "beta"
+
+        recorded = {
+            call.args[0]: (dict(call.args[1]), call.kwargs["posted"])
+            for call in fetch_cog.bot.channel_yield.record_attempt.await_args_list
+        }
+        assert recorded == {
+            "alpha": ({"fetched": 3, "duplicate": 1, "filtered": 2}, False),
+            "beta": ({"fetched": 1}, True),
+        }
+        assert not fetch_cog._channel_outcomes
+
+
+class TestFetchWindow:
+    """Test selecting the best message out of each channel's latest few."""
+
+    @pytest.fixture
+    def window_cog(self, fetch_cog):
+        fetch_cog.bot.channel_cursors = MagicMock(
+            load=AsyncMock(), get=MagicMock(return_value=0), is_handled=MagicMock(return_value=False), advance=AsyncMock()
+        )
+        fetch_cog.bot.automation_config = {"require_media": False, "require_text": True}
+        return fetch_cog
+
+    @pytest.mark.asyncio
+    async def test_ad_on_top_does_not_hide_news_below(self, window_cog):
+        """The cheap filters drop the ad and the news message below it is posted."""
+        ad = SimpleNamespace(
+            id=12, media=None, date=datetime.now(timezone.utc),
+            message="عرض http://a.com http://b.com http://c.com http://d.com",
+        )
+        news = SimpleNamespace(id=11, media=None, date=datetime.now(timezone.utc), message="قصف مدفعي على ريف إدلب الجنوبي")
+        window_cog.bot.telegram_client.get_messages = AsyncMock(return_value=[ad, news])
+
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            store.return_value.contains = AsyncMock(return_value=False)
+            assert await window_cog.fetch_and_post_auto("alpha") is True
+
+        assert window_cog._schedule_candidate.await_args.args[0].message is news
+        window_cog._analyze_candidate.assert_awaited_once()
+        window_cog.bot.channel_cursors.advance.assert_awaited_once_with("alpha", 12)
+
+    @pytest.mark.asyncio
+    async def test_survivors_are_ranked_by_posting_priority(self, window_cog):
+        """Every survivor is analyzed and the highest posting priority wins."""
+        messages = [
+            SimpleNamespace(id=i, media=None, date=datetime.now(timezone.utc), message=f"خبر عاجل رقم {i} من دمشق")
+            for i in (23, 22, 21)
+        ]
+        priorities = {23: 2, 22: 7, 21: 4}
+        window_cog.bot.telegram_client.get_messages = AsyncMock(return_value=messages)
+
+        async def analyze(candidate):
+            candidate.analysis = SimpleNamespace(
+                posting_priority=priorities[candidate.message.id], quality=SimpleNamespace(overall_score=0.5)
+            )
+            return True
+
+        window_cog._analyze_candidate = analyze
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            store.return_value.contains = AsyncMock(return_value=False)
+            assert await window_cog.fetch_and_post_best(["alpha"]) == "alpha"
+
+        assert window_cog._schedule_candidate.await_args.args[0].message.id == 22
+
+
+class TestUnselectedCandidates:
+    """Test that candidates losing to another channel's stay fetchable."""
+
+    @pytest.mark.asyncio
+    async def test_unselected_candidate_is_fetched_again(self, fetch_cog, tmp_path):
+        """A filtered newer message does not push the cursor past an unselected older one."""
+        from src.cache.channel_cursors import ChannelCursors
+        from src.cache.json_cache import JSONCache
+
+        cursors = ChannelCursors(JSONCache(str(tmp_path / "cache.json"), flush_interval=60))
+        await cursors.load()
+        await cursors.advance("alpha", 10)
+        fetch_cog.bot.channel_cursors = cursors
+        fetch_cog.bot.automation_config = {"require_media": False, "require_text": True}
+        now = datetime.now(timezone.utc)
+        published = {
+            "alpha": [
+                SimpleNamespace(id=12, media=None, date=now, message="عرض http://a.com http://b.com http://c.com http://d.com"),
+                SimpleNamespace(id=11, media=None, date=now, message="قصف مدفعي على ريف إدلب الجنوبي"),
+            ],
+            "beta": [SimpleNamespace(id=20, media=None, date=now, message="خبر عاجل من دمشق اليوم")],
+        }
+
+        async def get_messages(channel, limit, min_id):
+            return [message for message in published[channel] if message.id > min_id][:limit]
+
+        async def analyze(candidate):
+            priority = 7 if candidate.channel == "beta" else 3
+            candidate.analysis = SimpleNamespace(posting_priority=priority, quality=SimpleNamespace(overall_score=0.5))
+            return True
+
+        fetch_cog.bot.telegram_client.get_messages = get_messages
+        fetch_cog._analyze_candidate = analyze
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            store.return_value.contains = AsyncMock(return_value=False)
+            # beta wins; alpha's ad (12) is filtered and its news (11) is not selected
+            assert await fetch_cog.fetch_and_post_best(["alpha", "beta"]) == "beta"
+            assert cursors.get("alpha") == 10
+
+            assert await fetch_cog.fetch_and_post_best(["alpha"]) == "alpha"
+
+        assert fetch_cog._schedule_candidate.await_args.args[0].message.id == 11
+
+
+class TestPostFromIngestQueue:
+    """Test posting messages pushed by the Telegram NewMessage handler."""
+
+    @pytest.mark.asyncio
+    async def test_breaking_message_is_posted_without_fetching(self, fetch_cog):
+        """Queued messages are filtered and posted without a Telegram request."""
+        queue = IngestQueue()
+        fetch_cog.bot.telegram_client.ingest_queue = queue
+        fetch_cog.bot.telegram_client.get_messages = AsyncMock()
+        breaking = SimpleNamespace(id=7, message="عاجل: خبر", media=None, date=datetime.now(timezone.utc))
+        queue.push("ordinary", SimpleNamespace(id=1, message="خبر", media=None, date=None), priority=0.01)
+        queue.push("urgent", breaking, priority=0.05, breaking=True)
+
+        async def passthrough(channel_name, messages, blacklist):
+            return [FetchCandidate(channel_name, message, message.message) for message in messages]
+
+        fetch_cog._filter_messages = passthrough
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            result = await fetch_cog.post_from_ingest_queue(breaking_only=True)
+
+        assert result == "urgent"
+        assert fetch_cog._schedule_candidate.await_args.args[0].message is breaking
+        fetch_cog.bot.telegram_client.get_messages.assert_not_called()
+        # The ordinary message stays queued for the next scheduled slot
+        assert len(queue) == 1
+
+
+class TestIncrementalFetch:
+    """Test min_id fetches behind the per-channel cursors."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_asks_only_for_unseen_messages(self, fetch_cog):
+        """The cursor is passed as min_id and handled messages advance it."""
+        cursors = MagicMock(load=AsyncMock(), advance=AsyncMock(return_value=True))
+        cursors.get.return_value = 41
+        cursors.is_handled.return_value = False
+        fetch_cog.bot.channel_cursors = cursors
+        fetch_cog.bot.automation_config = {"require_media": False, "require_text": True}
+        messages = [SimpleNamespace(id=42, message="", media=None, date=None)]
+        fetch_cog.bot.telegram_client.get_messages = AsyncMock(return_value=messages)
+        blacklist = MagicMock(contains=AsyncMock(return_value=False))
+
+        with patch(
+            "src.cogs.streamlined_fetch.config.get",
+            side_effect=lambda key, default=None: 3 if key == "automation.fetch_window" else default,
+        ):
+            assert await fetch_cog._fetch_messages("alpha") == messages
+        assert await fetch_cog._filter_messages("alpha", messages, blacklist) == []
+
+        fetch_cog.bot.telegram_client.get_messages.assert_awaited_once_with("alpha", limit=3, min_id=41)
+        # Rejected for missing text, so it is never fetched again
+        cursors.advance.assert_awaited_once_with("alpha", 42)
+
+    @pytest.mark.asyncio
+    async def test_quiet_channel_returns_nothing(self, fetch_cog):
+        """An empty min_id response yields no candidates and no blacklist lookups."""
+        fetch_cog.bot.channel_cursors = MagicMock(load=AsyncMock(), get=MagicMock(return_value=42))
+        fetch_cog.bot.telegram_client.get_messages = AsyncMock(return_value=[])
+        fetch_cog._analyze_candidate = AsyncMock()
+
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            store.return_value.contains = AsyncMock()
+            assert await fetch_cog.fetch_and_post_best(["alpha"]) is None
+
+        store.return_value.contains.assert_not_called()
+        fetch_cog._analyze_candidate.assert_not_called()
+
+
+class TestLookAhead:
+    """Test staging the next post ahead of its slot."""
+
+    @pytest.fixture
+    def fetch_view_services(self):
+        """Patch the services FetchView builds so no network is touched."""
+        with patch("src.cogs.fetch_view.MediaService") as media, patch(
+            "src.cogs.fetch_view.AIService"
+        ) as ai, patch("src.cogs.fetch_view.PostingService") as posting:
+            ai.return_value.structured_enabled = MagicMock(return_value=False)
+            ai.return_value.process_text_with_ai = AsyncMock(return_value=("English", "Title", "Damascus"))
+            media.return_value.download_media_with_timeout = AsyncMock(return_value=(["/tmp/a.jpg"], "/tmp"))
+            media.return_value.validate_media_files = MagicMock(side_effect=lambda files: files)
+            posting.return_value.post_to_news_channel = AsyncMock(return_value=True)
+            yield SimpleNamespace(media=media.return_value, ai=ai.return_value, posting=posting.return_value)
+
+    @pytest.mark.asyncio
+    async def test_staged_post_only_uploads(self, fetch_cog, fetch_view_services):
+        """AI and media run while staging; posting the staged post only uploads."""
+        del fetch_cog._schedule_candidate
+        fetch_cog.news_intelligence = None
+        message = SimpleNamespace(id=5, message="text", media=object(), date=datetime.now(timezone.utc))
+        candidate = FetchCandidate("alpha", message, "text")
+
+        fetch_cog._fetch_messages = AsyncMock(return_value=[message])
+        fetch_cog._filter_messages = AsyncMock(return_value=[candidate])
+        fetch_cog.bot.telegram_client.ingest_queue = None
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store, patch(
+            "src.cogs.streamlined_fetch._atomic_blacklist_add", AsyncMock(return_value=True)
+        ) as blacklist_add:
+            store.return_value.load = AsyncMock()
+            store.return_value.contains = AsyncMock(return_value=False)
+            fetch_cog.bot.channel_cursors = MagicMock(advance=AsyncMock())
+
+            assert await fetch_cog.prepare_next_post(["alpha"]) == "alpha"
+            assert fetch_view_services.ai.process_text_with_ai.await_count == 1
+            assert fetch_view_services.media.download_media_with_timeout.await_count == 1
+            fetch_view_services.posting.post_to_news_channel.assert_not_called()
+
+            assert await fetch_cog.post_prepared() == "alpha"
+
+        # Nothing slow was repeated at posting time
+        assert fetch_view_services.ai.process_text_with_ai.await_count == 1
+        assert fetch_view_services.media.download_media_with_timeout.await_count == 1
+        kwargs = fetch_view_services.posting.post_to_news_channel.await_args.kwargs
+        assert kwargs["english_translation"] == "English"
+        assert kwargs["media_files"] == ["/tmp/a.jpg"]
+        blacklist_add.assert_awaited_once()
+        assert fetch_cog.prepared_post is None
+
+    @staticmethod
+    def structured_result(**overrides):
+        result = {
+            "title": "قصف على حلب اليوم", "translation": "Shelling on Aleppo today.",
+            "location": "Aleppo, Syria", "is_ad": False, "is_syria_related": True,
+            "urgency_level": "breaking", "urgency_score": 0.9, "urgency_reasoning": "Ongoing shelling",
+            "category": "military", "secondary_categories": [], "sentiment": "urgent",
+            "safety_level": "sensitive", "safety_issues": [],
+        }
+        result.update(overrides)
+        return result
+
+    async def prepare_structured(self, fetch_cog, fetch_view_services, structured):
+        """Stage a candidate in structured mode with the real analysis services."""
+        from src.services.ai_content_analyzer import AIContentAnalyzer
+        from src.services.news_intelligence import NewsIntelligenceService
+
+        fetch_view_services.ai.structured_enabled.return_value = True
+        fetch_view_services.ai.analyze_news_structured = AsyncMock(return_value=structured)
+        fetch_cog.news_intelligence = NewsIntelligenceService()
+        fetch_cog.news_intelligence._analyze_urgency_with_ai = AsyncMock()
+        fetch_cog.ai_analyzer = AIContentAnalyzer(fetch_cog.bot)
+        fetch_cog.ai_analyzer._send_discord_log = AsyncMock()
+
+        message = SimpleNamespace(id=7, message="text", media=object(), date=datetime.now(timezone.utc))
+        candidate = FetchCandidate("alpha", message, "قصف على حلب")
+        candidate.analysis = await fetch_cog.ai_analyzer.process_content_intelligently("قصف على حلب", "alpha")
+        return candidate, await fetch_cog._prepare_candidate(candidate)
+
+    @pytest.mark.asyncio
+    async def test_structured_mode_makes_one_ai_call(self, fetch_cog, fetch_view_services):
+        """One structured call fills the translation, urgency and content analysis."""
+        candidate, prepared = await self.prepare_structured(
+            fetch_cog, fetch_view_services, self.structured_result()
+        )
+
+        view = prepared.view
+        assert (view.ai_english, view.ai_title, view.ai_location) == (
+            "Shelling on Aleppo today.", "قصف على حلب اليوم", "Aleppo, Syria"
+        )
+        assert view.urgency_level == "breaking"
+        assert view.content_category == "military"
+        assert candidate.analysis.sentiment.sentiment.value == "urgent"
+        assert candidate.analysis.translated_content == "Shelling on Aleppo today."
+        fetch_view_services.ai.analyze_news_structured.assert_awaited_once()
+        fetch_view_services.ai.process_text_with_ai.assert_not_called()
+        fetch_cog.news_intelligence._analyze_urgency_with_ai.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_structured_safety_flag_rejects_candidate(self, fetch_cog, fetch_view_services):
+        """Content the structured analysis finds graphic is blacklisted, not staged."""
+        fetch_cog._cleanup_processing_message = AsyncMock()
+        with patch(
+            "src.cogs.streamlined_fetch._atomic_blacklist_add", AsyncMock(return_value=True)
+        ) as blacklist_add:
+            candidate, prepared = await self.prepare_structured(
+                fetch_cog, fetch_view_services,
+                self.structured_result(safety_level="graphic", safety_issues=["Describes injuries"]),
+            )
+
+        assert prepared is None
+        assert candidate.analysis.safety.should_filter
+        blacklist_add.assert_awaited_once()
+        fetch_cog._cleanup_processing_message.assert_awaited_once_with("alpha", 7, "safety filter", handled=True)
+        fetch_cog.ai_analyzer._send_discord_log.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_staged_post_is_dropped(self, fetch_cog, fetch_view_services):
+        """A staged post past its maximum age is discarded, not posted."""
+        from src.cogs.fetch_view import FetchView
+        from src.cogs.streamlined_fetch import PreparedPost
+
+        message = SimpleNamespace(id=6, message="text", media=None, date=None)
+        view = FetchView(fetch_cog.bot, message, "alpha", auto_mode=True)
+        fetch_cog.prepared_post = PreparedPost(FetchCandidate("alpha", message, "text"), view, prepared_at=0.0)
+
+        with patch("src.cogs.streamlined_fetch.time.monotonic", return_value=10_000.0):
+            assert await fetch_cog.post_prepared() is None
+
+        fetch_view_services.posting.post_to_news_channel.assert_not_called()
+        assert fetch_cog.prepared_post is None
+
+
+class TestPipeline:
+    """Test the staged pipeline that replaced the global posting lock."""
+
+    @pytest.mark.asyncio
+    async def test_slow_analysis_does_not_block_other_posts(self, fetch_cog):
+        """A queued breaking post completes while a slow AI call is in flight."""
+        release = asyncio.Event()
+
+        async def analyze(candidate):
+            if candidate.channel == "slow":
+                await release.wait()
+            return True
+
+        async def passthrough(channel_name, messages, blacklist):
+            return [FetchCandidate(channel_name, message, message.message) for message in messages]
+
+        queue = IngestQueue()
+        queue.push("urgent", SimpleNamespace(id=2, message="عاجل", media=None, date=None), priority=0.05, breaking=True)
+        fetch_cog.bot.telegram_client.ingest_queue = queue
+        fetch_cog._analyze_candidate = analyze
+        fetch_cog._filter_messages = passthrough
+        fetch_cog._fetch_messages = AsyncMock(return_value=[SimpleNamespace(id=1, message="خبر", date=None)])
+
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            slow = asyncio.create_task(fetch_cog.fetch_and_post_best(["slow"]))
+            await asyncio.sleep(0.01)
+
+            assert await asyncio.wait_for(fetch_cog.post_from_ingest_queue(breaking_only=True), 1) == "urgent"
+            assert fetch_cog.pipeline_stats()["analyze"]["active"] == 1
+
+            release.set()
+            assert await slow == "slow"
+
+    @pytest.mark.asyncio
+    async def test_stage_metrics(self, fetch_cog):
+        """Every stage reports its workers, queue depth and processed count."""
+        fetch_cog._fetch_messages = AsyncMock(return_value=[])
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store:
+            store.return_value.load = AsyncMock()
+            await fetch_cog.fetch_and_post_best(["alpha", "beta"])
+
+        stats = fetch_cog.pipeline_stats()
+        assert list(stats) == ["fetch", "clean", "analyze", "media", "post"]
+        assert stats["fetch"]["processed"] == 2
+        assert stats["fetch"]["queue_depth"] == 0
+        assert stats["clean"]["processed"] == 0
+
+
+class TestBackfill:
+    """Test catching up on messages missed during downtime."""
+
+    @pytest.mark.asyncio
+    async def test_backlog_is_paged_since_cursor(self, fetch_cog):
+        """History is walked in pages down to the cursor and the age limit."""
+        now = datetime.now(timezone.utc)
+
+        def message(message_id, minutes_ago):
+            return SimpleNamespace(id=message_id, date=now - timedelta(minutes=minutes_ago))
+
+        pages = [
+            [message(105, 1), message(104, 2)],
+            [message(104, 2), message(103, 3)],  # overlaps the previous page
+            [message(102, 4), message(101, 60 * 24)],  # 101 is past the age limit
+        ]
+        fetch_cog.bot.channel_cursors = MagicMock(load=AsyncMock(), get=MagicMock(return_value=100))
+        fetch_cog.bot.telegram_client.get_messages = AsyncMock(side_effect=pages)
+        settings = {"automation.backfill.page_size": 2, "automation.backfill.max_age_hours": 12}
+
+        with patch(
+            "src.cogs.streamlined_fetch.config.get",
+            side_effect=lambda key, default=None: settings.get(key, default),
+        ):
+            backlog = await fetch_cog._fetch_backlog("alpha")
+
+        assert [m.id for m in backlog] == [105, 104, 103, 102]
+        calls = fetch_cog.bot.telegram_client.get_messages.await_args_list
+        assert calls[0].kwargs == {"limit": 2, "offset_date": None, "min_id": 100}
+        assert calls[1].kwargs["offset_date"] == pages[0][1].date + timedelta(seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_channel_without_cursor_has_no_backlog(self, fetch_cog):
+        """A channel never processed before is not backfilled."""
+        fetch_cog.bot.channel_cursors = MagicMock(load=AsyncMock(), get=MagicMock(return_value=0))
+        fetch_cog.bot.telegram_client.get_messages = AsyncMock()
+
+        assert await fetch_cog._fetch_backlog("alpha") == []
+        fetch_cog.bot.telegram_client.get_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_top_candidates_are_posted_within_budget(self, fetch_cog):
+        """The best backlog messages are spaced out; the rest are marked handled."""
+        candidates = [make_candidate("alpha", i, priority=i, score=0.5) for i in range(1, 6)]
+        fetch_cog._fetch_backlog = AsyncMock(return_value=[c.message for c in candidates])
+
+        async def to_candidates(channel_name, messages, blacklist):
+            return [c for c in candidates if c.message in messages]
+
+        fetch_cog._filter_messages = to_candidates
+        fetch_cog._cleanup_processing_message = AsyncMock()
+        settings = {"automation.backfill.max_posts": 2, "automation.backfill.spacing_seconds": 120}
+
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store, patch(
+            "src.cogs.streamlined_fetch.config.get",
+            side_effect=lambda key, default=None: settings.get(key, default),
+        ):
+            store.return_value.load = AsyncMock()
+            assert await fetch_cog.backfill(["alpha"]) == ["alpha", "alpha"]
+
+        scheduled = [call.args[0] for call in fetch_cog._schedule_candidate.await_args_list]
+        assert [c.message.id for c in scheduled] == [5, 4]
+        assert [c.post_delay for c in scheduled] == [30, 150]
+        released = sorted(call.args[1] for call in fetch_cog._cleanup_processing_message.await_args_list)
+        assert released == [1, 2, 3]
+        assert all(call.kwargs["handled"] for call in fetch_cog._cleanup_processing_message.await_args_list)
+
+
+class TestScheduledPostJobs:
+    """Test posting of durable scheduled post jobs."""
+
+    @pytest.mark.asyncio
+    async def test_job_from_before_restart_reuses_stored_ai_results(self, fetch_cog):
+        """A job without a staged view is rebuilt from its stored results, without AI calls."""
+        job = PostJob("alpha", 42, 0.0, arabic_text="نص", ai_english="Text", ai_title="Title")
+        fetch_cog.bot.telegram_client.get_message = AsyncMock(return_value=SimpleNamespace(id=42))
+
+        with patch("src.cogs.streamlined_fetch.get_blacklist_store") as store, patch(
+            "src.cogs.streamlined_fetch.FetchView"
+        ) as view_class:
+            store.return_value.contains = AsyncMock(return_value=True)
+            view_class.return_value.do_post_to_news = AsyncMock(return_value=True)
+            assert await fetch_cog.execute_post_job(job)
+
+        kwargs = view_class.call_args.kwargs
+        assert (kwargs["ai_english"], kwargs["ai_title"], kwargs["arabic_text_clean"]) == ("Text", "Title", "نص")
+        fetch_cog._analyze_candidate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scheduled_job_uses_its_staged_view(self, fetch_cog):
+        """A job scheduled by this process posts through the view it was staged with."""
+        view = SimpleNamespace(
+            arabic_text_clean="نص", ai_english="Text", ai_title="Title", ai_location="Damascus",
+            urgency_level="normal", should_ping_news=False, content_category="social", quality_score=0.8,
+            do_post_to_news=AsyncMock(return_value=True),
+        )
+        jobs = MagicMock()
+        jobs.load = AsyncMock(return_value=True)
+        jobs.add = AsyncMock(return_value=True)
+
+        with patch("src.cogs.streamlined_fetch.get_post_job_store", return_value=jobs), patch(
+            "src.cogs.streamlined_fetch.get_blacklist_store"
+        ) as store:
+            store.return_value.contains = AsyncMock(return_value=True)
+            await fetch_cog._schedule_delayed_post(view, 42, 30, "alpha")
+            job = jobs.add.await_args.args[0]
+            assert job.ai_location == "Damascus" and job.due_at > time.time()
+            assert await fetch_cog.execute_post_job(job)
+
+        view.do_post_to_news.assert_awaited_once()
@@ -441,4 +441,306 @@ class TestTaskManager:
         
         # Task should be removed or completed
         task = task_manager.get_task("test_task")
-        assert task is None or task.done() 
\ No newline at end of file
+        assert task is None or task.done() 
+
+class TestIngestQueue:
+    """Test the Telegram push-ingestion queue."""
+
+    def test_breaking_then_urgency_then_arrival_order(self):
+        """Breaking messages come first, then higher urgency, then FIFO."""
+        from src.utils.ingest_queue import IngestQueue
+
+        queue = IngestQueue(maxsize=10)
+        queue.push("a", MagicMock(id=1), priority=0.01)
+        queue.push("b", MagicMock(id=2), priority=0.03)
+        queue.push("c", MagicMock(id=3), priority=0.01)
+        queue.push("d", MagicMock(id=4), priority=0.05, breaking=True)
+
+        assert queue.has_breaking()
+        assert [queue.pop().channel for _ in range(4)] == ["d", "b", "a", "c"]
+        assert queue.pop() is None
+        assert not queue.has_breaking()
+
+    def test_full_queue_drops_lowest_ranked(self):
+        """When full, the lowest-ranked message is the one dropped."""
+        from src.utils.ingest_queue import IngestQueue
+
+        queue = IngestQueue(maxsize=2)
+        queue.push("low", MagicMock(id=1), priority=0.01)
+        queue.push("mid", MagicMock(id=2), priority=0.02)
+        assert queue.push("high", MagicMock(id=3), priority=0.03) is True
+        assert queue.push("lowest", MagicMock(id=4), priority=0.0) is False
+
+        assert len(queue) == 2
+        assert [queue.pop().channel for _ in range(2)] == ["high", "mid"]
+        assert queue.dropped == 2
+
+    def test_breaking_only_and_stale_messages(self):
+        """breaking_only stops at ordinary messages; stale ones are discarded."""
+        from src.utils.ingest_queue import IngestQueue
+
+        queue = IngestQueue(maxsize=10, max_age_minutes=1)
+        queue.push("normal", MagicMock(id=1), priority=0.5)
+        assert queue.pop(breaking_only=True) is None
+
+        queue.push("old", MagicMock(id=2), priority=0.1, breaking=True)
+        queue._heap[0].received_at -= 120
+        assert queue.pop().channel == "normal"
+        assert queue.pop() is None
+        assert not queue.has_breaking()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_breaking_wakes_on_push(self):
+        """A waiter wakes as soon as a breaking message is pushed."""
+        import asyncio
+        from src.utils.ingest_queue import IngestQueue
+
+        queue = IngestQueue()
+        assert await queue.wait_for_breaking(0.01) is False
+
+        waiter = asyncio.create_task(queue.wait_for_breaking(5))
+        await asyncio.sleep(0)
+        queue.push("a", MagicMock(id=1), priority=0.1, breaking=True)
+        assert await asyncio.wait_for(waiter, 1) is True
+
+
+class TestTrackedChannels:
+    """Test how the Telegram manager resolves tracked channels."""
+
+    @pytest.mark.asyncio
+    async def test_tracked_channels_cached_until_channel_change(self, temp_dir):
+        """Channels are read from the cache once and re-read after a change."""
+        from src.utils.telegram_client import TelegramManager
+
+        cache = JSONCache(json_path=str(temp_dir / "botdata.json"))
+        await cache.initialize()
+        await cache.add_telegram_channel("AlphaNews")
+
+        manager = TelegramManager(MagicMock(json_cache=cache))
+        with patch.object(cache, "list_telegram_channels", wraps=cache.list_telegram_channels) as listed:
+            assert await manager.get_tracked_channels() == {"alphanews"}
+            assert await manager.get_tracked_channels() == {"alphanews"}
+            assert listed.call_count == 1
+
+            await cache.add_telegram_channel("betanews")
+            assert await manager.get_tracked_channels() == {"alphanews", "betanews"}
+            assert listed.call_count == 2
+
+        await cache.close()
+
+
+class TestPipeline:
+    """Test the staged processing pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_stages_fan_out_drop_and_partial_runs(self):
+        """Handlers fan out or drop items; runs may start and stop at any stage."""
+        from src.utils.pipeline import Pipeline
+
+        async def split(word):
+            return list(word)
+
+        async def upper(letter):
+            return [] if letter == "x" else [letter.upper()]
+
+        pipeline = Pipeline("test")
+        pipeline.add_stage("split", split)
+        pipeline.add_stage("upper", upper)
+
+        assert sorted(await pipeline.run(["ab", "xc"])) == ["A", "B", "C"]
+        assert sorted(await pipeline.run(["ab"], stop="split")) == ["a", "b"]
+        assert await pipeline.run(["q"], start="upper") == ["Q"]
+        assert await pipeline.run([]) == []
+        with pytest.raises(ValueError):
+            await pipeline.run(["a"], start="upper", stop="split")
+
+    @pytest.mark.asyncio
+    async def test_worker_limit_and_backpressure(self):
+        """A stage never exceeds its workers and a full queue blocks producers."""
+        import asyncio
+        from src.utils.pipeline import Pipeline
+
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def slow(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return [item]
+
+        pipeline = Pipeline("test")
+        pipeline.add_stage("slow", slow, workers=2, queue_size=1)
+
+        run = asyncio.create_task(pipeline.run(range(5)))
+        await asyncio.sleep(0.01)
+        stats = pipeline.stats()["slow"]
+        # Two items in progress, one queued, the submitter blocked on the rest
+        assert (stats["active"], stats["queue_depth"]) == (2, 1)
+
+        release.set()
+        assert sorted(await asyncio.wait_for(run, 1)) == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert pipeline.stats()["slow"]["processed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_items_are_counted_and_dropped(self):
+        """A handler error drops the item without stalling the run."""
+        from src.utils.pipeline import Pipeline
+
+        async def picky(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            return [item]
+
+        pipeline = Pipeline("test")
+        pipeline.add_stage("picky", picky)
+
+        assert sorted(await pipeline.run([1, 2, 3])) == [1, 3]
+        assert pipeline.stats()["picky"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_handlers_do_not_stall_the_run(self):
+        """A cancellation inside a handler, or of its worker, drops the item and the run still finishes."""
+        import asyncio
+        from src.utils.pipeline import Pipeline
+
+        started = asyncio.Event()
+
+        async def handler(item):
+            if item == "inner":
+                raise asyncio.CancelledError()
+            if item == "worker":
+                started.set()
+                await asyncio.Event().wait()
+            return [item]
+
+        pipeline = Pipeline("test")
+        stage = pipeline.add_stage("work", handler, workers=1)
+
+        assert await asyncio.wait_for(pipeline.run(["inner", "ok"]), 1) == ["ok"]
+
+        run = asyncio.create_task(pipeline.run(["worker", "next"]))
+        await started.wait()
+        for task in list(stage._tasks):
+            task.cancel()
+        assert await asyncio.wait_for(run, 1) == ["next"]
+
+        stats = pipeline.stats()["work"]
+        assert (stats["failed"], stats["active"], stats["queue_depth"]) == (2, 0, 0)
+        await asyncio.sleep(0)
+        assert stage._running == 0
+
+
+class TestOpenAIClientProvider:
+    """Test the shared OpenAI client provider."""
+
+    @staticmethod
+    def settings(**values):
+        values.setdefault("openai.api_key", "sk-test")
+        return MagicMock(get=lambda key, default=None: values.get(key, default))
+
+    @pytest.mark.asyncio
+    async def test_call_sites_share_one_pooled_client(self):
+        """Every call site reuses one client; only the timeout differs."""
+        from src.utils.openai_client import OpenAIClientProvider
+
+        provider = OpenAIClientProvider()
+        settings = self.settings(**{"openai.timeouts.translation": 60, "openai.pool.max_connections": 7})
+        with patch("src.utils.openai_client.config", settings):
+            base = provider.get_client()
+            assert provider.get_client() is base
+            translation = provider.get_client("translation")
+            assert translation.timeout == 60
+            assert provider.get_client("urgency").timeout == 15
+            # Per-site clients share the base client's connection pool
+            assert translation._client is base._client
+            assert base._client._transport._pool._max_connections == 7
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_no_client_without_api_key_and_rebuild_on_key_change(self):
+        """No client without a key; a new key gets a new client."""
+        from src.utils.openai_client import OpenAIClientProvider
+
+        provider = OpenAIClientProvider()
+        with patch("src.utils.openai_client.config", self.settings(**{"openai.api_key": None})):
+            assert provider.get_client() is None
+            assert provider.get_sync_client() is None
+            with pytest.raises(RuntimeError):
+                await provider.chat("default", model="gpt-3.5-turbo", messages=[])
+
+        with patch("src.utils.openai_client.config", self.settings()):
+            first = provider.get_client()
+        with patch("src.utils.openai_client.config", self.settings(**{"openai.api_key": "sk-other"})):
+            assert provider.get_client() is not first
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """Concurrent identical requests send one API call; different ones are not merged."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from src.utils.openai_client import OpenAIClientProvider
+
+        async def create(**kwargs):
+            await asyncio.sleep(0.05)
+            return kwargs["messages"][0]["content"]
+
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=create)
+        provider = OpenAIClientProvider()
+        request = {"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": "خبر"}]}
+        other = {"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": "آخر"}]}
+
+        with patch("src.utils.openai_client.config", self.settings()):
+            results = await asyncio.gather(
+                provider.chat("translation", client=client, **request),
+                provider.chat("translation", client=client, **request),
+                provider.chat("translation", client=client, **request),
+                provider.chat("translation", client=client, **other),
+            )
+            # Once the first call has finished the same request is sent again
+            await provider.chat("translation", client=client, **request)
+            # Another call site (timeout) or client never joins the request
+            other_client = MagicMock()
+            other_client.chat.completions.create = AsyncMock(side_effect=create)
+            await asyncio.gather(
+                provider.chat("translation", client=client, **request),
+                provider.chat("health_check", client=client, **request),
+                provider.chat("translation", client=other_client, **request),
+            )
+
+        assert results == ["خبر", "خبر", "خبر", "آخر"]
+        assert client.chat.completions.create.await_count == 5
+        assert other_client.chat.completions.create.await_count == 1
+        stats = provider.requests.stats()
+        assert (stats["requests"], stats["executed"], stats["coalesced"]) == (8, 6, 2)
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_share_errors_and_survive_cancellation(self):
+        """Every waiter sees the shared error; a cancelled waiter does not cancel the others."""
+        import asyncio
+        from src.utils.single_flight import SingleFlight
+
+        group = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            raise ValueError("rate limited")
+
+        first = asyncio.create_task(group.run("key", work))
+        second = asyncio.create_task(group.run("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        with pytest.raises(ValueError):
+            await second
+        assert first.cancelled()
+        assert group.stats()["coalesced"] == 1